@@ -0,0 +1,95 @@
+"""
+特徴量ストア管理 CLI
+
+バックテスト・学習で保存された特徴量ストア（src/features/feature_store.py・
+既定 .cache/features）のエントリ確認と削除を行う。
+
+使い方:
+    venv/bin/python3 scripts/maintenance/feature_store_cli.py list                 # エントリ一覧
+    venv/bin/python3 scripts/maintenance/feature_store_cli.py stats                # 集計
+    venv/bin/python3 scripts/maintenance/feature_store_cli.py prune --dry-run      # 削除対象確認
+    venv/bin/python3 scripts/maintenance/feature_store_cli.py prune --max-age-days 7
+    venv/bin/python3 scripts/maintenance/feature_store_cli.py clear                # 全削除
+
+prune は旧 feature_order.json / 旧生成コードのエントリ（stale）・破損エントリ・
+保持日数超過・合計サイズ超過（最終アクセスが古い順）を削除する。
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+# プロジェクトルートを sys.path に追加
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from src.features.feature_store import FeatureStore  # noqa: E402
+
+
+def _print_entries(store: FeatureStore) -> None:
+    entries = store.list_entries()
+    if not entries:
+        print(f"📭 エントリなし: {store.root}")
+        return
+
+    print(f"📦 特徴量ストア: {store.root}（{len(entries)}件）")
+    for meta in entries:
+        if meta.get("corrupt"):
+            print(f"  ❌ {meta['key']}  破損（meta.json 読み込み不可）")
+            continue
+        mark = "⚠️ stale" if meta["stale"] else "✅"
+        print(
+            f"  {mark} {meta['key']}  {meta['rows']}行 x {len(meta['columns'])}列  "
+            f"{meta['size_bytes'] / 1024 / 1024:.1f}MB  variant={meta['variant']}  "
+            f"v{meta['feature_order_version']}/{meta['code_version']}"
+            f"/{meta.get('config_version', '-')}  "
+            f"作成={meta['created_at'][:19]}  最終アクセス={meta['last_accessed'][:19]}  "
+            f"{meta.get('source') or ''}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="特徴量ストア管理")
+    parser.add_argument(
+        "--root", help="ストアディレクトリ（省略時は config の features.store.dir）"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="エントリ一覧")
+    sub.add_parser("stats", help="集計")
+    prune = sub.add_parser("prune", help="無効化ルールに従って削除")
+    prune.add_argument("--keep-stale", action="store_true", help="stale エントリを残す")
+    prune.add_argument("--max-age-days", type=float, help="保持日数（省略時は config）")
+    prune.add_argument("--max-size-mb", type=float, help="合計サイズ上限（省略時は config）")
+    prune.add_argument("--dry-run", action="store_true", help="削除せず対象のみ表示")
+    sub.add_parser("clear", help="全エントリ削除")
+    args = parser.parse_args(argv)
+
+    # CLI は環境変数 FEATURE_STORE_DISABLED に関係なく操作する
+    store = FeatureStore(root=args.root, enabled=True)
+
+    if args.command == "list":
+        _print_entries(store)
+    elif args.command == "stats":
+        for key, value in store.stats().items():
+            print(f"  {key}: {value}")
+    elif args.command == "prune":
+        removed = store.prune(
+            stale=not args.keep_stale,
+            max_age_days=args.max_age_days,
+            max_size_mb=args.max_size_mb,
+            dry_run=args.dry_run,
+        )
+        label = "削除対象" if args.dry_run else "削除"
+        print(f"🧹 {label}: {len(removed)}件")
+        for key in removed:
+            print(f"  - {key}")
+    elif args.command == "clear":
+        print(f"🧹 全削除: {store.clear()}件")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
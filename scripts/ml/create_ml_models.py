@@ -6,6 +6,13 @@ MLモデル作成スクリプト - Phase 61
 - 2段階MLモデル生成: full（37特徴量）・basic（37特徴量）
 - 6戦略統合・実戦略信号学習
 - TimeSeriesSplit・SMOTE・Optuna最適化
+- Phase 90: Optuna の sqlite 永続化（再実行で再開）・プロセス並列・fold 単位の枝刈り
+
+Optuna 関連の環境変数（Phase 90）:
+    ML_OPTUNA_WORKERS        並列プロセス数（0 = 自動: CPU コア数 / 2・既定 0）
+    ML_OPTUNA_TRIAL_THREADS  1 trial あたりの学習スレッド数（0 = 自動: CPU コア数 / プロセス数）
+    ML_OPTUNA_STORAGE        Optuna ストレージ URL（既定 sqlite:///models/optuna/optuna_studies.db）
+    ML_OPTUNA_PRUNER         median / halving / none（既定 median）
 - ProductionEnsemble作成
 
 使用方法:
@@ -18,12 +25,15 @@ MLモデル作成スクリプト - Phase 61
 
 import argparse
 import asyncio
+import hashlib
 import json
 import logging
+import multiprocessing
 import os
 import pickle
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -33,7 +43,10 @@ import optuna
 import pandas as pd
 from imblearn.over_sampling import SMOTE
 from lightgbm import LGBMClassifier
+from optuna.pruners import MedianPruner, NopPruner, SuccessiveHalvingPruner
 from optuna.samplers import TPESampler
+from optuna.study import MaxTrialsCallback
+from optuna.trial import TrialState
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
 from sklearn.model_selection import (  # noqa: F401  # Phase 89-β: kept for backward compatibility
@@ -46,6 +59,9 @@ from xgboost import XGBClassifier
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+# Phase 90: CV fold の並列評価（学習データは読み取り専用メモリマップで共有）
+from src.ml.cv.parallel import clone_estimator, evaluate_folds  # noqa: E402
+
 # Phase 89-β: Purged K-Fold（時系列リーク防止・embargo 付き）
 from src.ml.cv.purged_kfold import PurgedKFold  # noqa: E402
 
@@ -56,7 +72,10 @@ try:
     from src.core.logger import get_logger
     from src.data.data_pipeline import DataPipeline, DataRequest, TimeFrame
     from src.features.feature_generator import FeatureGenerator
+    from src.features.feature_store import get_feature_store
+    from src.ml.compiled_trees import file_sha256
     from src.ml.ensemble import ProductionEnsemble
+    from src.ml.model_artifacts import save_ensemble_artifact
     from src.strategies.base.strategy_manager import StrategyManager  # Phase 41.8
 except ImportError as e:
     print(f"❌ 新システムモジュールのインポートに失敗: {e}")
@@ -64,6 +83,407 @@ except ImportError as e:
     sys.exit(1)
 
 
+def triple_barrier_labels(
+    close: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    tp_ratio: float,
+    sl_ratio: float,
+    max_bars: int,
+) -> np.ndarray:
+    """
+    Phase 90: Triple Barrier ラベルのベクトル化計算
+
+    各足 i について将来 max_bars 本（i+1 〜 i+max_bars）の高値・安値をスライディング窓で並べ、
+    TP/SL 到達のブール行列から最初の到達足を argmax で求める。同じ足で両方に到達した場合は
+    TP を優先する（旧実装のループと同じ判定順序）。窓が足りない末尾は NaN で埋め、到達なし扱い。
+
+    Returns:
+        np.ndarray: 1 = TP 先着, 0 = SL 先着・時間切れ
+    """
+    n = len(close)
+    if n == 0 or max_bars <= 0:
+        return np.zeros(n, dtype=int)
+
+    padding = np.full(max_bars, np.nan)
+    high_windows = np.lib.stride_tricks.sliding_window_view(
+        np.concatenate([np.asarray(high, dtype=np.float64)[1:], padding]), max_bars
+    )
+    low_windows = np.lib.stride_tricks.sliding_window_view(
+        np.concatenate([np.asarray(low, dtype=np.float64)[1:], padding]), max_bars
+    )
+
+    close = np.asarray(close, dtype=np.float64)
+    tp_hit = high_windows >= (close * (1 + tp_ratio))[:, None]
+    sl_hit = low_windows <= (close * (1 - sl_ratio))[:, None]
+    touched = tp_hit | sl_hit
+    first_touch = touched.argmax(axis=1)
+    success = touched.any(axis=1) & tp_hit[np.arange(n), first_touch]
+    return success.astype(int)
+
+
+# Phase 90: 試行数にカウントする trial 状態（枝刈りも 1 試行として扱う）
+_FINISHED_TRIAL_STATES = (TrialState.COMPLETE, TrialState.PRUNED)
+
+
+def _optuna_settings(n_trials: int, optuna_dir: Path) -> Dict[str, Any]:
+    """
+    Phase 90: Optuna 並列・永続化設定（環境変数）
+
+    プロセス数 × trial あたりスレッド数が CPU コア数を超えないように自動決定する。
+    """
+    cpu_count = os.cpu_count() or 1
+    workers = int(os.environ.get("ML_OPTUNA_WORKERS", "0"))
+    if workers <= 0:
+        workers = max(1, cpu_count // 2)
+    workers = max(1, min(workers, n_trials))
+    trial_threads = int(os.environ.get("ML_OPTUNA_TRIAL_THREADS", "0"))
+    if trial_threads <= 0:
+        trial_threads = max(1, cpu_count // workers)
+    return {
+        "workers": workers,
+        "trial_threads": trial_threads,
+        "storage": os.environ.get(
+            "ML_OPTUNA_STORAGE", f"sqlite:///{optuna_dir / 'optuna_studies.db'}"
+        ),
+        "pruner": os.environ.get("ML_OPTUNA_PRUNER", "median"),
+    }
+
+
+def _rf_n_jobs(n_threads: int) -> int:
+    """
+    Phase 90: RandomForest の学習スレッド数（ML_TRAINING_N_JOBS を上限として維持）
+
+    ML_TRAINING_N_JOBS（default 1 = Phase 53.2 の GCP gVisor 対策）を超えない。
+    0 以下（-1 = 全コア）は上限なしとして n_threads を使う。
+    """
+    configured = int(os.environ.get("ML_TRAINING_N_JOBS", "1"))
+    return n_threads if configured <= 0 else min(configured, n_threads)
+
+
+def _optuna_storage(url: str) -> Any:
+    """sqlite はロック待ち・heartbeat 付き RDBStorage（クラッシュした RUNNING trial を失敗扱い）"""
+    if not url.startswith("sqlite"):
+        return url
+    return optuna.storages.RDBStorage(
+        url,
+        engine_kwargs={"connect_args": {"timeout": 60}},
+        heartbeat_interval=60,
+        grace_period=180,
+    )
+
+
+def _optuna_pruner(name: str) -> Any:
+    """fold 単位の中間スコアで見込みのない trial を打ち切る pruner"""
+    if name == "halving":
+        return SuccessiveHalvingPruner()
+    if name == "none":
+        return NopPruner()
+    return MedianPruner(n_startup_trials=5, n_warmup_steps=0)
+
+
+def _data_fingerprint(features: pd.DataFrame, target: pd.Series, n_classes: int) -> str:
+    """学習データの指紋（同じデータでの再実行のみ既存 study を再開するため）"""
+    digest = hashlib.sha256()
+    digest.update(pd.util.hash_pandas_object(features, index=True).values.tobytes())
+    digest.update(pd.util.hash_pandas_object(target, index=False).values.tobytes())
+    digest.update(f"{list(features.columns)}:{n_classes}".encode())
+    return digest.hexdigest()[:12]
+
+
+def _cross_validate_trial(
+    trial: optuna.Trial, model: Any, X_train: pd.DataFrame, y_train: pd.Series
+) -> float:
+    """
+    Purged K-Fold の macro F1 平均（Phase 89-β: embargo 付き・時系列リーク防止）
+
+    Phase 90: fold 毎に累積平均を中間値として報告し、pruner 判定で早期打ち切り。
+    """
+    tscv = PurgedKFold(n_splits=3, embargo_pct=0.01)
+    scores = []
+    for fold, (train_idx, val_idx) in enumerate(tscv.split(X_train)):
+        X_cv_train = X_train.iloc[train_idx]
+        y_cv_train = y_train.iloc[train_idx]
+        X_cv_val = X_train.iloc[val_idx]
+        y_cv_val = y_train.iloc[val_idx]
+
+        model.fit(X_cv_train, y_cv_train)
+        y_pred = model.predict(X_cv_val)
+        score = f1_score(y_cv_val, y_pred, average="macro")
+        scores.append(score)
+
+        trial.report(float(np.mean(scores)), fold)
+        if trial.should_prune():
+            raise optuna.TrialPruned()
+
+    return np.mean(scores)
+
+
+def _objective_lightgbm(
+    trial: optuna.Trial, X_train: pd.DataFrame, y_train: pd.Series, n_classes: int, n_jobs: int
+) -> float:
+    """Phase 39.5: LightGBM最適化objective関数（Phase 51.9-6A: 3クラス対応）"""
+    params = {
+        "learning_rate": trial.suggest_float("learning_rate", 0.01, 0.3, log=True),
+        "max_depth": trial.suggest_int("max_depth", 3, 15),
+        "n_estimators": trial.suggest_int("n_estimators", 50, 300),
+        "num_leaves": trial.suggest_int("num_leaves", 20, 100),
+        # Phase 73-C: 正則化パラメータを探索空間に追加
+        "reg_alpha": trial.suggest_float("reg_alpha", 0.01, 10.0, log=True),
+        "reg_lambda": trial.suggest_float("reg_lambda", 0.01, 10.0, log=True),
+        "feature_fraction": trial.suggest_float("feature_fraction", 0.5, 0.9),
+        "bagging_fraction": trial.suggest_float("bagging_fraction", 0.5, 0.9),
+        "bagging_freq": 5,
+        "random_state": 42,
+        "verbose": -1,
+        "class_weight": "balanced",
+        # Phase 90: 並列 trial 間でコアを分け合う
+        "n_jobs": n_jobs,
+    }
+
+    # Phase 51.9-6A: 3クラス分類対応
+    if n_classes == 3:
+        params["objective"] = "multiclass"
+        params["num_class"] = 3
+
+    return _cross_validate_trial(trial, LGBMClassifier(**params), X_train, y_train)
+
+
+def _objective_xgboost(
+    trial: optuna.Trial, X_train: pd.DataFrame, y_train: pd.Series, n_classes: int, n_jobs: int
+) -> float:
+    """Phase 39.5: XGBoost最適化objective関数（Phase 51.9-6A: 3クラス対応）"""
+    params = {
+        "learning_rate": trial.suggest_float("learning_rate", 0.01, 0.3, log=True),
+        "max_depth": trial.suggest_int("max_depth", 3, 15),
+        "n_estimators": trial.suggest_int("n_estimators", 50, 300),
+        "min_child_weight": trial.suggest_int("min_child_weight", 1, 10),
+        # Phase 73-C: 正則化パラメータを探索空間に追加
+        "reg_alpha": trial.suggest_float("xgb_reg_alpha", 0.01, 10.0, log=True),
+        "reg_lambda": trial.suggest_float("xgb_reg_lambda", 0.1, 10.0, log=True),
+        "subsample": trial.suggest_float("subsample", 0.5, 0.9),
+        "colsample_bytree": trial.suggest_float("colsample_bytree", 0.5, 0.9),
+        "random_state": 42,
+        "verbosity": 0,
+        # Phase 90: 並列 trial 間でコアを分け合う
+        "n_jobs": n_jobs,
+    }
+
+    # Phase 51.9-6A: 3クラス分類対応
+    if n_classes == 3:
+        params["objective"] = "multi:softprob"
+        params["num_class"] = 3
+        params["eval_metric"] = "mlogloss"
+    else:
+        params["eval_metric"] = "logloss"
+        # scale_pos_weight動的設定（2クラス分類のみ）
+        pos_count = y_train.sum()
+        neg_count = len(y_train) - pos_count
+        if pos_count > 0:
+            params["scale_pos_weight"] = neg_count / pos_count
+
+    return _cross_validate_trial(trial, XGBClassifier(**params), X_train, y_train)
+
+
+def _objective_random_forest(
+    trial: optuna.Trial, X_train: pd.DataFrame, y_train: pd.Series, n_classes: int, n_jobs: int
+) -> float:
+    """Phase 39.5: RandomForest最適化objective関数"""
+    params = {
+        "n_estimators": trial.suggest_int("n_estimators", 100, 300),
+        "max_depth": trial.suggest_int("max_depth", 5, 12),  # Phase 73-C: 上限12に制限
+        "min_samples_split": trial.suggest_int("min_samples_split", 2, 20),
+        # Phase 73-C: 正則化パラメータ追加
+        "min_samples_leaf": trial.suggest_int("min_samples_leaf", 2, 10),
+        "random_state": 42,
+        # Phase 90: 並列 trial 間でコアを分け合う（ML_TRAINING_N_JOBS を上限として維持）
+        "n_jobs": _rf_n_jobs(n_jobs),
+        "class_weight": "balanced",
+    }
+
+    return _cross_validate_trial(trial, RandomForestClassifier(**params), X_train, y_train)
+
+
+_OPTUNA_OBJECTIVES = {
+    "lightgbm": _objective_lightgbm,
+    "xgboost": _objective_xgboost,
+    "random_forest": _objective_random_forest,
+}
+
+
+def _optuna_worker(
+    settings: Dict[str, Any],
+    study_name: str,
+    model_name: str,
+    features: pd.DataFrame,
+    target: pd.Series,
+    n_classes: int,
+    n_trials: int,
+    max_trials: int,
+    timeout: int,
+    seed: int,
+) -> None:
+    """
+    Phase 90: 共有ストレージ上の study で trial を実行（並列時は spawn した子プロセスで実行）
+
+    このプロセスで最大 n_trials 実行し、study 全体の終了 trial 数（他プロセス・再開分を含む）が
+    max_trials に達した時点で停止する。
+    """
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    study = optuna.load_study(
+        study_name=study_name,
+        storage=_optuna_storage(settings["storage"]),
+        sampler=TPESampler(seed=seed),
+        pruner=_optuna_pruner(settings["pruner"]),
+    )
+    objective = _OPTUNA_OBJECTIVES[model_name]
+    study.optimize(
+        lambda trial: objective(trial, features, target, n_classes, settings["trial_threads"]),
+        n_trials=n_trials,
+        timeout=timeout,
+        callbacks=[MaxTrialsCallback(max_trials, states=_FINISHED_TRIAL_STATES)],
+        show_progress_bar=False,
+    )
+
+
+def _trial_progress(study: optuna.Study, run_start: datetime) -> List[Dict[str, Any]]:
+    """
+    Phase 90: 経過時間（wall-clock）と終了 trial 数・ベストスコアの推移
+
+    今回の実行で終了した trial を完了時刻順に並べる（再開前の trial は除外）。
+    """
+    finished = sorted(
+        (
+            t
+            for t in study.trials
+            if t.state in _FINISHED_TRIAL_STATES
+            and t.datetime_complete is not None
+            and t.datetime_complete >= run_start
+        ),
+        key=lambda t: t.datetime_complete,
+    )
+    progress = []
+    best = None
+    for count, trial in enumerate(finished, start=1):
+        if trial.state == TrialState.COMPLETE and (best is None or trial.value > best):
+            best = trial.value
+        progress.append(
+            {
+                "elapsed_seconds": round((trial.datetime_complete - run_start).total_seconds(), 1),
+                "trials": count,
+                "best_score": best,
+            }
+        )
+    return progress
+
+
+def _cv_settings(n_splits: int) -> Dict[str, Any]:
+    """
+    Phase 90: 学習時 CV の fold 並列設定（環境変数）
+
+    ML_CV_WORKERS: fold 並列プロセス数（default 1 = 直列・0 = min(fold 数, CPU コア数)）
+    ML_CV_FOLD_THREADS: fold あたりの学習スレッド数（0 = CPU コア数 / min(fold 数, CPU コア数)）
+
+    fold_threads はプロセス数に依らず同じ値に決定し、直列・並列の両方で使うため、
+    CV スコアは ML_CV_WORKERS に依らず同一になる。モデル設定の n_jobs より増やさない
+    （clone_estimator・RandomForest の n_jobs=1 は維持）。
+    """
+    cpu_count = os.cpu_count() or 1
+    max_workers = max(1, min(cpu_count, n_splits))
+    workers = int(os.environ.get("ML_CV_WORKERS", "1"))
+    if workers <= 0:
+        workers = max_workers
+    workers = max(1, min(workers, n_splits))
+    fold_threads = int(os.environ.get("ML_CV_FOLD_THREADS", "0"))
+    if fold_threads <= 0:
+        fold_threads = max(1, cpu_count // max_workers)
+    return {"workers": workers, "fold_threads": fold_threads}
+
+
+def _evaluate_cv_fold(
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    train_idx: np.ndarray,
+    val_idx: np.ndarray,
+    fold: int,
+    model: Any,
+    model_name: str,
+    use_smote: bool,
+    fold_threads: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Phase 90: CV 1 fold の学習・評価（evaluate_folds から直列/並列で呼ばれる）
+
+    model は複製して学習する（元のモデル・共有メモリマップの入力は変更しない）。
+    ワーカープロセスから logger を使わないため、ログ内容は戻り値で返し親プロセスで出力する。
+    """
+    model = clone_estimator(model, fold_threads)
+    X_cv_train = X_train.iloc[train_idx]
+    y_cv_train = y_train.iloc[train_idx]
+    X_cv_val = X_train.iloc[val_idx]
+    y_cv_val = y_train.iloc[val_idx]
+    result: Dict[str, Any] = {"fold": fold, "smote": None, "smote_error": None}
+
+    # Phase 39.4: SMOTE Oversampling (CV fold) - Phase 54.8: 3クラス対応
+    if use_smote:
+        try:
+            smote = SMOTE(sampling_strategy="auto", k_neighbors=5, random_state=42)
+            X_cv_train_resampled, y_cv_train_resampled = smote.fit_resample(X_cv_train, y_cv_train)
+            # Convert back to DataFrame to preserve feature names
+            X_cv_train = pd.DataFrame(X_cv_train_resampled, columns=X_cv_train.columns)
+            y_cv_train = pd.Series(y_cv_train_resampled)
+            class_dist = pd.Series(y_cv_train_resampled).value_counts(normalize=True)
+            result["smote"] = {
+                "before": len(train_idx),
+                "after": len(X_cv_train_resampled),
+                "class_dist": class_dist.to_dict(),
+            }
+        except Exception as e:
+            result["smote_error"] = str(e)
+
+    # Phase 39.3: Early Stopping for LightGBM and XGBoost
+    if model_name == "lightgbm":
+        try:
+            model.fit(
+                X_cv_train,
+                y_cv_train,
+                eval_set=[(X_cv_val, y_cv_val)],
+                callbacks=[
+                    # LightGBM 4.0+ uses callbacks instead of early_stopping_rounds
+                    __import__("lightgbm").early_stopping(stopping_rounds=20, verbose=False)
+                ],
+            )
+        except ValueError as e:
+            # Handle unseen labels in CV folds (small datasets)
+            if "previously unseen labels" in str(e):
+                model.fit(X_cv_train, y_cv_train)
+            else:
+                raise
+    elif model_name == "xgboost":
+        # XGBoost 2.0+ uses callbacks for early stopping
+        try:
+            from xgboost import callback as xgb_callback
+
+            model.fit(
+                X_cv_train,
+                y_cv_train,
+                eval_set=[(X_cv_val, y_cv_val)],
+                callbacks=[xgb_callback.EarlyStopping(rounds=20)],
+                verbose=False,
+            )
+        except Exception:
+            # Fallback: train without early stopping
+            model.fit(X_cv_train, y_cv_train)
+    else:
+        # RandomForest doesn't support early stopping
+        model.fit(X_cv_train, y_cv_train)
+
+    # 予測・評価
+    y_pred = model.predict(X_cv_val)
+    result["score"] = f1_score(y_cv_val, y_pred, average="macro")
+    return result
+
+
 class NewSystemMLModelCreator:
     """新システム用MLモデル作成・学習システム."""
 
@@ -360,7 +780,13 @@ class NewSystemMLModelCreator:
             self.logger.info(f"✅ 基本データ取得完了: {len(df)}行")
 
             # Phase 50.9: 特徴量エンジニアリング（62特徴量・外部API完全削除済み）
-            features_df = await self.feature_generator.generate_features(df)
+            # 特徴量ストア: 同一 CSV・同一特徴量定義/生成コードなら前回の計算結果をロード
+            features_df = await get_feature_store().load_or_compute_async(
+                df,
+                lambda: self.feature_generator.generate_features(df),
+                variant="primary",
+                source="BTC_JPY_15m.csv（学習）",
+            )
 
             # Phase 41.8: 戦略シグナル特徴量を削除（後で実戦略信号で置き換える）
             # generate_features() は戦略シグナルを0.0で自動生成するが、Phase 41.8では実戦略信号を使用
@@ -415,6 +841,7 @@ class NewSystemMLModelCreator:
 
         各時点で5戦略を実行し、本物の戦略信号を計算。
         これにより訓練時と推論時の一貫性を確保。
+        戦略は generate_signals_batch() で全時点を一括評価（行単位実行と同一結果）。
 
         Args:
             df: OHLCV価格データ
@@ -453,73 +880,31 @@ class NewSystemMLModelCreator:
             self.data_pipeline.set_backtest_data({"15m": df.copy()})
             self.logger.info("✅ DataPipelineバックテストモード設定完了")
 
-            # 各時点で戦略実行（look-ahead bias回避のため順次処理）
-            total_points = len(df)
-            processed = 0
-
-            for i in range(len(df)):
-                # 現在時点までのデータのみ使用（未来データ漏洩防止）
-                current_data = df.iloc[: i + 1]
-
-                # 最低限のデータポイントが必要（特徴量計算のため）
-                if len(current_data) < 50:
-                    # データ不足時は0で埋める
-                    for strategy_name in strategy_names:
-                        strategy_signals.loc[
-                            current_data.index[-1], f"strategy_signal_{strategy_name}"
-                        ] = 0.0
-                    continue
-
-                try:
-                    # DataPipeline更新（マルチタイムフレーム形式）
-                    self.data_pipeline.set_backtest_data({"15m": current_data.copy()})
-
-                    # 個別戦略信号取得（Phase 51.7 Day 7: 単一DataFrameとして渡す）
-                    signals = strategy_manager.get_individual_strategy_signals(current_data)
-
-                    # action × confidence を計算して格納
-                    current_timestamp = current_data.index[-1]
-                    for strategy_name in strategy_names:
-                        if strategy_name in signals:
-                            action = signals[strategy_name]["action"]
-                            confidence = signals[strategy_name]["confidence"]
-
-                            # Phase 51.9: 改善エンコーディング（hold=0問題解決）
-                            # 新方式: 0.0-1.0の連続値（全て非ゼロ）
-                            # - hold: 0.5（中立）
-                            # - buy: 0.5 + (confidence * 0.5) = 0.5-1.0範囲
-                            # - sell: 0.5 - (confidence * 0.5) = 0.0-0.5範囲
-                            if action == "buy":
-                                signal_value = 0.5 + (confidence * 0.5)
-                            elif action == "sell":
-                                signal_value = 0.5 - (confidence * 0.5)
-                            else:  # hold
-                                signal_value = 0.5
-
-                            strategy_signals.loc[
-                                current_timestamp, f"strategy_signal_{strategy_name}"
-                            ] = signal_value
-                        else:
-                            # 戦略信号が得られない場合はhold扱い（0.5）
-                            strategy_signals.loc[
-                                current_timestamp, f"strategy_signal_{strategy_name}"
-                            ] = 0.5
+            # 全時点の戦略信号を一括評価（行 i は行 i までのデータのみ使用・未来データ漏洩防止）
+            batch_signals = strategy_manager.get_individual_strategy_signals_batch(df)
 
-                except Exception as e:
-                    # Phase 51.9: エラー時はhold（0.5）で埋める（学習継続）
-                    self.logger.warning(f"⚠️ 時点{i}で戦略実行エラー: {e}, hold(0.5)で埋めます")
-                    for strategy_name in strategy_names:
-                        strategy_signals.loc[
-                            current_data.index[-1], f"strategy_signal_{strategy_name}"
-                        ] = 0.5
-
-                # 進捗表示（10%ごと）
-                processed += 1
-                if processed % max(1, total_points // 10) == 0:
-                    progress = (processed / total_points) * 100
-                    self.logger.info(
-                        f"📊 Phase 41.8: 戦略信号生成進捗 {processed}/{total_points} ({progress:.1f}%)"
+            # 最低限のデータポイント（特徴量計算のため50行）未満は0で埋める
+            warmup_rows = min(50, len(df))
+            for strategy_name in strategy_names:
+                signals = batch_signals.get(strategy_name)
+                if signals is None:
+                    # 戦略信号が得られない場合はhold扱い（0.5）
+                    signal_values = np.full(len(df), 0.5)
+                else:
+                    # Phase 51.9: 改善エンコーディング（hold=0問題解決）
+                    # 新方式: 0.0-1.0の連続値（全て非ゼロ）
+                    # - hold: 0.5（中立）
+                    # - buy: 0.5 + (confidence * 0.5) = 0.5-1.0範囲
+                    # - sell: 0.5 - (confidence * 0.5) = 0.0-0.5範囲
+                    action = signals["action"]
+                    confidence = signals["confidence"]
+                    signal_values = np.where(
+                        action == "buy",
+                        0.5 + (confidence * 0.5),
+                        np.where(action == "sell", 0.5 - (confidence * 0.5), 0.5),
                     )
+                signal_values[:warmup_rows] = 0.0
+                strategy_signals[f"strategy_signal_{strategy_name}"] = signal_values
 
             # Phase 51.9: 欠損値をhold（0.5）で埋める
             strategy_signals.fillna(0.5, inplace=True)
@@ -689,9 +1074,9 @@ class NewSystemMLModelCreator:
         sellエントリーの品質も同様に学習できる（市場の動きやすさを学習するため）。
 
         Phase 82: meta_tp_ratio / meta_sl_ratio で運用TP/SLに合わせた個別指定可能。
+        Phase 90: 行×将来足の二重ループを triple_barrier_labels() のベクトル化計算に置換（結果同一）。
         """
         close = df["close"].values
-        n = len(close)
         # Phase 82: 運用と学習のパラメータ乖離を解消するため個別指定優先
         if self.meta_tp_ratio is not None and self.meta_sl_ratio is not None:
             tp_ratio = self.meta_tp_ratio
@@ -707,28 +1092,10 @@ class NewSystemMLModelCreator:
             f"時間制限={max_bars}本（{max_bars * 15}分）"
         )
 
-        target = np.full(n, 0, dtype=int)  # デフォルト: 失敗(0)
-
-        for i in range(n - 1):
-            entry_price = close[i]
-            tp_price = entry_price * (1 + tp_ratio)
-            sl_price = entry_price * (1 - sl_ratio)
-
-            # 将来のmax_bars本を走査
-            end_idx = min(i + max_bars + 1, n)
-            for j in range(i + 1, end_idx):
-                future_high = df["high"].values[j] if "high" in df.columns else close[j]
-                future_low = df["low"].values[j] if "low" in df.columns else close[j]
-
-                # TP到達チェック（高値がTP以上）
-                if future_high >= tp_price:
-                    target[i] = 1  # 成功
-                    break
-                # SL到達チェック（安値がSL以下）
-                if future_low <= sl_price:
-                    target[i] = 0  # 失敗
-                    break
-            # ループ完了（時間切れ）→ デフォルトの0（失敗）
+        high = df["high"].values if "high" in df.columns else close
+        low = df["low"].values if "low" in df.columns else close
+        # TP到達（高値がTP以上）→ 成功(1)・SL到達（安値がSL以下）・時間切れ → 失敗(0)
+        target = triple_barrier_labels(close, high, low, tp_ratio, sl_ratio, max_bars)
 
         target_series = pd.Series(target, index=df.index, dtype=int)
 
@@ -783,139 +1150,17 @@ class NewSystemMLModelCreator:
 
         return features_clean, target_clean
 
-    def _objective_lightgbm(
-        self, trial: optuna.Trial, X_train: pd.DataFrame, y_train: pd.Series
-    ) -> float:
-        """Phase 39.5: LightGBM最適化objective関数（Phase 51.9-6A: 3クラス対応）"""
-        params = {
-            "learning_rate": trial.suggest_float("learning_rate", 0.01, 0.3, log=True),
-            "max_depth": trial.suggest_int("max_depth", 3, 15),
-            "n_estimators": trial.suggest_int("n_estimators", 50, 300),
-            "num_leaves": trial.suggest_int("num_leaves", 20, 100),
-            # Phase 73-C: 正則化パラメータを探索空間に追加
-            "reg_alpha": trial.suggest_float("reg_alpha", 0.01, 10.0, log=True),
-            "reg_lambda": trial.suggest_float("reg_lambda", 0.01, 10.0, log=True),
-            "feature_fraction": trial.suggest_float("feature_fraction", 0.5, 0.9),
-            "bagging_fraction": trial.suggest_float("bagging_fraction", 0.5, 0.9),
-            "bagging_freq": 5,
-            "random_state": 42,
-            "verbose": -1,
-            "class_weight": "balanced",
-        }
-
-        # Phase 51.9-6A: 3クラス分類対応
-        if self.n_classes == 3:
-            params["objective"] = "multiclass"
-            params["num_class"] = 3
-
-        model = LGBMClassifier(**params)
-
-        # Phase 89-β: Purged K-Fold（embargo 付き・時系列リーク防止）
-        tscv = PurgedKFold(n_splits=3, embargo_pct=0.01)
-        scores = []
-        for train_idx, val_idx in tscv.split(X_train):
-            X_cv_train = X_train.iloc[train_idx]
-            y_cv_train = y_train.iloc[train_idx]
-            X_cv_val = X_train.iloc[val_idx]
-            y_cv_val = y_train.iloc[val_idx]
-
-            model.fit(X_cv_train, y_cv_train)
-            y_pred = model.predict(X_cv_val)
-            score = f1_score(y_cv_val, y_pred, average="macro")
-            scores.append(score)
-
-        return np.mean(scores)
-
-    def _objective_xgboost(
-        self, trial: optuna.Trial, X_train: pd.DataFrame, y_train: pd.Series
-    ) -> float:
-        """Phase 39.5: XGBoost最適化objective関数（Phase 51.9-6A: 3クラス対応）"""
-        params = {
-            "learning_rate": trial.suggest_float("learning_rate", 0.01, 0.3, log=True),
-            "max_depth": trial.suggest_int("max_depth", 3, 15),
-            "n_estimators": trial.suggest_int("n_estimators", 50, 300),
-            "min_child_weight": trial.suggest_int("min_child_weight", 1, 10),
-            # Phase 73-C: 正則化パラメータを探索空間に追加
-            "reg_alpha": trial.suggest_float("xgb_reg_alpha", 0.01, 10.0, log=True),
-            "reg_lambda": trial.suggest_float("xgb_reg_lambda", 0.1, 10.0, log=True),
-            "subsample": trial.suggest_float("subsample", 0.5, 0.9),
-            "colsample_bytree": trial.suggest_float("colsample_bytree", 0.5, 0.9),
-            "random_state": 42,
-            "verbosity": 0,
-        }
-
-        # Phase 51.9-6A: 3クラス分類対応
-        if self.n_classes == 3:
-            params["objective"] = "multi:softprob"
-            params["num_class"] = 3
-            params["eval_metric"] = "mlogloss"
-        else:
-            params["eval_metric"] = "logloss"
-            # scale_pos_weight動的設定（2クラス分類のみ）
-            pos_count = y_train.sum()
-            neg_count = len(y_train) - pos_count
-            if pos_count > 0:
-                params["scale_pos_weight"] = neg_count / pos_count
-
-        model = XGBClassifier(**params)
-
-        # Phase 89-β: Purged K-Fold（embargo 付き・時系列リーク防止）
-        tscv = PurgedKFold(n_splits=3, embargo_pct=0.01)
-        scores = []
-        for train_idx, val_idx in tscv.split(X_train):
-            X_cv_train = X_train.iloc[train_idx]
-            y_cv_train = y_train.iloc[train_idx]
-            X_cv_val = X_train.iloc[val_idx]
-            y_cv_val = y_train.iloc[val_idx]
-
-            model.fit(X_cv_train, y_cv_train)
-            y_pred = model.predict(X_cv_val)
-            score = f1_score(y_cv_val, y_pred, average="macro")
-            scores.append(score)
-
-        return np.mean(scores)
-
-    def _objective_random_forest(
-        self, trial: optuna.Trial, X_train: pd.DataFrame, y_train: pd.Series
-    ) -> float:
-        """Phase 39.5: RandomForest最適化objective関数"""
-        # Phase 90: n_jobs を環境変数で制御（GCP=1 / ローカル=-1）
-        rf_n_jobs = int(os.environ.get("ML_TRAINING_N_JOBS", "1"))
-        params = {
-            "n_estimators": trial.suggest_int("n_estimators", 100, 300),
-            "max_depth": trial.suggest_int("max_depth", 5, 12),  # Phase 73-C: 上限12に制限
-            "min_samples_split": trial.suggest_int("min_samples_split", 2, 20),
-            # Phase 73-C: 正則化パラメータ追加
-            "min_samples_leaf": trial.suggest_int("min_samples_leaf", 2, 10),
-            "random_state": 42,
-            "n_jobs": rf_n_jobs,
-            "class_weight": "balanced",
-        }
-
-        model = RandomForestClassifier(**params)
-
-        # Phase 89-β: Purged K-Fold（embargo 付き・時系列リーク防止）
-        tscv = PurgedKFold(n_splits=3, embargo_pct=0.01)
-        scores = []
-        for train_idx, val_idx in tscv.split(X_train):
-            X_cv_train = X_train.iloc[train_idx]
-            y_cv_train = y_train.iloc[train_idx]
-            X_cv_val = X_train.iloc[val_idx]
-            y_cv_val = y_train.iloc[val_idx]
-
-            model.fit(X_cv_train, y_cv_train)
-            y_pred = model.predict(X_cv_val)
-            score = f1_score(y_cv_val, y_pred, average="macro")
-            scores.append(score)
-
-        return np.mean(scores)
-
     def optimize_hyperparameters(
         self, features: pd.DataFrame, target: pd.Series, n_trials: int = 20
     ) -> Dict[str, Dict[str, Any]]:
         """
         Phase 39.5: Optunaハイパーパラメータ最適化
 
+        Phase 90: study を sqlite に永続化（同じ学習データでの再実行は途中から再開）し、
+        ML_OPTUNA_WORKERS プロセスで trial を並列実行する。各 trial は fold 毎に中間スコアを
+        報告し、pruner（既定 median）が見込みのない trial を最初の fold で打ち切る。
+        経過時間と終了 trial 数の推移を結果 JSON（progress）に記録する。
+
         Args:
             features: 訓練データ特徴量
             target: 訓練データターゲット
@@ -930,11 +1175,20 @@ class NewSystemMLModelCreator:
         optuna.logging.set_verbosity(optuna.logging.WARNING)
 
         optimal_params = {}
+        settings = _optuna_settings(n_trials, self.optuna_dir)
+        fingerprint = _data_fingerprint(features, target, self.n_classes)
         optimization_results = {
             "created_at": datetime.now().isoformat(),
             "n_trials": n_trials,
+            "settings": settings,
+            "data_fingerprint": fingerprint,
             "models": {},
         }
+        self.logger.info(
+            f"⚙️  Phase 90: Optuna {settings['workers']} プロセス × "
+            f"{settings['trial_threads']} スレッド/trial・pruner={settings['pruner']}・"
+            f"storage={settings['storage']}"
+        )
 
         # Phase 90: モデル別タイムアウト（環境変数で上書き可・デフォルト 1800 秒）
         per_model_timeout = int(os.environ.get("ML_TRAINING_PER_MODEL_TIMEOUT", "1800"))
@@ -947,27 +1201,44 @@ class NewSystemMLModelCreator:
             self.logger.info(f"📊 {model_name} 最適化開始")
             start_time = time.time()
 
+            run_start = datetime.now()
+
             try:
-                # Objective関数選択（E731: flake8 lambda回避）
-                def objective_func(trial: optuna.Trial) -> float:
-                    if model_name == "lightgbm":
-                        return self._objective_lightgbm(trial, features, target)
-                    elif model_name == "xgboost":
-                        return self._objective_xgboost(trial, features, target)
-                    else:  # random_forest
-                        return self._objective_random_forest(trial, features, target)
-
-                # Optuna Study作成・最適化実行（Phase 90: timeout 追加で 30 分以内強制終了）
-                study = optuna.create_study(direction="maximize", sampler=TPESampler(seed=42))
-                study.optimize(
-                    objective_func,
-                    n_trials=n_trials,
-                    timeout=per_model_timeout,
-                    show_progress_bar=False,
+                # Phase 90: 永続化 study（同じデータ・モデル種別なら既存 trial から再開）
+                study_name = f"{self.current_model_type}_{model_name}_{fingerprint}"
+                study = optuna.create_study(
+                    study_name=study_name,
+                    storage=_optuna_storage(settings["storage"]),
+                    direction="maximize",
+                    sampler=TPESampler(seed=42),
+                    pruner=_optuna_pruner(settings["pruner"]),
+                    load_if_exists=True,
                 )
+                resumed_trials = len(study.get_trials(states=_FINISHED_TRIAL_STATES))
+                remaining = n_trials - resumed_trials
+                if resumed_trials:
+                    self.logger.info(
+                        f"♻️  {model_name}: 既存 study {study_name} から再開 "
+                        f"（終了済み {resumed_trials}/{n_trials} trial）"
+                    )
+
+                # Optuna最適化実行（Phase 90: timeout 追加で 30 分以内強制終了・プロセス並列）
+                if remaining > 0:
+                    self._run_optuna_workers(
+                        settings,
+                        study_name,
+                        model_name,
+                        features,
+                        target,
+                        remaining,
+                        n_trials,
+                        per_model_timeout,
+                    )
 
                 elapsed = time.time() - start_time
-                completed_trials = len(study.trials)
+                completed_trials = len(study.get_trials(states=_FINISHED_TRIAL_STATES))
+                pruned_trials = len(study.get_trials(states=(TrialState.PRUNED,)))
+                progress = _trial_progress(study, run_start)
 
                 # 最適パラメータ取得
                 best_params = study.best_params
@@ -979,7 +1250,11 @@ class NewSystemMLModelCreator:
                     "best_score": float(best_score),
                     "n_trials": n_trials,
                     "completed_trials": completed_trials,
+                    "pruned_trials": pruned_trials,
+                    "resumed_trials": resumed_trials,
+                    "study_name": study_name,
                     "elapsed_seconds": round(elapsed, 1),
+                    "progress": progress,
                 }
 
                 # Phase 90: 30 分超過 warning
@@ -992,9 +1267,11 @@ class NewSystemMLModelCreator:
 
                 self.logger.info(
                     f"✅ {model_name} 最適化完了 - Best F1: {best_score:.4f}, "
-                    f"elapsed: {elapsed:.1f}s, trials: {completed_trials}/{n_trials}, "
+                    f"elapsed: {elapsed:.1f}s, trials: {completed_trials}/{n_trials} "
+                    f"(pruned {pruned_trials}, resumed {resumed_trials}), "
                     f"Best params: {best_params}"
                 )
+                self._log_trial_progress(model_name, progress)
 
             except Exception as e:
                 elapsed = time.time() - start_time
@@ -1015,6 +1292,65 @@ class NewSystemMLModelCreator:
 
         return optimal_params
 
+    def _run_optuna_workers(
+        self,
+        settings: Dict[str, Any],
+        study_name: str,
+        model_name: str,
+        features: pd.DataFrame,
+        target: pd.Series,
+        n_trials: int,
+        max_trials: int,
+        timeout: int,
+    ) -> None:
+        """
+        Phase 90: Optuna trial の並列実行
+
+        workers > 1 なら spawn した子プロセスが同じ sqlite study を共有して trial を実行する
+        （TPESampler の seed はプロセス毎にずらし同一パラメータの重複を避ける）。
+        """
+        workers = min(settings["workers"], n_trials)
+        worker_args = [
+            (
+                settings,
+                study_name,
+                model_name,
+                features,
+                target,
+                self.n_classes,
+                n_trials,
+                max_trials,
+                timeout,
+                42 + index,
+            )
+            for index in range(workers)
+        ]
+        if workers <= 1:
+            _optuna_worker(*worker_args[0])
+            return
+
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            futures = [pool.submit(_optuna_worker, *args) for args in worker_args]
+            for future in futures:
+                future.result()
+
+    def _log_trial_progress(self, model_name: str, progress: List[Dict[str, Any]]) -> None:
+        """Phase 90: 経過時間 vs 終了 trial 数（25% 刻み）をログ出力"""
+        if not progress:
+            return
+        checkpoints = sorted(
+            {max(1, round(len(progress) * ratio)) for ratio in (0.25, 0.5, 0.75, 1.0)}
+        )
+        report = ", ".join(
+            f"{progress[i - 1]['trials']}trial@{progress[i - 1]['elapsed_seconds']:.0f}s"
+            f"(best {progress[i - 1]['best_score'] or 0:.4f})"
+            for i in checkpoints
+        )
+        total_seconds = progress[-1]["elapsed_seconds"]
+        rate = len(progress) / total_seconds * 60 if total_seconds > 0 else 0.0
+        self.logger.info(f"⏱️  {model_name} trial 推移: {report} - {rate:.1f} trial/分")
+
     def train_models(
         self, features: pd.DataFrame, target: pd.Series, dry_run: bool = False
     ) -> Dict[str, Any]:
@@ -1065,6 +1401,11 @@ class NewSystemMLModelCreator:
         # Phase 89-β: PurgedKFold n_splits=5 + embargo 1%（時系列リーク防止）
         tscv = PurgedKFold(n_splits=5, embargo_pct=0.01)
         self.logger.info("📊 Phase 89-β: PurgedKFold n_splits=5 + embargo 1% for CV")
+        cv_settings = _cv_settings(tscv.get_n_splits())
+        self.logger.info(
+            f"📊 Phase 90: CV fold 並列 {cv_settings['workers']} プロセス"
+            f"（fold あたりスレッド: 最大 {cv_settings['fold_threads']}）"
+        )
 
         # Phase 39.4: XGBoost scale_pos_weight動的設定
         if self.n_classes == 2:
@@ -1080,86 +1421,41 @@ class NewSystemMLModelCreator:
 
             try:
                 # Phase 39.3: Cross Validation with Early Stopping
+                # Phase 90: fold をワーカープールで並列評価（N-BEATS は torch のため直列）
+                fold_results = evaluate_folds(
+                    tscv,
+                    X_train,
+                    y_train,
+                    _evaluate_cv_fold,
+                    n_jobs=1 if model_name == "nbeats" else cv_settings["workers"],
+                    fold_kwargs={
+                        "model": model,
+                        "model_name": model_name,
+                        "use_smote": self.use_smote,
+                        "fold_threads": cv_settings["fold_threads"],
+                    },
+                )
                 cv_scores = []
-
-                for train_idx, val_idx in tscv.split(X_train):
-                    X_cv_train = X_train.iloc[train_idx]
-                    y_cv_train = y_train.iloc[train_idx]
-                    X_cv_val = X_train.iloc[val_idx]
-                    y_cv_val = y_train.iloc[val_idx]
-
-                    # Phase 39.4: SMOTE Oversampling (CV fold) - Phase 54.8: 3クラス対応
-                    if self.use_smote:
-                        try:
-                            smote = SMOTE(sampling_strategy="auto", k_neighbors=5, random_state=42)
-                            X_cv_train_resampled, y_cv_train_resampled = smote.fit_resample(
-                                X_cv_train, y_cv_train
-                            )
-                            # Convert back to DataFrame to preserve feature names
-                            X_cv_train = pd.DataFrame(
-                                X_cv_train_resampled, columns=X_cv_train.columns
-                            )
-                            y_cv_train = pd.Series(y_cv_train_resampled)
-                            # Phase 54.8: クラス分布確認ログ
-                            class_dist = pd.Series(y_cv_train_resampled).value_counts(
-                                normalize=True
-                            )
-                            self.logger.debug(
-                                f"📊 Phase 54.8: SMOTE適用（CV fold） - "
-                                f"{len(train_idx)}→{len(X_cv_train_resampled)}サンプル"
-                            )
-                            self.logger.debug(
-                                f"   SMOTE後クラス分布: "
-                                + ", ".join([f"Class {k}: {v:.1%}" for k, v in class_dist.items()])
-                            )
-                        except Exception as e:
-                            self.logger.warning(
-                                f"⚠️ SMOTE適用失敗（CV fold）: {e}, 元データで学習継続"
-                            )
-
-                    # Phase 39.3: Early Stopping for LightGBM and XGBoost
-                    if model_name == "lightgbm":
-                        try:
-                            model.fit(
-                                X_cv_train,
-                                y_cv_train,
-                                eval_set=[(X_cv_val, y_cv_val)],
-                                callbacks=[
-                                    # LightGBM 4.0+ uses callbacks instead of early_stopping_rounds
-                                    __import__("lightgbm").early_stopping(
-                                        stopping_rounds=20, verbose=False
-                                    )
-                                ],
-                            )
-                        except ValueError as e:
-                            # Handle unseen labels in CV folds (small datasets)
-                            if "previously unseen labels" in str(e):
-                                model.fit(X_cv_train, y_cv_train)
-                            else:
-                                raise
-                    elif model_name == "xgboost":
-                        # XGBoost 2.0+ uses callbacks for early stopping
-                        try:
-                            from xgboost import callback as xgb_callback
-
-                            model.fit(
-                                X_cv_train,
-                                y_cv_train,
-                                eval_set=[(X_cv_val, y_cv_val)],
-                                callbacks=[xgb_callback.EarlyStopping(rounds=20)],
-                                verbose=False,
+                for fold_result in fold_results:
+                    # Phase 54.8: クラス分布確認ログ
+                    if fold_result["smote"] is not None:
+                        smote_info = fold_result["smote"]
+                        self.logger.debug(
+                            f"📊 Phase 54.8: SMOTE適用（CV fold） - "
+                            f"{smote_info['before']}→{smote_info['after']}サンプル"
+                        )
+                        self.logger.debug(
+                            f"   SMOTE後クラス分布: "
+                            + ", ".join(
+                                [f"Class {k}: {v:.1%}" for k, v in smote_info["class_dist"].items()]
                             )
-                        except Exception:
-                            # Fallback: train without early stopping
-                            model.fit(X_cv_train, y_cv_train)
-                    else:
-                        # RandomForest doesn't support early stopping
-                        model.fit(X_cv_train, y_cv_train)
-
-                    # 予測・評価
-                    y_pred = model.predict(X_cv_val)
-                    score = f1_score(y_cv_val, y_pred, average="macro")
-                    cv_scores.append(score)
+                        )
+                    elif fold_result["smote_error"] is not None:
+                        self.logger.warning(
+                            f"⚠️ SMOTE適用失敗（CV fold）: {fold_result['smote_error']}, "
+                            f"元データで学習継続"
+                        )
+                    cv_scores.append(fold_result["score"])
 
                 # Phase 39.3: Final model training on Train+Val with Early Stopping
                 X_train_val = pd.concat([X_train, X_val])
@@ -1397,6 +1693,18 @@ class NewSystemMLModelCreator:
                     with open(model_file, "wb") as f:
                         pickle.dump(model, f)
 
+                    # Phase 90: マニフェスト形式（個別モデル遅延読み込み）を併せて保存
+                    try:
+                        save_ensemble_artifact(
+                            model,
+                            model_file.with_suffix(""),
+                            file_sha256(model_file),
+                            source_path=model_file,
+                        )
+                        self.logger.info(f"✅ マニフェスト形式保存: {model_file.with_suffix('')}")
+                    except Exception as e:
+                        self.logger.warning(f"⚠️ マニフェスト形式保存失敗（pickle のみ使用）: {e}")
+
                     # Git情報取得
                     try:
                         git_commit = self._get_git_info()
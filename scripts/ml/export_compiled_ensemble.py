@@ -0,0 +1,104 @@
+"""
+Phase 90: ProductionEnsemble の木モデルを NumPy 配列にコンパイルするエクスポートスクリプト.
+
+学習済みアンサンブル（pickle）の LightGBM・XGBoost・RandomForest をフラットな NumPy 配列に
+変換し、閾値周辺を含むプローブ入力で元モデルの predict_proba との一致（既定 1e-6 以内）を
+検証した上で <モデル名>_compiled.npz に保存する。
+
+ml.compiled_inference.enabled: true で MLModelLoader が読み込み、推論バックエンドとして使用する。
+npz にはコンパイル元 pickle の SHA-256 を記録し、再学習後の古いコンパイル結果は使用されない。
+
+実行:
+    python scripts/ml/export_compiled_ensemble.py
+    python scripts/ml/export_compiled_ensemble.py --model models/production/ensemble_basic.pkl
+"""
+
+from __future__ import annotations
+
+import argparse
+import pickle
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# プロジェクトルートを sys.path に追加（src.* import のため）
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.ml.compiled_trees import (  # noqa: E402
+    compile_ensemble,
+    file_sha256,
+    load_compiled_members,
+    save_compiled_members,
+)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="ProductionEnsemble 木モデルのコンパイル")
+    parser.add_argument(
+        "--model",
+        type=str,
+        default="models/production/ensemble_full.pkl",
+        help="ProductionEnsemble pickle パス",
+    )
+    parser.add_argument(
+        "--output", type=str, default=None, help="出力パス（既定: <モデル名>_compiled.npz）"
+    )
+    parser.add_argument("--tolerance", type=float, default=1e-6, help="許容最大絶対誤差")
+    parser.add_argument("--probe-rows", type=int, default=2000, help="検証用プローブ入力の行数")
+    parser.add_argument("--single", type=int, default=200, help="1 行推論の計測回数")
+    return parser.parse_args()
+
+
+def _single_row_ms(model, rows) -> float:
+    """1 行推論 1 回あたりの平均時間（ms）"""
+    start = time.perf_counter()
+    for row in rows:
+        model.predict_proba(row)
+    return (time.perf_counter() - start) / len(rows) * 1000
+
+
+def main() -> int:
+    args = _parse_args()
+    model_path = Path(args.model)
+    output_path = (
+        Path(args.output)
+        if args.output
+        else model_path.with_name(f"{model_path.stem}_compiled.npz")
+    )
+
+    with open(model_path, "rb") as f:
+        ensemble = pickle.load(f)
+
+    compiled = compile_ensemble(ensemble, tolerance=args.tolerance, n_probe_rows=args.probe_rows)
+    if not compiled:
+        print("❌ コンパイル可能なモデルがありません")
+        return 1
+
+    save_compiled_members(output_path, compiled, file_sha256(model_path))
+    reloaded, _ = load_compiled_members(output_path)
+    print(f"✅ 保存: {output_path} ({output_path.stat().st_size / 1024:.0f} KiB)")
+
+    import pandas as pd
+
+    rng = np.random.default_rng(7)
+    rows = [
+        pd.DataFrame(rng.normal(size=(1, ensemble.n_features_)), columns=ensemble.feature_names)
+        for _ in range(args.single)
+    ]
+    for name in ensemble.model_names:
+        if name not in reloaded:
+            print(f"  {name:<14}: 元モデルで推論（コンパイル対象外）")
+            continue
+        native_ms = _single_row_ms(ensemble.models[name], rows)
+        compiled_ms = _single_row_ms(reloaded[name], rows)
+        print(
+            f"  {name:<14}: {reloaded[name].n_trees}木 {reloaded[name].n_nodes}ノード "
+            f"1行推論 {native_ms:.3f}ms → {compiled_ms:.3f}ms ({native_ms / compiled_ms:.1f}x)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
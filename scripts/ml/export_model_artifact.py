@@ -0,0 +1,119 @@
+"""
+Phase 90: ProductionEnsemble pickle をマニフェスト形式アーティファクトに変換するスクリプト.
+
+models/production/ensemble_full.pkl → models/production/ensemble_full/（manifest.json +
+個別モデル joblib）。MLModelLoader はアーティファクトを優先して読み込み、個別モデルを
+初回推論時に遅延読み込みする（ml.model_artifacts）。create_ml_models.py は学習時に
+自動で出力するため、このスクリプトは既存 pickle の変換と起動コストの計測に使用する。
+
+変換後、pickle 読み込みとアーティファクト読み込みをそれぞれ別プロセスで実行し、
+読み込み時間・RSS 増加量・初回推論時間を比較表示する（コールドスタート相当）。
+
+実行:
+    python scripts/ml/export_model_artifact.py
+    python scripts/ml/export_model_artifact.py --model models/production/ensemble_basic.pkl
+    python scripts/ml/export_model_artifact.py --measure-only
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pickle
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# プロジェクトルートを sys.path に追加（src.* import のため）
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.ml.compiled_trees import file_sha256  # noqa: E402
+from src.ml.model_artifacts import (  # noqa: E402
+    current_rss_mb,
+    load_ensemble_artifact,
+    save_ensemble_artifact,
+)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="マニフェスト形式アーティファクトへの変換")
+    parser.add_argument(
+        "--model",
+        type=str,
+        default="models/production/ensemble_full.pkl",
+        help="ProductionEnsemble pickle パス",
+    )
+    parser.add_argument("--measure-only", action="store_true", help="変換せず計測のみ")
+    parser.add_argument("--probe", choices=["pickle", "artifact"], help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def _probe(kind: str, model_path: Path) -> dict:
+    """1 プロセスでの読み込み時間・RSS 増加量・初回推論時間（別プロセスから呼ばれる）"""
+    import numpy as np
+
+    # 読み込みと無関係な import コストを計測から除外
+    import src.ml.ensemble  # noqa: F401
+
+    rss_before = current_rss_mb()
+    start = time.perf_counter()
+    if kind == "pickle":
+        with open(model_path, "rb") as f:
+            ensemble = pickle.load(f)
+    else:
+        ensemble = load_ensemble_artifact(model_path.with_suffix(""))
+    load_ms = (time.perf_counter() - start) * 1000
+    rss_loaded = current_rss_mb()
+
+    X = np.random.default_rng(7).normal(size=(1, ensemble.n_features_))
+    start = time.perf_counter()
+    ensemble.predict_proba(X)
+    first_predict_ms = (time.perf_counter() - start) * 1000
+    rss_after = current_rss_mb()
+    return {
+        "load_ms": load_ms,
+        "load_rss_mb": rss_loaded - rss_before,
+        "first_predict_ms": first_predict_ms,
+        "total_rss_mb": rss_after - rss_before,
+    }
+
+
+def _measure(kind: str, model_path: Path) -> dict:
+    result = subprocess.run(
+        [sys.executable, __file__, "--model", str(model_path), "--probe", kind],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    args = _parse_args()
+    model_path = Path(args.model)
+
+    if args.probe:
+        print(json.dumps(_probe(args.probe, model_path)))
+        return 0
+
+    if not args.measure_only:
+        with open(model_path, "rb") as f:
+            ensemble = pickle.load(f)
+        manifest_path = save_ensemble_artifact(
+            ensemble, model_path.with_suffix(""), file_sha256(model_path), source_path=model_path
+        )
+        print(f"✅ 保存: {manifest_path}")
+
+    print(f"{'':<10}{'load':>10}{'load RSS':>12}{'1st predict':>14}{'total RSS':>12}")
+    for kind in ("pickle", "artifact"):
+        stats = _measure(kind, model_path)
+        print(
+            f"{kind:<10}{stats['load_ms']:>8.0f}ms{stats['load_rss_mb']:>10.1f}MB"
+            f"{stats['first_predict_ms']:>12.0f}ms{stats['total_rss_mb']:>10.1f}MB"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -36,6 +36,10 @@ PYTHON="$PROJECT_ROOT/venv/bin/python3"
 export ML_TRAINING_N_JOBS="${ML_TRAINING_N_JOBS:--1}"
 export ML_TRAINING_MODE="${ML_TRAINING_MODE:-true}"
 export ML_TRAINING_PER_MODEL_TIMEOUT="${ML_TRAINING_PER_MODEL_TIMEOUT:-1800}"
+# - ML_OPTUNA_WORKERS=0: Optuna trial 並列プロセス数（0 = CPU コア数 / 2・中断後の再実行は sqlite から再開）
+export ML_OPTUNA_WORKERS="${ML_OPTUNA_WORKERS:-0}"
+# - ML_CV_WORKERS=0: CV fold 並列プロセス数（0 = min(fold 数, CPU コア数)・1 = 直列）
+export ML_CV_WORKERS="${ML_CV_WORKERS:-0}"
 
 # Phase 90: macOS Apple Silicon N-BEATS ハング対策
 # PyTorch と sklearn/LightGBM の OpenMP/BLAS スレッド競合を回避
@@ -61,6 +65,8 @@ echo "  N_TRIALS:                       $N_TRIALS"
 echo "  ML_TRAINING_N_JOBS:             $ML_TRAINING_N_JOBS (RF 並列度・-1=全コア)"
 echo "  ML_TRAINING_MODE:               $ML_TRAINING_MODE (cross_asset リーク防止)"
 echo "  ML_TRAINING_PER_MODEL_TIMEOUT:  $ML_TRAINING_PER_MODEL_TIMEOUT 秒 (1 モデル上限)"
+echo "  ML_OPTUNA_WORKERS:              $ML_OPTUNA_WORKERS (Optuna 並列プロセス数・0=自動)"
+echo "  ML_CV_WORKERS:                  $ML_CV_WORKERS (CV fold 並列プロセス数・0=自動)"
 echo "  LOG_FILE:                       $LOG_FILE"
 echo "============================================================================"
 
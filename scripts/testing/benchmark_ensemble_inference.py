@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+アンサンブル推論ベンチマーク（predict + predict_proba vs predict_with_proba）
+
+ProductionEnsemble.predict() は内部で predict_proba() を呼ぶため、呼び出し側が
+predict() と predict_proba() を個別に呼ぶと各モデルの推論が 2 回走る。
+
+- separate: Phase 90 以前の呼び出し（predict() → predict_proba()）
+- fused   : predict_with_proba()（各モデルの推論 1 回・ラベルは argmax で導出）
+
+を同じ入力で計測し、結果の完全一致と推論時間を比較する。
+
+併せてバッチ推論の個別モデル逐次実行と共有スレッドプールでの並列実行（Phase 90:
+ensemble.parallel_inference）を比較し、個別モデル毎の推論時間を表示する。
+
+既定では合成データで LightGBM・XGBoost・RandomForest を学習した 3 モデル
+アンサンブルを使用する。--model で本番モデル（pickle）を指定可能。
+
+使用方法:
+    python scripts/testing/benchmark_ensemble_inference.py
+    python scripts/testing/benchmark_ensemble_inference.py --rows 20000 --repeat 5
+    python scripts/testing/benchmark_ensemble_inference.py --model models/production/ensemble_full.pkl
+"""
+
+import argparse
+import os
+import pickle
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="アンサンブル推論ベンチマーク")
+    parser.add_argument(
+        "--rows", type=int, default=17_500, help="推論行数（バックテスト一括推論相当）"
+    )
+    parser.add_argument("--single", type=int, default=200, help="1 行推論の回数（ライブ推論相当）")
+    parser.add_argument("--repeat", type=int, default=3, help="計測回数（最短値を採用）")
+    parser.add_argument("--model", type=str, default=None, help="ProductionEnsemble pickle パス")
+    return parser.parse_args()
+
+
+def _synthetic_ensemble(n_features: int):
+    """合成データで学習した 3 モデルアンサンブル（3 クラス分類）"""
+    from lightgbm import LGBMClassifier
+    from sklearn.ensemble import RandomForestClassifier
+    from xgboost import XGBClassifier
+
+    from src.core.config.feature_manager import get_feature_names
+    from src.ml.ensemble import ProductionEnsemble
+
+    rng = np.random.default_rng(42)
+    X = pd.DataFrame(rng.normal(size=(3000, n_features)), columns=get_feature_names()[:n_features])
+    y = np.digitize(X.iloc[:, 0] + rng.normal(0, 0.5, len(X)), [-0.5, 0.5])
+
+    models = {
+        "lightgbm": LGBMClassifier(n_estimators=200, verbose=-1, random_state=42),
+        "xgboost": XGBClassifier(n_estimators=200, random_state=42),
+        "random_forest": RandomForestClassifier(n_estimators=200, random_state=42, n_jobs=1),
+    }
+    for model in models.values():
+        model.fit(X, y)
+    return ProductionEnsemble(models)
+
+
+def _best_of(func, repeat: int) -> float:
+    """repeat 回実行した最短時間（秒）"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    args = _parse_args()
+
+    from src.core.config.feature_manager import get_feature_count
+
+    if args.model:
+        with open(args.model, "rb") as f:
+            ensemble = pickle.load(f)
+    else:
+        ensemble = _synthetic_ensemble(get_feature_count())
+
+    rng = np.random.default_rng(7)
+    X_batch = rng.normal(size=(args.rows, ensemble.n_features_))
+    X_single = [rng.normal(size=(1, ensemble.n_features_)) for _ in range(args.single)]
+
+    # 結果の完全一致確認
+    labels, probas = ensemble.predict_with_proba(X_batch)
+    if not (
+        np.array_equal(labels, ensemble.predict(X_batch))
+        and probas.tobytes() == ensemble.predict_proba(X_batch).tobytes()
+    ):
+        print("❌ predict_with_proba の結果が predict/predict_proba と一致しません")
+        return 1
+
+    def separate_batch() -> None:
+        ensemble.predict(X_batch)
+        ensemble.predict_proba(X_batch)
+
+    def fused_batch() -> None:
+        ensemble.predict_with_proba(X_batch)
+
+    def separate_single() -> None:
+        for X in X_single:
+            ensemble.predict(X)
+            ensemble.predict_proba(X)
+
+    def fused_single() -> None:
+        for X in X_single:
+            ensemble.predict_with_proba(X)
+
+    parallel_proba = ensemble.predict_proba(X_batch, parallel=True)
+    if parallel_proba.tobytes() != ensemble.predict_proba(X_batch, parallel=False).tobytes():
+        print("❌ 並列推論の結果が逐次推論と一致しません")
+        return 1
+
+    print(
+        f"models={','.join(ensemble.model_names)} features={ensemble.n_features_} "
+        f"repeat={args.repeat} (results identical)"
+    )
+    for label, separate, fused, unit in (
+        (f"batch {args.rows} rows", separate_batch, fused_batch, 1),
+        (f"single-row x{args.single}", separate_single, fused_single, args.single),
+    ):
+        separate_sec = _best_of(separate, args.repeat) / unit
+        fused_sec = _best_of(fused, args.repeat) / unit
+        print(f"  {label}")
+        print(f"    separate : {separate_sec * 1000:10.3f} ms/call")
+        print(f"    fused    : {fused_sec * 1000:10.3f} ms/call")
+        print(f"    speedup  : {separate_sec / fused_sec:10.2f} x")
+
+    timings = {}
+    for mode in ("sequential", "parallel"):
+        timings[mode] = _best_of(
+            lambda: ensemble.predict_proba(X_batch, parallel=mode == "parallel"), args.repeat
+        )
+        members = ", ".join(f"{n}={ms:.1f}ms" for n, ms in ensemble.last_member_timings.items())
+        print(f"  batch {args.rows} rows {mode:<10}: {timings[mode] * 1000:10.1f} ms ({members})")
+    print(
+        f"  parallel speedup : {timings['sequential'] / timings['parallel']:10.2f} x "
+        f"(cpu={os.cpu_count()})"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+戦略評価ホットパスのログ遅延評価ベンチマーク
+
+StrategyManager.analyze_market_with_signals()（全戦略評価 + シグナル統合）を
+合成特徴量で繰り返し実行し、1 サイクルあたりの CPU 時間を比較する。
+
+- eager: CryptoBotLogger.is_enabled_for を常に True にし、旧実装と同様に
+  出力されないログのメッセージ（f-string・列名リスト等）も毎回組み立てる
+- lazy : 現行実装。レベル無効時はメッセージを組み立てない
+
+使用方法:
+    python scripts/testing/benchmark_strategy_logging.py
+    python scripts/testing/benchmark_strategy_logging.py --cycles 500 --log-level WARNING
+    python scripts/testing/benchmark_strategy_logging.py --live   # BACKTEST_MODE 未設定で計測
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="戦略評価ログ遅延評価ベンチマーク")
+    parser.add_argument("--rows", type=int, default=600, help="合成ローソク足本数")
+    parser.add_argument("--cycles", type=int, default=300, help="計測サイクル数")
+    parser.add_argument("--repeat", type=int, default=3, help="計測回数（最短値を採用）")
+    parser.add_argument("--log-level", default="WARNING", help="LOG_LEVEL（既定: WARNING）")
+    parser.add_argument(
+        "--live", action="store_true", help="BACKTEST_MODE を設定せずライブ相当で計測"
+    )
+    return parser.parse_args()
+
+
+def _synthetic_ohlcv(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    close = 5_000_000 * np.exp(np.cumsum(rng.normal(0, 0.004, rows)))
+    return pd.DataFrame(
+        {
+            "open": close * (1 + rng.normal(0, 0.001, rows)),
+            "high": close * (1 + np.abs(rng.normal(0, 0.002, rows))),
+            "low": close * (1 - np.abs(rng.normal(0, 0.002, rows))),
+            "close": close,
+            "volume": rng.lognormal(1.0, 0.4, rows),
+        },
+        index=pd.date_range("2026-01-01", periods=rows, freq="15min", tz="Asia/Tokyo"),
+    )
+
+
+def _best_cpu_of(func, repeat: int) -> float:
+    """repeat 回実行した最短 CPU 時間（秒）"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        func()
+        best = min(best, time.process_time() - start)
+    return best
+
+
+def main() -> int:
+    args = _parse_args()
+
+    # ロガー生成前に環境を確定（LOG_LEVEL は CryptoBotLogger 初期化時に読まれる）
+    os.environ["LOG_LEVEL"] = args.log_level.upper()
+    if args.live:
+        os.environ.pop("BACKTEST_MODE", None)
+    else:
+        os.environ["BACKTEST_MODE"] = "true"
+
+    from src.core.logger import CryptoBotLogger
+    from src.features.feature_generator import FeatureGenerator
+    from src.strategies.base.strategy_manager import StrategyManager
+    from src.strategies.strategy_loader import StrategyLoader
+
+    features = FeatureGenerator().generate_features_sync(_synthetic_ohlcv(args.rows))
+    manager = StrategyManager()
+    for strategy_data in StrategyLoader().load_strategies():
+        manager.register_strategy(strategy_data["instance"], weight=strategy_data["weight"])
+
+    # 各サイクルの入力（直近までの履歴）は計測前に用意する
+    start_row = max(len(features) - args.cycles, 1)
+    windows = [features.iloc[: i + 1] for i in range(start_row, len(features))]
+
+    def run_cycles() -> None:
+        for window in windows:
+            manager.analyze_market_with_signals(window, {"15m": window})
+
+    with patch.object(CryptoBotLogger, "is_enabled_for", lambda self, level: True):
+        eager_sec = _best_cpu_of(run_cycles, args.repeat)
+    lazy_sec = _best_cpu_of(run_cycles, args.repeat)
+
+    n_cycles = len(windows)
+    mode = "live" if args.live else "backtest"
+    print(
+        f"mode={mode} LOG_LEVEL={args.log_level.upper()} strategies={len(manager.strategies)} "
+        f"cycles={n_cycles} repeat={args.repeat}"
+    )
+    print(f"  eager formatting : {eager_sec / n_cycles * 1000:8.3f} ms/cycle (CPU)")
+    print(f"  lazy formatting  : {lazy_sec / n_cycles * 1000:8.3f} ms/cycle (CPU)")
+    print(f"  reduction        : {(1 - lazy_sec / eager_sec) * 100:8.1f} %")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
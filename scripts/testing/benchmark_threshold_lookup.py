@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+閾値参照（get_threshold）コストベンチマーク
+
+合成特徴量で StrategyManager.analyze_market_with_signals()（バックテストの 1 足分の戦略評価）を
+繰り返し実行し、その間に呼ばれた get_threshold のキー列を記録する。記録したキー列を
+
+- walk    : Phase 90 以前の実装（キー分割・ネスト辞書走査）
+- snapshot: 現行実装（コンパイル済みスナップショットのフラットキー参照）
+
+で再生し、1 足あたりの参照コストと戦略評価全体に占める割合を比較する。
+
+使用方法:
+    python scripts/testing/benchmark_threshold_lookup.py
+    python scripts/testing/benchmark_threshold_lookup.py --candles 500 --repeat 5
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="閾値参照コストベンチマーク")
+    parser.add_argument("--rows", type=int, default=600, help="合成ローソク足本数")
+    parser.add_argument("--candles", type=int, default=300, help="計測する足数")
+    parser.add_argument("--repeat", type=int, default=3, help="計測回数（最短値を採用）")
+    return parser.parse_args()
+
+
+def _synthetic_ohlcv(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    close = 5_000_000 * np.exp(np.cumsum(rng.normal(0, 0.004, rows)))
+    return pd.DataFrame(
+        {
+            "open": close * (1 + rng.normal(0, 0.001, rows)),
+            "high": close * (1 + np.abs(rng.normal(0, 0.002, rows))),
+            "low": close * (1 - np.abs(rng.normal(0, 0.002, rows))),
+            "close": close,
+            "volume": rng.lognormal(1.0, 0.4, rows),
+        },
+        index=pd.date_range("2026-01-01", periods=rows, freq="15min", tz="Asia/Tokyo"),
+    )
+
+
+def _walk_threshold(thresholds, key_path, default_value=None):
+    """Phase 90 以前の get_threshold（キー分割・ネスト辞書走査）"""
+    current_value = thresholds
+    try:
+        for key in key_path.split("."):
+            current_value = current_value[key]
+        return current_value
+    except (KeyError, TypeError):
+        if default_value is not None:
+            return default_value
+        raise KeyError(f"閾値設定が見つかりません: {key_path}")
+
+
+def _best_of(func, repeat: int) -> float:
+    """repeat 回実行した最短時間（秒）"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    args = _parse_args()
+    os.environ["BACKTEST_MODE"] = "true"
+
+    from src.core.config.threshold_manager import (
+        get_threshold,
+        load_thresholds,
+        set_threshold_lookup_observer,
+    )
+    from src.features.feature_generator import FeatureGenerator
+    from src.strategies.base.strategy_manager import StrategyManager
+    from src.strategies.strategy_loader import StrategyLoader
+
+    features = FeatureGenerator().generate_features_sync(_synthetic_ohlcv(args.rows))
+    manager = StrategyManager()
+    for strategy_data in StrategyLoader().load_strategies():
+        manager.register_strategy(strategy_data["instance"], weight=strategy_data["weight"])
+
+    start_row = max(len(features) - args.candles, 1)
+    windows = [features.iloc[: i + 1] for i in range(start_row, len(features))]
+
+    def run_candles() -> None:
+        for window in windows:
+            manager.analyze_market_with_signals(window, {"15m": window})
+
+    # 1 周目: 実際に参照されるキー列を記録
+    lookups = []
+    set_threshold_lookup_observer(lookups.append)
+    try:
+        run_candles()
+    finally:
+        set_threshold_lookup_observer(None)
+
+    loop_sec = _best_of(run_candles, args.repeat)
+
+    def replay_walk() -> None:
+        for key_path in lookups:
+            _walk_threshold(load_thresholds(), key_path, 0)
+
+    def replay_snapshot() -> None:
+        for key_path in lookups:
+            get_threshold(key_path, 0)
+
+    walk_sec = _best_of(replay_walk, args.repeat)
+    snapshot_sec = _best_of(replay_snapshot, args.repeat)
+
+    n_candles = len(windows)
+    print(
+        f"candles={n_candles} strategies={len(manager.strategies)} "
+        f"lookups={len(lookups)} ({len(lookups) / n_candles:.1f}/candle, "
+        f"{len(set(lookups))} unique keys) repeat={args.repeat}"
+    )
+    print(f"  strategy loop     : {loop_sec / n_candles * 1e6:10.1f} us/candle")
+    print(
+        f"  walk lookups      : {walk_sec / n_candles * 1e6:10.1f} us/candle "
+        f"({walk_sec / loop_sec * 100:5.2f}% of loop)"
+    )
+    print(
+        f"  snapshot lookups  : {snapshot_sec / n_candles * 1e6:10.1f} us/candle "
+        f"({snapshot_sec / loop_sec * 100:5.2f}% of loop)"
+    )
+    print(f"  lookup speedup    : {walk_sec / snapshot_sec:10.2f} x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -34,6 +34,9 @@ from .threshold_manager import (
     get_monitoring_config,
     get_position_config,
     get_threshold,
+    get_threshold_snapshot,
+    get_thresholds_file_signature,
+    get_thresholds_version,
     load_thresholds,
     reload_thresholds,
 )
@@ -301,8 +304,11 @@ __all__ = [
     "config_manager",
     # 閾値管理関数
     "get_threshold",
+    "get_threshold_snapshot",
     "load_thresholds",
     "reload_thresholds",
+    "get_thresholds_version",
+    "get_thresholds_file_signature",
     "get_all_thresholds",
     "get_monitoring_config",
     "get_anomaly_config",
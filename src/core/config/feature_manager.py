@@ -211,6 +211,16 @@ class FeatureManager:
         level_info = self.get_feature_level_info()
         return {level: info["count"] for level, info in level_info.items()}
 
+    def get_feature_order_version(self) -> str:
+        """
+        特徴量定義バージョンを取得
+
+        Returns:
+            feature_order.json の feature_order_version（未設定時は "unknown"）
+        """
+        config = self._load_feature_config()
+        return str(config.get("feature_order_version", "unknown"))
+
     def get_basic_feature_names(self) -> List[str]:
         """Phase 77: Basicモデル用特徴量名リストを取得（importance>=2の実績ある特徴量のみ）"""
         config = self._load_feature_config()
@@ -253,3 +263,8 @@ def get_feature_categories() -> Dict[str, List[str]]:
 def get_basic_feature_names() -> List[str]:
     """Phase 77: Basicモデル用特徴量名リストを取得"""
     return _feature_manager.get_basic_feature_names()
+
+
+def get_feature_order_version() -> str:
+    """特徴量定義バージョンを取得（特徴量ストアのキー生成用）"""
+    return _feature_manager.get_feature_order_version()
@@ -3,6 +3,7 @@
 
 thresholds.yaml統合管理・6専用アクセス関数
 
+Phase 90: コンパイル済みスナップショット（ドット区切りキーの事前展開・1 回の辞書参照で取得）
 Phase 65.12: unified.yaml統合（2→1ファイル体系・thresholds.yaml単一読み込み）
 Phase 64.13: Optuna runtime override削除・未使用アクセサ削除
 Phase 28-29: 閾値設定管理システム確立
@@ -10,12 +11,22 @@ Phase 28-29: 閾値設定管理システム確立
 
 import copy
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import yaml
 
 # キャッシュ変数
 _thresholds_cache: Dict[str, Any] = None
+# 読み込み世代（読み込み毎に +1）と読み込み時のファイル署名（mtime_ns, size）
+_thresholds_version = 0
+_thresholds_signature: Optional[Tuple[int, int]] = None
+# get_threshold 呼び出しキーの観測フック（Phase 90: StrategyProfiler 用・通常は None）
+_lookup_observer: Optional[Callable[[str], None]] = None
+# コンパイル済みスナップショット（get_threshold 用・元の設定辞書が差し替わった時のみ再構築）
+_snapshot: Optional["ThresholdSnapshot"] = None
+_MISSING = object()
+_THRESHOLDS_PATH = "config/core/thresholds.yaml"
 
 
 def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
@@ -51,14 +62,17 @@ def load_thresholds() -> Dict[str, Any]:
     Returns:
         設定辞書
     """
-    global _thresholds_cache
+    global _thresholds_cache, _thresholds_version, _thresholds_signature
 
     if _thresholds_cache is not None:
         return _thresholds_cache
 
-    config_path = Path("config/core/thresholds.yaml")
+    config_path = Path(_THRESHOLDS_PATH)
+    _thresholds_version += 1
+    _thresholds_signature = None
     try:
         if config_path.exists():
+            _thresholds_signature = get_thresholds_file_signature()
             with open(config_path, "r", encoding="utf-8") as f:
                 _thresholds_cache = yaml.safe_load(f) or {}
         else:
@@ -71,10 +85,83 @@ def load_thresholds() -> Dict[str, Any]:
     return _thresholds_cache
 
 
+class ThresholdSnapshot:
+    """
+    閾値設定のコンパイル済みスナップショット（Phase 90）
+
+    読み込んだ設定の全階層を "a.b.c" のフラットキーに事前展開し、get_threshold() の
+    キー分割・辞書走査を 1 回の辞書参照に置き換える。展開結果は読み取り専用で、
+    元の設定辞書が差し替わった時（reload_thresholds()・load_thresholds のモック）のみ再構築する。
+
+    値は元の設定辞書のオブジェクトをそのまま返すため、呼び出し側は変更前にコピーすること
+    （既存コードは dict() でコピーしてから上書きしている）。
+    """
+
+    __slots__ = ("source", "version", "_values")
+
+    def __init__(self, source: Any, version: int = 0):
+        """
+        Args:
+            source: load_thresholds() の設定辞書
+            version: 設定の読み込み世代
+        """
+        values: Dict[str, Any] = {}
+        if isinstance(source, dict):
+            self._flatten(source, "", values)
+        self.source = source
+        self.version = version
+        self._values = values
+
+    @staticmethod
+    def _flatten(node: Dict[Any, Any], prefix: str, out: Dict[str, Any]) -> None:
+        """辞書の全階層をドット区切りキーで展開（"." を含むキー・非文字列キーは従来通り到達不可）."""
+        for key, value in node.items():
+            if not isinstance(key, str) or "." in key:
+                continue
+            path = f"{prefix}{key}"
+            out[path] = value
+            if isinstance(value, dict):
+                ThresholdSnapshot._flatten(value, f"{path}.", out)
+
+    @property
+    def values(self) -> "MappingProxyType[str, Any]":
+        """フラットキー → 値（読み取り専用ビュー）."""
+        return MappingProxyType(self._values)
+
+    def get(self, key_path: str, default_value: Any = None) -> Any:
+        """get_threshold() と同じ規則で値を取得（未設定かつデフォルト None なら KeyError）."""
+        value = self._values.get(key_path, _MISSING)
+        if value is not _MISSING:
+            return value
+        if not isinstance(key_path, str):
+            # 従来のキー分割（key_path.split）と同じく文字列以外は AttributeError
+            raise AttributeError(f"閾値キーは文字列で指定してください: {key_path!r}")
+        if default_value is not None:
+            return default_value
+        raise KeyError(f"閾値設定が見つかりません: {key_path}")
+
+
+def get_threshold_snapshot() -> ThresholdSnapshot:
+    """
+    現在の設定のコンパイル済みスナップショットを取得（Phase 90）
+
+    設定辞書が差し替わっていなければ既存スナップショットを返す。
+    """
+    global _snapshot
+    thresholds = load_thresholds()
+    snapshot = _snapshot
+    if snapshot is None or snapshot.source is not thresholds:
+        snapshot = _snapshot = ThresholdSnapshot(thresholds, _thresholds_version)
+    return snapshot
+
+
 def get_threshold(key_path: str, default_value: Any = None) -> Any:
     """
     階層キーで設定値を取得
 
+    Phase 90: コンパイル済みスナップショットのフラットキーを 1 回の辞書参照で取得
+    （従来のキー分割・辞書走査と同じ結果）。
+
     Args:
         key_path: ドット記法のキー（例: "ml.default_confidence"）
         default_value: デフォルト値
@@ -88,19 +175,28 @@ def get_threshold(key_path: str, default_value: Any = None) -> Any:
         >>> get_threshold("mode_balances.backtest.initial_balance", 100000.0)
         500000.0
     """
-    thresholds = load_thresholds()
+    if _lookup_observer is not None:
+        _lookup_observer(key_path)
 
-    keys = key_path.split(".")
-    current_value = thresholds
+    snapshot = _snapshot
+    if snapshot is None or snapshot.source is not load_thresholds():
+        snapshot = get_threshold_snapshot()
 
-    try:
-        for key in keys:
-            current_value = current_value[key]
-        return current_value
-    except (KeyError, TypeError):
-        if default_value is not None:
-            return default_value
-        raise KeyError(f"閾値設定が見つかりません: {key_path}")
+    value = snapshot._values.get(key_path, _MISSING)
+    if value is _MISSING:
+        return snapshot.get(key_path, default_value)
+    return value
+
+
+def set_threshold_lookup_observer(observer: Optional[Callable[[str], None]]) -> None:
+    """
+    get_threshold 呼び出しキーの観測フックを設定（Phase 90: 戦略プロファイリング用）
+
+    Args:
+        observer: キーを受け取るコールバック（None で解除）
+    """
+    global _lookup_observer
+    _lookup_observer = observer
 
 
 def reload_thresholds() -> None:
@@ -110,6 +206,32 @@ def reload_thresholds() -> None:
     load_thresholds()
 
 
+def get_thresholds_version() -> Tuple[int, Optional[Tuple[int, int]]]:
+    """
+    読み込み済み閾値設定のバージョン（派生キャッシュの無効化キー）
+
+    Returns:
+        (読み込み世代, 読み込み時のファイル署名 (mtime_ns, size))。
+        reload_thresholds() で世代が進むため、実行時の設定変更を検知できる
+    """
+    load_thresholds()
+    return _thresholds_version, _thresholds_signature
+
+
+def get_thresholds_file_signature() -> Optional[Tuple[int, int]]:
+    """
+    thresholds.yaml の現在のファイル署名（設定は読み込まない・stat のみ）
+
+    Returns:
+        (mtime_ns, size)。ファイルが存在しない場合 None
+    """
+    try:
+        stat = Path(_THRESHOLDS_PATH).stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
 def get_all_thresholds() -> Dict[str, Any]:
     """全閾値設定を取得（デバッグ用）."""
     return copy.deepcopy(load_thresholds())
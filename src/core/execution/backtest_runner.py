@@ -25,6 +25,7 @@ import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from ..config import get_threshold
@@ -260,6 +261,7 @@ class BacktestRunner(BaseRunner):
 
             from ...data.external_api_client import get_external_api_client
             from ...features.feature_generator import FeatureGenerator
+            from ...features.feature_store import get_feature_store
 
             self.logger.warning("🚀 特徴量事前計算開始（Phase 35最適化）")
             start_time = time.time()
@@ -271,6 +273,8 @@ class BacktestRunner(BaseRunner):
                 regime_classifier=getattr(self, "regime_classifier", None),
             )
 
+            feature_store = get_feature_store()
+
             for timeframe, df in self.csv_data.items():
                 if df.empty:
                     continue
@@ -278,8 +282,13 @@ class BacktestRunner(BaseRunner):
                 # Phase 35.2: 詳細ログ削除（高速化）
                 tf_start = time.time()
 
-                # 同期版特徴量生成（全データ一括計算）
-                features_df = feature_gen.generate_features_sync(df)
+                # 同期版特徴量生成（全データ一括計算・特徴量ストアにあればロード）
+                features_df = feature_store.load_or_compute(
+                    df,
+                    lambda df=df: feature_gen.generate_features_sync(df),
+                    variant="sync",
+                    source=f"backtest {timeframe}",
+                )
 
                 # Phase 49.1: 戦略シグナル特徴量は_precompute_strategy_signals()で別途計算
                 # ここでは0.0で初期化のみ（後で上書きされる）
@@ -319,7 +328,9 @@ class BacktestRunner(BaseRunner):
         重要ポイント:
         - Look-ahead bias防止: df.iloc[:i+1]で過去データのみ使用
         - Phase 41.8 Strategy-Aware ML完全対応
-        - 各タイムスタンプで特徴量生成+戦略実行が必要（処理時間増）
+        - 特徴量は generate_features_causal() で全履歴を 1 パス計算し、各時点ではスライスのみ
+          （行 i は行 i 以前のみに依存・プレフィックス毎の再計算 O(n²) を O(n) に削減）
+        - 戦略は generate_signals_batch() で全時点を一括評価（行単位実行と同一結果）
 
         最適化効果:
         - バックテスト精度: BUY偏重 → ライブモード完全一致
@@ -329,6 +340,7 @@ class BacktestRunner(BaseRunner):
             import time
 
             from ...features.feature_generator import FeatureGenerator
+            from ...features.feature_graph import collect_required_features
 
             self.logger.warning("🎯 戦略シグナル事前計算開始（Phase 49.1: 実戦略実行）")
             start_time = time.time()
@@ -353,6 +365,19 @@ class BacktestRunner(BaseRunner):
             )
             total_rows = len(main_df)
 
+            # 全履歴の因果的特徴量を一括計算（各時点ではスライスのみ）
+            # 特徴量依存グラフで ML 特徴量 + 有効戦略の必要特徴量のみ計算
+            strategy_service = self.orchestrator.strategy_service
+            required_features = collect_required_features(
+                strategies=getattr(strategy_service, "strategies", {}).values()
+            )
+            causal_features = feature_gen.generate_features_causal(
+                main_df, required_features=required_features
+            )
+            self.logger.warning(
+                f"  因果的特徴量一括計算完了: {total_rows}件（{time.time() - start_time:.1f}秒）"
+            )
+
             # 戦略シグナル特徴量の初期化（Phase 51.7 Day 7: 6戦略・設定駆動型）
             from ...strategies.strategy_loader import StrategyLoader
 
@@ -363,67 +388,16 @@ class BacktestRunner(BaseRunner):
 
             self.logger.warning(f"✅ {len(strategy_names)}戦略でバックテスト実行: {strategy_names}")
 
-            # 進捗報告用
-            progress_interval = max(1, total_rows // 10)  # 10%ごとに報告
-
-            # 各タイムスタンプで過去データのみ使用して戦略実行
-            for i in range(total_rows):
-                # Phase 49.1: Look-ahead bias防止 - 過去データのみ使用
-                historical_data = main_df.iloc[: i + 1]
-
-                # 進捗報告
-                if i % progress_interval == 0 and i > 0:
-                    progress = (i / total_rows) * 100
-                    elapsed = time.time() - start_time
-                    eta = (elapsed / i) * (total_rows - i) if i > 0 else 0
-                    self.logger.warning(
-                        f"  進捗: {progress:.1f}% ({i}/{total_rows}) - "
-                        f"経過: {elapsed:.1f}秒, 残り: {eta:.1f}秒"
-                    )
-
-                # データ不足時は0.0で埋める（最初の数行）
-                if len(historical_data) < 20:  # 最小データ数チェック
-                    for col in strategy_signal_columns.keys():
-                        strategy_signal_columns[col].append(0.0)
-                    continue
-
-                try:
-                    # 1. 特徴量生成（過去データのみ）- Look-ahead bias防止
-                    features_df = feature_gen.generate_features_sync(historical_data)
-                    if features_df.empty or len(features_df) == 0:
-                        for col in strategy_signal_columns.keys():
-                            strategy_signal_columns[col].append(0.0)
-                        continue
-
-                    # 2. 全タイムフレーム特徴量準備（ライブモード一致）
-                    # 戦略は特徴量DataFrame（全履歴）を期待している
-                    all_features = {main_timeframe: features_df}
-
-                    # 3. 個別戦略シグナル取得（Phase 41.8準拠）
-                    # features_df（過去全体の特徴量）を渡すことでライブモードと一致
-                    strategy_signals = (
-                        self.orchestrator.strategy_service.get_individual_strategy_signals(
-                            features_df, multi_timeframe_data=all_features
-                        )
-                    )
-
-                    # 4. 戦略シグナルエンコーディング（action × confidence）
-                    for strategy_name in strategy_names:
-                        if strategy_name in strategy_signals:
-                            signal = strategy_signals[strategy_name]
-                            encoded_value = signal.get("encoded", 0.0)
-                            strategy_signal_columns[f"strategy_signal_{strategy_name}"].append(
-                                encoded_value
-                            )
-                        else:
-                            # 戦略シグナル取得失敗時は0.0
-                            strategy_signal_columns[f"strategy_signal_{strategy_name}"].append(0.0)
-
-                except Exception as e:
-                    # エラー時は0.0で埋める
-                    self.logger.debug(f"⚠️ タイムスタンプ {i} で戦略シグナル計算エラー: {e}")
-                    for col in strategy_signal_columns.keys():
-                        strategy_signal_columns[col].append(0.0)
+            # 全時点の個別戦略シグナルを一括評価（行 i は行 i 以前のみ使用・Phase 41.8準拠）
+            # 最小データ数（20行）未満・シグナル取得失敗時は0.0
+            batch_signals = strategy_service.get_individual_strategy_signals_batch(causal_features)
+            for strategy_name in strategy_names:
+                signals = batch_signals.get(strategy_name)
+                if signals is None:
+                    values = np.zeros(total_rows)
+                else:
+                    values = np.asarray(signals["encoded"], dtype=float)
+                strategy_signal_columns[f"strategy_signal_{strategy_name}"] = values.tolist()
 
             # 5. precomputed_featuresに戦略シグナル特徴量を追加
             if main_timeframe in self.precomputed_features:
@@ -482,9 +456,10 @@ class BacktestRunner(BaseRunner):
                 if len(available_features) == len(features_to_use):
                     ml_features = features_df[available_features]
 
-                    # バッチ予測実行
-                    predictions_array = self.orchestrator.ml_service.predict(ml_features)
-                    probabilities_array = self.orchestrator.ml_service.predict_proba(ml_features)
+                    # バッチ予測実行（Phase 90: アンサンブル推論 1 回でラベル・確率を取得）
+                    predictions_array, probabilities_array = (
+                        self.orchestrator.ml_service.predict_with_proba(ml_features)
+                    )
 
                     # 予測結果を保存（インデックス対応）
                     self.precomputed_ml_predictions[main_timeframe] = {
@@ -497,6 +472,13 @@ class BacktestRunner(BaseRunner):
                         f"✅ ML予測事前計算完了: {len(predictions_array)}件 "
                         f"（{elapsed:.1f}秒, {len(predictions_array) / elapsed:.0f}件/秒）"
                     )
+                    # Phase 90: 個別モデルの推論時間（並列推論のボトルネック確認用）
+                    member_timings = self.orchestrator.ml_service.get_member_timings()
+                    if isinstance(member_timings, dict) and member_timings:
+                        self.logger.warning(
+                            "⏱️ ML個別モデル推論時間: "
+                            + ", ".join(f"{name}={ms:.0f}ms" for name, ms in member_timings.items())
+                        )
                 else:
                     self.logger.warning(
                         f"⚠️ 特徴量不足: {len(available_features)}/{len(features_to_use)}個 - ML予測スキップ"
@@ -1357,6 +1339,13 @@ class BacktestRunner(BaseRunner):
                 "balance_history": self.balance_history,
             }
 
+            # Phase 90: 戦略別プロファイル（performance.strategy_profiling 有効時のみ）
+            profiler = getattr(self.orchestrator.strategy_service, "profiler", None)
+            if profiler is not None and profiler.enabled:
+                final_stats["strategy_profile"] = profiler.summary()
+                for line in profiler.format_summary():
+                    self.logger.warning(line)
+
             # バックテストレポーター経由で詳細レポート生成
             # Phase 35: datetime→ISO文字列変換
             # Phase 54.8: ML予測データを渡す
@@ -196,6 +196,18 @@ class CryptoBotLogger:
         file_handler.setFormatter(JSONFormatter())
         self.logger.addHandler(file_handler)
 
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        指定レベルのログが出力されるか（メッセージ組み立て前の判定用）
+
+        ホットパスでは f-string・repr の生成自体を省くため、
+        ``if self.logger.is_enabled_for(logging.DEBUG):`` で囲んでから出力する。
+        バックテストモードの INFO は _log_with_context と同様に出力しない。
+        """
+        if level == logging.INFO and os.environ.get("BACKTEST_MODE") == "true":
+            return False
+        return self.logger.isEnabledFor(level)
+
     def _log_with_context(
         self,
         level: int,
@@ -205,11 +217,8 @@ class CryptoBotLogger:
     ) -> None:
         """コンテキスト付きログ出力."""
         # Phase 35.7: バックテストモード時のログフィルタ（高速化）
-        is_backtest = os.environ.get("BACKTEST_MODE") == "true"
-
-        # バックテストモード時は不要なログをスキップ
-        if is_backtest and level == logging.INFO:
-            # INFO レベルは完全スキップ（I/O削減）
+        # バックテストモード時の INFO・ロガーレベル未満は extra 組み立て前にスキップ
+        if not self.is_enabled_for(level):
             return
 
         # ログレコード作成
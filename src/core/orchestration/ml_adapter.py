@@ -10,9 +10,13 @@ Phase 64.6: Stacking関連コメント削除
 - ProductionEnsemble統一インターフェース（3モデルアンサンブル予測）
 - DummyModelフォールバック（MLモデル未学習時の安全装置）
 - 3クラス分類対応（buy/hold/sell）
+
+Phase 90: predict_with_proba() で予測ラベル・確率を 1 回の推論で取得
+Phase 90: get_inference_rows() でライブ推論に必要な入力行数を提供
+Phase 90: get_member_timings() で直近推論の個別モデル推論時間を提供
 """
 
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -46,6 +50,7 @@ class MLServiceAdapter:
         self.model = self.loader.load_model_with_priority()
         self.model_type = self.loader.model_type
         self.is_fitted = self.loader.is_fitted
+        self.model_version = self.loader.model_version
         self.current_feature_count = None  # Phase 50.8: 現在のモデルの特徴量数
 
         # Phase 87 C4: MLHealthMonitor（DummyModel サーキットブレーカー）
@@ -146,6 +151,70 @@ class MLServiceAdapter:
             else:
                 raise ModelPredictionError(f"ダミーモデルでも確率予測に失敗: {e}")
 
+    def predict_with_proba(
+        self, X: Union[pd.DataFrame, np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        予測ラベルと予測確率を同時取得（Phase 90: アンサンブル推論を 1 回に統合）
+
+        predict_with_proba() を持つモデル（ProductionEnsemble）は各モデルの推論を 1 回だけ行い、
+        predict() + predict_proba() と同一の結果を返す。それ以外のモデルは従来通り個別に呼ぶ。
+
+        Args:
+            X: 特徴量データ
+
+        Returns:
+            (予測結果, 予測確率)
+        """
+        # クラス定義で判定（Mock 等の動的属性を fused 対応と誤認しない）
+        if getattr(self.model.__class__, "predict_with_proba", None) is None:
+            return self.predict(X), self.predict_proba(X)
+
+        if not self.is_fitted:
+            raise ValueError("モデルが学習されていません")
+
+        try:
+            result = self.model.predict_with_proba(X)
+            self._reset_ml_health()
+            return result
+        except Exception as e:
+            self.logger.error(f"予測エラー: {e}")
+            if self.model_type != "DummyModel":
+                self.logger.critical(
+                    f"🚨 Phase 87 C4: predict_with_proba エラーによりダミーモデルにフォールバック: {e}"
+                )
+                # 個別呼び出し時（predict + predict_proba の 2 回失敗）とサーキットブレーカーの
+                # カウントを揃える
+                self._record_ml_failure(f"predict_error: {e}")
+                self._record_ml_failure(f"predict_proba_error: {e}")
+                dummy_model = DummyModel()
+                return dummy_model.predict(X), dummy_model.predict_proba(X)
+            else:
+                raise ModelPredictionError(f"ダミーモデルでも予測に失敗: {e}")
+
+    def get_inference_rows(self) -> Optional[int]:
+        """
+        最終行の予測に必要な入力行数（Phase 90: ライブ推論の行削減）
+
+        Returns:
+            最終行 + モデルの required_lookback。モデルが required_lookback を
+            提供しない場合は None（全行を渡す）
+        """
+        lookback = getattr(self.model, "required_lookback", None)
+        if not isinstance(lookback, int) or lookback < 0:
+            return None
+        return lookback + 1
+
+    def get_member_timings(self) -> Dict[str, float]:
+        """
+        直近推論の個別モデル推論時間（Phase 90: ProductionEnsemble.last_member_timings）
+
+        Returns:
+            {モデル名: 推論時間ms}（記録を持たないモデルは空辞書）
+        """
+        timings = getattr(self.model, "last_member_timings", None)
+        return dict(timings) if isinstance(timings, dict) else {}
+
     def get_model_info(self) -> Dict[str, Any]:
         """モデル情報取得 - ローダーから情報を取得"""
         base_info = {
@@ -170,6 +239,7 @@ class MLServiceAdapter:
                 self.model = self.loader.model
                 self.model_type = self.loader.model_type
                 self.is_fitted = self.loader.is_fitted
+                self.model_version = self.loader.model_version
                 return True
             else:
                 return False
@@ -204,6 +274,7 @@ class MLServiceAdapter:
             self.model = self.loader.load_model_with_priority(feature_count=feature_count)
             self.model_type = self.loader.model_type
             self.is_fitted = self.loader.is_fitted
+            self.model_version = self.loader.model_version
             self.current_feature_count = feature_count
 
             # ロードされたモデルレベルを確認
@@ -29,6 +29,9 @@ class DummyModel:
     Phase 83C: n_classes を動的化（旧実装は2クラス固定で3クラスモデル時shape不一致）
     """
 
+    # Phase 90: 行単位の推論（最終行の推論に過去行は不要）
+    required_lookback = 0
+
     def __init__(self, n_classes: int = 2) -> None:
         self.is_fitted = True
         self.n_classes = n_classes
@@ -11,12 +11,18 @@ Phase 64.6:
   - Level 2（基本）: ensemble_basic.pkl（37特徴量）
   - Level 2.5（再構築）: 個別モデルから再構築
   - Level 3（ダミー）: DummyModel（最終フォールバック）
+
+Phase 90: ml.model_artifacts.enabled 時にマニフェスト形式（models/production/<モデル名>/）を
+優先して読み込み、重み 0 の個別モデルは読み込まない（src/ml/model_artifacts.py）。
+Phase 90: ml.compiled_inference.enabled 時に <モデル名>_compiled.npz（木モデルの
+NumPy コンパイル版）を読み込み、ProductionEnsemble の推論バックエンドとして設定。
 """
 
 import pickle
 import sys
+import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..config import get_threshold
 from ..logger import CryptoBotLogger
@@ -42,6 +48,10 @@ class MLModelLoader:
         self.model_type = "Unknown"
         self.is_fitted = False
         self.feature_level = "unknown"
+        # モデルファイル署名付きバージョン（シグナルメモ等の派生キャッシュのキー）
+        self.model_version = "unknown"
+        # Phase 90: pickle の SHA-256（{パス: ((サイズ, mtime), digest)}・読み込み毎に 1 回まで計算）
+        self._source_digests: Dict[str, Tuple[Tuple[int, int], str]] = {}
 
     def load_model_with_priority(self, feature_count: Optional[int] = None) -> Any:
         """
@@ -156,7 +166,16 @@ class MLModelLoader:
             self.logger.warning(f"ProductionEnsemble未発見 (Level {level.upper()}): {model_path}")
             return False
 
+        # Phase 90: マニフェスト形式アーティファクトを優先（個別モデルは遅延読み込み）
+        if self._load_ensemble_artifact(model_path, level, level_info):
+            return True
+
         try:
+            from ...ml.model_artifacts import current_rss_mb
+
+            rss_before = current_rss_mb()
+            load_start = time.perf_counter()
+
             # 古いPickleファイル互換性レイヤー
             class EnsembleModule:
                 """ensemble サブモジュールのエミュレート"""
@@ -199,9 +218,15 @@ class MLModelLoader:
                 self.model_type = f"ProductionEnsemble_{level.upper()}"
                 self.is_fitted = getattr(self.model, "is_fitted", True)
                 self.feature_level = level
+                version_paths = [model_path]
+                compiled_path = self._attach_compiled_members(model_path)
+                if compiled_path is not None:
+                    version_paths.append(compiled_path)
+                self.model_version = self._build_model_version(version_paths)
                 feature_count = level_info[level].get("count", "unknown")
                 self.logger.info(
                     f"✅ ProductionEnsemble読み込み成功 (Level {level.upper()}, {feature_count}特徴量)"
+                    f"{self._load_stats_text(load_start, rss_before)}"
                 )
                 return True
             else:
@@ -254,6 +279,9 @@ class MLModelLoader:
                 self.model = ProductionEnsemble(individual_models)
                 self.model_type = "ReconstructedEnsemble"
                 self.is_fitted = True
+                self.model_version = self._build_model_version(
+                    [training_path / filename for filename in model_files.values()]
+                )
                 self.logger.info(
                     f"✅ 個別モデルからEnsemble再構築成功 ({len(individual_models)}モデル)"
                 )
@@ -271,8 +299,154 @@ class MLModelLoader:
         self.model = DummyModel()
         self.model_type = "DummyModel"
         self.is_fitted = True
+        self.model_version = "DummyModel"
         self.logger.warning("⚠️ ダミーモデル使用 - 全てholdシグナルで稼働継続")
 
+    def _load_ensemble_artifact(
+        self, model_path: Path, level: str, level_info: Dict[str, Any]
+    ) -> bool:
+        """
+        マニフェスト形式アーティファクトの読み込み（Phase 90）
+
+        models/production/<モデル名>/manifest.json（create_ml_models.py・
+        scripts/ml/export_model_artifact.py で生成）を読み、推論対象（重みが正）の個別モデルを
+        読み込んで検証する（重み 0 のモデルは使用時まで読み込まない）。マニフェストの
+        コンパイル元 SHA-256 が pickle と一致しない場合や、個別モデルの不足・サイズ不一致・
+        読み込み失敗時は False（pickle 読み込みにフォールバック）。
+        """
+        try:
+            if not get_threshold("ml.model_artifacts.enabled", True):
+                return False
+            artifact_dir = model_path.with_suffix("")
+            manifest_path = artifact_dir / "manifest.json"
+            if not manifest_path.exists():
+                return False
+
+            from ...ml.model_artifacts import (
+                current_rss_mb,
+                load_active_members,
+                load_ensemble_artifact,
+                read_manifest,
+            )
+
+            rss_before = current_rss_mb()
+            load_start = time.perf_counter()
+            manifest = read_manifest(artifact_dir)
+            if manifest.get("source_sha256") != self._source_digest(model_path, manifest):
+                self.logger.warning(
+                    f"⚠️ アーティファクトが {model_path.name} と不一致（再エクスポートが必要）"
+                    " - pickle を読み込み"
+                )
+                return False
+
+            # 推論対象のモデルは起動時に読み込む（壊れたファイルは初回推論前に検出して pickle へ）
+            ensemble = load_ensemble_artifact(artifact_dir, manifest)
+            load_active_members(ensemble)
+            self.model = ensemble
+            self.model_type = f"ProductionEnsemble_{level.upper()}"
+            self.is_fitted = True
+            self.feature_level = level
+            version_paths = [model_path, manifest_path]
+            compiled_path = self._attach_compiled_members(model_path)
+            if compiled_path is not None:
+                version_paths.append(compiled_path)
+            self.model_version = self._build_model_version(version_paths)
+            feature_count = level_info[level].get("count", "unknown")
+            self.logger.info(
+                f"✅ ProductionEnsemble読み込み成功 (Level {level.upper()}, {feature_count}特徴量・"
+                f"マニフェスト形式・重み 0 のモデルは未読み込み)"
+                f"{self._load_stats_text(load_start, rss_before)}"
+            )
+            return True
+        except Exception as e:
+            self.logger.warning(f"⚠️ アーティファクト読み込み失敗（pickle を読み込み）: {e}")
+            return False
+
+    @staticmethod
+    def _load_stats_text(load_start: float, rss_before: Optional[float]) -> str:
+        """読み込み時間・RSS 増加量のログ用文字列（Phase 90）"""
+        from ...ml.model_artifacts import current_rss_mb
+
+        text = f" 読み込み {(time.perf_counter() - load_start) * 1000:.0f}ms"
+        rss_after = current_rss_mb()
+        if rss_before is not None and rss_after is not None:
+            text += f"・RSS +{rss_after - rss_before:.1f}MB"
+        return text
+
+    def _attach_compiled_members(self, model_path: Path) -> Optional[Path]:
+        """
+        コンパイル済み木モデル（<モデル名>_compiled.npz）を推論バックエンドに設定（Phase 90）
+
+        scripts/ml/export_compiled_ensemble.py で生成。コンパイル元 pickle の SHA-256 が
+        一致しない（再学習後に未エクスポート）場合や読み込み失敗時は元モデルで推論を継続する。
+
+        Returns:
+            設定したコンパイル済みファイルのパス（未設定なら None）
+        """
+        if not get_threshold("ml.compiled_inference.enabled", False):
+            return None
+        if not hasattr(self.model, "attach_compiled_members"):
+            return None
+
+        compiled_path = model_path.with_name(f"{model_path.stem}_compiled.npz")
+        if not compiled_path.exists():
+            self.logger.warning(f"⚠️ コンパイル済みモデル未発見（元モデルで推論）: {compiled_path}")
+            return None
+
+        try:
+            from ...ml.compiled_trees import load_compiled_members
+
+            compiled, source_digest = load_compiled_members(compiled_path)
+            if source_digest != self._source_digest(model_path):
+                self.logger.warning(
+                    f"⚠️ コンパイル済みモデルが {model_path.name} と不一致（再エクスポートが必要）"
+                    " - 元モデルで推論"
+                )
+                return None
+            self.model.attach_compiled_members(compiled)
+            return compiled_path
+        except Exception as e:
+            self.logger.warning(f"⚠️ コンパイル済みモデル読み込み失敗（元モデルで推論）: {e}")
+            return None
+
+    def _source_digest(self, model_path: Path, manifest: Optional[Dict[str, Any]] = None) -> str:
+        """
+        pickle の SHA-256（Phase 90: 起動時の全読み込みを避ける）
+
+        マニフェスト記録時とサイズ・mtime が一致すれば記録済みの値を使い、pickle を読まない。
+        それ以外は計算し、同じファイル（サイズ・mtime 不変）に対しては再計算しない
+        （アーティファクト照合とコンパイル済みモデル照合で共有）。
+        """
+        stat = Path(model_path).stat()
+        signature = (stat.st_size, stat.st_mtime_ns)
+        cached = self._source_digests.get(str(model_path))
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        if (
+            manifest is not None
+            and manifest.get("source_sha256")
+            and (manifest.get("source_size"), manifest.get("source_mtime_ns")) == signature
+        ):
+            digest = manifest["source_sha256"]
+        else:
+            from ...ml.compiled_trees import file_sha256
+
+            digest = file_sha256(model_path)
+        self._source_digests[str(model_path)] = (signature, digest)
+        return digest
+
+    def _build_model_version(self, paths: List[Path]) -> str:
+        """モデル種別 + 読み込んだファイルの署名 (mtime_ns, size) からバージョン文字列を生成"""
+        signatures = []
+        for path in paths:
+            try:
+                stat = Path(path).stat()
+                signatures.append(f"{stat.st_mtime_ns}-{stat.st_size}")
+            except OSError:
+                continue
+        return f"{self.model_type}:{'/'.join(signatures)}"
+
     def reload_model(self) -> bool:
         """モデル再読み込み"""
         try:
@@ -298,6 +472,7 @@ class MLModelLoader:
             "model_type": self.model_type,
             "is_fitted": self.is_fitted,
             "feature_level": self.feature_level,
+            "model_version": self.model_version,
             "has_predict": hasattr(self.model, "predict") if self.model else False,
             "has_predict_proba": (hasattr(self.model, "predict_proba") if self.model else False),
         }
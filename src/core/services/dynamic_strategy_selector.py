@@ -123,11 +123,10 @@ class DynamicStrategySelector:
         Returns:
             Dict[str, float]: デフォルト戦略重み（全戦略・動的・合計1.0）
         """
-        from ...strategies.strategy_loader import StrategyLoader
+        from ...strategies.strategy_loader import get_strategy_metadata
 
-        # 全戦略を動的取得
-        loader = StrategyLoader()
-        strategies_data = loader.load_strategies()
+        # 全戦略を動的取得（キャッシュ済みメタデータ・設定変更時のみ再ロード）
+        strategies_data = get_strategy_metadata()
 
         # 全戦略を0.0で初期化
         weights = {s["metadata"]["name"]: 0.0 for s in strategies_data}
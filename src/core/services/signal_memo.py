@@ -0,0 +1,212 @@
+"""
+シグナルメモ - 同一足の再トリガーで戦略シグナル・ML予測を再利用
+
+Cloud Scheduler は 5 分間隔で /trigger を呼ぶが判断足は 15 分足のため、同じ足に対して
+最大 3 回（バックテストも backtest.inner_loop_count 回）取引サイクルが実行される。
+(判断足タイムスタンプ, 設定ハッシュ, モデルバージョン) をキーに戦略シグナルと ML 予測を
+保持し、入力（各タイムフレーム特徴量の最新行）が前回と同一なら再計算を省略する。
+入力が 1 値でも変われば（未確定足の価格更新等）ミス扱いとなり、判断結果は変わらない。
+
+- バックテスト・ML学習: メモリのみ（本番状態の混入防止・cross_asset history と同じ方針）
+- ライブ/ペーパー: 最新行が未確定足（トリガー毎に価格が変わる）のため実質ヒットしない。
+  TradingCycleManager は execution.signal_memo.live_enabled（既定 false）の場合のみ使用し、
+  その場合は data/runtime_state/signal_memo.pkl に保存してウォームインスタンスで再利用する
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import pickle
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+
+from ..config import get_thresholds_version, load_thresholds
+from ..logger import CryptoBotLogger, get_logger
+
+MemoKey = Tuple[str, str, str]
+
+_config_hash_cache: Dict[str, Any] = {"version": None, "hash": None}
+
+
+def get_config_hash() -> str:
+    """閾値設定内容のハッシュ（設定バージョンが変わった時のみ再計算）"""
+    version = get_thresholds_version()
+    if _config_hash_cache["version"] != version:
+        payload = json.dumps(load_thresholds(), sort_keys=True, default=str)
+        _config_hash_cache["hash"] = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+        _config_hash_cache["version"] = version
+    return _config_hash_cache["hash"]
+
+
+def compute_input_fingerprint(features: Dict[str, pd.DataFrame]) -> str:
+    """
+    各タイムフレーム特徴量の最新行・行数・列構成から入力フィンガープリントを計算
+
+    戦略・ML は最新行（と確定済みの過去行）を参照するため、
+    最新行と行数が同一なら同じ入力とみなす。
+    """
+    digest = hashlib.sha256()
+    for timeframe in sorted(features):
+        df = features[timeframe]
+        digest.update(str(timeframe).encode("utf-8"))
+        if not isinstance(df, pd.DataFrame) or df.empty:
+            digest.update(b"empty")
+            continue
+        digest.update(f"{len(df)}|{','.join(map(str, df.columns))}".encode("utf-8"))
+        row_hash = pd.util.hash_pandas_object(df.iloc[-1:], index=True)
+        digest.update(row_hash.to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def is_runtime_state_disabled() -> bool:
+    """バックテスト・ML学習時はローカル状態の読み書きを行わない"""
+    return (
+        os.environ.get("BACKTEST_MODE", "").lower() == "true"
+        or os.environ.get("ML_TRAINING_MODE", "").lower() == "true"
+    )
+
+
+class SignalMemo:
+    """判断足単位の戦略シグナル・ML予測メモ（LRU・ローカル永続化）"""
+
+    DEFAULT_PATH = "data/runtime_state/signal_memo.pkl"
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        path: Optional[str] = None,
+        max_entries: int = 4,
+        logger: Optional[CryptoBotLogger] = None,
+    ):
+        """
+        Args:
+            enabled: 無効時は常にミス（保存もしない）
+            path: ローカル永続化ファイル（pickle）
+            max_entries: 保持する判断足の数（古いものから削除）
+            logger: ログシステム
+        """
+        self.enabled = bool(enabled)
+        self.path = Path(path or self.DEFAULT_PATH)
+        self.max_entries = max(1, int(max_entries))
+        self.logger = logger or get_logger()
+        self._entries: "OrderedDict[MemoKey, Dict[str, Any]]" = OrderedDict()
+        self._loaded = False
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(candle_timestamp: Any, model_version: Optional[str]) -> MemoKey:
+        """(判断足タイムスタンプ, 設定ハッシュ, モデルバージョン) のキーを生成"""
+        timestamp = (
+            candle_timestamp.isoformat()
+            if hasattr(candle_timestamp, "isoformat")
+            else str(candle_timestamp)
+        )
+        return timestamp, get_config_hash(), str(model_version or "unknown")
+
+    def get(self, key: MemoKey, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """
+        メモ済み結果を取得
+
+        Returns:
+            {"strategy_signal", "strategy_signals", "ml_prediction"}（呼び出し側で
+            変更されてもメモに影響しないようコピーを返す）。キー・入力不一致時は None
+        """
+        if not self.enabled:
+            return None
+        self._ensure_loaded()
+
+        entry = self._entries.get(key)
+        if entry is None or entry["fingerprint"] != fingerprint:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(
+            {name: entry[name] for name in ("strategy_signal", "strategy_signals", "ml_prediction")}
+        )
+
+    def put(
+        self,
+        key: MemoKey,
+        fingerprint: str,
+        strategy_signal: Any,
+        strategy_signals: Dict[str, Dict[str, float]],
+        ml_prediction: Dict[str, Any],
+    ) -> None:
+        """判断足の戦略シグナル・ML予測を保存（ライブ/ペーパーはローカルファイルにも保存）"""
+        if not self.enabled:
+            return
+        self._ensure_loaded()
+
+        self._entries[key] = {
+            "fingerprint": fingerprint,
+            "strategy_signal": copy.deepcopy(strategy_signal),
+            "strategy_signals": copy.deepcopy(strategy_signals),
+            "ml_prediction": copy.deepcopy(ml_prediction),
+            "stored_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+        if not is_runtime_state_disabled():
+            self._save()
+
+    def clear(self) -> None:
+        """メモをクリア（ローカルファイルも削除）"""
+        self._entries.clear()
+        self._loaded = True
+        if not is_runtime_state_disabled():
+            try:
+                self.path.unlink(missing_ok=True)
+            except OSError as e:
+                self.logger.warning(f"シグナルメモ削除失敗: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """ヒット率等の統計"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def _ensure_loaded(self) -> None:
+        """初回アクセス時にローカルファイルから復元（失敗時は空で開始）"""
+        if self._loaded:
+            return
+        self._loaded = True
+        if is_runtime_state_disabled() or not self.path.exists():
+            return
+
+        try:
+            with self.path.open("rb") as f:
+                state = pickle.load(f)
+            for key, entry in list(state.get("entries", {}).items())[-self.max_entries :]:
+                self._entries[tuple(key)] = entry
+            self.logger.info(f"シグナルメモ復元: {len(self._entries)}足分")
+        except Exception as e:
+            # 復元失敗は致命的でない（再計算されるだけ）
+            self.logger.warning(f"シグナルメモ復元失敗（空で開始）: {e}")
+
+    def _save(self) -> None:
+        """一時ファイル経由でアトミックに保存（失敗は warning のみ）"""
+        tmp = self.path.with_name(f".{self.path.name}.tmp-{os.getpid()}")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp.open("wb") as f:
+                pickle.dump({"entries": dict(self._entries)}, f)
+            os.replace(tmp, self.path)
+        except Exception as e:
+            self.logger.warning(f"シグナルメモ保存失敗: {e}")
+            tmp.unlink(missing_ok=True)
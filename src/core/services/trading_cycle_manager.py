@@ -7,6 +7,7 @@ orchestrator.pyから分離した取引サイクル実行機能。
 
 from __future__ import annotations
 
+import logging
 import time
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
@@ -17,6 +18,7 @@ import pandas as pd
 from ..config import get_threshold
 from ..exceptions import CryptoBotError, ModelLoadError
 from ..logger import CryptoBotLogger
+from .signal_memo import SignalMemo, compute_input_fingerprint, is_runtime_state_disabled
 
 if TYPE_CHECKING:
     from ...strategies.base.strategy_base import StrategySignal
@@ -44,6 +46,20 @@ class TradingCycleManager:
         self._signal_history: list[str] = []  # ["buy", "sell", "hold", ...]
         self._signal_consistency_required = 2  # 必要連続回数
 
+        # 同一足の再トリガー（バックテスト inner loop）で戦略シグナル・ML予測を再利用
+        # ライブ/ペーパーは最新行が未確定足で入力が毎回変わりヒットしないため既定で無効
+        # （無効ならコピー・ローカルファイル書き込みのコストも発生しない）
+        memo_enabled = get_threshold("execution.signal_memo.enabled", True) and (
+            is_runtime_state_disabled()
+            or get_threshold("execution.signal_memo.live_enabled", False)
+        )
+        self.signal_memo = SignalMemo(
+            enabled=memo_enabled,
+            path=get_threshold("execution.signal_memo.path", SignalMemo.DEFAULT_PATH),
+            max_entries=get_threshold("execution.signal_memo.max_entries", 4),
+            logger=logger,
+        )
+
         # Phase 51.3: Dynamic Strategy Selection初期化
         self.dynamic_strategy_selector = None
         self.market_regime_classifier = None
@@ -72,7 +88,8 @@ class TradingCycleManager:
         import os
 
         if os.environ.get("BACKTEST_MODE") == "true":
-            self.logger.debug(f"取引サイクル開始 - ID: {cycle_id}")
+            if self.logger.is_enabled_for(logging.DEBUG):
+                self.logger.debug(f"取引サイクル開始 - ID: {cycle_id}")
         else:
             self.logger.info(f"取引サイクル開始 - ID: {cycle_id}")
 
@@ -95,11 +112,21 @@ class TradingCycleManager:
             # Phase 51.3: 動的戦略選択（レジーム分類 → 戦略重み更新）
             await self._apply_dynamic_strategy_selection(main_features)
 
-            # Phase 4: 戦略評価（Phase 31: マルチタイムフレーム対応）
-            strategy_signal = await self._evaluate_strategy(main_features, features)
+            # 同一足・同一入力の再トリガーはメモ済みの戦略シグナル・ML予測を再利用
+            memo_key, memo_fingerprint = self._get_signal_memo_key(features, main_features)
+            memoized = self.signal_memo.get(memo_key, memo_fingerprint) if memo_key else None
 
-            # Phase 41: 個別戦略シグナル取得
-            strategy_signals = await self._get_individual_strategy_signals(main_features, features)
+            if memoized is not None:
+                strategy_signal = memoized["strategy_signal"]
+                strategy_signals = memoized["strategy_signals"]
+                if self.logger.is_enabled_for(logging.INFO):
+                    self.logger.info(f"♻️ シグナルメモ使用: 判断足={memo_key[0]}")
+            else:
+                # Phase 4: 戦略評価（Phase 31: マルチタイムフレーム対応）
+                # Phase 41: 個別戦略シグナルも同じ評価結果から取得（全戦略の実行はサイクル内 1 回）
+                strategy_signal, strategy_signals = await self._evaluate_strategy(
+                    main_features, features
+                )
 
             # Phase 49.8: 診断ログ削除（根本原因修正完了）
 
@@ -110,7 +137,14 @@ class TradingCycleManager:
                 )
 
             # Phase 5: ML予測（Phase 77: 37特徴量対応 / Phase 89-β: 47特徴量）
-            ml_prediction = await self._get_ml_prediction(main_features)
+            if memoized is not None:
+                ml_prediction = memoized["ml_prediction"]
+            else:
+                ml_prediction = await self._get_ml_prediction(main_features)
+                if memo_key and self._is_memoizable(strategy_signals, ml_prediction):
+                    self.signal_memo.put(
+                        memo_key, memo_fingerprint, strategy_signal, strategy_signals, ml_prediction
+                    )
 
             # Phase 89-β: Drift 検出（特徴量分布の急変を検知）
             ml_health = getattr(self.orchestrator.ml_service, "ml_health_monitor", None)
@@ -157,6 +191,35 @@ class TradingCycleManager:
         except Exception as e:
             await self._handle_unexpected_error(e, cycle_id)
 
+    def _get_signal_memo_key(self, features, main_features):
+        """
+        シグナルメモのキー（判断足タイムスタンプ, 設定ハッシュ, モデルバージョン）と
+        入力フィンガープリントを取得（メモ無効・特徴量なしの場合は (None, None)）
+        """
+        if not self.signal_memo.enabled or main_features is None or main_features.empty:
+            return None, None
+        try:
+            model_version = getattr(self.orchestrator.ml_service, "model_version", None)
+            key = self.signal_memo.make_key(main_features.index[-1], model_version)
+            return key, compute_input_fingerprint(features)
+        except Exception as e:
+            self.logger.warning(f"シグナルメモキー生成失敗（メモ不使用）: {e}")
+            return None, None
+
+    @staticmethod
+    def _is_memoizable(strategy_signals, ml_prediction) -> bool:
+        """
+        メモ保存可否（戦略評価・ML予測が成功した結果のみ保存）
+
+        ML予測エラー時のフォールバック値（n_classes なし）は一時的な失敗の可能性が
+        あるため保存せず、次のトリガーで再予測する（バックテストは事前計算値を使用）。
+        """
+        if not strategy_signals or not isinstance(ml_prediction, dict):
+            return False
+        import os
+
+        return "n_classes" in ml_prediction or os.environ.get("BACKTEST_MODE") == "true"
+
     async def _fetch_market_data(self):
         """Phase 2: データ取得"""
         try:
@@ -169,8 +232,13 @@ class TradingCycleManager:
             return None
 
     async def _generate_features(self, market_data):
-        """Phase 3: 特徴量生成（型安全性強化）"""
+        """Phase 3: 特徴量生成（型安全性強化）
+
+        生成が必要なタイムフレームは feature_service.generate_features_multi() で並列生成する
+        （pandas 計算はスレッドプールで実行・結果は逐次生成と同一・features.parallel で制御）。
+        """
         features = {}
+        pending = {}
 
         for timeframe, df in market_data.items():
             try:
@@ -190,30 +258,30 @@ class TradingCycleManager:
                     if all(col in df.columns for col in required_features):
                         # 既に特徴量が計算済み（事前計算データ）
                         features[timeframe] = df
-                        self.logger.debug(f"✅ {timeframe}事前計算済み特徴量使用（Phase 35最適化）")
+                        if self.logger.is_enabled_for(logging.DEBUG):
+                            self.logger.debug(
+                                f"✅ {timeframe}事前計算済み特徴量使用（Phase 35最適化）"
+                            )
                     else:
                         # Phase 50.8: Level 1→Level 2フォールバック実装
                         # Phase 50.9: 62特徴量固定システム（外部API削除）
-                        features[timeframe] = (
-                            await self.orchestrator.feature_service.generate_features(df)
-                        )
+                        features[timeframe] = None  # 生成後に設定（タイムフレーム順を維持）
+                        pending[timeframe] = df
                 else:
                     self.logger.warning(f"空のDataFrame検出: {timeframe}")
                     features[timeframe] = pd.DataFrame()
-
-            except (KeyError, ValueError) as e:
-                self.logger.error(f"特徴量データエラー: {timeframe}, エラー: {e}")
-                features[timeframe] = pd.DataFrame()
-            except AttributeError as e:
-                self.logger.error(f"特徴量メソッドエラー: {timeframe}, エラー: {e}")
-                features[timeframe] = pd.DataFrame()
-            except (ImportError, ModuleNotFoundError) as e:
-                self.logger.error(f"特徴量生成ライブラリエラー: {timeframe}, エラー: {e}")
-                features[timeframe] = pd.DataFrame()
             except Exception as e:
-                self.logger.critical(f"特徴量生成予期しないエラー: {timeframe}, エラー: {e}")
+                self._log_feature_generation_error(timeframe, e)
                 features[timeframe] = pd.DataFrame()
 
+        if pending:
+            for timeframe, result in (await self._generate_pending_features(pending)).items():
+                if isinstance(result, Exception):
+                    self._log_feature_generation_error(timeframe, result)
+                    features[timeframe] = pd.DataFrame()
+                else:
+                    features[timeframe] = result
+
         # 設定からメインタイムフレームを取得
         from ..config import get_data_config
 
@@ -221,18 +289,71 @@ class TradingCycleManager:
         main_features = features.get(main_timeframe, pd.DataFrame())
         return features, main_features
 
+    async def _generate_pending_features(self, pending):
+        """未計算タイムフレームの特徴量生成（{timeframe: DataFrame または例外}）"""
+        feature_service = self.orchestrator.feature_service
+        if hasattr(type(feature_service), "generate_features_multi"):
+            return await feature_service.generate_features_multi(pending)
+
+        results = {}
+        for timeframe, df in pending.items():
+            try:
+                results[timeframe] = await feature_service.generate_features(df)
+            except Exception as e:
+                results[timeframe] = e
+        return results
+
+    def _log_feature_generation_error(self, timeframe, error):
+        """特徴量生成エラーの種別毎ログ出力"""
+        if isinstance(error, (KeyError, ValueError)):
+            self.logger.error(f"特徴量データエラー: {timeframe}, エラー: {error}")
+        elif isinstance(error, AttributeError):
+            self.logger.error(f"特徴量メソッドエラー: {timeframe}, エラー: {error}")
+        elif isinstance(error, (ImportError, ModuleNotFoundError)):
+            self.logger.error(f"特徴量生成ライブラリエラー: {timeframe}, エラー: {error}")
+        else:
+            self.logger.critical(f"特徴量生成予期しないエラー: {timeframe}, エラー: {error}")
+
     async def _evaluate_strategy(self, main_features, all_features):
-        """Phase 4: 戦略評価（Phase 31: マルチタイムフレーム対応）"""
+        """
+        Phase 4: 戦略評価（Phase 31: マルチタイムフレーム対応）
+
+        全戦略を 1 回だけ実行し、統合シグナルと Phase 41 の個別戦略シグナル
+        （ML特徴量用）を同じ評価結果から返す。
+
+        Args:
+            main_features: メインタイムフレーム特徴量
+            all_features: 全タイムフレーム特徴量
+
+        Returns:
+            tuple: (統合シグナル, 個別戦略シグナル辞書)
+                個別戦略シグナル例:
+                {"ATRBased": {"action": "buy", "confidence": 0.678, "encoded": 0.678}}
+        """
         try:
             if not main_features.empty:
                 # Phase 31: all_featuresをmulti_timeframe_dataとして渡す
-                return self.orchestrator.strategy_service.analyze_market(
-                    main_features, multi_timeframe_data=all_features
+                strategy_signal, strategy_signals = (
+                    self.orchestrator.strategy_service.analyze_market_with_signals(
+                        main_features, multi_timeframe_data=all_features
+                    )
                 )
+                if strategy_signals:
+                    if self.logger.is_enabled_for(logging.INFO):
+                        self.logger.info(
+                            f"✅ Phase 41: 個別戦略シグナル取得完了 - {len(strategy_signals)}戦略"
+                        )
+                else:
+                    self.logger.warning("Phase 41: 個別戦略シグナルが空です")
+                return strategy_signal, strategy_signals
             else:
                 # 空のDataFrameの場合はHOLDシグナル
-                return self.orchestrator.strategy_service._create_hold_signal(
-                    pd.DataFrame(), "データ不足"
+                self.logger.debug("Phase 41: 特徴量不足により個別戦略シグナル取得スキップ")
+                return (
+                    self.orchestrator.strategy_service._create_hold_signal(
+                        pd.DataFrame(), "データ不足"
+                    ),
+                    {},
                 )
         except Exception as e:
             # Phase 35: バックテストモード時はDEBUGレベル（環境変数直接チェック）
@@ -242,8 +363,11 @@ class TradingCycleManager:
                 self.logger.debug(f"戦略評価エラー: {e}")
             else:
                 self.logger.error(f"戦略評価エラー: {e}")
-            return self.orchestrator.strategy_service._create_hold_signal(
-                pd.DataFrame(), f"戦略評価エラー: {e}"
+            return (
+                self.orchestrator.strategy_service._create_hold_signal(
+                    pd.DataFrame(), f"戦略評価エラー: {e}"
+                ),
+                {},
             )
 
     async def _apply_dynamic_strategy_selection(self, main_features: pd.DataFrame):
@@ -280,10 +404,11 @@ class TradingCycleManager:
             if regime_weights:
                 # 通常レジーム: 戦略重み適用
                 self.orchestrator.strategy_service.update_strategy_weights(regime_weights)
-                self.logger.info(
-                    f"✅ Phase 51.3: 戦略重み更新完了 - レジーム={regime.value}, "
-                    f"戦略数={len(regime_weights)}"
-                )
+                if self.logger.is_enabled_for(logging.INFO):
+                    self.logger.info(
+                        f"✅ Phase 51.3: 戦略重み更新完了 - レジーム={regime.value}, "
+                        f"戦略数={len(regime_weights)}"
+                    )
             else:
                 # 高ボラティリティ: 全戦略無効化（待機モード）
                 # 注: 空辞書を渡すと全戦略が無効化される想定だが、
@@ -302,44 +427,6 @@ class TradingCycleManager:
             self.logger.error(f"Phase 51.3: 動的戦略選択エラー: {e} - 固定重み継続使用")
             # エラー時は既存の重みを維持（何もしない）
 
-    async def _get_individual_strategy_signals(self, main_features, all_features):
-        """
-        Phase 41: 個別戦略シグナル取得（ML特徴量用）
-
-        各戦略の個別判断を取得し、ML特徴量として使用するための
-        エンコードされたシグナルを返します。
-
-        Args:
-            main_features: メインタイムフレーム特徴量
-            all_features: 全タイムフレーム特徴量
-
-        Returns:
-            Dict: 個別戦略シグナル辞書
-                例: {"ATRBased": {"action": "buy", "confidence": 0.678, "encoded": 0.678}}
-        """
-        try:
-            if main_features.empty:
-                self.logger.debug("Phase 41: 特徴量不足により個別戦略シグナル取得スキップ")
-                return {}
-
-            # StrategyManager.get_individual_strategy_signals() を呼び出し
-            strategy_signals = self.orchestrator.strategy_service.get_individual_strategy_signals(
-                main_features, multi_timeframe_data=all_features
-            )
-
-            if strategy_signals:
-                self.logger.info(
-                    f"✅ Phase 41: 個別戦略シグナル取得完了 - {len(strategy_signals)}戦略"
-                )
-                return strategy_signals
-            else:
-                self.logger.warning("Phase 41: 個別戦略シグナルが空です")
-                return {}
-
-        except Exception as e:
-            self.logger.error(f"Phase 41: 個別戦略シグナル取得エラー: {e}")
-            return {}
-
     async def _add_strategy_signal_features(self, main_features, strategy_signals):
         """
         Phase 41: 戦略シグナル特徴量追加
@@ -369,10 +456,11 @@ class TradingCycleManager:
                 updated_count = len(updated_features.columns)
                 added_count = updated_count - original_count
 
-                self.logger.info(
-                    f"✅ Phase 41: 戦略シグナル特徴量追加完了 - "
-                    f"{original_count}→{updated_count}特徴量（+{added_count}個）"
-                )
+                if self.logger.is_enabled_for(logging.INFO):
+                    self.logger.info(
+                        f"✅ Phase 41: 戦略シグナル特徴量追加完了 - "
+                        f"{original_count}→{updated_count}特徴量（+{added_count}個）"
+                    )
                 return updated_features
             else:
                 self.logger.warning("Phase 41: 特徴量追加失敗 - 元の特徴量を使用")
@@ -391,10 +479,11 @@ class TradingCycleManager:
             if os.environ.get("BACKTEST_MODE") == "true":
                 cached_prediction = self.orchestrator.data_service.get_backtest_ml_prediction()
                 if cached_prediction:
-                    self.logger.debug(
-                        f"✅ ML予測キャッシュ使用: prediction={cached_prediction['prediction']}, "
-                        f"confidence={cached_prediction['confidence']:.3f}"
-                    )
+                    if self.logger.is_enabled_for(logging.DEBUG):
+                        self.logger.debug(
+                            f"✅ ML予測キャッシュ使用: prediction={cached_prediction['prediction']}, "
+                            f"confidence={cached_prediction['confidence']:.3f}"
+                        )
                     return cached_prediction
 
             if not main_features.empty:
@@ -427,25 +516,34 @@ class TradingCycleManager:
                         )
                     elif strategy_signal_features:
                         # 戦略シグナル特徴量のみが不足している場合はDEBUGレベル（Phase 41で追加予定）
-                        self.logger.debug(
-                            f"Phase 41: 戦略シグナル特徴量は後で追加されます（{len(strategy_signal_features)}個）"
-                        )
-
-                main_features_for_ml = main_features[available_features]
-                self.logger.debug(f"ML予測用特徴量選択完了: {main_features_for_ml.shape}")
+                        if self.logger.is_enabled_for(logging.DEBUG):
+                            self.logger.debug(
+                                f"Phase 41: 戦略シグナル特徴量は後で追加されます（{len(strategy_signal_features)}個）"
+                            )
 
                 # Phase 50.8: 特徴量数に応じた正しいモデルを確保
-                actual_feature_count = len(main_features_for_ml.columns)
+                actual_feature_count = len(available_features)
                 if not self.orchestrator.ml_service.ensure_correct_model(actual_feature_count):
                     self.logger.warning(
                         f"⚠️ Phase 50.8: モデルロード失敗（{actual_feature_count}特徴量） - "
                         "フォールバック処理継続"
                     )
 
-                # ML予測と信頼度を同時取得
+                # Phase 90: 使用するのは最終行の予測のみのため、最終行 + モデルの
+                # 必要過去行数だけを切り出して特徴量選択・推論する（不明時は全行）
+                inference_rows = self.orchestrator.ml_service.get_inference_rows()
+                if isinstance(inference_rows, int) and 0 < inference_rows < len(main_features):
+                    main_features = main_features.iloc[-inference_rows:]
+
+                main_features_for_ml = main_features[available_features]
+                if self.logger.is_enabled_for(logging.DEBUG):
+                    self.logger.debug(f"ML予測用特徴量選択完了: {main_features_for_ml.shape}")
+
+                # ML予測と信頼度を同時取得（Phase 90: アンサンブル推論 1 回）
                 self.logger.info("🤖 ML予測実行開始: ProductionEnsemble予測中")
-                ml_predictions_array = self.orchestrator.ml_service.predict(main_features_for_ml)
-                ml_probabilities = self.orchestrator.ml_service.predict_proba(main_features_for_ml)
+                ml_predictions_array, ml_probabilities = (
+                    self.orchestrator.ml_service.predict_with_proba(main_features_for_ml)
+                )
 
                 # Phase 87 Stage 2-R1 (C4 閉ループ): ML サーキットブレーカー判定
                 # ml_service.ml_health_monitor が連続失敗閾値に到達したら EMERGENCY_STOP へ
@@ -467,8 +565,8 @@ class TradingCycleManager:
                     from ..orchestration.ml_confidence import get_predicted_class_proba
 
                     _, confidence = get_predicted_class_proba(ml_probabilities)
-                    # ml_predictions_array は ml_service.predict() の出力
-                    # （理論上 argmax(probabilities) と一致する）
+                    # ml_predictions_array は ml_service.predict() と同一
+                    # （ProductionEnsemble では argmax(probabilities)）
                     prediction = int(ml_predictions_array[-1])
                     import numpy as np  # n_classes 算出で利用
 
@@ -483,9 +581,10 @@ class TradingCycleManager:
                         label_map = {0: "売り", 1: "保持", 2: "買い"}
                     pred_label = label_map.get(prediction, "不明")
 
-                    self.logger.info(
-                        f"✅ ML予測完了: prediction={pred_label}, confidence={confidence:.3f}"
-                    )
+                    if self.logger.is_enabled_for(logging.INFO):
+                        self.logger.info(
+                            f"✅ ML予測完了: prediction={pred_label}, confidence={confidence:.3f}"
+                        )
 
                     return {
                         "prediction": prediction,
@@ -517,9 +616,10 @@ class TradingCycleManager:
             execution_service = getattr(self.orchestrator, "execution_service", None)
             if execution_service and execution_service.mode == "backtest":
                 actual_balance = execution_service.virtual_balance
-                self.logger.debug(
-                    f"Phase 57.6: バックテストモード - virtual_balance使用: ¥{actual_balance:,.0f}"
-                )
+                if self.logger.is_enabled_for(logging.DEBUG):
+                    self.logger.debug(
+                        f"Phase 57.6: バックテストモード - virtual_balance使用: ¥{actual_balance:,.0f}"
+                    )
             else:
                 # 現在の残高取得（ライブ/ペーパーモード）
                 balance_info = self.orchestrator.data_service.client.fetch_balance()
@@ -530,10 +630,11 @@ class TradingCycleManager:
             if capital_limit and capital_limit > 0:
                 current_balance = min(actual_balance, capital_limit)
                 if actual_balance > capital_limit:
-                    self.logger.debug(
-                        f"Phase 56.6: 資金アロケーション上限適用 - "
-                        f"実残高: ¥{actual_balance:,.0f} → 計算用: ¥{current_balance:,.0f}"
-                    )
+                    if self.logger.is_enabled_for(logging.DEBUG):
+                        self.logger.debug(
+                            f"Phase 56.6: 資金アロケーション上限適用 - "
+                            f"実残高: ¥{actual_balance:,.0f} → 計算用: ¥{current_balance:,.0f}"
+                        )
             else:
                 current_balance = actual_balance
 
@@ -545,10 +646,11 @@ class TradingCycleManager:
             bid = ticker_info.get("bid", 0.0)
             ask = ticker_info.get("ask", 0.0)
 
-            self.logger.debug(
-                f"取引情報取得 - 残高: ¥{current_balance:,.0f}, bid: ¥{bid:,.0f}, "
-                f"ask: ¥{ask:,.0f}, API遅延: {api_latency_ms:.1f}ms"
-            )
+            if self.logger.is_enabled_for(logging.DEBUG):
+                self.logger.debug(
+                    f"取引情報取得 - 残高: ¥{current_balance:,.0f}, bid: ¥{bid:,.0f}, "
+                    f"ask: ¥{ask:,.0f}, API遅延: {api_latency_ms:.1f}ms"
+                )
 
             return {
                 "current_balance": current_balance,
@@ -805,10 +907,11 @@ class TradingCycleManager:
 
                 # レジーム別設定が存在する場合のみログ出力
                 if min_ml_confidence is not None:
-                    self.logger.info(
-                        f"📊 Phase 51.9: レジーム別ML統合適用 - regime={regime}, "
-                        f"min_conf={min_ml_confidence:.2f}, ml_weight={ml_weight:.2f}"
-                    )
+                    if self.logger.is_enabled_for(logging.INFO):
+                        self.logger.info(
+                            f"📊 Phase 51.9: レジーム別ML統合適用 - regime={regime}, "
+                            f"min_conf={min_ml_confidence:.2f}, ml_weight={ml_weight:.2f}"
+                        )
             else:
                 # Phase 51.9無効 or レジーム不明時はデフォルト設定使用
                 min_ml_confidence = None
@@ -836,9 +939,10 @@ class TradingCycleManager:
             ml_confidence = ml_prediction.get("confidence", 0.0)
 
             if ml_confidence < min_ml_confidence:
-                self.logger.info(
-                    f"ML信頼度不足 ({ml_confidence:.3f} < {min_ml_confidence:.3f}) - 戦略シグナルのみ使用"
-                )
+                if self.logger.is_enabled_for(logging.INFO):
+                    self.logger.info(
+                        f"ML信頼度不足 ({ml_confidence:.3f} < {min_ml_confidence:.3f}) - 戦略シグナルのみ使用"
+                    )
                 return strategy_signal
 
             # Phase 73-B: クラス数に応じた動的アクションマッピング
@@ -939,7 +1043,8 @@ class TradingCycleManager:
             else:
                 # ML信頼度が高くない場合は加重平均のみ
                 adjusted_confidence = base_confidence
-                self.logger.debug(f"📊 ML通常統合（加重平均のみ）: {base_confidence:.3f}")
+                if self.logger.is_enabled_for(logging.DEBUG):
+                    self.logger.debug(f"📊 ML通常統合（加重平均のみ）: {base_confidence:.3f}")
 
             # Phase 65.16: ML Signal Recovery
             # 戦略がHOLD → MLが方向性を持つ → 個別戦略が1つでも同方向 → HOLDオーバーライド
@@ -1040,9 +1145,10 @@ class TradingCycleManager:
             if decision_value == "approved" or (
                 hasattr(decision_value, "value") and decision_value.value == "approved"
             ):
-                self.logger.debug(
-                    f"取引実行開始 - サイクル: {cycle_id}, アクション: {getattr(trade_evaluation, 'side', 'unknown')}"
-                )
+                if self.logger.is_enabled_for(logging.DEBUG):
+                    self.logger.debug(
+                        f"取引実行開始 - サイクル: {cycle_id}, アクション: {getattr(trade_evaluation, 'side', 'unknown')}"
+                    )
 
                 # Phase 8a-1: 取引直前最終検証（口座残高使い切り防止・追加安全チェック）
                 pre_execution_check = await self._pre_execution_verification(
@@ -1080,13 +1186,15 @@ class TradingCycleManager:
                 reason = getattr(trade_evaluation, "denial_reasons", ["理由不明"])
 
                 if side.lower() in ["hold", "none"]:
-                    self.logger.info(
-                        f"📤 holdシグナル処理 - サイクル: {cycle_id}, アクション: {side}, 判定: {decision}"
-                    )
+                    if self.logger.is_enabled_for(logging.INFO):
+                        self.logger.info(
+                            f"📤 holdシグナル処理 - サイクル: {cycle_id}, アクション: {side}, 判定: {decision}"
+                        )
                 else:
-                    self.logger.debug(
-                        f"取引未承認 - サイクル: {cycle_id}, 決定: {decision}, アクション: {side}, 理由: {reason}"
-                    )
+                    if self.logger.is_enabled_for(logging.DEBUG):
+                        self.logger.debug(
+                            f"取引未承認 - サイクル: {cycle_id}, 決定: {decision}, アクション: {side}, 理由: {reason}"
+                        )
                 await self.orchestrator.trading_logger.log_trade_decision(
                     trade_evaluation, cycle_id
                 )
@@ -1277,11 +1385,12 @@ class TradingCycleManager:
 
         # ログ出力（既存の Phase 73-D ログ文言を維持しつつ regime 情報を追加）
         if result.verdict == "accept":
-            self.logger.info(
-                f"✅ Phase 73-D/87-H10: 品質フィルタ通過 - "
-                f"{strategy_signal.action.upper()} 信頼度={ml_confidence:.3f} "
-                f"(>={result.thresholds_used['accept_threshold']:.3f}) regime={regime}"
-            )
+            if self.logger.is_enabled_for(logging.INFO):
+                self.logger.info(
+                    f"✅ Phase 73-D/87-H10: 品質フィルタ通過 - "
+                    f"{strategy_signal.action.upper()} 信頼度={ml_confidence:.3f} "
+                    f"(>={result.thresholds_used['accept_threshold']:.3f}) regime={regime}"
+                )
         elif result.verdict == "reject":
             self.logger.warning(
                 f"🚫 Phase 73-D/87-H10: 品質フィルタ拒否 - "
@@ -1291,12 +1400,13 @@ class TradingCycleManager:
                 f"regime={regime})"
             )
         else:  # uncertain
-            self.logger.info(
-                f"📊 Phase 73-D/87-H10: 品質フィルタ中間 - "
-                f"{strategy_signal.action.upper()} 信頼度縮小 "
-                f"factor={result.adjusted_confidence_factor} "
-                f"(ML={ml_pred}, conf={ml_confidence:.3f}, regime={regime})"
-            )
+            if self.logger.is_enabled_for(logging.INFO):
+                self.logger.info(
+                    f"📊 Phase 73-D/87-H10: 品質フィルタ中間 - "
+                    f"{strategy_signal.action.upper()} 信頼度縮小 "
+                    f"factor={result.adjusted_confidence_factor} "
+                    f"(ML={ml_pred}, conf={ml_confidence:.3f}, regime={regime})"
+                )
 
         return apply_to_signal(result, strategy_signal)
 
@@ -1334,10 +1444,11 @@ class TradingCycleManager:
             # 一貫性チェック: 直近N回の非holdシグナルが同方向かどうか
             required = self._signal_consistency_required
             if len(self._signal_history) < required:
-                self.logger.info(
-                    f"📊 Phase 70: シグナル履歴不足 "
-                    f"({len(self._signal_history)}/{required}回) → エントリー保留"
-                )
+                if self.logger.is_enabled_for(logging.INFO):
+                    self.logger.info(
+                        f"📊 Phase 70: シグナル履歴不足 "
+                        f"({len(self._signal_history)}/{required}回) → エントリー保留"
+                    )
                 trade_evaluation.decision = RiskDecision.DENIED
                 trade_evaluation.denial_reasons.append(
                     f"Phase 70: シグナル履歴不足（{len(self._signal_history)}/{required}回）"
@@ -1346,18 +1457,21 @@ class TradingCycleManager:
 
             recent = self._signal_history[-required:]
             if not all(s == side.lower() for s in recent):
-                self.logger.info(
-                    f"📊 Phase 70: シグナル不一致 → エントリー保留 " f"(履歴={recent}, 現在={side})"
-                )
+                if self.logger.is_enabled_for(logging.INFO):
+                    self.logger.info(
+                        f"📊 Phase 70: シグナル不一致 → エントリー保留 "
+                        f"(履歴={recent}, 現在={side})"
+                    )
                 trade_evaluation.decision = RiskDecision.DENIED
                 trade_evaluation.denial_reasons.append(
                     f"Phase 70: シグナル一貫性不足（直近{required}回不一致: {recent}）"
                 )
                 return trade_evaluation
 
-            self.logger.info(
-                f"✅ Phase 70: シグナル一貫性確認 ({required}回連続{side}) → エントリー許可"
-            )
+            if self.logger.is_enabled_for(logging.INFO):
+                self.logger.info(
+                    f"✅ Phase 70: シグナル一貫性確認 ({required}回連続{side}) → エントリー許可"
+                )
             return trade_evaluation
 
         except Exception as e:
@@ -1379,7 +1493,8 @@ class TradingCycleManager:
             Dict: {"allowed": bool, "reason": str, "additional_info": dict}
         """
         try:
-            self.logger.debug(f"🔍 取引直前最終検証開始 - サイクル: {cycle_id}")
+            if self.logger.is_enabled_for(logging.DEBUG):
+                self.logger.debug(f"🔍 取引直前最終検証開始 - サイクル: {cycle_id}")
 
             # 1. 基本情報確認
             side = getattr(trade_evaluation, "side", "unknown")
@@ -1411,7 +1526,8 @@ class TradingCycleManager:
                     "reason": f"システム健全性問題: {health_status.get('issue', '不明')}",
                 }
 
-            self.logger.debug(f"✅ 取引直前最終検証通過 - サイクル: {cycle_id}")
+            if self.logger.is_enabled_for(logging.DEBUG):
+                self.logger.debug(f"✅ 取引直前最終検証通過 - サイクル: {cycle_id}")
 
             return {
                 "allowed": True,
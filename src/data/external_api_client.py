@@ -7,20 +7,29 @@
 
 設計方針:
 - fail-open: API 失敗時は last-known-good または 0.0 を返し、bot を停止させない
-- TTL キャッシュ: 5 分（300 秒）デフォルト・連続呼び出しの API 負荷削減
+- TTL キャッシュ: ソース毎の TTL（features.external_api.sources.<source>.ttl_seconds）
+- stale-while-revalidate: TTL 切れ後も stale_seconds 以内なら前回値を即返し、
+  バックグラウンドで再取得（取引サイクルは外部 API の応答を待たない）
+- 取得予算: キャッシュが無い初回取得もソース毎の budget_seconds で打ち切り、fallback を返す
+  （打ち切った取得はバックグラウンドで継続し、次回サイクルのキャッシュになる）
 - 設定駆動: thresholds.yaml の features.external_api セクションから動的取得
 """
 
 import asyncio
 import threading
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
 
 import aiohttp
 
 from ..core.config.threshold_manager import get_threshold
 from ..core.logger import get_logger
 
+T = TypeVar("T")
+
+# 取得ソース名（features.external_api.sources.<ソース名> で TTL・stale・予算を個別設定）
+EXTERNAL_SOURCES: Tuple[str, ...] = ("funding_rate", "fear_greed", "eth_ticker")
+
 
 class ExternalAPIClient:
     """無料外部 API（Binance Funding / Alternative.me Fear&Greed）の非同期取得."""
@@ -65,12 +74,29 @@ class ExternalAPIClient:
             "features.external_api.fear_greed_url", "https://api.alternative.me/fng/"
         )
 
+        # ソース毎の TTL・stale 許容秒数・取得予算（未設定は共通値）
+        self.source_ttl: Dict[str, float] = {}
+        self.source_stale: Dict[str, float] = {}
+        self.source_budget: Dict[str, float] = {}
+        budget_default = get_threshold("features.external_api.budget_seconds", 2.0)
+        for source in EXTERNAL_SOURCES:
+            prefix = f"features.external_api.sources.{source}"
+            self.source_ttl[source] = (
+                cache_ttl_seconds
+                if cache_ttl_seconds is not None
+                else get_threshold(f"{prefix}.ttl_seconds", self.cache_ttl)
+            )
+            self.source_stale[source] = get_threshold(f"{prefix}.stale_seconds", 0)
+            self.source_budget[source] = get_threshold(f"{prefix}.budget_seconds", budget_default)
+
         self._cache: Dict[str, Tuple[float, datetime]] = {}
         self._last_known_good: Dict[str, float] = {}
         # P1-2: dict 型キャッシュ専用ストレージ（ticker 等）。float cache との二重管理を解消。
         self._dict_cache: Dict[str, Tuple[Dict[str, Any], datetime]] = {}
         self._last_known_good_dict: Dict[str, Dict[str, Any]] = {}
         self._lock = threading.RLock()
+        # 実行中のバックグラウンド取得（キャッシュキー → Task・同一キーの重複取得を防ぐ）
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
 
     async def fetch_funding_rate(self, symbol: str = "BTCUSDT", limit: int = 24) -> float:
         """
@@ -87,7 +113,16 @@ class ExternalAPIClient:
         cached = self._get_cached(cache_key)
         if cached is not None:
             return cached
+        return await self._fetch_or_revalidate(
+            "funding_rate",
+            cache_key,
+            lambda: self._request_funding_rate(cache_key, symbol, limit),
+            self._get_stale(cache_key, "funding_rate"),
+            lambda: self._fallback(cache_key),
+        )
 
+    async def _request_funding_rate(self, cache_key: str, symbol: str, limit: int) -> float:
+        """Binance Funding Rate の HTTP 取得本体（成功時はキャッシュに保存）."""
         params = {"symbol": symbol, "limit": limit}
         try:
             async with aiohttp.ClientSession(timeout=self.timeout) as session:
@@ -106,7 +141,7 @@ class ExternalAPIClient:
                 return self._fallback(cache_key)
 
             avg = sum(rates) / len(rates)
-            self._put_cache(cache_key, avg)
+            self._put_cache(cache_key, avg, self.source_ttl["funding_rate"])
             return avg
 
         except (aiohttp.ClientError, asyncio.TimeoutError) as e:
@@ -129,7 +164,17 @@ class ExternalAPIClient:
         cached = self._get_cached_dict(cache_key)
         if cached is not None:
             return cached
+        return await self._fetch_or_revalidate(
+            "eth_ticker",
+            cache_key,
+            self._request_eth_jpy_ticker,
+            self._get_stale_dict(cache_key, "eth_ticker"),
+            self._fallback_eth_ticker,
+        )
 
+    async def _request_eth_jpy_ticker(self) -> Dict[str, float]:
+        """bitbank ETH/JPY ticker の HTTP 取得本体（成功時はキャッシュに保存）."""
+        cache_key = "eth_jpy_ticker"
         url = "https://public.bitbank.cc/eth_jpy/ticker"
         try:
             async with aiohttp.ClientSession(timeout=self.timeout) as session:
@@ -151,7 +196,7 @@ class ExternalAPIClient:
                 "volume": float(data.get("vol", 0.0) or 0.0),
             }
             # P1-2: dict 専用キャッシュで一元化（旧二重管理を解消）
-            self._put_cache_dict(cache_key, result)
+            self._put_cache_dict(cache_key, result, self.source_ttl["eth_ticker"])
             return result
 
         except (aiohttp.ClientError, asyncio.TimeoutError) as e:
@@ -181,7 +226,17 @@ class ExternalAPIClient:
         cached = self._get_cached(cache_key)
         if cached is not None:
             return cached
+        return await self._fetch_or_revalidate(
+            "fear_greed",
+            cache_key,
+            self._request_fear_greed_index,
+            self._get_stale(cache_key, "fear_greed"),
+            lambda: self._fallback(cache_key),
+        )
 
+    async def _request_fear_greed_index(self) -> float:
+        """Alternative.me Fear & Greed Index の HTTP 取得本体（成功時はキャッシュに保存）."""
+        cache_key = "fear_greed"
         try:
             async with aiohttp.ClientSession(timeout=self.timeout) as session:
                 async with session.get(self.fear_greed_url, params={"limit": 1}) as resp:
@@ -196,7 +251,7 @@ class ExternalAPIClient:
 
             value_str = data["data"][0].get("value", "50")
             value = float(value_str) / 100.0  # 0-100 → 0.0-1.0
-            self._put_cache(cache_key, value)
+            self._put_cache(cache_key, value, self.source_ttl["fear_greed"])
             return value
 
         except (aiohttp.ClientError, asyncio.TimeoutError) as e:
@@ -206,6 +261,69 @@ class ExternalAPIClient:
             self.logger.warning(f"Fear & Greed 応答解析失敗: {e} → fallback")
             return self._fallback(cache_key)
 
+    async def _fetch_or_revalidate(
+        self,
+        source: str,
+        cache_key: str,
+        request: Callable[[], Awaitable[T]],
+        stale: Optional[T],
+        fallback: Callable[[], T],
+    ) -> T:
+        """
+        TTL 切れ・未取得時の取得（stale-while-revalidate + 取得予算）.
+
+        stale 値があれば即返してバックグラウンドで再取得する。無ければ取得予算
+        （source_budget）まで待ち、超過時は fallback を返して取得はバックグラウンドで継続する。
+
+        Args:
+            source: ソース名（EXTERNAL_SOURCES）
+            cache_key: キャッシュキー（同一キーのバックグラウンド取得は 1 件まで）
+            request: HTTP 取得コルーチン関数（失敗時は自身で fallback を返す）
+            stale: stale 許容時間内の前回値（無ければ None）
+            fallback: 予算超過時の値
+
+        Returns:
+            取得値・stale 値・fallback 値のいずれか
+        """
+        if stale is not None:
+            self._refresh_in_background(cache_key, request)
+            return stale
+
+        task = self._refresh_tasks.get(cache_key)
+        if task is None or task.done():
+            task = asyncio.ensure_future(request())
+        done, _ = await asyncio.wait({task}, timeout=self.source_budget[source])
+        if task in done:
+            return task.result()
+
+        self.logger.warning(
+            f"外部 API {source} が取得予算 {self.source_budget[source]}s 超過 → fallback"
+            "（取得はバックグラウンドで継続）"
+        )
+        self._track_refresh(cache_key, task)
+        return fallback()
+
+    def _refresh_in_background(self, cache_key: str, request: Callable[[], Awaitable[Any]]) -> None:
+        """バックグラウンド再取得を開始（同一キーの取得が実行中なら何もしない）."""
+        task = self._refresh_tasks.get(cache_key)
+        if task is not None and not task.done():
+            return
+        self._track_refresh(cache_key, asyncio.ensure_future(request()))
+
+    def _track_refresh(self, cache_key: str, task: asyncio.Task) -> None:
+        """バックグラウンド取得を登録（完了時に登録解除・例外はログのみ）."""
+        self._refresh_tasks[cache_key] = task
+
+        def _on_done(done_task: asyncio.Task) -> None:
+            if self._refresh_tasks.get(cache_key) is done_task:
+                del self._refresh_tasks[cache_key]
+            if not done_task.cancelled() and done_task.exception() is not None:
+                self.logger.warning(
+                    f"外部 API バックグラウンド取得失敗: {cache_key}: {done_task.exception()}"
+                )
+
+        task.add_done_callback(_on_done)
+
     def _get_cached(self, key: str) -> Optional[float]:
         """TTL 内のキャッシュ値を返す（無ければ None）."""
         with self._lock:
@@ -214,14 +332,26 @@ class ExternalAPIClient:
                 return None
             value, expires_at = entry
             if datetime.now() >= expires_at:
-                del self._cache[key]
                 return None
             return value
 
-    def _put_cache(self, key: str, value: float) -> None:
+    def _get_stale(self, key: str, source: str) -> Optional[float]:
+        """TTL 切れ後 stale_seconds 以内の前回成功値を返す（無ければ None）."""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None or key not in self._last_known_good:
+                return None
+            _, expires_at = entry
+            if datetime.now() >= expires_at + timedelta(seconds=self.source_stale[source]):
+                del self._cache[key]
+                return None
+            return self._last_known_good[key]
+
+    def _put_cache(self, key: str, value: float, ttl_seconds: Optional[float] = None) -> None:
         """キャッシュと last-known-good 両方に保存."""
         with self._lock:
-            expires_at = datetime.now() + timedelta(seconds=self.cache_ttl)
+            ttl = self.cache_ttl if ttl_seconds is None else ttl_seconds
+            expires_at = datetime.now() + timedelta(seconds=ttl)
             self._cache[key] = (value, expires_at)
             self._last_known_good[key] = value
 
@@ -239,14 +369,28 @@ class ExternalAPIClient:
                 return None
             value, expires_at = entry
             if datetime.now() >= expires_at:
-                del self._dict_cache[key]
                 return None
             return dict(value)
 
-    def _put_cache_dict(self, key: str, value: Dict[str, Any]) -> None:
+    def _get_stale_dict(self, key: str, source: str) -> Optional[Dict[str, Any]]:
+        """TTL 切れ後 stale_seconds 以内の前回成功 dict を返す（無ければ None・copy 返却）."""
+        with self._lock:
+            entry = self._dict_cache.get(key)
+            if entry is None or key not in self._last_known_good_dict:
+                return None
+            _, expires_at = entry
+            if datetime.now() >= expires_at + timedelta(seconds=self.source_stale[source]):
+                del self._dict_cache[key]
+                return None
+            return dict(self._last_known_good_dict[key])
+
+    def _put_cache_dict(
+        self, key: str, value: Dict[str, Any], ttl_seconds: Optional[float] = None
+    ) -> None:
         """dict キャッシュと last-known-good 両方に保存."""
         with self._lock:
-            expires_at = datetime.now() + timedelta(seconds=self.cache_ttl)
+            ttl = self.cache_ttl if ttl_seconds is None else ttl_seconds
+            expires_at = datetime.now() + timedelta(seconds=ttl)
             self._dict_cache[key] = (dict(value), expires_at)
             self._last_known_good_dict[key] = dict(value)
 
@@ -262,6 +406,9 @@ class ExternalAPIClient:
             self._last_known_good.clear()
             self._dict_cache.clear()
             self._last_known_good_dict.clear()
+        for task in list(self._refresh_tasks.values()):
+            task.cancel()
+        self._refresh_tasks.clear()
 
 
 _external_api_client: Optional[ExternalAPIClient] = None
@@ -29,6 +29,30 @@ def __getattr__(name):
         from .feature_cache import get_feature_cache
 
         return get_feature_cache
+    elif name == "IncrementalFeatureEngine":
+        from .incremental_engine import IncrementalFeatureEngine
+
+        return IncrementalFeatureEngine
+    elif name == "FeatureFrame":
+        from .feature_frame import FeatureFrame
+
+        return FeatureFrame
+    elif name == "FeatureStore":
+        from .feature_store import FeatureStore
+
+        return FeatureStore
+    elif name == "get_feature_store":
+        from .feature_store import get_feature_store
+
+        return get_feature_store
+    elif name == "FeatureGraph":
+        from .feature_graph import FeatureGraph
+
+        return FeatureGraph
+    elif name == "collect_required_features":
+        from .feature_graph import collect_required_features
+
+        return collect_required_features
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
@@ -38,4 +62,10 @@ __all__ = [
     "FEATURE_CATEGORIES",
     "FeatureCache",  # Phase 89-α Stage 2
     "get_feature_cache",  # Phase 89-α Stage 2
+    "IncrementalFeatureEngine",
+    "FeatureFrame",
+    "FeatureStore",
+    "get_feature_store",
+    "FeatureGraph",
+    "collect_required_features",
 ]
@@ -11,3 +11,13 @@ Phase 89-δ: 52 → 55（cross_asset: eth_btc_price_ratio + eth_btc_corr_24h + e
 
 EXPECTED_FEATURE_COUNT: int = 55
 STRATEGY_COUNT: int = 6
+
+# 先頭からこの行数以降は特徴量が bfill（未来値参照）の影響を受けない
+# （VPIN: rolling std bfill 50 本 + imbalance 50 本 + vpin_ma20 20 本 ≒ 120 本）
+FEATURE_WARMUP_ROWS: int = 128
+
+# 部分再計算（FeatureCache 追記・スライド一致）で末尾と一緒に再計算する重複行数
+# パイプラインで最長の窓（VPIN の rolling 50 + 50 + vpin_ma20 の連鎖 ≒ 120 本・
+# btc_realized_vol_24h の rolling 96 本・ema_50 の span 50）を覆う FEATURE_WARMUP_ROWS。
+# rolling 系は全行計算と一致し、EMA 系は初期値の影響 (1 - 2/(span+1))^n（ema_50 で初期値との差の約 0.6%）が残る
+FEATURE_REUSE_OVERLAP_ROWS: int = FEATURE_WARMUP_ROWS
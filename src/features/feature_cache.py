@@ -8,11 +8,21 @@ LRU + TTL キャッシュ。
 - src/data/data_cache.py の LRUCache 設計を踏襲（OrderedDict + threading.RLock）
 - ディスク永続化なし（特徴量はサイクル内のみ価値あり）
 - TTL ベースの自動失効
+- get/put はコピーで受け渡す（呼び出し側の in-place 改変が cache 内 DF に波及しない）
 - BACKTEST_MODE=true 環境変数または config disable で完全無効化可能
 
 キャッシュキー設計:
 - (symbol, timeframe, last_timestamp, len(df), last_close) を md5 でハッシュ化
 - last_close を含めることで同タイムスタンプでも内容が変われば別キー
+
+追記検出（部分ヒット）:
+- 新しい足が来るとキーは必ず変わるため、ストリーム（symbol + timeframe + 足間隔）毎に
+  直前の入力 OHLCV と特徴量を保持する
+- 入力の先頭行が直前の入力の j 行目にあり、直前の入力の j 行目以降が入力の先頭と一致する
+  （追記のみなら j = 0・固定長のスライド窓なら j = 落とした行数）なら、一致する行の特徴量を
+  再利用し、呼び出し側は末尾の新規行（+ 重複 FEATURE_REUSE_OVERLAP_ROWS 行）のみ計算する
+- 一致判定は index + OHLCV 全値。途中で値が異なる行（形成中の足の更新等）以降は新規行扱い
+- 再利用行数が FEATURE_REUSE_OVERLAP_ROWS 以下なら全計算と変わらないためミス扱い
 """
 
 import hashlib
@@ -21,10 +31,15 @@ from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from ..core.config.threshold_manager import get_threshold
 from ..core.logger import get_logger
+from .constants import FEATURE_REUSE_OVERLAP_ROWS
+
+# 追記一致判定に使う入力列
+OHLCV_COLUMNS: Tuple[str, ...] = ("open", "high", "low", "close", "volume")
 
 
 class FeatureCache:
@@ -47,6 +62,9 @@ class FeatureCache:
         self.logger = get_logger()
         self._lock = threading.RLock()
         self._cache: "OrderedDict[str, Tuple[pd.DataFrame, datetime]]" = OrderedDict()
+        # 追記検出用: ストリーム ID → (直前の入力 OHLCV, 直前の特徴量)
+        self._streams: "OrderedDict[str, Tuple[pd.DataFrame, pd.DataFrame]]" = OrderedDict()
+        self.max_streams = get_threshold("features.cache.max_streams", 8)
 
         self.max_size = (
             max_size if max_size is not None else get_threshold("features.cache.max_size", 200)
@@ -62,6 +80,7 @@ class FeatureCache:
 
         self._stats: Dict[str, int] = {
             "hits": 0,
+            "partial_hits": 0,
             "misses": 0,
             "evictions": 0,
             "expirations": 0,
@@ -95,6 +114,24 @@ class FeatureCache:
         signature = f"{symbol}|{timeframe}|{last_ts}|{len(df)}|{last_close:.6f}"
         return hashlib.md5(signature.encode("utf-8")).hexdigest()
 
+    @staticmethod
+    def compute_stream_id(symbol: str, timeframe: str, df: pd.DataFrame) -> str:
+        """
+        追記検出用のストリーム ID を生成
+
+        同じラベルで呼ばれる 15m / 4h 等を区別するため、末尾 2 行の index 差（足間隔）を含める。
+
+        Args:
+            symbol: 通貨ペア
+            timeframe: キャッシュキーと同じラベル
+            df: 市場データ DataFrame
+
+        Returns:
+            ストリーム ID
+        """
+        interval = str(df.index[-1] - df.index[-2]) if df is not None and len(df) >= 2 else "-"
+        return f"{symbol}|{timeframe}|{interval}"
+
     def get(self, key: str) -> Optional[pd.DataFrame]:
         """
         キャッシュから DataFrame を取得（コピーを返す）
@@ -106,33 +143,115 @@ class FeatureCache:
             return None
 
         with self._lock:
-            if key not in self._cache:
+            cached = self._get_unlocked(key)
+            if cached is None:
                 self._stats["misses"] += 1
                 return None
 
-            df, expires_at = self._cache[key]
+            self._stats["hits"] += 1
+            return cached
 
-            if datetime.now() >= expires_at:
-                del self._cache[key]
-                self._stats["expirations"] += 1
-                self._stats["misses"] += 1
-                return None
+    def lookup(
+        self, key: str, stream_id: str, df: pd.DataFrame
+    ) -> Tuple[Optional[pd.DataFrame], int]:
+        """
+        完全一致 → 追記一致 → ミスの順に参照
 
-            # LRU: 最新アクセスとして末尾へ
-            self._cache.move_to_end(key)
-            self._stats["hits"] += 1
-            return df.copy()
+        Args:
+            key: compute_key() のキー
+            stream_id: compute_stream_id() のストリーム ID
+            df: 入力 OHLCV DataFrame
+
+        Returns:
+            (特徴量, 再利用行数)。完全一致は (全行, len(df))、追記一致は
+            (再利用可能な先頭行の特徴量, 行数)、ミス・無効化時は (None, 0)
+        """
+        if not self.enabled:
+            return None, 0
 
-    def put(self, key: str, df: pd.DataFrame) -> None:
+        with self._lock:
+            cached = self._get_unlocked(key)
+            if cached is not None:
+                self._stats["hits"] += 1
+                return cached, len(cached)
+
+            prefix, reused_rows = self._match_append(stream_id, df)
+            if prefix is not None:
+                self._stats["partial_hits"] += 1
+                return prefix, reused_rows
+
+            self._stats["misses"] += 1
+            return None, 0
+
+    def _get_unlocked(self, key: str) -> Optional[pd.DataFrame]:
+        """完全一致参照（統計は呼び出し側で更新・ロック取得済みであること）."""
+        if key not in self._cache:
+            return None
+
+        df, expires_at = self._cache[key]
+        if datetime.now() >= expires_at:
+            del self._cache[key]
+            self._stats["expirations"] += 1
+            return None
+
+        # LRU: 最新アクセスとして末尾へ
+        self._cache.move_to_end(key)
+        return df.copy()
+
+    def _match_append(self, stream_id: str, df: pd.DataFrame) -> Tuple[Optional[pd.DataFrame], int]:
+        """直前の入力の末尾側と df の先頭から一致する行数を求め、その行の特徴量を返す."""
+        entry = self._streams.get(stream_id)
+        if entry is None or df is None or len(df) == 0:
+            return None, 0
+
+        prev_input, prev_features = entry
+        # df の先頭行の直前の入力内の位置（追記のみなら 0・スライド窓なら落とした行数）
+        positions = np.flatnonzero(np.asarray(prev_input.index == df.index[0]))
+        if len(positions) != 1:
+            return None, 0
+        offset = int(positions[0])
+
+        overlap = min(len(prev_input) - offset, len(df))
+        prev_rows = prev_input.iloc[offset : offset + overlap]
+        same = np.asarray(prev_rows.index == df.index[:overlap])
+        for column in OHLCV_COLUMNS:
+            if column in df.columns and column in prev_rows.columns:
+                same &= prev_rows[column].to_numpy() == df[column].to_numpy()[:overlap]
+        mismatched = np.flatnonzero(~same)
+        if len(mismatched) > 0:
+            overlap = int(mismatched[0])
+
+        # 新規行なし（TTL 失効後の同一入力）・再利用行が重複行数以下はミス扱い
+        if overlap >= len(df) or overlap <= FEATURE_REUSE_OVERLAP_ROWS:
+            return None, 0
+
+        self._streams.move_to_end(stream_id)
+        return prev_features.iloc[offset : offset + overlap].copy(), overlap
+
+    def put(
+        self,
+        key: str,
+        df: pd.DataFrame,
+        stream_id: Optional[str] = None,
+        source_df: Optional[pd.DataFrame] = None,
+    ) -> None:
         """
         DataFrame をキャッシュに保存（コピーを保持）
 
         max_size を超えた場合は古いエントリから順に LRU 削除。
+        stream_id・source_df を指定すると次回の追記検出用に入力と特徴量を保持する。
         """
         if not self.enabled:
             return
 
         with self._lock:
+            if stream_id is not None and source_df is not None and len(source_df) == len(df):
+                if stream_id in self._streams:
+                    del self._streams[stream_id]
+                self._streams[stream_id] = (source_df.copy(), df.copy())
+                while len(self._streams) > self.max_streams:
+                    self._streams.popitem(last=False)
+
             expires_at = datetime.now() + timedelta(seconds=self.ttl_seconds)
 
             if key in self._cache:
@@ -148,19 +267,23 @@ class FeatureCache:
         """全エントリと統計をクリア."""
         with self._lock:
             self._cache.clear()
+            self._streams.clear()
             for key in self._stats:
                 self._stats[key] = 0
 
     def stats(self) -> Dict[str, Any]:
         """統計取得."""
         with self._lock:
-            total = self._stats["hits"] + self._stats["misses"]
+            total = self._stats["hits"] + self._stats["partial_hits"] + self._stats["misses"]
             hit_rate = (self._stats["hits"] / total * 100) if total > 0 else 0.0
+            partial_rate = (self._stats["partial_hits"] / total * 100) if total > 0 else 0.0
             return {
                 **self._stats,
                 "size": len(self._cache),
                 "max_size": self.max_size,
+                "streams": len(self._streams),
                 "hit_rate_percent": round(hit_rate, 2),
+                "partial_hit_rate_percent": round(partial_rate, 2),
                 "enabled": self.enabled,
             }
 
@@ -0,0 +1,107 @@
+"""
+列指向特徴量フレーム - 特徴量パイプラインのコピー削減
+
+FeatureGenerator の各 _generate_* ステージは従来 `result_df = df.copy()` で
+DataFrame 全体を複製してから列を追加していたため、1 回のパイプライン実行で
+8 回以上の全体コピー（+ 列追加ごとの pandas ブロック再構成）が発生していた。
+
+FeatureFrame は「列名 → NumPy 配列」の辞書として特徴量を保持し、
+ステージ間では同じオブジェクトを受け渡して列を追加・置換するだけにする。
+DataFrame の生成はパイプライン末尾の to_frame() で 1 回だけ行う。
+
+設計:
+- 既存列の値は in-place で書き換えない（置換は新しい配列の代入）。
+  そのため入力 DataFrame の列配列をコピーせず参照できる
+- 列取得は index 付きの pd.Series ビューを返すため、既存の _calculate_* 系
+  ヘルパー（pandas の rolling / ewm 等）をそのまま利用可能
+- 列の順序は追加順（pandas の列追加と同一）
+"""
+
+from functools import wraps
+from typing import Any, Callable, Dict, KeysView, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class FeatureFrame:
+    """列名 → NumPy 配列の辞書で特徴量を保持する軽量フレーム."""
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        初期化
+
+        Args:
+            df: 入力 DataFrame（列配列はコピーせず参照する。以降も変更しないこと）
+        """
+        self._index = df.index
+        self._columns: Dict[str, np.ndarray] = {
+            name: df[name].to_numpy(copy=False) for name in df.columns
+        }
+
+    @property
+    def index(self) -> pd.Index:
+        return self._index
+
+    @property
+    def columns(self) -> KeysView[str]:
+        return self._columns.keys()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._columns
+
+    def __getitem__(self, name: str) -> pd.Series:
+        """列を index 付き Series（配列を共有するビュー）として取得."""
+        try:
+            values = self._columns[name]
+        except KeyError:
+            raise KeyError(name) from None
+        return pd.Series(values, index=self._index, name=name, copy=False)
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        """列を追加・置換（スカラーは全行にブロードキャスト、Series は index 整列）."""
+        n = len(self._index)
+        if isinstance(value, pd.Series):
+            if not value.index.equals(self._index):
+                value = value.reindex(self._index)
+            array = value.to_numpy()
+        elif np.ndim(value) == 0:
+            array = np.full(n, value)
+        else:
+            array = np.asarray(value)
+        if len(array) != n:
+            raise ValueError(f"列'{name}'の長さ不一致: expected={n}, got={len(array)}")
+        self._columns[name] = array
+
+    def slice_rows(self, start: Optional[int], stop: Optional[int] = None) -> pd.DataFrame:
+        """指定行範囲のみを DataFrame として生成（全体を生成せずに済む用途向け）."""
+        rows = slice(start, stop)
+        return pd.DataFrame(
+            {name: values[rows] for name, values in self._columns.items()},
+            index=self._index[rows],
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """DataFrame を生成（パイプライン末尾で 1 回だけ呼ぶ想定）."""
+        return pd.DataFrame(self._columns, index=self._index)
+
+
+def columnar_stage(func: Callable[..., FeatureFrame]) -> Callable[..., Any]:
+    """
+    特徴量ステージ用デコレータ
+
+    FeatureFrame を受け取った場合はそのまま処理して FeatureFrame を返す（コピーなし）。
+    DataFrame を受け取った場合は FeatureFrame に変換して処理し、DataFrame で返す
+    （単体呼び出し・後方互換用。入力 DataFrame は変更されない）。
+    """
+
+    @wraps(func)
+    def wrapper(self, df, *args, **kwargs):
+        if isinstance(df, FeatureFrame):
+            return func(self, df, *args, **kwargs)
+        return func(self, FeatureFrame(df), *args, **kwargs).to_frame()
+
+    return wrapper
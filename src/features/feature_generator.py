@@ -5,8 +5,13 @@ TechnicalIndicators、MarketAnomalyDetector、FeatureServiceAdapterを
 1つのクラスに統合。設定駆動型特徴量生成。
 """
 
+import asyncio
+import functools
 import os
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -20,10 +25,19 @@ from ..core.exceptions import DataProcessingError
 from ..core.logger import CryptoBotLogger, get_logger
 
 # Phase 87 H7: 共有定数（silent failure 防止）
-from .constants import EXPECTED_FEATURE_COUNT, STRATEGY_COUNT
+from .constants import (
+    EXPECTED_FEATURE_COUNT,
+    FEATURE_REUSE_OVERLAP_ROWS,
+    FEATURE_WARMUP_ROWS,
+    STRATEGY_COUNT,
+)
 
 # Phase 89-α Stage 2: 特徴量キャッシュ
 from .feature_cache import FeatureCache, get_feature_cache
+from .feature_frame import FeatureFrame, columnar_stage
+
+# 特徴量依存グラフ（必要ノードのみ計算）
+from .feature_graph import FRAME_LEVEL_FEATURES, FeatureGraph
 
 # 特徴量リスト（一元化対応）
 OPTIMIZED_FEATURES = get_feature_names()
@@ -31,6 +45,46 @@ OPTIMIZED_FEATURES = get_feature_names()
 # 特徴量カテゴリ（一元化対応）
 FEATURE_CATEGORIES = get_feature_categories()
 
+# 部分再計算の重複行一致判定の許容誤差（rolling の丸め差のみ許容・EMA 系列は判定対象外）
+_REUSE_RTOL = 1e-9
+_REUSE_ATOL = 1e-12
+
+
+def rolling_mean_abs_deviation(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    移動平均絶対偏差（CCI用・Pythonコールバックなしのベクトル化版）
+
+    `pd.Series(values).rolling(window, min_periods=1).apply(
+    lambda x: np.abs(x - x.mean()).mean(), raw=True)` と同一の値を返す。
+
+    - window 行以上の区間: sliding_window_view で (n, window) のビューを作り一括計算
+    - 先頭 window-1 行（min_periods=1 のウォームアップ）: 利用可能な行のみで計算
+    - NaN を含むウィンドウは NaN（rolling.apply と同じ）
+
+    Args:
+        values: 1次元配列（典型価格 TP）
+        window: ウィンドウ長
+
+    Returns:
+        values と同じ長さの平均絶対偏差配列
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    result = np.full(n, np.nan)
+    if n == 0 or window <= 0:
+        return result
+
+    head = min(window - 1, n)
+    for i in range(head):
+        x = values[: i + 1]
+        result[i] = np.abs(x - x.mean()).mean()
+
+    if n >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(values, window)
+        means = windows.mean(axis=1)
+        result[window - 1 :] = np.abs(windows - means[:, None]).mean(axis=1)
+    return result
+
 
 class FeatureGenerator:
     """
@@ -82,6 +136,17 @@ class FeatureGenerator:
         self._eth_history: deque = deque(maxlen=96)
         self._btc_history: deque = deque(maxlen=96)
 
+        # 特徴量依存グラフ（HMM 入力列は regime_classifier の設定に依存）
+        hmm_classifier = getattr(regime_classifier, "hmm_classifier", None)
+        hmm_inputs = tuple(getattr(hmm_classifier, "feature_names", None) or ())
+        self.feature_graph = FeatureGraph(extra_inputs={"hmm_state": hmm_inputs})
+        # 実行中パイプラインの計算対象ノード・ノード別処理時間（並列生成のためスレッド毎に保持）
+        self._run_state = threading.local()
+        # 直近パイプラインのノード別処理時間（秒）
+        self.node_timings: Dict[str, float] = {}
+        # 複数タイムフレーム並列生成用スレッドプール（generate_features_multi で遅延生成）
+        self._executor: Optional[ThreadPoolExecutor] = None
+
         # Phase 89 H8: silent fallback を観測可能にする警告
         if external_api_client is None:
             self.logger.warning(
@@ -169,6 +234,9 @@ class FeatureGenerator:
         result_df: pd.DataFrame,
         strategy_signals: Optional[Dict[str, Dict[str, float]]] = None,
         external_values: Optional[Dict[str, float]] = None,
+        causal: bool = False,
+        required_features: Optional[Iterable[str]] = None,
+        cross_asset_history: Optional[Tuple[Tuple[float, ...], Tuple[float, ...]]] = None,
     ) -> pd.DataFrame:
         """共通特徴量生成パイプライン（37特徴量（Phase 77）→ 47特徴量（Phase 89-β））
 
@@ -181,24 +249,77 @@ class FeatureGenerator:
 
         Phase 89-β: 外部 API 派生 +10 特徴量（funding/sentiment/microstructure/macro_lite）.
         external_values が None の場合は 0 fill / fallback で生成される（fail-open 設計）。
+
+        causal=True の場合、DataFrame 全体から 1 回だけ計算して全行に broadcast する値
+        （HMM 状態確率）を行毎に計算し、行 i が行 i 以前のみに依存するようにする。
+
+        各ステージは FeatureFrame（列指向ストア）に列を追加するだけでコピーせず、
+        DataFrame の生成は末尾で 1 回のみ。入力 DataFrame は変更されない。
+
+        required_features を指定した場合、特徴量依存グラフで必要なノードのみ計算する
+        （None は全特徴量）。ノード別処理時間は node_timings に記録される。
+
+        cross_asset_history を指定した場合、cross_asset 履歴を追記せず渡された履歴で計算する
+        （generate_features_multi が呼び出し順に追記済みの履歴を渡す）。
         """
         self._validate_required_columns(result_df)
-        result_df = self._generate_basic_features(result_df)
-        result_df = self._generate_technical_indicators(result_df)
-        result_df = self._generate_anomaly_indicators(result_df)
-        result_df = self._generate_lag_features(result_df)
-        result_df = self._generate_rolling_statistics(result_df)
-        result_df = self._generate_interaction_features(result_df)
-        result_df = self._generate_time_features(result_df)
-        # Phase R-Ha: 旧呼び出しを削除。strategy_signals 引数は API 互換性のため残置（無視）
-        # Phase 89-β: 外部 API 派生特徴量 (+10)
-        result_df = self._add_external_features(result_df, external_values)
-        # Phase 89-γ: VPIN + HMM 状態確率 (+5)
-        result_df = self._add_microstructure_advanced_features(result_df)
-        # Phase 89-δ: BTC-ETH 相関 (+3)
-        result_df = self._add_cross_asset_features(result_df, external_values)
-        result_df = self._handle_nan_values(result_df)
-        return result_df
+        timings: Dict[str, float] = {}
+        self._run_state.timings = timings
+        self._run_state.active_nodes = (
+            None if required_features is None else self.feature_graph.resolve(required_features)
+        )
+        try:
+            result_df = FeatureFrame(result_df)
+            result_df = self._generate_basic_features(result_df)
+            result_df = self._generate_technical_indicators(result_df)
+            result_df = self._generate_anomaly_indicators(result_df)
+            result_df = self._generate_lag_features(result_df)
+            result_df = self._generate_rolling_statistics(result_df)
+            result_df = self._generate_interaction_features(result_df)
+            result_df = self._generate_time_features(result_df)
+            # Phase R-Ha: 旧呼び出しを削除。strategy_signals 引数は API 互換性のため残置（無視）
+            # Phase 89-β: 外部 API 派生特徴量 (+10)
+            result_df = self._add_external_features(result_df, external_values)
+            # Phase 89-γ: VPIN + HMM 状態確率 (+5)
+            result_df = self._add_microstructure_advanced_features(result_df, causal=causal)
+            # Phase 89-δ: BTC-ETH 相関 (+3)
+            result_df = self._add_cross_asset_features(
+                result_df, external_values, history=cross_asset_history
+            )
+            result_df = self._handle_nan_values(result_df)
+            return result_df.to_frame()
+        finally:
+            self._run_state.active_nodes = None
+            self._run_state.timings = None
+            self.node_timings = timings
+
+    def _run_node(self, df: FeatureFrame, name: str, **kwargs: Any) -> None:
+        """特徴量ノードを実行（計算対象外ならスキップ・処理時間を node_timings に記録）"""
+        active_nodes = getattr(self._run_state, "active_nodes", None)
+        if active_nodes is not None and name not in active_nodes:
+            return
+        timings = getattr(self._run_state, "timings", None)
+        if timings is None:
+            timings = self.node_timings
+        start = time.perf_counter()
+        getattr(self, f"_node_{name}")(df, **kwargs)
+        timings[name] = timings.get(name, 0.0) + (time.perf_counter() - start)
+
+    def get_node_profile(self) -> Dict[str, float]:
+        """
+        直近パイプライン実行のノード別処理時間（ミリ秒・降順）
+
+        Returns:
+            {ノード名: 処理時間ms}（スキップしたノードは含まない）
+        """
+        ranked = sorted(self.node_timings.items(), key=lambda item: item[1], reverse=True)
+        return {name: round(seconds * 1000, 3) for name, seconds in ranked}
+
+    def _lazy_cache_suffix(self, required_features: Optional[Iterable[str]]) -> str:
+        """遅延計算時のキャッシュキー接尾辞（計算ノード集合が異なれば別キー）"""
+        if required_features is None:
+            return ""
+        return "|nodes=" + ",".join(sorted(self.feature_graph.resolve(required_features)))
 
     def _default_external_values(self) -> Dict[str, float]:
         """Phase 89-β/δ: 外部 API 取得失敗時/未設定時の fallback 値."""
@@ -211,36 +332,55 @@ class FeatureGenerator:
         }
 
     async def _fetch_external_values(self) -> Dict[str, float]:
-        """Phase 89-β/δ: external_api_client から非同期取得。失敗時 fallback."""
+        """Phase 89-β/δ: external_api_client から 3 ソースを並行取得。失敗時 fallback.
+
+        各ソースの TTL キャッシュ・stale-while-revalidate・取得予算は external_api_client 側で
+        処理するため、取得時間は最も遅いソースの予算で頭打ちになる。
+        """
         if self.external_api_client is None:
             return self._default_external_values()
-        try:
-            funding = await self.external_api_client.fetch_funding_rate()
-            fear_greed = await self.external_api_client.fetch_fear_greed_index()
-            result = {
-                "funding_rate_8h_avg": funding,
-                "fear_greed_index": fear_greed,
-                "eth_jpy_last": 0.0,
-                "eth_jpy_volume": 0.0,
-            }
-            # Phase 89-δ: ETH/JPY ticker（メソッドがあれば取得・無ければスキップ）
-            if hasattr(self.external_api_client, "fetch_eth_jpy_ticker"):
-                try:
-                    eth = await self.external_api_client.fetch_eth_jpy_ticker()
-                    result["eth_jpy_last"] = float(eth.get("last", 0.0) or 0.0)
-                    result["eth_jpy_volume"] = float(eth.get("volume", 0.0) or 0.0)
-                except Exception as e:
-                    self.logger.warning(f"Phase 89-δ ETH ticker 取得失敗 → 0 fill: {e}")
-            return result
-        except Exception as e:
-            self.logger.warning(f"Phase 89-β/δ 外部 API 取得失敗 → fallback: {e}")
-            return self._default_external_values()
 
+        client = self.external_api_client
+        calls = [client.fetch_funding_rate, client.fetch_fear_greed_index]
+        # Phase 89-δ: ETH/JPY ticker（メソッドがあれば取得・無ければスキップ）
+        if hasattr(client, "fetch_eth_jpy_ticker"):
+            calls.append(client.fetch_eth_jpy_ticker)
+        funding, fear_greed, *eth = await asyncio.gather(
+            *(self._call_external(call) for call in calls), return_exceptions=True
+        )
+
+        for value in (funding, fear_greed):
+            if isinstance(value, BaseException):
+                self.logger.warning(f"Phase 89-β/δ 外部 API 取得失敗 → fallback: {value}")
+                return self._default_external_values()
+
+        result = {
+            "funding_rate_8h_avg": funding,
+            "fear_greed_index": fear_greed,
+            "eth_jpy_last": 0.0,
+            "eth_jpy_volume": 0.0,
+        }
+        if eth and isinstance(eth[0], BaseException):
+            self.logger.warning(f"Phase 89-δ ETH ticker 取得失敗 → 0 fill: {eth[0]}")
+        elif eth:
+            try:
+                result["eth_jpy_last"] = float(eth[0].get("last", 0.0) or 0.0)
+                result["eth_jpy_volume"] = float(eth[0].get("volume", 0.0) or 0.0)
+            except Exception as e:
+                self.logger.warning(f"Phase 89-δ ETH ticker 取得失敗 → 0 fill: {e}")
+        return result
+
+    @staticmethod
+    async def _call_external(call: Callable[[], Awaitable[Any]]) -> Any:
+        """外部 API 取得メソッドを呼び出す（非 awaitable 返却も gather 内の例外として扱う）"""
+        return await call()
+
+    @columnar_stage
     def _add_external_features(
         self,
-        df: pd.DataFrame,
+        df: FeatureFrame,
         external_values: Optional[Dict[str, float]] = None,
-    ) -> pd.DataFrame:
+    ) -> FeatureFrame:
         """Phase 89-β: 外部 API 派生 +10 特徴量を追加.
 
         - funding (1): funding_rate_8h_avg
@@ -251,6 +391,13 @@ class FeatureGenerator:
                           btc_realized_vol_24h / btc_funding_premium
           ※ btc_realized_vol_24h は close 列から計算可能、他は外部依存のため 0 fill
         """
+        self._run_node(df, "external", external_values=external_values)
+        return df
+
+    def _node_external(
+        self, df: FeatureFrame, external_values: Optional[Dict[str, float]] = None
+    ) -> None:
+        """外部 API 派生 10 特徴量（external_values 未指定時は fallback 値）"""
         if external_values is None:
             external_values = self._default_external_values()
 
@@ -297,8 +444,6 @@ class FeatureGenerator:
         ):
             self.computed_features.add(name)
 
-        return df
-
     def _calculate_vpin(self, df: pd.DataFrame, window: int = 50) -> pd.Series:
         """Phase 89-γ: VPIN (Volume-synchronized Probability of Informed Trading).
 
@@ -333,22 +478,41 @@ class FeatureGenerator:
         vpin = imbalance.rolling(window=window, min_periods=window).sum() / (vol_sum + 1e-9)
         return vpin.fillna(0.5).clip(0.0, 1.0)
 
-    def _add_microstructure_advanced_features(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Phase 89-γ: VPIN×3 + HMM 状態確率×2 = +5 特徴量."""
-        # VPIN 系
+    @columnar_stage
+    def _add_microstructure_advanced_features(
+        self, df: FeatureFrame, causal: bool = False
+    ) -> FeatureFrame:
+        """Phase 89-γ: VPIN×3 + HMM 状態確率×2 = +5 特徴量.
+
+        causal=True の場合、HMM 状態確率を行毎（その行までのデータの末尾行）に計算する。
+        """
+        self._run_node(df, "vpin")
+        self._run_node(df, "hmm_state", causal=causal)
+        return df
+
+    def _node_vpin(self, df: FeatureFrame) -> None:
+        """VPIN 系（vpin / vpin_ma20 / vpin_change）"""
         vpin = self._calculate_vpin(df, window=50)
         df["vpin"] = vpin
         df["vpin_ma20"] = vpin.rolling(window=20, min_periods=1).mean()
         df["vpin_change"] = vpin.diff().fillna(0.0)
+        self.computed_features.update(["vpin", "vpin_ma20", "vpin_change"])
 
-        # HMM 状態確率（regime_classifier 経由・None なら 1/3 fill）
+    def _node_hmm_state(self, df: FeatureFrame, causal: bool = False) -> None:
+        """HMM 状態確率（regime_classifier 経由・None なら 1/3 fill）"""
         if self.regime_classifier is not None and hasattr(
             self.regime_classifier, "get_hmm_state_probabilities"
         ):
             try:
-                probs = self.regime_classifier.get_hmm_state_probabilities(df)
-                df["hmm_state_bear_prob"] = probs.get("hmm_state_bear_prob", 1.0 / 3)
-                df["hmm_state_bull_prob"] = probs.get("hmm_state_bull_prob", 1.0 / 3)
+                if causal:
+                    bear, bull = self._calculate_hmm_probabilities_per_row(df)
+                    df["hmm_state_bear_prob"] = bear
+                    df["hmm_state_bull_prob"] = bull
+                else:
+                    # get_hmm_state_probabilities は末尾行のみ参照するため末尾行だけ生成
+                    probs = self.regime_classifier.get_hmm_state_probabilities(df.slice_rows(-1))
+                    df["hmm_state_bear_prob"] = probs.get("hmm_state_bear_prob", 1.0 / 3)
+                    df["hmm_state_bull_prob"] = probs.get("hmm_state_bull_prob", 1.0 / 3)
             except Exception as e:
                 self.logger.warning(f"Phase 89-γ HMM 確率取得失敗 → uniform: {e}")
                 df["hmm_state_bear_prob"] = 1.0 / 3
@@ -357,50 +521,99 @@ class FeatureGenerator:
             df["hmm_state_bear_prob"] = 1.0 / 3
             df["hmm_state_bull_prob"] = 1.0 / 3
 
-        for name in (
-            "vpin",
-            "vpin_ma20",
-            "vpin_change",
-            "hmm_state_bear_prob",
-            "hmm_state_bull_prob",
-        ):
-            self.computed_features.add(name)
+        self.computed_features.update(["hmm_state_bear_prob", "hmm_state_bull_prob"])
 
-        return df
+    def _calculate_hmm_probabilities_per_row(self, df: FeatureFrame) -> tuple:
+        """HMM 状態確率を行毎に計算（get_hmm_state_probabilities は末尾行のみ参照）."""
+        n = len(df)
+        bear = np.full(n, 1.0 / 3)
+        bull = np.full(n, 1.0 / 3)
+        for i in range(n):
+            probs = self.regime_classifier.get_hmm_state_probabilities(df.slice_rows(i, i + 1))
+            bear[i] = probs.get("hmm_state_bear_prob", 1.0 / 3)
+            bull[i] = probs.get("hmm_state_bull_prob", 1.0 / 3)
+        return bear, bull
 
+    @columnar_stage
     def _add_cross_asset_features(
         self,
-        df: pd.DataFrame,
+        df: FeatureFrame,
         external_values: Optional[Dict[str, float]] = None,
-    ) -> pd.DataFrame:
+        history: Optional[Tuple[Tuple[float, ...], Tuple[float, ...]]] = None,
+    ) -> FeatureFrame:
         """Phase 89-δ: BTC-ETH 相関特徴量 (+3).
 
         Args:
             df: 入力 DataFrame（close, volume 必須）
             external_values: ETH/JPY ticker を含む辞書（無ければ 0 fill）
+            history: 追記済みの (BTC 履歴, ETH 履歴)（None なら本呼び出しで追記）
 
         Returns 新規列:
             - eth_btc_price_ratio: ETH/JPY ÷ BTC/JPY（先頭 0、ETH 不在時 0）
             - eth_btc_corr_24h: 24h rolling pearson correlation（履歴 96 サンプル必要）
             - eth_returns_15m: ETH/JPY 15m return（履歴蓄積後）
         """
+        self._run_node(df, "cross_asset", external_values=external_values, history=history)
+        return df
+
+    @staticmethod
+    def _cross_asset_prices(
+        df: pd.DataFrame, external_values: Optional[Dict[str, float]]
+    ) -> Tuple[float, float]:
+        """BTC 最新 close と ETH 最新 last（取得不可なら 0.0）"""
         eth_last = 0.0
         if external_values is not None:
             eth_last = float(external_values.get("eth_jpy_last", 0.0) or 0.0)
-
-        # BTC 最新 close と ETH 最新 last を蓄積（履歴 96 サンプル）
         btc_last = float(df["close"].iloc[-1]) if "close" in df.columns and len(df) > 0 else 0.0
+        return btc_last, eth_last
+
+    def _advance_cross_asset_history(
+        self, btc_last: float, eth_last: float
+    ) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+        """BTC/ETH 価格を履歴に追記（履歴 96 サンプル）し、追記後の履歴を返す"""
         if btc_last > 0 and eth_last > 0:
             self._btc_history.append(btc_last)
             self._eth_history.append(eth_last)
+        return tuple(self._btc_history), tuple(self._eth_history)
+
+    def _cross_asset_history_for(
+        self,
+        df: pd.DataFrame,
+        external_values: Optional[Dict[str, float]],
+        required_features: Optional[Set[str]],
+    ) -> Optional[Tuple[Tuple[float, ...], Tuple[float, ...]]]:
+        """
+        入力 1 件分の cross_asset 履歴を 1 回だけ追記し、追記後の履歴を返す
+
+        部分再計算の全行計算フォールバック等でパイプラインを複数回実行しても
+        履歴に同じサンプルを重複追記しないよう、パイプラインの外で追記する。
+        cross_asset を計算しない場合は追記せず None。
+        """
+        if required_features is not None and "cross_asset" not in self.feature_graph.resolve(
+            required_features
+        ):
+            return None
+        return self._advance_cross_asset_history(*self._cross_asset_prices(df, external_values))
+
+    def _node_cross_asset(
+        self,
+        df: FeatureFrame,
+        external_values: Optional[Dict[str, float]] = None,
+        history: Optional[Tuple[Tuple[float, ...], Tuple[float, ...]]] = None,
+    ) -> None:
+        """BTC-ETH 相関 3 特徴量（ETH/BTC 価格履歴を蓄積）"""
+        btc_last, eth_last = self._cross_asset_prices(df, external_values)
+        if history is None:
+            history = self._advance_cross_asset_history(btc_last, eth_last)
+        btc_history, eth_history = history
 
         ratio = eth_last / btc_last if btc_last > 0 and eth_last > 0 else 0.0
         df["eth_btc_price_ratio"] = ratio
 
         # 24h pearson 相関（履歴 24 サンプル以上で計算可）
-        if len(self._btc_history) >= 24 and len(self._eth_history) >= 24:
-            btc_arr = np.asarray(self._btc_history, dtype=float)
-            eth_arr = np.asarray(self._eth_history, dtype=float)
+        if len(btc_history) >= 24 and len(eth_history) >= 24:
+            btc_arr = np.asarray(btc_history, dtype=float)
+            eth_arr = np.asarray(eth_history, dtype=float)
             try:
                 corr = float(np.corrcoef(btc_arr, eth_arr)[0, 1])
                 if not np.isfinite(corr):
@@ -412,9 +625,9 @@ class FeatureGenerator:
         df["eth_btc_corr_24h"] = corr
 
         # ETH 15m return（履歴 2 サンプル以上で計算可）
-        if len(self._eth_history) >= 2:
-            prev = self._eth_history[-2]
-            curr = self._eth_history[-1]
+        if len(eth_history) >= 2:
+            prev = eth_history[-2]
+            curr = eth_history[-1]
             eth_ret = (curr - prev) / prev if prev > 0 else 0.0
         else:
             eth_ret = 0.0
@@ -423,12 +636,11 @@ class FeatureGenerator:
         for name in ("eth_btc_price_ratio", "eth_btc_corr_24h", "eth_returns_15m"):
             self.computed_features.add(name)
 
-        return df
-
     async def generate_features(
         self,
         market_data: Dict[str, Any],
         strategy_signals: Optional[Dict[str, Dict[str, float]]] = None,
+        required_features: Optional[Iterable[str]] = None,
     ) -> pd.DataFrame:
         """
         統合特徴量生成処理（37特徴量: Phase 77）
@@ -439,6 +651,8 @@ class FeatureGenerator:
         Args:
             market_data: 市場データ（DataFrame または dict）
             strategy_signals: 戦略シグナル辞書（オプション、None時は0埋め）
+            required_features: 必要な特徴量（指定時は依存グラフで必要ノードのみ計算・
+                None は全特徴量。feature_graph.collect_required_features() で構築）
 
         Returns:
             特徴量を含むDataFrame（37特徴量）
@@ -449,16 +663,23 @@ class FeatureGenerator:
         try:
             result_df = self._convert_to_dataframe(market_data)
             self.computed_features.clear()
+            if required_features is not None:
+                required_features = set(required_features)
 
-            # Phase 89-α Stage 2: キャッシュ参照
+            # Phase 89-α Stage 2: キャッシュ参照（完全一致 → 追記一致の部分ヒット）
             cache = get_feature_cache()
             cache_key: Optional[str] = None
+            stream_id: Optional[str] = None
+            cached: Optional[pd.DataFrame] = None
+            reused_rows = 0
             if cache.enabled and strategy_signals is None:
                 # strategy_signals は呼び出し毎に変わり得るため、None 渡しの時のみキャッシュ対象
                 symbol = get_threshold("exchange.symbol", "BTC/JPY")
-                cache_key = FeatureCache.compute_key(symbol, "primary", result_df)
-                cached = cache.get(cache_key)
-                if cached is not None:
+                label = "primary" + self._lazy_cache_suffix(required_features)
+                cache_key = FeatureCache.compute_key(symbol, label, result_df)
+                stream_id = FeatureCache.compute_stream_id(symbol, label, result_df)
+                cached, reused_rows = cache.lookup(cache_key, stream_id, result_df)
+                if cached is not None and reused_rows == len(result_df):
                     self._restore_computed_features_from_df(cached)
                     self._log_cache_stats_periodically(cache)
                     return cached
@@ -466,11 +687,18 @@ class FeatureGenerator:
             # Phase 89-β: 外部 API 派生特徴量を事前取得
             external_values = await self._fetch_external_values()
 
-            result_df = self._run_feature_pipeline(result_df, strategy_signals, external_values)
-            self._validate_feature_generation(result_df, expected_count=EXPECTED_FEATURE_COUNT)
+            source_df = result_df
+            result_df = self._compute_and_validate_features(
+                source_df,
+                cached,
+                reused_rows,
+                external_values,
+                required_features,
+                strategy_signals=strategy_signals,
+            )
 
             if cache.enabled and cache_key is not None:
-                cache.put(cache_key, result_df)
+                cache.put(cache_key, result_df, stream_id=stream_id, source_df=source_df)
                 self._log_cache_stats_periodically(cache)
 
             return result_df
@@ -479,10 +707,152 @@ class FeatureGenerator:
             self.logger.error(f"統合特徴量生成エラー: {e}")
             raise DataProcessingError(f"特徴量生成失敗: {e}")
 
+    async def generate_features_multi(
+        self,
+        frames: Dict[str, Any],
+        required_features: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Union[pd.DataFrame, Exception]]:
+        """
+        複数タイムフレームの特徴量を並列生成（generate_features の逐次呼び出しと同一結果）
+
+        呼び出し順に依存する処理（キャッシュ参照・cross_asset 履歴の追記）は frames の順に
+        イベントループ上で行い、pandas 計算のみ有界スレッドプールで並列実行する。
+        計算中もイベントループは解放されるため、trigger server は /health に応答できる。
+        外部 API 派生値はタイムフレーム間で 1 回だけ取得する。
+
+        features.parallel.enabled=false の場合は generate_features を順に呼ぶ（従来動作）。
+
+        Args:
+            frames: {タイムフレーム: 市場データ}
+            required_features: 必要な特徴量（None は全特徴量）
+
+        Returns:
+            {タイムフレーム: 特徴量 DataFrame または DataProcessingError}（frames と同じ順序）
+        """
+        results: Dict[str, Union[pd.DataFrame, Exception]] = {}
+        if not get_threshold("features.parallel.enabled", True):
+            for timeframe, market_data in frames.items():
+                try:
+                    results[timeframe] = await self.generate_features(
+                        market_data, required_features=required_features
+                    )
+                except DataProcessingError as e:
+                    results[timeframe] = e
+            return results
+
+        if required_features is not None:
+            required_features = set(required_features)
+        self.computed_features.clear()
+
+        cache = get_feature_cache()
+        symbol = get_threshold("exchange.symbol", "BTC/JPY")
+        label = "primary" + self._lazy_cache_suffix(required_features)
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        external_values: Optional[Dict[str, float]] = None
+        pending: Dict[str, Tuple[asyncio.Future, pd.DataFrame, Optional[str], Optional[str]]] = {}
+
+        for timeframe, market_data in frames.items():
+            try:
+                df = self._convert_to_dataframe(market_data)
+                cache_key: Optional[str] = None
+                stream_id: Optional[str] = None
+                cached: Optional[pd.DataFrame] = None
+                reused_rows = 0
+                if cache.enabled:
+                    cache_key = FeatureCache.compute_key(symbol, label, df)
+                    stream_id = FeatureCache.compute_stream_id(symbol, label, df)
+                    cached, reused_rows = cache.lookup(cache_key, stream_id, df)
+                    if cached is not None and reused_rows == len(df):
+                        self._restore_computed_features_from_df(cached)
+                        results[timeframe] = cached
+                        continue
+
+                if external_values is None:
+                    external_values = await self._fetch_external_values()
+
+                # cross_asset 履歴は逐次呼び出しと同じ順序で追記し、追記後の履歴を計算に渡す
+                history = self._cross_asset_history_for(df, external_values, required_features)
+
+                future = loop.run_in_executor(
+                    executor,
+                    functools.partial(
+                        self._compute_and_validate_features,
+                        df,
+                        cached,
+                        reused_rows,
+                        external_values,
+                        required_features,
+                        cross_asset_history=history,
+                    ),
+                )
+                pending[timeframe] = (future, df, cache_key, stream_id)
+            except Exception as e:
+                self.logger.error(f"統合特徴量生成エラー: {timeframe}: {e}")
+                results[timeframe] = DataProcessingError(f"特徴量生成失敗: {e}")
+
+        for timeframe, (future, df, cache_key, stream_id) in pending.items():
+            try:
+                features_df = await future
+            except Exception as e:
+                self.logger.error(f"統合特徴量生成エラー: {timeframe}: {e}")
+                results[timeframe] = DataProcessingError(f"特徴量生成失敗: {e}")
+                continue
+            if cache.enabled and cache_key is not None:
+                cache.put(cache_key, features_df, stream_id=stream_id, source_df=df)
+            results[timeframe] = features_df
+
+        if cache.enabled:
+            self._log_cache_stats_periodically(cache)
+        return {timeframe: results[timeframe] for timeframe in frames}
+
+    def _compute_and_validate_features(
+        self,
+        df: pd.DataFrame,
+        cached: Optional[pd.DataFrame],
+        reused_rows: int,
+        external_values: Optional[Dict[str, float]],
+        required_features: Optional[Set[str]],
+        strategy_signals: Optional[Dict[str, Dict[str, float]]] = None,
+        cross_asset_history: Optional[Tuple[Tuple[float, ...], Tuple[float, ...]]] = None,
+    ) -> pd.DataFrame:
+        """特徴量計算（部分ヒット時は末尾のみ）+ 検証（スレッドプールからも呼ばれる同期処理）"""
+        if cross_asset_history is None:
+            cross_asset_history = self._cross_asset_history_for(
+                df, external_values, required_features
+            )
+        result_df = self._run_pipeline_reusing_rows(
+            df,
+            cached,
+            reused_rows,
+            lambda part: self._run_feature_pipeline(
+                part,
+                strategy_signals,
+                external_values,
+                required_features=required_features,
+                cross_asset_history=cross_asset_history,
+            ),
+        )
+        if required_features is None:
+            self._validate_feature_generation(result_df, expected_count=EXPECTED_FEATURE_COUNT)
+        else:
+            self._validate_requested_features(result_df, required_features)
+        return result_df
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """並列生成用スレッドプール（features.parallel.max_workers で上限）"""
+        if self._executor is None:
+            max_workers = max(1, int(get_threshold("features.parallel.max_workers", 2)))
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="feature-gen"
+            )
+        return self._executor
+
     def generate_features_sync(
         self,
         df: pd.DataFrame,
         strategy_signals: Optional[Dict[str, Dict[str, float]]] = None,
+        required_features: Optional[Iterable[str]] = None,
     ) -> pd.DataFrame:
         """
         同期版特徴量生成（37特徴量・バックテスト事前計算用）
@@ -493,29 +863,47 @@ class FeatureGenerator:
         Args:
             df: OHLCVデータを含むDataFrame
             strategy_signals: 戦略シグナル辞書（オプション、None時は0埋め）
+            required_features: 必要な特徴量（None は全特徴量）
 
         Returns:
             特徴量を含むDataFrame（37特徴量）
         """
         try:
-            result_df = df.copy()
+            if required_features is not None:
+                required_features = set(required_features)
 
             # Phase 89-α Stage 2: バックテスト中はキャッシュ無効
             backtest_mode = os.environ.get("BACKTEST_MODE", "").lower() == "true"
             cache = get_feature_cache() if not backtest_mode else None
             cache_key: Optional[str] = None
+            stream_id: Optional[str] = None
+            cached: Optional[pd.DataFrame] = None
+            reused_rows = 0
 
             if cache is not None and cache.enabled and strategy_signals is None:
                 symbol = get_threshold("exchange.symbol", "BTC/JPY")
-                cache_key = FeatureCache.compute_key(symbol, "sync", result_df)
-                cached = cache.get(cache_key)
-                if cached is not None:
+                label = "sync" + self._lazy_cache_suffix(required_features)
+                cache_key = FeatureCache.compute_key(symbol, label, df)
+                stream_id = FeatureCache.compute_stream_id(symbol, label, df)
+                cached, reused_rows = cache.lookup(cache_key, stream_id, df)
+                if cached is not None and reused_rows == len(df):
                     return cached
 
-            result_df = self._run_feature_pipeline(result_df, strategy_signals)
+            history = self._cross_asset_history_for(df, None, required_features)
+            result_df = self._run_pipeline_reusing_rows(
+                df,
+                cached,
+                reused_rows,
+                lambda part: self._run_feature_pipeline(
+                    part,
+                    strategy_signals,
+                    required_features=required_features,
+                    cross_asset_history=history,
+                ),
+            )
 
             if cache is not None and cache.enabled and cache_key is not None:
-                cache.put(cache_key, result_df)
+                cache.put(cache_key, result_df, stream_id=stream_id, source_df=df)
 
             return result_df
 
@@ -523,10 +911,124 @@ class FeatureGenerator:
             self.logger.error(f"同期版特徴量生成エラー: {e}")
             raise DataProcessingError(f"同期版特徴量生成失敗: {e}")
 
+    def generate_features_causal(
+        self,
+        df: pd.DataFrame,
+        warmup_rows: int = FEATURE_WARMUP_ROWS,
+        required_features: Optional[Iterable[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        全履歴の因果的特徴量一括計算（バックテスト事前計算用）
+
+        行 i の特徴量が行 0..i のみに依存することを保証し、
+        generate_features_sync(df.iloc[: i + 1]).iloc[-1] と同じ値を 1 パスで得る。
+
+        - 全履歴を 1 回だけパイプラインに通す（rolling / ewm は元々因果的）
+        - HMM 状態確率は行毎に計算（causal=True）
+        - 先頭 warmup_rows 行は bfill・len(df) 依存分岐が未来値を参照するため、
+          その行までのプレフィックスで個別に再計算して置き換える
+
+        Args:
+            df: OHLCVデータを含むDataFrame（全履歴）
+            warmup_rows: プレフィックス再計算する先頭行数
+            required_features: 必要な特徴量（None は全特徴量）
+
+        Returns:
+            特徴量を含むDataFrame（df と同じ行数）
+        """
+        try:
+            self._validate_required_columns(df)
+            if required_features is not None:
+                required_features = set(required_features)
+            result_df = self._run_feature_pipeline(
+                df, causal=True, required_features=required_features
+            )
+
+            head_rows = min(warmup_rows, len(df))
+            if head_rows == 0:
+                return result_df
+
+            head = [
+                self._run_feature_pipeline(
+                    df.iloc[: i + 1], causal=True, required_features=required_features
+                ).iloc[[-1]]
+                for i in range(head_rows)
+            ]
+            return pd.concat(head + [result_df.iloc[head_rows:]])
+
+        except Exception as e:
+            self.logger.error(f"因果的特徴量一括計算エラー: {e}")
+            raise DataProcessingError(f"因果的特徴量一括計算失敗: {e}")
+
+    def _run_pipeline_reusing_rows(
+        self,
+        df: pd.DataFrame,
+        cached: Optional[pd.DataFrame],
+        reused_rows: int,
+        run_pipeline: Callable[[pd.DataFrame], pd.DataFrame],
+    ) -> pd.DataFrame:
+        """
+        追記・スライド一致（部分ヒット）時は再利用行 + 末尾の新規行のみ計算
+
+        末尾は重複 FEATURE_REUSE_OVERLAP_ROWS 行（パイプライン最長の窓）を含めて計算し、
+        重複分を捨てて連結する。rolling 系は全行計算と一致し、EMA 系は重複区間の先頭を
+        初期値とする差（ema_50 で初期値との差の約 0.6%）が末尾行に残る。
+        入力全体から決まる列（FRAME_LEVEL_FEATURES: 外部 API 値・HMM 状態確率・cross_asset）は
+        再利用行も末尾の計算結果で上書きする（全行計算と同じく全行が最新の値）。
+        重複区間の最終行が再利用行と一致しない場合（EMA 系列を除く）は全行を計算する。
+        cached が None なら全行を計算する。
+
+        Args:
+            df: 入力 OHLCV DataFrame
+            cached: 先頭 reused_rows 行分のキャッシュ済み特徴量（None はミス）
+            reused_rows: 再利用行数
+            run_pipeline: 特徴量パイプライン（入力 DataFrame → 特徴量 DataFrame）
+
+        Returns:
+            df と同じ行数の特徴量 DataFrame
+        """
+        if cached is None:
+            return run_pipeline(df)
+
+        start = max(0, reused_rows - FEATURE_REUSE_OVERLAP_ROWS)
+        computed = run_pipeline(df.iloc[start:])
+        if not self._reused_row_matches(computed.iloc[reused_rows - start - 1], cached.iloc[-1]):
+            self.logger.debug("FeatureCache 部分ヒット: 重複行が再利用行と不一致のため全行計算")
+            return run_pipeline(df)
+
+        tail = computed.iloc[reused_rows - start :]
+        latest = {
+            column: tail[column].iloc[-1] for column in FRAME_LEVEL_FEATURES if column in tail
+        }
+        self.logger.debug(
+            f"FeatureCache 部分ヒット: {reused_rows}行再利用・{len(tail)}行計算"
+            f"（重複 {reused_rows - start}行）"
+        )
+        return pd.concat([cached.assign(**latest), tail])
+
+    def _reused_row_matches(self, computed: pd.Series, reused: pd.Series) -> bool:
+        """重複区間の最終行（再計算値）と同じ行の再利用値が一致するか（EMA 系・全行同値列を除く）."""
+        if list(computed.index) != list(reused.index):
+            return False
+        skipped = self.feature_graph.recursive_outputs().union(FRAME_LEVEL_FEATURES)
+        columns = [column for column in computed.index if column not in skipped]
+        try:
+            return bool(
+                np.allclose(
+                    computed[columns].to_numpy(dtype=float),
+                    reused[columns].to_numpy(dtype=float),
+                    rtol=_REUSE_RTOL,
+                    atol=_REUSE_ATOL,
+                    equal_nan=True,
+                )
+            )
+        except (TypeError, ValueError):
+            return False
+
     def _log_cache_stats_periodically(self, cache: FeatureCache) -> None:
         """Phase 89-α Stage 2: N サイクル毎にキャッシュ統計を INFO ログ出力."""
         stats = cache.stats()
-        total = stats["hits"] + stats["misses"]
+        total = stats["hits"] + stats["partial_hits"] + stats["misses"]
         if total <= 0:
             return
         interval = get_threshold("features.cache.log_interval_cycles", 100)
@@ -534,7 +1036,9 @@ class FeatureGenerator:
             return
         self.logger.info(
             f"FeatureCache stats: hit_rate={stats['hit_rate_percent']}% "
-            f"(hits={stats['hits']}, misses={stats['misses']}, "
+            f"partial_hit_rate={stats['partial_hit_rate_percent']}% "
+            f"(hits={stats['hits']}, partial_hits={stats['partial_hits']}, "
+            f"misses={stats['misses']}, "
             f"size={stats['size']}/{stats['max_size']}, "
             f"evictions={stats['evictions']}, expirations={stats['expirations']})"
         )
@@ -550,9 +1054,12 @@ class FeatureGenerator:
                 self.computed_features.add(feature)
 
     def _convert_to_dataframe(self, market_data: Dict[str, Any]) -> pd.DataFrame:
-        """市場データをDataFrameに変換（タイムフレーム辞書対応）"""
+        """市場データをDataFrameに変換（タイムフレーム辞書対応）
+
+        パイプラインは入力 DataFrame を変更しないため、DataFrame はコピーせずそのまま返す。
+        """
         if isinstance(market_data, pd.DataFrame):
-            return market_data.copy()
+            return market_data
         elif isinstance(market_data, dict):
             try:
                 # タイムフレーム辞書の場合（マルチタイムフレームデータ）
@@ -563,7 +1070,7 @@ class FeatureGenerator:
                 for tf in timeframe_keys:
                     if tf in market_data and isinstance(market_data[tf], pd.DataFrame):
                         self.logger.info(f"タイムフレーム辞書からメイン時系列取得: {tf}")
-                        return market_data[tf].copy()
+                        return market_data[tf]
 
                 # 通常の辞書データの場合（OHLCV形式等）
                 # 全ての値がスカラーかリストかをチェック
@@ -596,203 +1103,229 @@ class FeatureGenerator:
         if missing_cols:
             raise DataProcessingError(f"必要列が不足: {missing_cols}")
 
-    def _generate_basic_features(self, df: pd.DataFrame) -> pd.DataFrame:
+    @columnar_stage
+    def _generate_basic_features(self, df: FeatureFrame) -> FeatureFrame:
         """基本特徴量生成（2個）"""
-        result_df = df.copy()
-
         # 基本データはそのまま（close, volume）
         basic_features = []
-        if "close" in result_df.columns:
+        if "close" in df.columns:
             basic_features.append("close")
-        if "volume" in result_df.columns:
+        if "volume" in df.columns:
             basic_features.append("volume")
 
         self.computed_features.update(basic_features)
         self.logger.debug(f"基本特徴量生成完了: {len(basic_features)}個")
-        return result_df
+        return df
 
-    def _generate_technical_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+    @columnar_stage
+    def _generate_technical_indicators(self, df: FeatureFrame) -> FeatureFrame:
         """Phase 77: テクニカル指標生成（SHAP+Forward Selectionで最適化済み）"""
-        result_df = df.copy()
+        for node in self.feature_graph.nodes_in_stage("technical"):
+            self._run_node(df, node)
+        self.logger.debug("テクニカル指標生成完了: 10個ML特徴量 + 戦略用補助指標")
+        return df
 
-        # RSI 14期間
-        result_df["rsi_14"] = self._calculate_rsi(result_df["close"])
+    def _node_rsi(self, df: FeatureFrame) -> None:
+        """RSI 14期間"""
+        df["rsi_14"] = self._calculate_rsi(df["close"])
         self.computed_features.add("rsi_14")
 
-        # MACDライン（signal/histogramはSHAP分析でimportance=0のためML入力から除外）
-        macd_line, macd_signal = self._calculate_macd(result_df["close"])
-        result_df["macd"] = macd_line
-        result_df["macd_signal"] = macd_signal  # 戦略で使用するが、ML特徴量には含まない
-        result_df["macd_histogram"] = macd_line - macd_signal  # 同上
+    def _node_macd(self, df: FeatureFrame) -> None:
+        """MACDライン（signal/histogramはSHAP分析でimportance=0のためML入力から除外）"""
+        macd_line, macd_signal = self._calculate_macd(df["close"])
+        df["macd"] = macd_line
+        df["macd_signal"] = macd_signal  # 戦略で使用するが、ML特徴量には含まない
+        df["macd_histogram"] = macd_line - macd_signal  # 同上
         self.computed_features.add("macd")
 
-        # ATR 14期間
-        result_df["atr_14"] = self._calculate_atr(result_df)
+    def _node_atr(self, df: FeatureFrame) -> None:
+        """ATR 14期間"""
+        df["atr_14"] = self._calculate_atr(df)
         self.computed_features.add("atr_14")
 
-        # BB位置のみ（bb_upper/bb_lowerはbb_positionと冗長のためML入力から除外）
-        bb_upper, bb_lower, bb_position = self._calculate_bb_bands(result_df["close"])
-        result_df["bb_upper"] = bb_upper  # 戦略で使用
-        result_df["bb_lower"] = bb_lower  # 戦略で使用
-        result_df["bb_position"] = bb_position
+    def _node_bollinger(self, df: FeatureFrame) -> None:
+        """BB位置のみ（bb_upper/bb_lowerはbb_positionと冗長のためML入力から除外）"""
+        bb_upper, bb_lower, bb_position = self._calculate_bb_bands(df["close"])
+        df["bb_upper"] = bb_upper  # 戦略で使用
+        df["bb_lower"] = bb_lower  # 戦略で使用
+        df["bb_position"] = bb_position
         self.computed_features.add("bb_position")
 
-        # EMA 2本
-        result_df["ema_20"] = result_df["close"].ewm(span=20, adjust=False).mean()
-        result_df["ema_50"] = result_df["close"].ewm(span=50, adjust=False).mean()
+    def _node_ema(self, df: FeatureFrame) -> None:
+        """EMA 2本"""
+        df["ema_20"] = df["close"].ewm(span=20, adjust=False).mean()
+        df["ema_50"] = df["close"].ewm(span=50, adjust=False).mean()
         self.computed_features.update(["ema_20", "ema_50"])
 
-        # Donchian Channel（channel_positionのみML使用）
-        donchian_high, donchian_low, channel_position = self._calculate_donchian_channel(result_df)
-        result_df["channel_position"] = channel_position
+    def _node_donchian(self, df: FeatureFrame) -> None:
+        """Donchian Channel（channel_positionのみML使用）"""
+        donchian_high, donchian_low, channel_position = self._calculate_donchian_channel(df)
+        df["channel_position"] = channel_position
         self.computed_features.add("channel_position")
 
-        # CMF/CCI（戦略で使用するが、ML特徴量にはimportance=0のため含まない）
-        result_df["cmf_20"] = self._calculate_cmf(result_df)
-        result_df["cci_20"] = self._calculate_cci(result_df)
+    def _node_cmf(self, df: FeatureFrame) -> None:
+        """CMF（戦略で使用するが、ML特徴量にはimportance=0のため含まない）"""
+        df["cmf_20"] = self._calculate_cmf(df)
+
+    def _node_cci(self, df: FeatureFrame) -> None:
+        """CCI（戦略で使用するが、ML特徴量にはimportance=0のため含まない）"""
+        df["cci_20"] = self._calculate_cci(df)
 
-        # ADX指標（3個）
-        adx, plus_di, minus_di = self._calculate_adx_indicators(result_df)
-        result_df["adx_14"] = adx
-        result_df["plus_di_14"] = plus_di
-        result_df["minus_di_14"] = minus_di
+    def _node_adx(self, df: FeatureFrame) -> None:
+        """ADX指標（3個）"""
+        adx, plus_di, minus_di = self._calculate_adx_indicators(df)
+        df["adx_14"] = adx
+        df["plus_di_14"] = plus_di
+        df["minus_di_14"] = minus_di
         self.computed_features.update(["adx_14", "plus_di_14", "minus_di_14"])
 
-        # Stochastic（戦略で使用するが、ML特徴量にはimportance=0のため含まない）
-        stoch_k, stoch_d = self._calculate_stochastic(result_df)
-        result_df["stoch_k"] = stoch_k
-        result_df["stoch_d"] = stoch_d
+    def _node_stochastic(self, df: FeatureFrame) -> None:
+        """Stochastic（戦略で使用するが、ML特徴量にはimportance=0のため含まない）"""
+        stoch_k, stoch_d = self._calculate_stochastic(df)
+        df["stoch_k"] = stoch_k
+        df["stoch_d"] = stoch_d
 
-        # 出来高EMA（Forward Selectionで+0.006改善、採用）
-        result_df["volume_ema"] = self._calculate_volume_ema(result_df["volume"])
+    def _node_volume_ema(self, df: FeatureFrame) -> None:
+        """出来高EMA（Forward Selectionで+0.006改善、採用）"""
+        df["volume_ema"] = self._calculate_volume_ema(df["volume"])
         self.computed_features.add("volume_ema")
 
-        # Williams %R（戦略で使用するが、ML特徴量にはimportance=0のため含まない）
-        result_df["williams_r_14"] = self._calculate_williams_r(result_df)
-
-        self.logger.debug("テクニカル指標生成完了: 10個ML特徴量 + 戦略用補助指標")
-        return result_df
+    def _node_williams_r(self, df: FeatureFrame) -> None:
+        """Williams %R（戦略で使用するが、ML特徴量にはimportance=0のため含まない）"""
+        df["williams_r_14"] = self._calculate_williams_r(df)
 
-    def _generate_anomaly_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+    @columnar_stage
+    def _generate_anomaly_indicators(self, df: FeatureFrame) -> FeatureFrame:
         """異常検知指標生成（1個）"""
-        result_df = df.copy()
+        for node in self.feature_graph.nodes_in_stage("anomaly"):
+            self._run_node(df, node)
+        self.logger.debug("異常検知指標生成完了: 2個")
+        return df
 
-        # 出来高比率
-        result_df["volume_ratio"] = self._calculate_volume_ratio(result_df["volume"])
+    def _node_volume_ratio(self, df: FeatureFrame) -> None:
+        """出来高比率"""
+        df["volume_ratio"] = self._calculate_volume_ratio(df["volume"])
         self.computed_features.add("volume_ratio")
 
-        self.logger.debug("異常検知指標生成完了: 2個")
-        return result_df
-
-    def _generate_lag_features(self, df: pd.DataFrame) -> pd.DataFrame:
+    @columnar_stage
+    def _generate_lag_features(self, df: FeatureFrame) -> FeatureFrame:
         """ラグ特徴量生成（過去N期間の値・7個・Phase 51.7 Day 2削減）"""
-        result_df = df.copy()
+        for node in self.feature_graph.nodes_in_stage("lag"):
+            self._run_node(df, node)
+        self.logger.debug("ラグ特徴量生成完了: 9個（Phase 51.7 Day 2削減）")
+        return df
 
-        # Phase 77: close_lag → returns変換（定常性改善・研究裏付け）
+    def _node_returns(self, df: FeatureFrame) -> None:
+        """Phase 77: close_lag → returns変換（定常性改善・研究裏付け）"""
         for lag in [1, 2, 3, 10]:
-            shifted = result_df["close"].shift(lag)
-            result_df[f"returns_{lag}"] = (
-                (result_df["close"] - shifted) / (shifted + 1e-8) * 100
-            ).fillna(0.0)
+            shifted = df["close"].shift(lag)
+            df[f"returns_{lag}"] = ((df["close"] - shifted) / (shifted + 1e-8) * 100).fillna(0.0)
             self.computed_features.add(f"returns_{lag}")
 
-        # Volume lag features (3個・全保持: volume_lag_2が最重要!)
+    def _node_volume_lag(self, df: FeatureFrame) -> None:
+        """Volume lag features (3個・全保持: volume_lag_2が最重要!)"""
         for lag in [1, 2, 3]:
-            result_df[f"volume_lag_{lag}"] = result_df["volume"].shift(lag)
+            df[f"volume_lag_{lag}"] = df["volume"].shift(lag)
             self.computed_features.add(f"volume_lag_{lag}")
 
-        # RSI lag feature (1個)
-        if "rsi_14" in result_df.columns:
-            result_df["rsi_lag_1"] = result_df["rsi_14"].shift(1)
+    def _node_rsi_lag(self, df: FeatureFrame) -> None:
+        """RSI lag feature (1個)"""
+        if "rsi_14" in df.columns:
+            df["rsi_lag_1"] = df["rsi_14"].shift(1)
             self.computed_features.add("rsi_lag_1")
 
-        # MACD lag feature (1個)
-        if "macd" in result_df.columns:
-            result_df["macd_lag_1"] = result_df["macd"].shift(1)
+    def _node_macd_lag(self, df: FeatureFrame) -> None:
+        """MACD lag feature (1個)"""
+        if "macd" in df.columns:
+            df["macd_lag_1"] = df["macd"].shift(1)
             self.computed_features.add("macd_lag_1")
 
-        self.logger.debug("ラグ特徴量生成完了: 9個（Phase 51.7 Day 2削減）")
-        return result_df
-
-    def _generate_rolling_statistics(self, df: pd.DataFrame) -> pd.DataFrame:
+    @columnar_stage
+    def _generate_rolling_statistics(self, df: FeatureFrame) -> FeatureFrame:
         """移動統計量生成（Rolling Statistics・5個・Phase 51.7 Day 2削減）"""
-        result_df = df.copy()
+        for node in self.feature_graph.nodes_in_stage("rolling"):
+            self._run_node(df, node)
+        self.logger.debug("移動統計量生成完了: 5個")
+        return df
 
-        # Moving Average (2個・close_ma_5削除: Importance=0)
+    def _node_close_ma(self, df: FeatureFrame) -> None:
+        """Moving Average (2個・close_ma_5削除: Importance=0)"""
         for window in [10, 20]:
-            result_df[f"close_ma_{window}"] = (
-                result_df["close"].rolling(window=window, min_periods=1).mean()
-            )
+            df[f"close_ma_{window}"] = df["close"].rolling(window=window, min_periods=1).mean()
             self.computed_features.add(f"close_ma_{window}")
 
-        # Standard Deviation (3個・全保持: Importance=16/12/5と非常に高い！)
+    def _node_close_std(self, df: FeatureFrame) -> None:
+        """Standard Deviation (3個・全保持: Importance=16/12/5と非常に高い！)"""
         for window in [5, 10, 20]:
-            result_df[f"close_std_{window}"] = (
-                result_df["close"].rolling(window=window, min_periods=1).std()
-            )
+            df[f"close_std_{window}"] = df["close"].rolling(window=window, min_periods=1).std()
             self.computed_features.add(f"close_std_{window}")
 
-        self.logger.debug("移動統計量生成完了: 5個")
-        return result_df
-
-    def _generate_interaction_features(self, df: pd.DataFrame) -> pd.DataFrame:
+    @columnar_stage
+    def _generate_interaction_features(self, df: FeatureFrame) -> FeatureFrame:
         """交互作用特徴量生成（Feature Interactions・5個・Phase 51.7 Day 2削減）"""
-        result_df = df.copy()
+        for node in self.feature_graph.nodes_in_stage("interaction"):
+            self._run_node(df, node)
+        self.logger.debug("交互作用特徴量生成完了: 5個（Phase 51.7 Day 2削減）")
+        return df
 
-        # RSI × ATR
-        if "rsi_14" in result_df.columns and "atr_14" in result_df.columns:
-            result_df["rsi_x_atr"] = result_df["rsi_14"] * result_df["atr_14"]
+    def _node_rsi_x_atr(self, df: FeatureFrame) -> None:
+        """RSI × ATR"""
+        if "rsi_14" in df.columns and "atr_14" in df.columns:
+            df["rsi_x_atr"] = df["rsi_14"] * df["atr_14"]
             self.computed_features.add("rsi_x_atr")
 
-        # MACD × Volume
-        if "macd" in result_df.columns and "volume" in result_df.columns:
-            result_df["macd_x_volume"] = result_df["macd"] * result_df["volume"]
+    def _node_macd_x_volume(self, df: FeatureFrame) -> None:
+        """MACD × Volume"""
+        if "macd" in df.columns and "volume" in df.columns:
+            df["macd_x_volume"] = df["macd"] * df["volume"]
             self.computed_features.add("macd_x_volume")
 
-        # BB Position × Volume Ratio
-        if "bb_position" in result_df.columns and "volume_ratio" in result_df.columns:
-            result_df["bb_position_x_volume_ratio"] = (
-                result_df["bb_position"] * result_df["volume_ratio"]
-            )
+    def _node_bb_position_x_volume_ratio(self, df: FeatureFrame) -> None:
+        """BB Position × Volume Ratio"""
+        if "bb_position" in df.columns and "volume_ratio" in df.columns:
+            df["bb_position_x_volume_ratio"] = df["bb_position"] * df["volume_ratio"]
             self.computed_features.add("bb_position_x_volume_ratio")
 
-        # Close × ATR
-        if "close" in result_df.columns and "atr_14" in result_df.columns:
-            result_df["close_x_atr"] = result_df["close"] * result_df["atr_14"]
+    def _node_close_x_atr(self, df: FeatureFrame) -> None:
+        """Close × ATR"""
+        if "close" in df.columns and "atr_14" in df.columns:
+            df["close_x_atr"] = df["close"] * df["atr_14"]
             self.computed_features.add("close_x_atr")
 
-        # Volume × BB Position
-        if "volume" in result_df.columns and "bb_position" in result_df.columns:
-            result_df["volume_x_bb_position"] = result_df["volume"] * result_df["bb_position"]
+    def _node_volume_x_bb_position(self, df: FeatureFrame) -> None:
+        """Volume × BB Position"""
+        if "volume" in df.columns and "bb_position" in df.columns:
+            df["volume_x_bb_position"] = df["volume"] * df["bb_position"]
             self.computed_features.add("volume_x_bb_position")
 
-        self.logger.debug("交互作用特徴量生成完了: 5個（Phase 51.7 Day 2削減）")
-        return result_df
-
-    def _generate_time_features(self, df: pd.DataFrame) -> pd.DataFrame:
+    @columnar_stage
+    def _generate_time_features(self, df: FeatureFrame) -> FeatureFrame:
         """時間ベース特徴量生成（5個）- Phase 77: day_cos・is_europe_session削除"""
-        result_df = df.copy()
+        self._run_node(df, "time")
+        return df
 
+    def _node_time(self, df: FeatureFrame) -> None:
+        """時間ベース特徴量（hour / day_of_week / hour_cos / day_sin）"""
         # indexまたはtimestamp列から日時情報を抽出
-        if isinstance(result_df.index, pd.DatetimeIndex):
-            dt_index = result_df.index
-        elif "timestamp" in result_df.columns:
-            dt_index = pd.DatetimeIndex(pd.to_datetime(result_df["timestamp"]))
+        if isinstance(df.index, pd.DatetimeIndex):
+            dt_index = df.index
+        elif "timestamp" in df.columns:
+            dt_index = pd.DatetimeIndex(pd.to_datetime(df["timestamp"]))
         else:
             self.logger.warning("日時情報が見つかりません。時間特徴量をデフォルト値で生成します")
-            result_df["hour"] = 0
-            result_df["day_of_week"] = 0
-            result_df["hour_cos"] = 1.0
-            result_df["day_sin"] = 0.0
+            df["hour"] = 0
+            df["day_of_week"] = 0
+            df["hour_cos"] = 1.0
+            df["day_sin"] = 0.0
             self.computed_features.update(["hour", "day_of_week", "hour_cos", "day_sin"])
-            return result_df
+            return
 
         # Hour (0-23)
-        result_df["hour"] = dt_index.hour
+        df["hour"] = dt_index.hour
         self.computed_features.add("hour")
 
         # Day of week (0-6)
-        result_df["day_of_week"] = dt_index.dayofweek
+        df["day_of_week"] = dt_index.dayofweek
         self.computed_features.add("day_of_week")
 
         # Phase 72: is_market_open_hour削除（williams_r_14に入替済み）
@@ -800,15 +1333,14 @@ class FeatureGenerator:
         # Phase 77: is_europe_session削除（hourで代替可能）
 
         # 周期性エンコーディング
-        result_df["hour_cos"] = np.cos(2 * np.pi * dt_index.hour / 24)
+        df["hour_cos"] = np.cos(2 * np.pi * dt_index.hour / 24)
         self.computed_features.add("hour_cos")
 
         # 曜日の周期性エンコーディング（Phase 77: day_cos削除、day_sinのみ保持）
-        result_df["day_sin"] = np.sin(2 * np.pi * dt_index.dayofweek / 7)
+        df["day_sin"] = np.sin(2 * np.pi * dt_index.dayofweek / 7)
         self.computed_features.add("day_sin")
 
         self.logger.debug("時間ベース特徴量生成完了: 5個（Phase 77削減）")
-        return result_df
 
     def _get_strategy_signal_feature_names(self) -> Dict[str, str]:
         """
@@ -816,18 +1348,17 @@ class FeatureGenerator:
 
         config/core/thresholds.yamlから戦略リストを読み込み、特徴量名辞書を生成。
         これにより、戦略追加時に修正が不要になる。
+        戦略メタデータはキャッシュ済みのものを使用（設定変更時のみ再ロード）。
 
         Returns:
             戦略名をキーとした特徴量名辞書
             例: {"ATRBased": "strategy_signal_ATRBased", ...}
         """
-        from ..strategies.strategy_loader import StrategyLoader
+        from ..strategies.strategy_loader import get_strategy_metadata
 
-        loader = StrategyLoader()
-        strategies_data = loader.load_strategies()
         return {
             s["metadata"]["name"]: f"strategy_signal_{s['metadata']['name']}"
-            for s in strategies_data
+            for s in get_strategy_metadata()
         }
 
     def _add_strategy_signal_features(
@@ -1007,8 +1538,8 @@ class FeatureGenerator:
         try:
             tp = (df["high"] + df["low"] + df["close"]) / 3
             sma_tp = tp.rolling(window=period, min_periods=1).mean()
-            mean_dev = tp.rolling(window=period, min_periods=1).apply(
-                lambda x: np.abs(x - x.mean()).mean(), raw=True
+            mean_dev = pd.Series(
+                rolling_mean_abs_deviation(tp.to_numpy(dtype=float), period), index=tp.index
             )
             cci = (tp - sma_tp) / (0.015 * mean_dev + 1e-8)
             return cci.fillna(0.0)
@@ -1218,9 +1749,11 @@ class FeatureGenerator:
             zeros = pd.Series(np.zeros(len(df)), index=df.index)
             return zeros, zeros, zeros
 
-    def _handle_nan_values(self, df: pd.DataFrame) -> pd.DataFrame:
+    @columnar_stage
+    def _handle_nan_values(self, df: FeatureFrame) -> FeatureFrame:
         """NaN値処理（統合版）"""
-        for feature in self.computed_features:
+        # 並列生成中は他スレッドが computed_features に追加し得るためスナップショットで走査
+        for feature in tuple(self.computed_features):
             if feature in df.columns:
                 # pandas 2.x互換性: チェーン代入を2行に分割
                 df[feature] = df[feature].ffill().bfill()
@@ -1309,6 +1842,21 @@ class FeatureGenerator:
         if total_generated == expected_count:
             self.logger.info(f"{expected_count}特徴量完全生成成功")
 
+    def _validate_requested_features(self, df: pd.DataFrame, required_features: Set[str]) -> None:
+        """遅延計算時の検証: 依存グラフで生成する要求特徴量が全て揃っているか確認"""
+        missing = sorted(
+            feature
+            for feature in required_features
+            if self.feature_graph.producer_of(feature) is not None and feature not in df.columns
+        )
+        if missing:
+            self.logger.critical(f"🚨 要求特徴量不足検出（遅延計算）: {missing}")
+        else:
+            self.logger.debug(
+                f"要求特徴量生成完了（遅延計算）: {len(required_features)}個要求・"
+                f"{len(self.node_timings)}ノード計算"
+            )
+
     def get_feature_info(self) -> Dict[str, Any]:
         """特徴量情報取得"""
         return {
@@ -0,0 +1,240 @@
+"""
+特徴量依存グラフ - 必要な特徴量のみを計算する遅延評価
+
+FeatureGenerator は従来、戦略専用指標（cmf_20 / cci_20 / stoch_k/d / williams_r_14 /
+macd_signal / bb_upper/lower）と全 ML 特徴量を無条件に計算していた。
+
+本モジュールは特徴量計算を「ノード（出力列 + 入力列）」の宣言的グラフとして定義し、
+要求された出力列集合から必要ノードだけを逆順に辿って解決する。
+
+- 要求集合は config/core/feature_order.json の特徴量レベル（full / basic）と
+  有効戦略の get_required_features() / get_optional_features() から構築
+- 無効化された戦略・小さい特徴量レベルの分は自動的に計算対象から外れる
+- ノードはパイプライン順（トポロジカル順）に並べてあり、逆順 1 パスで依存解決できる
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from ..core.config.feature_manager import get_basic_feature_names, get_feature_names
+
+# 入力 DataFrame にそのまま含まれる列（ノードでは生成しない）
+RAW_COLUMNS: Tuple[str, ...] = ("open", "high", "low", "close", "volume", "timestamp")
+
+
+@dataclass(frozen=True)
+class FeatureNode:
+    """特徴量計算ノード（FeatureGenerator._node_<name> が計算本体）."""
+
+    name: str
+    stage: str
+    outputs: Tuple[str, ...]
+    inputs: Tuple[str, ...] = ()
+    # ewm(adjust=False) 等、値が入力の先頭行まで遡って依存する（初期値の影響が指数減衰）
+    recursive: bool = False
+
+
+# パイプライン順（トポロジカル順）。出力列の並びは生成される DataFrame の列順と一致
+FEATURE_NODES: Tuple[FeatureNode, ...] = (
+    # テクニカル指標
+    FeatureNode("rsi", "technical", ("rsi_14",), ("close",)),
+    FeatureNode(
+        "macd", "technical", ("macd", "macd_signal", "macd_histogram"), ("close",), recursive=True
+    ),
+    FeatureNode("atr", "technical", ("atr_14",), ("high", "low", "close")),
+    FeatureNode("bollinger", "technical", ("bb_upper", "bb_lower", "bb_position"), ("close",)),
+    FeatureNode("ema", "technical", ("ema_20", "ema_50"), ("close",), recursive=True),
+    FeatureNode("donchian", "technical", ("channel_position",), ("high", "low", "close")),
+    FeatureNode("cmf", "technical", ("cmf_20",), ("high", "low", "close", "volume")),
+    FeatureNode("cci", "technical", ("cci_20",), ("high", "low", "close")),
+    FeatureNode(
+        "adx", "technical", ("adx_14", "plus_di_14", "minus_di_14"), ("high", "low", "close")
+    ),
+    FeatureNode("stochastic", "technical", ("stoch_k", "stoch_d"), ("high", "low", "close")),
+    FeatureNode("volume_ema", "technical", ("volume_ema",), ("volume",), recursive=True),
+    FeatureNode("williams_r", "technical", ("williams_r_14",), ("high", "low", "close")),
+    # 異常検知指標
+    FeatureNode("volume_ratio", "anomaly", ("volume_ratio",), ("volume",)),
+    # ラグ特徴量
+    FeatureNode(
+        "returns", "lag", ("returns_1", "returns_2", "returns_3", "returns_10"), ("close",)
+    ),
+    FeatureNode("volume_lag", "lag", ("volume_lag_1", "volume_lag_2", "volume_lag_3"), ("volume",)),
+    FeatureNode("rsi_lag", "lag", ("rsi_lag_1",), ("rsi_14",)),
+    FeatureNode("macd_lag", "lag", ("macd_lag_1",), ("macd",)),
+    # 移動統計量
+    FeatureNode("close_ma", "rolling", ("close_ma_10", "close_ma_20"), ("close",)),
+    FeatureNode(
+        "close_std", "rolling", ("close_std_5", "close_std_10", "close_std_20"), ("close",)
+    ),
+    # 交互作用特徴量
+    FeatureNode("rsi_x_atr", "interaction", ("rsi_x_atr",), ("rsi_14", "atr_14")),
+    FeatureNode("macd_x_volume", "interaction", ("macd_x_volume",), ("macd", "volume")),
+    FeatureNode(
+        "bb_position_x_volume_ratio",
+        "interaction",
+        ("bb_position_x_volume_ratio",),
+        ("bb_position", "volume_ratio"),
+    ),
+    FeatureNode("close_x_atr", "interaction", ("close_x_atr",), ("close", "atr_14")),
+    FeatureNode(
+        "volume_x_bb_position", "interaction", ("volume_x_bb_position",), ("volume", "bb_position")
+    ),
+    # 時間特徴量（index / timestamp 列から生成）
+    FeatureNode("time", "time", ("hour", "day_of_week", "hour_cos", "day_sin")),
+    # Phase 89-β: 外部 API 派生
+    FeatureNode(
+        "external",
+        "external",
+        (
+            "funding_rate_8h_avg",
+            "fear_greed_index",
+            "ofi_top5",
+            "bid_ask_imbalance",
+            "depth_ratio",
+            "btc_dominance_change",
+            "usdjpy_change",
+            "nikkei_change_proxy",
+            "btc_realized_vol_24h",
+            "btc_funding_premium",
+        ),
+        ("close",),
+    ),
+    # Phase 89-γ: VPIN + HMM 状態確率（HMM の入力列は regime_classifier 依存のため実行時に追加）
+    FeatureNode(
+        "vpin", "microstructure_advanced", ("vpin", "vpin_ma20", "vpin_change"), ("close", "volume")
+    ),
+    FeatureNode(
+        "hmm_state", "microstructure_advanced", ("hmm_state_bear_prob", "hmm_state_bull_prob")
+    ),
+    # Phase 89-δ: BTC-ETH 相関
+    FeatureNode(
+        "cross_asset",
+        "cross_asset",
+        ("eth_btc_price_ratio", "eth_btc_corr_24h", "eth_returns_15m"),
+        ("close",),
+    ),
+)
+
+# 入力全体（最新行・外部 API 値・cross_asset 履歴）から決まる 1 つの値を全行に持つ列
+# （部分再計算では再利用行も最新の値で上書きする。causal=True の HMM 状態確率は行毎のため対象外）
+FRAME_LEVEL_FEATURES: Tuple[str, ...] = (
+    "funding_rate_8h_avg",
+    "fear_greed_index",
+    "ofi_top5",
+    "bid_ask_imbalance",
+    "depth_ratio",
+    "btc_dominance_change",
+    "usdjpy_change",
+    "nikkei_change_proxy",
+    "btc_funding_premium",
+    "hmm_state_bear_prob",
+    "hmm_state_bull_prob",
+    "eth_btc_price_ratio",
+    "eth_btc_corr_24h",
+    "eth_returns_15m",
+)
+
+
+class FeatureGraph:
+    """特徴量依存グラフ（要求出力列 → 必要ノード集合の解決）."""
+
+    def __init__(
+        self,
+        nodes: Sequence[FeatureNode] = FEATURE_NODES,
+        extra_inputs: Optional[Dict[str, Sequence[str]]] = None,
+    ):
+        """
+        初期化
+
+        Args:
+            nodes: パイプライン順のノード列
+            extra_inputs: 実行時に決まる追加入力列（例: {"hmm_state": HMM 入力特徴量}）
+        """
+        extra_inputs = extra_inputs or {}
+        self.nodes: Tuple[FeatureNode, ...] = tuple(
+            FeatureNode(
+                node.name,
+                node.stage,
+                node.outputs,
+                node.inputs + tuple(extra_inputs.get(node.name, ())),
+                node.recursive,
+            )
+            for node in nodes
+        )
+        self._producers: Dict[str, str] = {
+            column: node.name for node in self.nodes for column in node.outputs
+        }
+
+    def producer_of(self, column: str) -> Optional[str]:
+        """列を生成するノード名（入力列・未知列は None）."""
+        return self._producers.get(column)
+
+    def nodes_in_stage(self, stage: str) -> List[str]:
+        """ステージに属するノード名（パイプライン順）."""
+        return [node.name for node in self.nodes if node.stage == stage]
+
+    def resolve(self, requested: Iterable[str]) -> Set[str]:
+        """
+        要求列の計算に必要なノード名集合を解決
+
+        ノードはトポロジカル順のため、逆順 1 パスで推移的依存まで解決できる。
+        グラフで生成しない列（OHLCV・strategy_signal_* 等）は無視する。
+
+        Args:
+            requested: 必要な出力列
+
+        Returns:
+            計算が必要なノード名の集合
+        """
+        needed = set(requested)
+        active: Set[str] = set()
+        for node in reversed(self.nodes):
+            if needed.intersection(node.outputs):
+                active.add(node.name)
+                needed.update(node.inputs)
+        return active
+
+    def recursive_outputs(self) -> Set[str]:
+        """先頭行まで遡って依存する列（recursive ノードの出力とその派生列）."""
+        recursive: Set[str] = set()
+        for node in self.nodes:
+            if node.recursive or recursive.intersection(node.inputs):
+                recursive.update(node.outputs)
+        return recursive
+
+    def outputs_of(self, active: Iterable[str]) -> Set[str]:
+        """ノード集合が生成する列の集合."""
+        active = set(active)
+        return {column for node in self.nodes if node.name in active for column in node.outputs}
+
+
+def collect_required_features(
+    feature_level: str = "full",
+    strategies: Iterable = (),
+    extra_features: Iterable[str] = (),
+) -> Set[str]:
+    """
+    特徴量レベルと有効戦略から要求特徴量集合を構築
+
+    Args:
+        feature_level: "full" / "basic"（config/core/feature_order.json の feature_levels）
+        strategies: 戦略インスタンス（is_enabled=False の戦略は除外）
+        extra_features: その他の消費側が必要とする列
+
+    Returns:
+        要求特徴量名の集合
+    """
+    if feature_level == "basic":
+        required = set(get_basic_feature_names())
+    else:
+        required = set(get_feature_names())
+
+    for strategy in strategies:
+        if not getattr(strategy, "is_enabled", True):
+            continue
+        required.update(strategy.get_required_features())
+        required.update(strategy.get_optional_features())
+
+    required.update(extra_features)
+    return required
@@ -0,0 +1,512 @@
+"""
+特徴量ストア - バックテスト・学習用の永続特徴量キャッシュ
+
+scripts/ml/create_ml_models.py・walk_forward_validation.py・BacktestRunner._precompute_features は
+同じ src/backtest/data の CSV から毎回同一の特徴量を再計算していた。
+本モジュールは計算結果をディスクへ保存し、次回以降はロードのみで済ませる。
+
+設計:
+- コンテンツアドレス: キー = sha256(入力 OHLCV ハッシュ + feature_order.json バージョン
+  + 特徴量生成コードバージョン + 特徴量設定バージョン + variant)
+- 列指向・メモリマップ可能な形式: エントリ毎のディレクトリに列単位の .npy + meta.json
+  （np.load(mmap_mode="r") でページキャッシュから直接読み込み）
+- 書き込みは一時ディレクトリ → rename のアトミック置換（並列実行でも壊れたエントリを残さない）
+- 保存・読み込み失敗は警告のみ（呼び出し側は常に再計算にフォールバック）
+
+無効化ルール:
+- 入力データ・feature_order.json バージョン・生成コード・特徴量の値を決める設定
+  （thresholds.yaml の FEATURE_CONFIG_SECTIONS: 異常検知・rolling 期間等）のいずれかが変わればキーが変わる
+- 旧バージョンのエントリ（stale）・max_age_days 超過・max_size_mb 超過（最終アクセスが古い順）・
+  meta.json 破損エントリは prune() で削除（put() 後に自動実行）
+- FEATURE_STORE_DISABLED=1 環境変数または config disable で完全無効化可能
+
+CLI: scripts/maintenance/feature_store_cli.py（list / stats / prune / clear）
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import uuid
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..core.config.feature_manager import get_feature_order_version
+from ..core.config.threshold_manager import get_threshold
+from ..core.logger import get_logger
+
+# 特徴量の値を決めるソース（変更時は全エントリが自動的に無効化される）
+GENERATOR_SOURCES = ("feature_generator.py", "feature_graph.py", "feature_frame.py", "constants.py")
+
+# 特徴量の値を決める設定セクション（thresholds.yaml・変更時は全エントリが自動的に無効化される）
+# （anomaly_detection.volume_ratio.calculation_period 等を FeatureGenerator が参照）
+FEATURE_CONFIG_SECTIONS = ("anomaly_detection",)
+
+META_FILE = "meta.json"
+INDEX_FILE = "index.npy"
+
+
+@lru_cache(maxsize=1)
+def get_generator_code_version() -> str:
+    """特徴量生成コードのバージョン（GENERATOR_SOURCES の sha256 先頭 16 文字）."""
+    digest = hashlib.sha256()
+    base = Path(__file__).resolve().parent
+    for name in GENERATOR_SOURCES:
+        path = base / name
+        digest.update(name.encode("utf-8"))
+        if path.exists():
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def get_feature_config_version() -> str:
+    """特徴量の値を決める設定（FEATURE_CONFIG_SECTIONS）の sha256 先頭 16 文字."""
+    config = {section: get_threshold(section, {}) for section in FEATURE_CONFIG_SECTIONS}
+    payload = json.dumps(config, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def save_frame_arrays(directory: Path, df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    DataFrame を列単位の .npy + index.npy として directory に保存
+
+    Returns:
+        load_frame_arrays() に渡す meta（columns / object_columns / index / rows）
+    """
+    object_columns = []
+    for i, name in enumerate(df.columns):
+        values = df[name].to_numpy()
+        is_object = values.dtype == object
+        object_columns.append(is_object)
+        np.save(directory / f"{i}.npy", values, allow_pickle=is_object)
+    return {
+        "columns": [str(c) for c in df.columns],
+        "object_columns": object_columns,
+        "index": FeatureStore._save_index(directory, df.index),
+        "rows": len(df),
+    }
+
+
+def load_frame_arrays(directory: Path, meta: Dict[str, Any]) -> pd.DataFrame:
+    """save_frame_arrays() の保存内容をロード（数値列は mmap・DataFrame は書き込み可能なコピー）."""
+    columns = {}
+    for i, (name, is_object) in enumerate(zip(meta["columns"], meta["object_columns"])):
+        # object 列は pickle 形式のため mmap 不可
+        if is_object:
+            columns[name] = np.load(directory / f"{i}.npy", allow_pickle=True)
+        else:
+            columns[name] = np.load(directory / f"{i}.npy", mmap_mode="r")
+    index = FeatureStore._load_index(directory, meta)
+    return pd.DataFrame(columns, index=index, columns=meta["columns"])
+
+
+class FeatureStore:
+    """特徴量 DataFrame のコンテンツアドレス型ディスクストア."""
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        enabled: Optional[bool] = None,
+        max_size_mb: Optional[float] = None,
+        max_age_days: Optional[float] = None,
+    ):
+        """
+        初期化
+
+        Args:
+            root: 保存ディレクトリ（None で config から取得）
+            enabled: 有効化フラグ（None で config + FEATURE_STORE_DISABLED から判定）
+            max_size_mb: 合計サイズ上限 MB（None で config から取得）
+            max_age_days: エントリ保持日数（None で config から取得）
+        """
+        self.logger = get_logger()
+        self._lock = threading.RLock()
+
+        self.root = Path(
+            root if root is not None else get_threshold("features.store.dir", ".cache/features")
+        )
+        if enabled is None:
+            enabled = get_threshold("features.store.enabled", True) and os.environ.get(
+                "FEATURE_STORE_DISABLED", ""
+            ).lower() not in ("1", "true")
+        self.enabled = bool(enabled)
+        self.max_size_mb = (
+            max_size_mb
+            if max_size_mb is not None
+            else get_threshold("features.store.max_size_mb", 2048)
+        )
+        self.max_age_days = (
+            max_age_days
+            if max_age_days is not None
+            else get_threshold("features.store.max_age_days", 30)
+        )
+
+        self._stats: Dict[str, int] = {"hits": 0, "misses": 0, "writes": 0, "errors": 0}
+
+    # ------------------------------------------------------------------
+    # キー生成
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def hash_source(df: pd.DataFrame) -> str:
+        """入力 DataFrame（index・列名・全値）の sha256."""
+        digest = hashlib.sha256()
+        digest.update("|".join(map(str, df.columns)).encode("utf-8"))
+        digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    def compute_key(self, df: pd.DataFrame, variant: str = "sync") -> str:
+        """
+        入力データ・特徴量定義・生成コード・特徴量設定から決定論的なキーを生成
+
+        Args:
+            df: 入力 OHLCV DataFrame
+            variant: 計算方式の識別子（例: "sync" / "primary"）
+
+        Returns:
+            32 文字のキー
+        """
+        signature = "|".join(
+            [
+                self.hash_source(df),
+                get_feature_order_version(),
+                get_generator_code_version(),
+                get_feature_config_version(),
+                variant,
+            ]
+        )
+        return hashlib.sha256(signature.encode("utf-8")).hexdigest()[:32]
+
+    # ------------------------------------------------------------------
+    # 読み書き
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        エントリをロード（列は mmap で読み込み、DataFrame は書き込み可能なコピー）
+
+        Returns:
+            特徴量 DataFrame（ミス・無効化・破損時 None）
+        """
+        if not self.enabled:
+            return None
+
+        entry = self.root / key
+        with self._lock:
+            meta = self._read_meta(entry)
+            if meta is None:
+                self._stats["misses"] += 1
+                return None
+
+            try:
+                df = load_frame_arrays(entry, meta)
+            except Exception as e:
+                self.logger.warning(f"⚠️ 特徴量ストア読み込み失敗（破損エントリ削除）: {key}: {e}")
+                self._stats["errors"] += 1
+                self._stats["misses"] += 1
+                shutil.rmtree(entry, ignore_errors=True)
+                return None
+
+            meta["last_accessed"] = datetime.now().isoformat()
+            self._write_meta(entry, meta)
+            self._stats["hits"] += 1
+            return df
+
+    def put(
+        self,
+        key: str,
+        df: pd.DataFrame,
+        variant: str = "sync",
+        source: Optional[str] = None,
+        source_hash: Optional[str] = None,
+    ) -> bool:
+        """
+        エントリを保存（アトミック置換・保存後に prune を自動実行）
+
+        Args:
+            key: compute_key() のキー
+            df: 特徴量 DataFrame
+            variant: 計算方式の識別子
+            source: 入力データの説明（CLI 表示用・例: CSV パス）
+            source_hash: 入力データのハッシュ（CLI 表示用）
+
+        Returns:
+            保存成功なら True
+        """
+        if not self.enabled:
+            return False
+
+        entry = self.root / key
+        tmp = self.root / f".{key}.tmp-{uuid.uuid4().hex[:8]}"
+        try:
+            tmp.mkdir(parents=True)
+            frame_meta = save_frame_arrays(tmp, df)
+
+            now = datetime.now().isoformat()
+            meta = {
+                "key": key,
+                **frame_meta,
+                "variant": variant,
+                "source": source,
+                "source_hash": source_hash,
+                "feature_order_version": get_feature_order_version(),
+                "code_version": get_generator_code_version(),
+                "config_version": get_feature_config_version(),
+                "created_at": now,
+                "last_accessed": now,
+            }
+            self._write_meta(tmp, meta)
+
+            with self._lock:
+                if entry.exists():
+                    shutil.rmtree(entry, ignore_errors=True)
+                os.replace(tmp, entry)
+                self._stats["writes"] += 1
+        except Exception as e:
+            self.logger.warning(f"⚠️ 特徴量ストア保存失敗: {key}: {e}")
+            self._stats["errors"] += 1
+            shutil.rmtree(tmp, ignore_errors=True)
+            return False
+
+        self.prune()
+        return True
+
+    def load_or_compute(
+        self,
+        df: pd.DataFrame,
+        compute: Callable[[], pd.DataFrame],
+        variant: str = "sync",
+        source: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        ストアにあればロード、無ければ compute() で計算して保存
+
+        Args:
+            df: 入力 OHLCV DataFrame（キー生成用）
+            compute: 特徴量計算関数
+            variant: 計算方式の識別子
+            source: 入力データの説明（CLI 表示用）
+
+        Returns:
+            特徴量 DataFrame
+        """
+        if not self.enabled:
+            return compute()
+
+        key, source_hash, cached = self._lookup(df, variant, source)
+        if cached is not None:
+            return cached
+
+        features_df = compute()
+        self.put(key, features_df, variant=variant, source=source, source_hash=source_hash)
+        return features_df
+
+    async def load_or_compute_async(
+        self,
+        df: pd.DataFrame,
+        compute: Callable[[], Awaitable[pd.DataFrame]],
+        variant: str = "sync",
+        source: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        load_or_compute() の非同期版（compute は FeatureGenerator.generate_features 等の coroutine）
+
+        Args:
+            df: 入力 OHLCV DataFrame（キー生成用）
+            compute: 特徴量計算 coroutine 関数
+            variant: 計算方式の識別子
+            source: 入力データの説明（CLI 表示用）
+
+        Returns:
+            特徴量 DataFrame
+        """
+        if not self.enabled:
+            return await compute()
+
+        key, source_hash, cached = self._lookup(df, variant, source)
+        if cached is not None:
+            return cached
+
+        features_df = await compute()
+        self.put(key, features_df, variant=variant, source=source, source_hash=source_hash)
+        return features_df
+
+    def _lookup(
+        self, df: pd.DataFrame, variant: str, source: Optional[str]
+    ) -> Tuple[str, str, Optional[pd.DataFrame]]:
+        """load_or_compute 共通: (キー, 入力ハッシュ, ストアの特徴量 or None)."""
+        source_hash = self.hash_source(df)
+        key = self.compute_key(df, variant)
+        cached = self.get(key)
+        if cached is not None:
+            self.logger.info(f"⚡ 特徴量ストアヒット: {source or key}（{len(cached)}行）")
+        return key, source_hash, cached
+
+    # ------------------------------------------------------------------
+    # 管理（CLI から使用）
+    # ------------------------------------------------------------------
+
+    def list_entries(self) -> List[Dict[str, Any]]:
+        """全エントリのメタデータ（size_bytes・stale 付き・最終アクセス降順）."""
+        entries = []
+        if not self.root.exists():
+            return entries
+        for entry in self.root.iterdir():
+            if not entry.is_dir() or entry.name.startswith("."):
+                continue
+            meta = self._read_meta(entry) or {"key": entry.name, "corrupt": True}
+            meta["size_bytes"] = sum(p.stat().st_size for p in entry.iterdir() if p.is_file())
+            meta["stale"] = self._is_stale(meta)
+            entries.append(meta)
+        entries.sort(key=lambda m: m.get("last_accessed", ""), reverse=True)
+        return entries
+
+    def prune(
+        self,
+        stale: bool = True,
+        max_age_days: Optional[float] = None,
+        max_size_mb: Optional[float] = None,
+        dry_run: bool = False,
+    ) -> List[str]:
+        """
+        無効化ルールに従ってエントリを削除
+
+        Args:
+            stale: 旧 feature_order.json / 旧生成コード / 旧設定のエントリ・破損エントリを削除
+            max_age_days: 作成からの保持日数（None で self.max_age_days）
+            max_size_mb: 合計サイズ上限（None で self.max_size_mb・最終アクセスが古い順に削除）
+            dry_run: True なら削除せず対象キーのみ返す
+
+        Returns:
+            削除（対象）キーのリスト
+        """
+        max_age_days = self.max_age_days if max_age_days is None else max_age_days
+        max_size_mb = self.max_size_mb if max_size_mb is None else max_size_mb
+
+        with self._lock:
+            entries = self.list_entries()
+            removed: List[str] = []
+            cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat()
+            kept = []
+            for meta in entries:
+                if (stale and (meta.get("corrupt") or meta["stale"])) or (
+                    meta.get("created_at", "") < cutoff
+                ):
+                    removed.append(meta["key"])
+                else:
+                    kept.append(meta)
+
+            # サイズ上限: 最終アクセスが古いエントリから削除
+            total = sum(meta["size_bytes"] for meta in kept)
+            limit = max_size_mb * 1024 * 1024
+            for meta in reversed(kept):
+                if total <= limit:
+                    break
+                removed.append(meta["key"])
+                total -= meta["size_bytes"]
+
+            if not dry_run:
+                for key in removed:
+                    shutil.rmtree(self.root / key, ignore_errors=True)
+                if removed:
+                    self.logger.info(f"🧹 特徴量ストア prune: {len(removed)}件削除")
+            return removed
+
+    def clear(self) -> int:
+        """全エントリを削除し、削除件数を返す."""
+        with self._lock:
+            entries = self.list_entries()
+            for meta in entries:
+                shutil.rmtree(self.root / meta["key"], ignore_errors=True)
+            return len(entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """統計取得."""
+        entries = self.list_entries()
+        total = self._stats["hits"] + self._stats["misses"]
+        hit_rate = (self._stats["hits"] / total * 100) if total > 0 else 0.0
+        return {
+            **self._stats,
+            "entries": len(entries),
+            "stale_entries": sum(1 for meta in entries if meta["stale"]),
+            "size_mb": round(sum(meta["size_bytes"] for meta in entries) / 1024 / 1024, 2),
+            "max_size_mb": self.max_size_mb,
+            "hit_rate_percent": round(hit_rate, 2),
+            "enabled": self.enabled,
+            "root": str(self.root),
+        }
+
+    # ------------------------------------------------------------------
+    # 内部処理
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _is_stale(meta: Dict[str, Any]) -> bool:
+        """旧 feature_order.json / 旧生成コード / 旧設定で作られたエントリか."""
+        return (
+            meta.get("feature_order_version") != get_feature_order_version()
+            or meta.get("code_version") != get_generator_code_version()
+            or meta.get("config_version") != get_feature_config_version()
+        )
+
+    @staticmethod
+    def _read_meta(entry: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(entry / META_FILE, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_meta(entry: Path, meta: Dict[str, Any]) -> None:
+        with open(entry / META_FILE, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+
+    @staticmethod
+    def _save_index(entry: Path, index: pd.Index) -> Dict[str, Any]:
+        """index を保存（DatetimeIndex は tz を meta に分離して datetime64[ns] で保存）."""
+        if isinstance(index, pd.DatetimeIndex):
+            tz = str(index.tz) if index.tz is not None else None
+            values = (index.tz_convert(None) if tz else index).to_numpy(dtype="datetime64[ns]")
+            np.save(entry / INDEX_FILE, values)
+            return {"kind": "datetime", "tz": tz, "name": index.name}
+        values = index.to_numpy()
+        np.save(entry / INDEX_FILE, values, allow_pickle=values.dtype == object)
+        return {"kind": "generic", "name": index.name}
+
+    @staticmethod
+    def _load_index(entry: Path, meta: Dict[str, Any]) -> pd.Index:
+        index_meta = meta["index"]
+        if index_meta["kind"] == "datetime":
+            index = pd.DatetimeIndex(np.load(entry / INDEX_FILE), name=index_meta["name"])
+            if index_meta["tz"]:
+                index = index.tz_localize("UTC").tz_convert(index_meta["tz"])
+            return index
+        return pd.Index(np.load(entry / INDEX_FILE, allow_pickle=True), name=index_meta["name"])
+
+
+_feature_store: Optional[FeatureStore] = None
+_singleton_lock = threading.Lock()
+
+
+def get_feature_store() -> FeatureStore:
+    """グローバル FeatureStore シングルトン."""
+    global _feature_store
+    if _feature_store is None:
+        with _singleton_lock:
+            if _feature_store is None:
+                _feature_store = FeatureStore()
+    return _feature_store
+
+
+def reset_feature_store() -> None:
+    """テスト用: シングルトンを再生成."""
+    global _feature_store
+    with _singleton_lock:
+        _feature_store = None
@@ -0,0 +1,605 @@
+"""
+インクリメンタル特徴量エンジン - 新規 1 本の足から最新行を O(1) で計算
+
+FeatureGenerator._run_feature_pipeline() は 15m 足 1 本追加のたびに 200 行 × 55 特徴量を
+全再計算する。本モジュールは各指標の状態（EMA 値・リングバッファ）を保持し、
+update(candle) 1 回で新しい 1 行分の特徴量だけを計算する。
+
+設計:
+- 各 rolling 指標は collections.deque(maxlen=window) のリングバッファで保持
+- EMA / MACD は adjust=False の漸化式をそのまま保持（pandas ewm と同一定義）
+- NaN 処理は _handle_nan_values() と同じく「直前の有効値で ffill → 無ければ 0」
+- 出力は直近 history_size 行のみ保持し、to_frame() で DataFrame 化
+
+バッチとの一致保証:
+- 同じ履歴の先頭から update() を流した場合、WARMUP_ROWS 行目以降は
+  generate_features_sync() と許容誤差内で一致する
+- 先頭の warm-up 区間はバッチ側が bfill（未来値参照）で埋めているため一致しない
+  （内訳は constants.FEATURE_WARMUP_ROWS 参照）
+- HMM 状態確率は DataFrame 全体を要求するため update() の引数で受け取る（None なら 1/3）
+"""
+
+import math
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..core.config import get_anomaly_config
+from ..core.exceptions import DataProcessingError
+from .constants import FEATURE_WARMUP_ROWS
+
+# 指標パラメータ（FeatureGenerator のデフォルト引数と同一）
+_RSI_PERIOD = 14
+_ATR_PERIOD = 14
+_ADX_PERIOD = 14
+_BB_PERIOD = 20
+_DONCHIAN_PERIOD = 20
+_CMF_PERIOD = 20
+_CCI_PERIOD = 20
+_STOCH_PERIOD = 14
+_STOCH_SMOOTH = 3
+_WILLIAMS_PERIOD = 14
+_VPIN_WINDOW = 50
+_REALIZED_VOL_WINDOW = 96
+_REALIZED_VOL_MIN_PERIODS = 24
+_CROSS_ASSET_HISTORY = 96
+
+_RETURN_LAGS = (1, 2, 3, 10)
+_VOLUME_LAGS = (1, 2, 3)
+_MA_WINDOWS = (10, 20)
+_STD_WINDOWS = (5, 10, 20)
+
+# _handle_nan_values() の対象外（バッチ側でも ffill/bfill されない戦略用補助指標）
+_NON_FILLED_FEATURES = frozenset(
+    {
+        "macd_signal",
+        "macd_histogram",
+        "bb_upper",
+        "bb_lower",
+        "cmf_20",
+        "cci_20",
+        "stoch_k",
+        "stoch_d",
+        "williams_r_14",
+    }
+)
+
+# バッチ出力と同じ列順（OHLCV の後にパイプライン順で追加される）
+FEATURE_COLUMNS: List[str] = [
+    "rsi_14",
+    "macd",
+    "macd_signal",
+    "macd_histogram",
+    "atr_14",
+    "bb_upper",
+    "bb_lower",
+    "bb_position",
+    "ema_20",
+    "ema_50",
+    "channel_position",
+    "cmf_20",
+    "cci_20",
+    "adx_14",
+    "plus_di_14",
+    "minus_di_14",
+    "stoch_k",
+    "stoch_d",
+    "volume_ema",
+    "williams_r_14",
+    "volume_ratio",
+    *[f"returns_{lag}" for lag in _RETURN_LAGS],
+    *[f"volume_lag_{lag}" for lag in _VOLUME_LAGS],
+    "rsi_lag_1",
+    "macd_lag_1",
+    *[f"close_ma_{w}" for w in _MA_WINDOWS],
+    *[f"close_std_{w}" for w in _STD_WINDOWS],
+    "rsi_x_atr",
+    "macd_x_volume",
+    "bb_position_x_volume_ratio",
+    "close_x_atr",
+    "volume_x_bb_position",
+    "hour",
+    "day_of_week",
+    "hour_cos",
+    "day_sin",
+    "funding_rate_8h_avg",
+    "fear_greed_index",
+    "ofi_top5",
+    "bid_ask_imbalance",
+    "depth_ratio",
+    "btc_dominance_change",
+    "usdjpy_change",
+    "nikkei_change_proxy",
+    "btc_realized_vol_24h",
+    "btc_funding_premium",
+    "vpin",
+    "vpin_ma20",
+    "vpin_change",
+    "hmm_state_bear_prob",
+    "hmm_state_bull_prob",
+    "eth_btc_price_ratio",
+    "eth_btc_corr_24h",
+    "eth_returns_15m",
+]
+
+_OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+
+def _window_mean(buf: Iterable[float]) -> float:
+    """NaN を除いた平均（pandas rolling(min_periods=1).mean() 相当）."""
+    values = [v for v in buf if not math.isnan(v)]
+    if not values:
+        return math.nan
+    return sum(values) / len(values)
+
+
+def _window_std(buf: Iterable[float], min_periods: int = 1) -> float:
+    """NaN を除いた標本標準偏差（ddof=1・pandas rolling().std() 相当）."""
+    values = [v for v in buf if not math.isnan(v)]
+    n = len(values)
+    if n < max(min_periods, 2):
+        return math.nan
+    mean = sum(values) / n
+    return math.sqrt(sum((v - mean) ** 2 for v in values) / (n - 1))
+
+
+def _ema_step(prev: Optional[float], value: float, span: int) -> float:
+    """pandas ewm(span, adjust=False).mean() の 1 ステップ."""
+    if prev is None or math.isnan(prev):
+        return value
+    alpha = 2.0 / (span + 1.0)
+    return alpha * value + (1.0 - alpha) * prev
+
+
+def _normal_cdf(z: float) -> float:
+    """標準正規分布の累積分布関数（scipy.stats.norm.cdf 相当）."""
+    return 0.5 * (1.0 + math.erf(z / math.sqrt(2.0)))
+
+
+class IncrementalFeatureEngine:
+    """
+    ストリーミング特徴量エンジン
+
+    使用例:
+        engine = IncrementalFeatureEngine()
+        engine.warm_up(history_df)           # 過去足で状態を構築
+        row = engine.update(new_candle)      # 新しい足 1 本 → 最新行の特徴量 dict
+        features_df = engine.to_frame()      # 直近 history_size 行の DataFrame
+    """
+
+    # この行数以降はバッチ計算（generate_features_sync）と一致する
+    WARMUP_ROWS: int = FEATURE_WARMUP_ROWS
+
+    def __init__(
+        self,
+        history_size: int = 200,
+        volume_ratio_period: Optional[int] = None,
+    ) -> None:
+        """
+        初期化
+
+        Args:
+            history_size: to_frame() で保持する直近出力行数
+            volume_ratio_period: 出来高比率の平均期間（None で異常検知設定から取得）
+        """
+        self.history_size = history_size
+        self.volume_ratio_period = volume_ratio_period or get_anomaly_config(
+            "volume_ratio.calculation_period", 20
+        )
+        self.reset()
+
+    def reset(self) -> None:
+        """全状態を初期化."""
+        self.rows_processed = 0
+        self._prev_close: Optional[float] = None
+        self._prev_high: Optional[float] = None
+        self._prev_low: Optional[float] = None
+
+        # EMA 状態
+        self._ema: Dict[str, Optional[float]] = {
+            "ema_12": None,
+            "ema_26": None,
+            "macd_signal": None,
+            "ema_20": None,
+            "ema_50": None,
+            "volume_ema": None,
+        }
+
+        # リングバッファ
+        self._closes: Deque[float] = deque(maxlen=max(_RETURN_LAGS) + 1)
+        self._volumes: Deque[float] = deque(maxlen=max(_VOLUME_LAGS) + 1)
+        self._gains: Deque[float] = deque(maxlen=_RSI_PERIOD)
+        self._losses: Deque[float] = deque(maxlen=_RSI_PERIOD)
+        self._atr_tr: Deque[float] = deque(maxlen=_ATR_PERIOD)
+        self._adx_tr: Deque[float] = deque(maxlen=_ADX_PERIOD)
+        self._plus_dm: Deque[float] = deque(maxlen=_ADX_PERIOD)
+        self._minus_dm: Deque[float] = deque(maxlen=_ADX_PERIOD)
+        self._dx: Deque[float] = deque(maxlen=_ADX_PERIOD)
+        self._close_window: Deque[float] = deque(maxlen=max(_BB_PERIOD, *_MA_WINDOWS))
+        self._highs: Deque[float] = deque(maxlen=max(_DONCHIAN_PERIOD, _STOCH_PERIOD))
+        self._lows: Deque[float] = deque(maxlen=max(_DONCHIAN_PERIOD, _STOCH_PERIOD))
+        self._mfv: Deque[float] = deque(maxlen=_CMF_PERIOD)
+        self._cmf_volume: Deque[float] = deque(maxlen=_CMF_PERIOD)
+        self._tp: Deque[float] = deque(maxlen=_CCI_PERIOD)
+        self._stoch_fast: Deque[float] = deque(maxlen=_STOCH_SMOOTH)
+        self._stoch_k: Deque[float] = deque(maxlen=3)
+        self._volume_ratio_window: Deque[float] = deque(maxlen=self.volume_ratio_period)
+        self._log_returns: Deque[float] = deque(maxlen=_REALIZED_VOL_WINDOW)
+        self._vpin_returns: Deque[float] = deque(maxlen=_VPIN_WINDOW)
+        self._vpin_imbalance: Deque[float] = deque(maxlen=_VPIN_WINDOW)
+        self._vpin_volume: Deque[float] = deque(maxlen=_VPIN_WINDOW)
+        self._vpin_values: Deque[float] = deque(maxlen=20)
+        self._btc_history: Deque[float] = deque(maxlen=_CROSS_ASSET_HISTORY)
+        self._eth_history: Deque[float] = deque(maxlen=_CROSS_ASSET_HISTORY)
+
+        # 直前行（lag 特徴量・ffill 用）
+        self._last_raw: Dict[str, float] = {}
+        self._last_valid: Dict[str, float] = {}
+        self._rows: Deque[Dict[str, float]] = deque(maxlen=self.history_size)
+        self._index: Deque[Any] = deque(maxlen=self.history_size)
+
+    def warm_up(self, df: pd.DataFrame) -> None:
+        """
+        過去データで状態を構築（既存状態は破棄）
+
+        Args:
+            df: OHLCV を含む DataFrame（DatetimeIndex または timestamp 列）
+        """
+        missing = [col for col in _OHLCV_COLUMNS if col not in df.columns]
+        if missing:
+            raise DataProcessingError(f"必要列が不足: {missing}")
+
+        self.reset()
+        timestamps = self._extract_timestamps(df)
+        columns = {col: df[col].to_numpy(dtype=float) for col in _OHLCV_COLUMNS}
+        for i in range(len(df)):
+            candle = {col: columns[col][i] for col in _OHLCV_COLUMNS}
+            self.update(candle, timestamp=timestamps[i] if timestamps is not None else None)
+
+    def update(
+        self,
+        candle: Mapping[str, Any],
+        timestamp: Optional[Any] = None,
+        external_values: Optional[Dict[str, float]] = None,
+        hmm_probs: Optional[Dict[str, float]] = None,
+    ) -> Dict[str, float]:
+        """
+        新しい足 1 本を取り込み、その行の特徴量を返す
+
+        Args:
+            candle: open/high/low/close/volume を含む dict または pd.Series
+                （timestamp キー、または Series.name を日時として使用）
+            timestamp: 足の日時（candle 側より優先）
+            external_values: FeatureGenerator._fetch_external_values() と同形式の dict
+            hmm_probs: regime_classifier.get_hmm_state_probabilities() の戻り値
+
+        Returns:
+            OHLCV + 全特徴量の dict（最新 1 行分）
+        """
+        try:
+            o = float(candle["open"])
+            h = float(candle["high"])
+            low = float(candle["low"])
+            c = float(candle["close"])
+            v = float(candle["volume"])
+        except (KeyError, TypeError, ValueError) as e:
+            raise DataProcessingError(f"インクリメンタル特徴量: 足データ不正: {e}")
+
+        if timestamp is None:
+            if isinstance(candle, Mapping) and "timestamp" in candle:
+                timestamp = candle["timestamp"]
+            elif isinstance(candle, pd.Series):
+                timestamp = candle.name
+
+        raw: Dict[str, float] = {"open": o, "high": h, "low": low, "close": c, "volume": v}
+        self._update_technical(raw, h, low, c, v)
+        self._update_lag_and_rolling(raw, c, v)
+        self._update_interactions(raw)
+        self._update_time(raw, timestamp)
+        self._update_external(raw, c, external_values)
+        self._update_vpin(raw, c, v)
+        self._update_hmm(raw, hmm_probs)
+        self._update_cross_asset(raw, c, external_values)
+
+        # 次の足のための状態更新（lag 用は NaN 処理前の値を保持）
+        self._prev_close, self._prev_high, self._prev_low = c, h, low
+        self._last_raw = raw
+        self.rows_processed += 1
+
+        row = self._fill_nan(raw)
+        self._rows.append(row)
+        self._index.append(timestamp if timestamp is not None else self.rows_processed - 1)
+        return row
+
+    def latest(self) -> Optional[Dict[str, float]]:
+        """直近の出力行（未更新なら None）."""
+        return self._rows[-1] if self._rows else None
+
+    def to_frame(self) -> pd.DataFrame:
+        """直近 history_size 行を DataFrame 化."""
+        columns = _OHLCV_COLUMNS + FEATURE_COLUMNS
+        if not self._rows:
+            return pd.DataFrame(columns=columns)
+        index = list(self._index)
+        if all(isinstance(ts, pd.Timestamp) for ts in index):
+            index = pd.DatetimeIndex(index)
+        return pd.DataFrame(list(self._rows), index=index, columns=columns)
+
+    # ========== 内部計算 ==========
+
+    @staticmethod
+    def _extract_timestamps(df: pd.DataFrame) -> Optional[List[Any]]:
+        """DataFrame から各行の日時を取得（無ければ None）."""
+        if isinstance(df.index, pd.DatetimeIndex):
+            return list(df.index)
+        if "timestamp" in df.columns:
+            return list(pd.DatetimeIndex(pd.to_datetime(df["timestamp"])))
+        return None
+
+    def _update_technical(self, raw: Dict[str, float], h: float, low: float, c: float, v: float):
+        """RSI / MACD / ATR / BB / EMA / Donchian / CMF / CCI / ADX / Stochastic / Williams."""
+        prev_c = self._prev_close
+        nan = math.nan
+
+        # RSI（差分 NaN の先頭行は gain/loss=0 として扱う・バッチと同一）
+        delta = c - prev_c if prev_c is not None else nan
+        self._gains.append(delta if delta > 0 else 0.0)
+        self._losses.append(-delta if delta < 0 else 0.0)
+        gain = sum(self._gains) / len(self._gains)
+        loss = sum(self._losses) / len(self._losses)
+        rs = gain / (loss + 1e-8)
+        raw["rsi_14"] = 100 - (100 / (1 + rs))
+
+        # MACD
+        ema = self._ema
+        ema["ema_12"] = _ema_step(ema["ema_12"], c, 12)
+        ema["ema_26"] = _ema_step(ema["ema_26"], c, 26)
+        macd = ema["ema_12"] - ema["ema_26"]
+        ema["macd_signal"] = _ema_step(ema["macd_signal"], macd, 9)
+        raw["macd"] = macd
+        raw["macd_signal"] = ema["macd_signal"]
+        raw["macd_histogram"] = macd - ema["macd_signal"]
+
+        # ATR（先頭行の TR は NaN・np.maximum の NaN 伝播と同一）
+        if prev_c is not None:
+            self._atr_tr.append(max(h - low, abs(h - prev_c), abs(low - prev_c)))
+        raw["atr_14"] = _window_mean(self._atr_tr) if self._atr_tr else nan
+
+        # ボリンジャーバンド
+        self._close_window.append(c)
+        bb_window = list(self._close_window)[-_BB_PERIOD:]
+        bb_middle = sum(bb_window) / len(bb_window)
+        bb_std = _window_std(bb_window, min_periods=_BB_PERIOD)
+        bb_upper = bb_middle + bb_std * 2
+        bb_lower = bb_middle - bb_std * 2
+        raw["bb_upper"] = bb_upper
+        raw["bb_lower"] = bb_lower
+        raw["bb_position"] = (c - bb_lower) / (bb_upper - bb_lower + 1e-8)
+
+        # EMA
+        ema["ema_20"] = _ema_step(ema["ema_20"], c, 20)
+        ema["ema_50"] = _ema_step(ema["ema_50"], c, 50)
+        raw["ema_20"] = ema["ema_20"]
+        raw["ema_50"] = ema["ema_50"]
+
+        # Donchian
+        self._highs.append(h)
+        self._lows.append(low)
+        highs = list(self._highs)
+        lows = list(self._lows)
+        donchian_high = max(highs[-_DONCHIAN_PERIOD:])
+        donchian_low = min(lows[-_DONCHIAN_PERIOD:])
+        raw["channel_position"] = (c - donchian_low) / (donchian_high - donchian_low + 1e-8)
+
+        # CMF
+        mf_multiplier = ((c - low) - (h - c)) / (h - low + 1e-8)
+        self._mfv.append(mf_multiplier * v)
+        self._cmf_volume.append(v)
+        raw["cmf_20"] = sum(self._mfv) / (sum(self._cmf_volume) + 1e-8)
+
+        # CCI（平均絶対偏差はウィンドウ長 20 固定のため O(1)）
+        tp = (h + low + c) / 3
+        self._tp.append(tp)
+        sma_tp = sum(self._tp) / len(self._tp)
+        mean_dev = sum(abs(x - sma_tp) for x in self._tp) / len(self._tp)
+        raw["cci_20"] = (tp - sma_tp) / (0.015 * mean_dev + 1e-8)
+
+        # ADX（TR は NaN をスキップした最大値・先頭行は high-low）
+        if prev_c is not None:
+            adx_tr = max(h - low, abs(h - prev_c), abs(low - prev_c))
+            up_move = h - self._prev_high
+            down_move = self._prev_low - low
+            plus_dm = up_move if up_move > down_move else 0.0
+            minus_dm = down_move if down_move > up_move else 0.0
+        else:
+            adx_tr = h - low
+            plus_dm = minus_dm = 0.0
+        self._adx_tr.append(adx_tr)
+        self._plus_dm.append(max(plus_dm, 0.0))
+        self._minus_dm.append(max(minus_dm, 0.0))
+        atr_adx = sum(self._adx_tr) / len(self._adx_tr)
+        plus_di = 100 * (sum(self._plus_dm) / len(self._plus_dm)) / (atr_adx + 1e-8)
+        minus_di = 100 * (sum(self._minus_dm) / len(self._minus_dm)) / (atr_adx + 1e-8)
+        self._dx.append(100 * abs(plus_di - minus_di) / (plus_di + minus_di + 1e-8))
+        raw["adx_14"] = sum(self._dx) / len(self._dx)
+        raw["plus_di_14"] = plus_di
+        raw["minus_di_14"] = minus_di
+
+        # Stochastic / Williams %R
+        stoch_high = max(highs[-_STOCH_PERIOD:])
+        stoch_low = min(lows[-_STOCH_PERIOD:])
+        self._stoch_fast.append(100 * (c - stoch_low) / (stoch_high - stoch_low + 1e-8))
+        stoch_k = sum(self._stoch_fast) / len(self._stoch_fast)
+        self._stoch_k.append(stoch_k)
+        raw["stoch_k"] = stoch_k
+        raw["stoch_d"] = sum(self._stoch_k) / len(self._stoch_k)
+
+        ema["volume_ema"] = _ema_step(ema["volume_ema"], v, 20)
+        raw["volume_ema"] = ema["volume_ema"]
+
+        williams_high = max(highs[-_WILLIAMS_PERIOD:])
+        williams_low = min(lows[-_WILLIAMS_PERIOD:])
+        raw["williams_r_14"] = (williams_high - c) / (williams_high - williams_low + 1e-8) * -100
+
+        # 出来高比率
+        self._volume_ratio_window.append(v)
+        volume_avg = sum(self._volume_ratio_window) / len(self._volume_ratio_window)
+        raw["volume_ratio"] = v / (volume_avg + 1e-8)
+
+    def _update_lag_and_rolling(self, raw: Dict[str, float], c: float, v: float) -> None:
+        """ラグ特徴量・移動統計量."""
+        nan = math.nan
+        closes = self._closes
+        for lag in _RETURN_LAGS:
+            if len(closes) >= lag:
+                shifted = closes[-lag]
+                raw[f"returns_{lag}"] = (c - shifted) / (shifted + 1e-8) * 100
+            else:
+                raw[f"returns_{lag}"] = 0.0
+        closes.append(c)
+
+        volumes = self._volumes
+        for lag in _VOLUME_LAGS:
+            raw[f"volume_lag_{lag}"] = volumes[-lag] if len(volumes) >= lag else nan
+        volumes.append(v)
+
+        raw["rsi_lag_1"] = self._last_raw.get("rsi_14", nan)
+        raw["macd_lag_1"] = self._last_raw.get("macd", nan)
+
+        window = list(self._close_window)
+        for w in _MA_WINDOWS:
+            recent = window[-w:]
+            raw[f"close_ma_{w}"] = sum(recent) / len(recent)
+        for w in _STD_WINDOWS:
+            raw[f"close_std_{w}"] = _window_std(window[-w:])
+
+    @staticmethod
+    def _update_interactions(raw: Dict[str, float]) -> None:
+        """交互作用特徴量."""
+        raw["rsi_x_atr"] = raw["rsi_14"] * raw["atr_14"]
+        raw["macd_x_volume"] = raw["macd"] * raw["volume"]
+        raw["bb_position_x_volume_ratio"] = raw["bb_position"] * raw["volume_ratio"]
+        raw["close_x_atr"] = raw["close"] * raw["atr_14"]
+        raw["volume_x_bb_position"] = raw["volume"] * raw["bb_position"]
+
+    @staticmethod
+    def _update_time(raw: Dict[str, float], timestamp: Optional[Any]) -> None:
+        """時間特徴量（日時不明時はバッチと同じデフォルト値）."""
+        if timestamp is None:
+            raw["hour"] = 0
+            raw["day_of_week"] = 0
+            raw["hour_cos"] = 1.0
+            raw["day_sin"] = 0.0
+            return
+        ts = pd.Timestamp(timestamp)
+        raw["hour"] = ts.hour
+        raw["day_of_week"] = ts.dayofweek
+        raw["hour_cos"] = math.cos(2 * math.pi * ts.hour / 24)
+        raw["day_sin"] = math.sin(2 * math.pi * ts.dayofweek / 7)
+
+    def _update_external(
+        self, raw: Dict[str, float], c: float, external_values: Optional[Dict[str, float]]
+    ) -> None:
+        """外部 API 派生特徴量 + 24h 実現ボラ."""
+        external_values = external_values or {}
+        funding = external_values.get("funding_rate_8h_avg", 0.0)
+        raw["funding_rate_8h_avg"] = funding
+        raw["fear_greed_index"] = external_values.get("fear_greed_index", 0.0)
+        raw["ofi_top5"] = 0.0
+        raw["bid_ask_imbalance"] = 0.0
+        raw["depth_ratio"] = 1.0
+        raw["btc_dominance_change"] = 0.0
+        raw["usdjpy_change"] = 0.0
+        raw["nikkei_change_proxy"] = 0.0
+
+        if self._prev_close is not None:
+            self._log_returns.append(math.log(c / self._prev_close))
+        if len(self._log_returns) >= _REALIZED_VOL_MIN_PERIODS:
+            raw["btc_realized_vol_24h"] = _window_std(self._log_returns) * math.sqrt(96)
+        else:
+            raw["btc_realized_vol_24h"] = 0.0
+        raw["btc_funding_premium"] = funding * 365 * 3 if funding != 0.0 else 0.0
+
+    def _update_vpin(self, raw: Dict[str, float], c: float, v: float) -> None:
+        """VPIN（window 未満は中立値 0.5）."""
+        log_ret = math.log(c / self._prev_close) if self._prev_close is not None else 0.0
+        self._vpin_returns.append(log_ret)
+        # バッチは先頭 window 行の std を bfill（未来値）するため、warm-up 中は暫定 std を使う
+        rolling_std = _window_std(self._vpin_returns)
+        if math.isnan(rolling_std):
+            rolling_std = 1e-9
+        z = log_ret / (rolling_std + 1e-9)
+        buy_frac = _normal_cdf(z)
+        self._vpin_imbalance.append(abs(v * buy_frac - v * (1.0 - buy_frac)))
+        self._vpin_volume.append(v)
+
+        if len(self._vpin_imbalance) < _VPIN_WINDOW:
+            vpin = 0.5
+        else:
+            vpin = sum(self._vpin_imbalance) / (sum(self._vpin_volume) + 1e-9)
+            vpin = min(max(vpin, 0.0), 1.0)
+
+        prev_vpin = self._vpin_values[-1] if self._vpin_values else None
+        self._vpin_values.append(vpin)
+        raw["vpin"] = vpin
+        raw["vpin_ma20"] = sum(self._vpin_values) / len(self._vpin_values)
+        raw["vpin_change"] = vpin - prev_vpin if prev_vpin is not None else 0.0
+
+    @staticmethod
+    def _update_hmm(raw: Dict[str, float], hmm_probs: Optional[Dict[str, float]]) -> None:
+        """HMM 状態確率（未提供時は uniform）."""
+        hmm_probs = hmm_probs or {}
+        raw["hmm_state_bear_prob"] = hmm_probs.get("hmm_state_bear_prob", 1.0 / 3)
+        raw["hmm_state_bull_prob"] = hmm_probs.get("hmm_state_bull_prob", 1.0 / 3)
+
+    def _update_cross_asset(
+        self, raw: Dict[str, float], c: float, external_values: Optional[Dict[str, float]]
+    ) -> None:
+        """BTC-ETH 相関特徴量（FeatureGenerator._add_cross_asset_features と同一ロジック）."""
+        eth_last = 0.0
+        if external_values is not None:
+            eth_last = float(external_values.get("eth_jpy_last", 0.0) or 0.0)
+        if c > 0 and eth_last > 0:
+            self._btc_history.append(c)
+            self._eth_history.append(eth_last)
+
+        raw["eth_btc_price_ratio"] = eth_last / c if c > 0 and eth_last > 0 else 0.0
+
+        corr = 0.0
+        if len(self._btc_history) >= 24 and len(self._eth_history) >= 24:
+            try:
+                corr = float(
+                    np.corrcoef(
+                        np.asarray(self._btc_history, dtype=float),
+                        np.asarray(self._eth_history, dtype=float),
+                    )[0, 1]
+                )
+                if not np.isfinite(corr):
+                    corr = 0.0
+            except Exception:
+                corr = 0.0
+        raw["eth_btc_corr_24h"] = corr
+
+        if len(self._eth_history) >= 2:
+            prev, curr = self._eth_history[-2], self._eth_history[-1]
+            raw["eth_returns_15m"] = (curr - prev) / prev if prev > 0 else 0.0
+        else:
+            raw["eth_returns_15m"] = 0.0
+
+    def _fill_nan(self, raw: Dict[str, float]) -> Dict[str, float]:
+        """_handle_nan_values() 相当: 直前の有効値で ffill、無ければ 0."""
+        row = dict(raw)
+        for name in FEATURE_COLUMNS:
+            if name in _NON_FILLED_FEATURES:
+                continue
+            value = row[name]
+            if value is None or (isinstance(value, float) and math.isnan(value)):
+                row[name] = self._last_valid.get(name, 0.0)
+            else:
+                self._last_valid[name] = value
+        return row
+
+
+__all__ = ["IncrementalFeatureEngine", "FEATURE_COLUMNS"]
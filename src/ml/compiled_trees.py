@@ -0,0 +1,622 @@
+"""
+決定木モデルの NumPy コンパイル推論 - Phase 90
+
+学習済みの LightGBM・XGBoost・RandomForest（sklearn 森林）を、ライブラリに依存しない
+フラットな NumPy 配列（分岐特徴量・閾値・左右子ノード・欠損時方向・葉の値）に変換し、
+ベクトル化した評価器で各ライブラリの predict_proba を再現する。
+
+- ライブ推論（1 行）ではライブラリ毎の入力検証・DataFrame 変換の呼び出しオーバーヘッドが
+  推論時間の大半を占めるため、配列の走査だけで済むコンパイル版の方が軽い
+- コンパイル済み配列は .npz に保存でき、読み込みにライブラリ・pickle は不要
+
+各ライブラリの判定規則を再現する:
+- sklearn: 入力を float32 に丸めて `x <= threshold`、欠損は missing_go_to_left
+- LightGBM: float64 で `x <= threshold`（|x| <= kZeroThreshold は 0 として比較）、
+  missing_type（None/Zero/NaN）と default_left
+- XGBoost: float32 で `x < split_condition`、欠損は default_left。マージンの加算・softmax も
+  float32 で木の順に行う（ライブラリと同じ丸め）
+
+compile_ensemble() は閾値周辺を含むプローブ入力で元モデルとの差を検証し、許容誤差
+（既定 1e-6）を超えるモデル・未対応モデル（N-BEATS・カテゴリ分岐・DART 等）は
+コンパイルせず元モデルでの推論を継続する。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..core.logger import get_logger
+
+# 欠損値の扱い（LightGBM の missing_type に対応）
+MISSING_NONE = 0  # 欠損は 0 として比較
+MISSING_ZERO = 1  # 0（および欠損）は default_left 方向
+MISSING_NAN = 2  # 欠損は default_left 方向
+
+# LightGBM の kZeroThreshold（C++ では float リテラル 1e-35f を double で保持）
+_ZERO_THRESHOLD_F32 = float(np.float32(1e-35))
+
+# 一度に評価する行数（行 × 木 × 出力の一時配列サイズを抑える）
+_CHUNK_ROWS = 1024
+
+# 保存ファイルのメタデータキー
+_MEMBERS_KEY = "__members__"
+_SOURCE_DIGEST_KEY = "__source_sha256__"
+
+_ARRAY_FIELDS = (
+    "feature",
+    "threshold",
+    "left",
+    "right",
+    "missing_type",
+    "default_left",
+    "leaf_values",
+    "roots",
+)
+
+
+class CompiledTreeModel:
+    """フラット配列で表現した木アンサンブル 1 モデル分とその評価器."""
+
+    def __init__(self, arrays: Dict[str, np.ndarray], meta: Dict[str, Any]):
+        """
+        Args:
+            arrays: _ARRAY_FIELDS の各配列（全木のノードを連結・葉は left < 0）
+            meta: kind / comparison（"le" | "lt"）/ x_dtype / transform
+                （"mean_proba" | "softmax" | "sigmoid"）/ base_margin / n_classes 等
+        """
+        self.arrays = arrays
+        self.meta = meta
+        self.feature = arrays["feature"]
+        self.threshold = arrays["threshold"]
+        self.left = arrays["left"]
+        self.right = arrays["right"]
+        self.missing_type = arrays["missing_type"]
+        self.default_left = arrays["default_left"]
+        self.leaf_values = arrays["leaf_values"]
+        self.roots = arrays["roots"]
+
+        self.kind: str = meta["kind"]
+        self.transform: str = meta["transform"]
+        self.n_features: int = int(meta["n_features"])
+        self.n_classes: int = int(meta["n_classes"])
+        self.max_depth: int = int(meta["max_depth"])
+        self.feature_names: Optional[List[str]] = meta.get("feature_names")
+        self._x_dtype = np.dtype(meta["x_dtype"])
+        self._strict_less = meta["comparison"] == "lt"
+        self._sum_dtype = np.dtype(meta.get("sum_dtype", "float64"))
+        self._base_margin = np.asarray(meta.get("base_margin", [0.0]), dtype=self._sum_dtype)
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.feature)
+
+    def predict_proba(self, X) -> np.ndarray:
+        """元モデルの predict_proba に相当する確率（n_samples, n_classes）."""
+        if hasattr(X, "columns") and self.feature_names:
+            columns = list(X.columns)
+            # 学習時の列名で並べ替え（列名なしで学習したモデルは位置で対応）
+            if columns != self.feature_names and set(self.feature_names).issubset(columns):
+                X = X[self.feature_names]
+        X = np.asarray(X)
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            raise ValueError(f"特徴量数不一致: {X.shape} (expected {self.n_features})")
+        # 比較精度をライブラリに合わせる（sklearn/XGBoost は float32 に丸めてから比較）
+        X = X.astype(self._x_dtype, copy=False).astype(np.float64, copy=False)
+        if self.kind == "lightgbm":
+            # LightGBM は missing_type に関係なく |x| <= kZeroThreshold を 0 として分岐判定
+            X = np.where(np.abs(X) <= _ZERO_THRESHOLD_F32, 0.0, X)
+
+        if len(X) <= _CHUNK_ROWS:
+            return self._transform(self._raw_scores(X))
+        return np.concatenate(
+            [
+                self._transform(self._raw_scores(X[start : start + _CHUNK_ROWS]))
+                for start in range(0, len(X), _CHUNK_ROWS)
+            ]
+        )
+
+    def _leaf_indices(self, X: np.ndarray) -> np.ndarray:
+        """各行・各木の到達葉ノード（n_rows, n_trees）."""
+        rows = np.arange(len(X))[:, None]
+        node = np.repeat(self.roots[None, :], len(X), axis=0)
+        for _ in range(self.max_depth):
+            left = self.left[node]
+            internal = left >= 0
+            if not internal.any():
+                break
+            x = X[rows, self.feature[node]]
+            missing_type = self.missing_type[node]
+            is_nan = np.isnan(x)
+            # 欠損を default 方向に送らない規則（LightGBM None/Zero）では 0 として比較
+            x = np.where(is_nan & (missing_type != MISSING_NAN), 0.0, x)
+            threshold = self.threshold[node]
+            go_left = x < threshold if self._strict_less else x <= threshold
+            use_default = ((missing_type == MISSING_NAN) & is_nan) | (
+                (missing_type == MISSING_ZERO) & (np.abs(x) <= _ZERO_THRESHOLD_F32)
+            )
+            go_left = np.where(use_default, self.default_left[node], go_left)
+            node = np.where(internal, np.where(go_left, left, self.right[node]), node)
+        return node
+
+    def _raw_scores(self, X: np.ndarray) -> np.ndarray:
+        """葉の値の合計（RF は確率の合計・ブースティングはマージン）."""
+        leaves = self.leaf_values[self._leaf_indices(X)]  # (n_rows, n_trees, n_out)
+        if self._sum_dtype == np.float32:
+            # XGBoost と同じく base_margin から木の順に float32 で加算
+            base = np.broadcast_to(self._base_margin, (len(X), 1, leaves.shape[2]))
+            stacked = np.concatenate([base, leaves.astype(np.float32)], axis=1)
+            return np.cumsum(stacked, axis=1, dtype=np.float32)[:, -1, :]
+        return leaves.sum(axis=1) + self._base_margin
+
+    def _transform(self, raw: np.ndarray) -> np.ndarray:
+        if self.transform == "mean_proba":
+            return raw / self.n_trees
+        if self.transform == "softmax":
+            shifted = raw - raw.max(axis=1, keepdims=True)
+            exp = np.exp(shifted)
+            proba = exp / exp.sum(axis=1, keepdims=True)
+            return proba.astype(np.float64) if self._sum_dtype == np.float32 else proba
+        if self.transform == "sigmoid":
+            scale = float(self.meta.get("sigmoid_scale", 1.0))
+            positive = 1.0 / (1.0 + np.exp(-scale * raw[:, 0]))
+            if self._sum_dtype == np.float32:
+                positive = positive.astype(np.float32)
+                return np.column_stack([1.0 - positive, positive]).astype(np.float64)
+            return np.column_stack([1.0 - positive, positive])
+        raise ValueError(f"未対応の変換: {self.transform}")
+
+
+# ----------------------------------------------------------------------
+# エクスポーター
+# ----------------------------------------------------------------------
+
+
+class _NodeBuffer:
+    """木を 1 本ずつ追加してフラット配列を組み立てる."""
+
+    def __init__(self, n_out: int):
+        self.n_out = n_out
+        self.feature: List[int] = []
+        self.threshold: List[float] = []
+        self.left: List[int] = []
+        self.right: List[int] = []
+        self.missing_type: List[int] = []
+        self.default_left: List[bool] = []
+        self.leaf_values: List[np.ndarray] = []
+        self.roots: List[int] = []
+        self.max_depth = 0
+
+    def add_node(self) -> int:
+        self.feature.append(0)
+        self.threshold.append(0.0)
+        self.left.append(-1)
+        self.right.append(-1)
+        self.missing_type.append(MISSING_NONE)
+        self.default_left.append(False)
+        self.leaf_values.append(np.zeros(self.n_out))
+        return len(self.feature) - 1
+
+    def set_split(
+        self,
+        index: int,
+        feature: int,
+        threshold: float,
+        left: int,
+        right: int,
+        missing_type: int,
+        default_left: bool,
+    ) -> None:
+        self.feature[index] = int(feature)
+        self.threshold[index] = float(threshold)
+        self.left[index] = int(left)
+        self.right[index] = int(right)
+        self.missing_type[index] = int(missing_type)
+        self.default_left[index] = bool(default_left)
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        return {
+            "feature": np.asarray(self.feature, dtype=np.int32),
+            "threshold": np.asarray(self.threshold, dtype=np.float64),
+            "left": np.asarray(self.left, dtype=np.int32),
+            "right": np.asarray(self.right, dtype=np.int32),
+            "missing_type": np.asarray(self.missing_type, dtype=np.int8),
+            "default_left": np.asarray(self.default_left, dtype=bool),
+            "leaf_values": np.vstack(self.leaf_values).astype(np.float64),
+            "roots": np.asarray(self.roots, dtype=np.int32),
+        }
+
+
+def _feature_names(model: Any) -> Optional[List[str]]:
+    names = getattr(model, "feature_names_in_", None)
+    return [str(name) for name in names] if names is not None else None
+
+
+def _compile_sklearn_forest(model: Any) -> CompiledTreeModel:
+    """RandomForestClassifier / ExtraTreesClassifier."""
+    n_classes = len(model.classes_)
+    buffer = _NodeBuffer(n_classes)
+    for estimator in model.estimators_:
+        tree = estimator.tree_
+        if tree.n_outputs != 1:
+            raise ValueError("多出力の森林は未対応")
+        offset = len(buffer.feature)
+        buffer.roots.append(offset)
+        buffer.max_depth = max(buffer.max_depth, int(tree.max_depth))
+        missing_left = getattr(tree, "missing_go_to_left", None)
+        for node in range(tree.node_count):
+            buffer.add_node()
+            left = tree.children_left[node]
+            if left < 0:
+                value = tree.value[node][0].astype(np.float64)
+                total = value.sum()
+                buffer.leaf_values[-1] = value / total if total > 0 else value
+            else:
+                buffer.set_split(
+                    offset + node,
+                    tree.feature[node],
+                    tree.threshold[node],
+                    offset + left,
+                    offset + tree.children_right[node],
+                    MISSING_NAN,
+                    bool(missing_left[node]) if missing_left is not None else False,
+                )
+    meta = {
+        "kind": "sklearn_forest",
+        "comparison": "le",
+        "x_dtype": "float32",
+        "transform": "mean_proba",
+        "n_features": int(model.n_features_in_),
+        "n_classes": n_classes,
+        "max_depth": buffer.max_depth,
+        "feature_names": _feature_names(model),
+    }
+    return CompiledTreeModel(buffer.arrays(), meta)
+
+
+_LGBM_MISSING = {"None": MISSING_NONE, "Zero": MISSING_ZERO, "NaN": MISSING_NAN}
+
+
+def _compile_lightgbm(model: Any) -> CompiledTreeModel:
+    """LGBMClassifier（booster_.dump_model()・best_iteration まで）."""
+    dump = model.booster_.dump_model()
+    objective = str(dump.get("objective", ""))
+    n_per_iter = int(dump.get("num_tree_per_iteration", 1))
+    if objective.startswith("multiclass ") or objective == "multiclass":
+        transform, n_out = "softmax", n_per_iter
+    elif objective.startswith("binary"):
+        transform, n_out = "sigmoid", 1
+    else:
+        raise ValueError(f"未対応の LightGBM objective: {objective}")
+    if dump.get("average_output"):
+        raise ValueError("LightGBM rf モード（average_output）は未対応")
+
+    sigmoid_scale = 1.0
+    for token in objective.split():
+        if token.startswith("sigmoid:"):
+            sigmoid_scale = float(token.split(":", 1)[1])
+
+    buffer = _NodeBuffer(n_out)
+    for tree_index, tree_info in enumerate(dump["tree_info"]):
+        klass = tree_index % n_per_iter if n_out > 1 else 0
+        buffer.roots.append(len(buffer.feature))
+        stack: List[Tuple[Dict[str, Any], int, int]] = [
+            (tree_info["tree_structure"], buffer.add_node(), 0)
+        ]
+        while stack:
+            structure, index, depth = stack.pop()
+            buffer.max_depth = max(buffer.max_depth, depth)
+            if "leaf_value" in structure and "split_feature" not in structure:
+                buffer.leaf_values[index][klass] = float(structure["leaf_value"])
+                continue
+            if structure.get("decision_type", "<=") != "<=":
+                raise ValueError("LightGBM カテゴリ分岐は未対応")
+            left_index, right_index = buffer.add_node(), buffer.add_node()
+            buffer.set_split(
+                index,
+                structure["split_feature"],
+                structure["threshold"],
+                left_index,
+                right_index,
+                _LGBM_MISSING[str(structure.get("missing_type", "None"))],
+                bool(structure.get("default_left", True)),
+            )
+            stack.append((structure["left_child"], left_index, depth + 1))
+            stack.append((structure["right_child"], right_index, depth + 1))
+
+    meta = {
+        "kind": "lightgbm",
+        "comparison": "le",
+        "x_dtype": "float64",
+        "transform": transform,
+        "sigmoid_scale": sigmoid_scale,
+        "n_features": int(dump["max_feature_idx"]) + 1,
+        "n_classes": max(n_out, 2),
+        "max_depth": buffer.max_depth,
+        "feature_names": [str(name) for name in dump.get("feature_names", [])] or None,
+    }
+    return CompiledTreeModel(buffer.arrays(), meta)
+
+
+def _parse_float_list(value: Any) -> List[float]:
+    """XGBoost JSON の base_score（"5E-1" / "[5E-1,5E-1]"）を数値リストに変換."""
+    text = str(value).strip().strip("[]")
+    return [float(item) for item in text.split(",") if item.strip()]
+
+
+def _compile_xgboost(model: Any) -> CompiledTreeModel:
+    """XGBClassifier（保存 JSON・best_iteration まで・gbtree のみ）."""
+    booster = model.get_booster()
+    config = json.loads(booster.save_raw("json"))
+    learner = config["learner"]
+    gradient_booster = learner["gradient_booster"]
+    if gradient_booster.get("name") != "gbtree":
+        raise ValueError(f"未対応の XGBoost booster: {gradient_booster.get('name')}")
+
+    objective = learner["objective"]["name"]
+    n_classes = int(learner["learner_model_param"].get("num_class", "0") or 0)
+    if objective in ("multi:softprob", "multi:softmax"):
+        transform, n_out = "softmax", n_classes
+    elif objective == "binary:logistic":
+        transform, n_out = "sigmoid", 1
+    else:
+        raise ValueError(f"未対応の XGBoost objective: {objective}")
+
+    base_score = np.asarray(
+        _parse_float_list(learner["learner_model_param"]["base_score"]), dtype=np.float64
+    )
+    if transform == "sigmoid":
+        base_score = np.log(base_score / (1.0 - base_score))  # 確率空間 → マージン
+    base_margin = np.broadcast_to(base_score, (n_out,)).astype(np.float32)
+
+    trees = gradient_booster["model"]["trees"]
+    tree_info = gradient_booster["model"]["tree_info"]
+    best_iteration = getattr(model, "best_iteration", None)
+    if best_iteration is not None:
+        per_round = n_out * int(
+            gradient_booster["model"]["gbtree_model_param"].get("num_parallel_tree", "1")
+        )
+        trees = trees[: (int(best_iteration) + 1) * per_round]
+
+    buffer = _NodeBuffer(n_out)
+    for tree_index, tree in enumerate(trees):
+        if any(int(t) != 0 for t in tree.get("split_type", [])):
+            raise ValueError("XGBoost カテゴリ分岐は未対応")
+        klass = int(tree_info[tree_index]) if n_out > 1 else 0
+        offset = len(buffer.feature)
+        buffer.roots.append(offset)
+        left_children = tree["left_children"]
+        right_children = tree["right_children"]
+        conditions = np.asarray(tree["split_conditions"], dtype=np.float32).astype(np.float64)
+        depth = {0: 0}
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if int(left_children[node]) >= 0:
+                for child in (int(left_children[node]), int(right_children[node])):
+                    depth[child] = depth[node] + 1
+                    stack.append(child)
+        buffer.max_depth = max(buffer.max_depth, max(depth.values()))
+        for node in range(len(left_children)):
+            buffer.add_node()
+            left = int(left_children[node])
+            if left < 0:
+                buffer.leaf_values[-1][klass] = conditions[node]
+                continue
+            right = int(right_children[node])
+            buffer.set_split(
+                offset + node,
+                tree["split_indices"][node],
+                conditions[node],
+                offset + left,
+                offset + right,
+                MISSING_NAN,
+                bool(int(tree["default_left"][node])),
+            )
+
+    names = booster.feature_names
+    n_features = int(booster.num_features())
+    base_margin = _calibrate_xgboost_base_margin(
+        booster, buffer, base_margin, n_features, names, best_iteration
+    )
+    meta = {
+        "kind": "xgboost",
+        "comparison": "lt",
+        "x_dtype": "float32",
+        "sum_dtype": "float32",
+        "transform": transform,
+        "base_margin": base_margin.tolist(),
+        "n_features": n_features,
+        "n_classes": max(n_out, 2),
+        "max_depth": buffer.max_depth,
+        "feature_names": list(names) if names else None,
+    }
+    return CompiledTreeModel(buffer.arrays(), meta)
+
+
+def _calibrate_xgboost_base_margin(
+    booster: Any,
+    buffer: _NodeBuffer,
+    base_margin: np.ndarray,
+    n_features: int,
+    names: Optional[List[str]],
+    best_iteration: Optional[int],
+) -> np.ndarray:
+    """
+    XGBoost の初期マージンを実モデルのマージン出力と照合
+
+    base_score の保存形式（確率空間/マージン空間・スカラー/クラス別）はバージョンで異なるため、
+    全特徴量 0 の 1 行で出力マージンと木の合計の差を取り、保存値と食い違えば差を採用する。
+    """
+    import pandas as pd
+
+    probe = np.zeros((1, n_features), dtype=np.float32)
+    iteration_range = (0, int(best_iteration) + 1) if best_iteration is not None else (0, 0)
+    library = np.asarray(
+        booster.inplace_predict(
+            pd.DataFrame(probe, columns=names) if names else probe,
+            iteration_range=iteration_range,
+            predict_type="margin",
+        ),
+        dtype=np.float32,
+    ).reshape(-1)
+    meta = {
+        "kind": "xgboost",
+        "comparison": "lt",
+        "x_dtype": "float32",
+        "sum_dtype": "float32",
+        "transform": "softmax",
+        "base_margin": [0.0] * len(base_margin),
+        "n_features": n_features,
+        "n_classes": 2,
+        "max_depth": buffer.max_depth,
+    }
+    trees_only = CompiledTreeModel(buffer.arrays(), meta)._raw_scores(probe.astype(np.float64))[0]
+    observed = (library - trees_only).astype(np.float32)
+    if np.allclose(observed, base_margin, atol=1e-5):
+        return base_margin
+    return observed
+
+
+def compile_tree_model(model: Any) -> CompiledTreeModel:
+    """
+    学習済み木モデルをフラット配列にコンパイル
+
+    Raises:
+        ValueError: 未対応のモデル・設定（カテゴリ分岐・DART・多出力等）
+    """
+    if hasattr(model, "booster_") and hasattr(model.booster_, "dump_model"):
+        return _compile_lightgbm(model)
+    if hasattr(model, "get_booster"):
+        return _compile_xgboost(model)
+    estimators = getattr(model, "estimators_", None)
+    if (
+        estimators is not None
+        and hasattr(model, "classes_")
+        and all(hasattr(est, "tree_") for est in estimators)
+    ):
+        return _compile_sklearn_forest(model)
+    raise ValueError(f"未対応のモデル: {type(model).__name__}")
+
+
+def _probe_inputs(compiled: List[CompiledTreeModel], n_features: int, n_rows: int) -> np.ndarray:
+    """
+    検証用プローブ入力（各特徴量の分岐閾値ちょうど・前後を含む）
+
+    実データなしで全モデルの分岐の両側と境界（<= / < の違い）を通す。
+    """
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(n_rows, n_features))
+    thresholds: Dict[int, List[float]] = {}
+    for model in compiled:
+        internal = model.left >= 0
+        for feature, threshold in zip(model.feature[internal], model.threshold[internal]):
+            thresholds.setdefault(int(feature), []).append(float(threshold))
+    for feature, values in thresholds.items():
+        values = np.unique(values)
+        picked = rng.choice(values, size=n_rows)
+        nudge = rng.choice([-1.0, 0.0, 1.0], size=n_rows) * (np.abs(picked) * 1e-6 + 1e-9)
+        X[:, feature] = picked + nudge
+    return X
+
+
+def compile_ensemble(
+    ensemble: Any, tolerance: float = 1e-6, n_probe_rows: int = 2000
+) -> Dict[str, CompiledTreeModel]:
+    """
+    ProductionEnsemble の木モデルをコンパイルし、元モデルとの一致を検証
+
+    Args:
+        ensemble: ProductionEnsemble
+        tolerance: 元モデルの predict_proba との最大絶対誤差の許容値
+        n_probe_rows: 検証用プローブ入力の行数
+
+    Returns:
+        {モデル名: CompiledTreeModel}（未対応・検証失敗のモデルは含まない）
+    """
+    import pandas as pd
+
+    logger = get_logger()
+    compiled: Dict[str, CompiledTreeModel] = {}
+    for name, model in ensemble.models.items():
+        try:
+            compiled[name] = compile_tree_model(model)
+        except Exception as e:
+            logger.warning(f"⚠️ {name}: コンパイル対象外（元モデルで推論）: {e}")
+
+    if not compiled:
+        return compiled
+
+    X = _probe_inputs(list(compiled.values()), ensemble.n_features_, n_probe_rows)
+    X_df = pd.DataFrame(X, columns=ensemble.feature_names)
+    for name in list(compiled):
+        expected = ensemble.models[name].predict_proba(X_df)
+        actual = compiled[name].predict_proba(X_df)
+        error = float(np.max(np.abs(actual - expected))) if expected.shape == actual.shape else None
+        if error is None or error > tolerance:
+            logger.warning(
+                f"⚠️ {name}: コンパイル結果が元モデルと不一致（最大誤差 {error}）- 元モデルで推論"
+            )
+            del compiled[name]
+        else:
+            logger.info(
+                f"✅ {name}: コンパイル完了 {compiled[name].n_trees}木・"
+                f"{compiled[name].n_nodes}ノード（最大誤差 {error:.2e}）"
+            )
+    return compiled
+
+
+# ----------------------------------------------------------------------
+# 保存・読み込み
+# ----------------------------------------------------------------------
+
+
+def file_sha256(path: Path) -> str:
+    """コンパイル元モデルファイルの SHA-256（古いコンパイル結果の検出用）."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def save_compiled_members(
+    path: Path, compiled: Dict[str, CompiledTreeModel], source_digest: str = ""
+) -> None:
+    """コンパイル済みモデルを .npz に保存（pickle 不使用）."""
+    payload: Dict[str, np.ndarray] = {
+        _MEMBERS_KEY: np.array(json.dumps({name: m.meta for name, m in compiled.items()})),
+        _SOURCE_DIGEST_KEY: np.array(source_digest),
+    }
+    for name, model in compiled.items():
+        for field in _ARRAY_FIELDS:
+            payload[f"{name}.{field}"] = model.arrays[field]
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        np.savez(f, **payload)
+
+
+def load_compiled_members(path: Path) -> Tuple[Dict[str, CompiledTreeModel], str]:
+    """
+    .npz からコンパイル済みモデルを読み込み
+
+    Returns:
+        ({モデル名: CompiledTreeModel}, コンパイル元ファイルの SHA-256)
+    """
+    with np.load(path, allow_pickle=False) as data:
+        metas = json.loads(str(data[_MEMBERS_KEY]))
+        compiled = {
+            name: CompiledTreeModel(
+                {field: data[f"{name}.{field}"] for field in _ARRAY_FIELDS}, meta
+            )
+            for name, meta in metas.items()
+        }
+        return compiled, str(data[_SOURCE_DIGEST_KEY])
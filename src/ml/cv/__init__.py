@@ -1,5 +1,6 @@
 """Phase 89-β: 時系列リーク対策 CV ユーティリティ."""
 
+from .parallel import clone_estimator, evaluate_folds
 from .purged_kfold import PurgedKFold
 
-__all__ = ["PurgedKFold"]
+__all__ = ["PurgedKFold", "clone_estimator", "evaluate_folds"]
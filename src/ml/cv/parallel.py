@@ -0,0 +1,84 @@
+"""
+Phase 90: CV fold 評価の並列実行.
+
+PurgedKFold 等の splitter が返す fold を joblib（loky）のワーカープールで並列評価する。
+
+- 学習データ（numpy 配列・DataFrame 内部の配列）は `max_nbytes` を超えると joblib が
+  一時ファイルにダンプし、各ワーカーは読み取り専用メモリマップとして共有する
+  （ワーカー毎にコピーしない）。fold 関数内で入力を書き換えないこと。
+- 結果は fold 順のリスト。各 fold で推定器を複製し（clone_estimator）、スレッド数を
+  固定すれば、ワーカー数に依らず直列実行（n_jobs=1）と同一の結果になる。
+"""
+
+import copy
+from typing import Any, Callable, Dict, List, Optional
+
+
+def clone_estimator(estimator: Any, n_threads: Optional[int] = None) -> Any:
+    """
+    fold 評価用に未学習の推定器を複製
+
+    sklearn の clone() を優先し、非対応の推定器は deepcopy する。
+    n_threads 指定時は n_jobs パラメータ（LightGBM・XGBoost・RandomForest 共通）を
+    min(設定値, n_threads) に制限する（未指定・0 以下の場合は n_threads）。設定値より
+    増やさないため、RandomForest の n_jobs=1（Phase 53.2）は維持される。
+    OpenMP の木構築はスレッド数で浮動小数点の集計順が変わり得るため、直列・並列で
+    同じ値を指定して結果を一致させる。
+    """
+    try:
+        from sklearn.base import clone
+
+        fresh = clone(estimator)
+    except (TypeError, RuntimeError):
+        fresh = copy.deepcopy(estimator)
+
+    if n_threads is not None and hasattr(fresh, "get_params"):
+        params = fresh.get_params(deep=False)
+        if "n_jobs" in params:
+            original = params["n_jobs"]
+            limited = n_threads if original is None or original <= 0 else min(original, n_threads)
+            fresh.set_params(n_jobs=limited)
+    return fresh
+
+
+def evaluate_folds(
+    cv: Any,
+    X: Any,
+    y: Any,
+    fold_fn: Callable[..., Any],
+    n_jobs: int = 1,
+    fold_kwargs: Optional[Dict[str, Any]] = None,
+    max_nbytes: str = "1M",
+) -> List[Any]:
+    """
+    fold 毎に fold_fn(X, y, train_idx, test_idx, fold, **fold_kwargs) を実行
+
+    Args:
+        cv: split(X) を持つ splitter（PurgedKFold 等）
+        X: 特徴量（numpy 配列 / DataFrame）
+        y: ラベル（numpy 配列 / Series）
+        fold_fn: fold 評価関数（ワーカーへ送るため pickle 可能なモジュールレベル関数）
+        n_jobs: ワーカープロセス数（1 以下なら同一プロセスで直列実行）
+        fold_kwargs: fold_fn への追加引数
+        max_nbytes: この大きさを超える配列をメモリマップで共有
+
+    Returns:
+        fold 順の fold_fn 戻り値リスト
+    """
+    fold_kwargs = fold_kwargs or {}
+    splits = list(cv.split(X, y))
+    n_workers = min(n_jobs, len(splits))
+
+    if n_workers <= 1:
+        return [
+            fold_fn(X, y, train_idx, test_idx, fold, **fold_kwargs)
+            for fold, (train_idx, test_idx) in enumerate(splits)
+        ]
+
+    from joblib import Parallel, delayed
+
+    parallel = Parallel(n_jobs=n_workers, backend="loky", max_nbytes=max_nbytes, mmap_mode="r")
+    return parallel(
+        delayed(fold_fn)(X, y, train_idx, test_idx, fold, **fold_kwargs)
+        for fold, (train_idx, test_idx) in enumerate(splits)
+    )
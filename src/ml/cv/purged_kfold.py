@@ -10,6 +10,9 @@ Lopez de Prado "Advances in Financial Machine Learning" 3.4 章準拠の
 - sklearn の splitter API 互換（cross_val_score / GridSearchCV から利用可）
 
 引数 `embargo_pct` で embargo 幅をデータ長の比率で指定（default 0.01 = 1%）。
+
+Phase 90: fold 境界（test 区間・embargo 範囲）を fold_bounds() で一括計算（ベクトル化）。
+fold 評価の並列実行は parallel.evaluate_folds() を参照。
 """
 
 from typing import Iterator, Optional, Tuple
@@ -52,26 +55,34 @@ class PurgedKFold:
             groups: 互換性のため受け取るだけ
         """
         n = len(X)
+        for test_start, test_end, embargo_start, embargo_end in self.fold_bounds(n):
+            test_idx = np.arange(test_start, test_end)
+            # test 区間とその前後 embargo を除いた残り（連続 2 区間）
+            train_idx = np.concatenate([np.arange(embargo_start), np.arange(embargo_end, n)])
+            yield train_idx, test_idx
+
+    def fold_bounds(self, n_samples: int) -> np.ndarray:
+        """
+        全 fold の境界を一括計算（Phase 90: ベクトル化）
+
+        Returns:
+            shape=(n_splits, 4) の int 配列。各行は
+            (test_start, test_end, embargo_start, embargo_end)（半開区間 [start, end)）。
+            train は [0, embargo_start) と [embargo_end, n_samples)。
+        """
+        n = n_samples
         if n < self.n_splits:
             raise ValueError(f"Cannot split {n} samples into {self.n_splits} folds")
 
         embargo = int(n * self.embargo_pct)
-        all_idx = np.arange(n)
         fold_size = n // self.n_splits
-
-        for i in range(self.n_splits):
-            test_start = i * fold_size
-            # 最終 fold は残り全部を吸収（端数対応）
-            test_end = (i + 1) * fold_size if i < self.n_splits - 1 else n
-            test_idx = all_idx[test_start:test_end]
-
-            # embargo 範囲: test の前後 `embargo` サンプルを train から除外
-            embargo_start = max(0, test_start - embargo)
-            embargo_end = min(n, test_end + embargo)
-
-            train_idx = np.concatenate([all_idx[:embargo_start], all_idx[embargo_end:]])
-
-            yield train_idx, test_idx
+        test_start = np.arange(self.n_splits) * fold_size
+        # 最終 fold は残り全部を吸収（端数対応）
+        test_end = np.append(test_start[1:], n)
+        # embargo 範囲: test の前後 `embargo` サンプルを train から除外
+        embargo_start = np.maximum(test_start - embargo, 0)
+        embargo_end = np.minimum(test_end + embargo, n)
+        return np.column_stack([test_start, test_end, embargo_start, embargo_end])
 
     def get_n_splits(self, X=None, y=None, groups=None) -> int:
         """sklearn splitter API 互換."""
@@ -4,12 +4,22 @@
 ProductionEnsemble: 本番環境で使用する3モデルアンサンブル予測クラス。
 LightGBM・XGBoost・RandomForestの重み付け投票により安定した予測を提供。
 
+Phase 90: predict_with_proba() で各モデルの推論を 1 回に統合・required_lookback（ライブ推論行数）
+Phase 90: 個別モデル推論の共有スレッドプール並列化（ensemble.parallel_inference）
+Phase 90: 木モデルの NumPy コンパイル推論バックエンド（attach_compiled_members・compiled_trees.py）
+Phase 90: 重み 0 のモデルは推論しない（マニフェスト形式の遅延読み込みで読み込みも省略）
 Phase 64.6: 未使用クラス削除（VotingSystem・EnsembleModel・StackingEnsemble）
 Phase 51.9: 3クラス分類対応
 Phase 50.7: レベル別特徴量数対応
 """
 
-from typing import Any, Dict
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -18,6 +28,66 @@ from ..core.config import get_threshold
 from ..core.config.feature_manager import get_feature_count, get_feature_names
 from ..core.logger import get_logger
 
+# Phase 90: 個別モデル並列推論用の共有スレッドプール
+# （LightGBM・XGBoost・sklearn は推論中に GIL を解放するためスレッド並列で重なる）
+_inference_pool: Optional[ThreadPoolExecutor] = None
+_inference_pool_lock = threading.Lock()
+
+
+def get_inference_pool(max_workers: int) -> ThreadPoolExecutor:
+    """個別モデル並列推論用の共有スレッドプール（初回呼び出し時の max_workers で生成）."""
+    global _inference_pool
+    if _inference_pool is None:
+        with _inference_pool_lock:
+            if _inference_pool is None:
+                _inference_pool = ThreadPoolExecutor(
+                    max_workers=max(1, max_workers), thread_name_prefix="ensemble-infer"
+                )
+    return _inference_pool
+
+
+def reset_inference_pool() -> None:
+    """テスト用: 共有スレッドプールを停止・破棄."""
+    global _inference_pool
+    with _inference_pool_lock:
+        if _inference_pool is not None:
+            _inference_pool.shutdown(wait=True)
+        _inference_pool = None
+
+
+@contextmanager
+def _limit_model_threads(model: Any, n_threads: int) -> Iterator[None]:
+    """
+    推論中のみモデルの n_jobs を n_threads 以下に制限（並列推論時のスレッド過剰生成防止）
+
+    LightGBM・XGBoost・RandomForest の sklearn API は n_jobs で推論スレッド数を決める。
+    n_jobs が未指定（None: LightGBM 4.x・XGBoost の既定値）・0 以下（全コア）なら n_threads、
+    正の値なら min(n_jobs, n_threads) とし、設定値より増やさない
+    （gVisor 対策で n_jobs=1 固定の RandomForest は 1 のまま・Phase 53.2）。
+    n_jobs を持たないモデル（N-BEATS 等）はそのまま実行する。
+    """
+    params: Dict[str, Any] = {}
+    if n_threads > 0 and hasattr(model, "get_params") and hasattr(model, "set_params"):
+        try:
+            params = model.get_params(deep=False)
+        except Exception:
+            params = {}
+    if "n_jobs" not in params:
+        yield
+        return
+
+    original = params["n_jobs"]
+    limited = n_threads if original is None or original <= 0 else min(original, n_threads)
+    if limited == original:
+        yield
+        return
+
+    model.set_params(n_jobs=limited)
+    try:
+        yield
+    finally:
+        model.set_params(n_jobs=original)
+
 
 class ProductionEnsemble:
     """
@@ -51,9 +121,14 @@ class ProductionEnsemble:
                 "nbeats": 0.15,
             },
         )
-        self.weights = default_weights
+        # Phase 90: 設定キャッシュの dict を共有しない（重み 0 は推論対象外のため他インスタンスに波及する）
+        self.weights = dict(default_weights)
 
         self.is_fitted = True
+        # Phase 90: 直近推論の個別モデル推論時間（ms）
+        self.last_member_timings: Dict[str, float] = {}
+        # Phase 90: コンパイル済み木モデル（{モデル名: CompiledTreeModel}・未設定なら元モデルで推論）
+        self.compiled_members: Dict[str, Any] = {}
         # レベル別特徴量数対応 - 実際のモデルから特徴量数を取得
         detected_n_features = None
         for model_name, model in self.models.items():
@@ -79,6 +154,40 @@ class ProductionEnsemble:
         if len(self.models) == 0:
             raise ValueError("個別モデルが提供されていません")
 
+    @property
+    def required_lookback(self) -> int:
+        """最終行の推論に必要な過去行数（Phase 90）
+
+        各モデルの required_lookback（未定義なら 0 = 行単位の推論）の最大値。
+        ライブ推論では最終行 + この行数だけを渡せば全行を渡した場合と同じ最終行の結果になる。
+        """
+        lookbacks = [
+            getattr(model, "required_lookback", 0) for model in self._active_models().values()
+        ]
+        return max((lb for lb in lookbacks if isinstance(lb, int)), default=0)
+
+    def attach_compiled_members(self, compiled: Dict[str, Any]) -> None:
+        """コンパイル済み木モデルを推論バックエンドとして設定（Phase 90）
+
+        設定したモデルは predict_proba で元モデルの代わりに使用する（元モデルとの差は
+        コンパイル時に検証済み）。欠損値を含む入力は元モデルで推論する。
+
+        Args:
+            compiled: {モデル名: CompiledTreeModel}（src/ml/compiled_trees.py）
+        """
+        unknown = set(compiled) - set(self.models)
+        if unknown:
+            raise ValueError(f"アンサンブルに存在しないモデル: {sorted(unknown)}")
+        for name, model in compiled.items():
+            if model.n_features != self.n_features_:
+                raise ValueError(f"{name}: 特徴量数不一致 {model.n_features} != {self.n_features_}")
+        self.compiled_members = dict(compiled)
+        self.logger.info(f"✅ コンパイル推論有効: {', '.join(self.compiled_members)}")
+
+    def detach_compiled_members(self) -> None:
+        """コンパイル済み木モデルを解除し、全モデルを元モデルで推論."""
+        self.compiled_members = {}
+
     def predict(self, X) -> np.ndarray:
         """予測実行（重み付け投票）
 
@@ -89,13 +198,33 @@ class ProductionEnsemble:
         probas = self.predict_proba(X)
         return np.argmax(probas, axis=1)
 
-    def predict_proba(self, X) -> np.ndarray:
+    def predict_with_proba(self, X) -> Tuple[np.ndarray, np.ndarray]:
+        """予測ラベルと予測確率を 1 回の推論で取得（Phase 90）
+
+        predict() と predict_proba() を個別に呼ぶと各モデルの推論が 2 回走るため、
+        確率を 1 回だけ計算し、ラベルは predict() と同じく argmax で導出する。
+
+        Returns:
+            (predict(X) と同一のラベル, predict_proba(X) と同一の確率)
+        """
+        probas = self.predict_proba(X)
+        return np.argmax(probas, axis=1), probas
+
+    def predict_proba(self, X, parallel: Optional[bool] = None) -> np.ndarray:
         """予測確率（重み付け平均）
 
         3クラス分類対応:
         - 各モデルの全クラス確率を保持
         - 重み付け平均で統合
         - 2クラス・3クラス両対応
+
+        Phase 90: 行数が ensemble.parallel_inference.min_rows 以上なら個別モデルを
+        共有スレッドプールで並列推論する（統合はモデル順に行うため結果は逐次と同一）。
+        個別モデルの推論時間（ms）は last_member_timings に記録する。
+
+        Args:
+            X: 特徴量
+            parallel: 並列推論の強制指定（None で設定値と行数から判定）
         """
         if hasattr(X, "values"):
             X_array = X.values
@@ -112,19 +241,22 @@ class ProductionEnsemble:
         else:
             X_with_names = X
 
+        # 各モデルの推論（並列時も結果はモデル順に取り出す）
+        outputs = self._run_members(X_with_names, parallel)
+
         probabilities = {}
         n_classes = None
 
-        # 各モデルから確率取得
-        for name, model in self.models.items():
-            if hasattr(model, "predict_proba"):
-                proba = model.predict_proba(X_with_names)
+        # 各モデルから確率取得（推論したモデルのみ・モデル順）
+        for name, (kind, output) in outputs.items():
+            if kind == "proba":
+                proba = output
                 probabilities[name] = proba
                 if n_classes is None:
                     n_classes = proba.shape[1]
-            elif hasattr(model, "predict"):
+            elif kind == "predict":
                 # predict_probaがない場合はpredictを使用
-                pred = model.predict(X_with_names).astype(int)
+                pred = output.astype(int)
                 # one-hot encoding
                 proba = np.zeros((len(pred), n_classes if n_classes else 2))
                 proba[np.arange(len(pred)), pred] = 1.0
@@ -145,6 +277,86 @@ class ProductionEnsemble:
 
         return final_proba
 
+    def _active_models(self) -> Dict[str, Any]:
+        """
+        推論対象のモデル（Phase 90: 重み 0 のモデルを除外）
+
+        重み 0 のモデルは加重平均に寄与しないため推論しない（遅延読み込み時は読み込みも
+        発生しない）。全モデルが重み 0 の場合は従来通り全モデルを対象とする。
+        """
+        active = {name: model for name, model in self.models.items() if self.weights.get(name, 1.0)}
+        return active or dict(self.models)
+
+    def _run_members(self, X, parallel: Optional[bool]) -> Dict[str, Tuple[str, Any]]:
+        """
+        個別モデルの推論（Phase 90: 並列化対応）
+
+        Returns:
+            {モデル名: ("proba" | "predict" | "none", 出力)}（モデル順）
+        """
+        members = self._active_models()
+        if parallel is None:
+            min_rows = get_threshold("ensemble.parallel_inference.min_rows", 1000)
+            parallel = (
+                get_threshold("ensemble.parallel_inference.enabled", True) and len(X) >= min_rows
+            )
+        parallel = parallel and len(members) > 1
+
+        # Phase 90: コンパイル済み木モデルを優先（旧 pickle は属性なし・欠損値入力は元モデル）
+        compiled = getattr(self, "compiled_members", None)
+        if compiled and not np.isnan(np.asarray(X, dtype=np.float64)).any():
+            members.update({name: model for name, model in compiled.items() if name in members})
+
+        if parallel:
+            max_workers = int(get_threshold("ensemble.parallel_inference.max_workers", 0) or 0)
+            if max_workers <= 0:
+                max_workers = len(self.models)
+            member_threads = int(
+                get_threshold("ensemble.parallel_inference.member_threads", 0) or 0
+            )
+            if member_threads <= 0:
+                concurrent = min(max_workers, len(members))
+                member_threads = max(1, (os.cpu_count() or 1) // concurrent)
+
+            pool = get_inference_pool(max_workers)
+            futures = {
+                name: pool.submit(self._run_member, model, X, member_threads)
+                for name, model in members.items()
+            }
+            results = {name: future.result() for name, future in futures.items()}
+        else:
+            results = {}
+            for name, model in members.items():
+                results[name] = self._run_member(model, X, 0)
+                # 逐次実行は従来通り失敗したモデル以降を実行しない
+                if results[name][1] == "none":
+                    break
+
+        self.last_member_timings = {
+            name: elapsed_ms for name, (_, _, elapsed_ms) in results.items()
+        }
+        if self.logger.is_enabled_for(logging.DEBUG):
+            timings = ", ".join(
+                f"{name}={ms:.1f}ms" for name, ms in self.last_member_timings.items()
+            )
+            self.logger.debug(
+                f"アンサンブル推論: {len(X)}行 {'並列' if parallel else '逐次'} ({timings})"
+            )
+        return {name: (kind, output) for name, (output, kind, _) in results.items()}
+
+    @staticmethod
+    def _run_member(model: Any, X, n_threads: int) -> Tuple[Any, str, float]:
+        """個別モデル 1 つの推論（出力, 種別, 経過ms）."""
+        start = time.perf_counter()
+        with _limit_model_threads(model, n_threads):
+            if hasattr(model, "predict_proba"):
+                output, kind = model.predict_proba(X), "proba"
+            elif hasattr(model, "predict"):
+                output, kind = model.predict(X), "predict"
+            else:
+                output, kind = None, "none"
+        return output, kind, (time.perf_counter() - start) * 1000
+
     def get_model_info(self) -> Dict[str, Any]:
         """モデル情報取得"""
         return {
@@ -171,8 +383,7 @@ class ProductionEnsemble:
 
     def validate_predictions(self, X, y_true=None) -> Dict[str, Any]:
         """予測精度の検証"""
-        predictions = self.predict(X)
-        probabilities = self.predict_proba(X)
+        predictions, probabilities = self.predict_with_proba(X)
 
         validation_result = {
             "n_samples": len(X),
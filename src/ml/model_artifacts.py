@@ -0,0 +1,264 @@
+"""
+アンサンブルモデルのマニフェスト形式アーティファクト - Phase 90
+
+ensemble_full.pkl は全モデル（N-BEATS の torch 重みを含む）を 1 つの pickle に持つため、
+起動時に重み 0 のモデルまで含めて全て展開される。マニフェスト形式では
+
+    models/production/ensemble_full/
+    ├── manifest.json        # 特徴量・重み・個別モデルのファイル名（小さい JSON のみ）
+    ├── lightgbm.joblib      # 個別モデル（非圧縮 joblib）
+    ├── xgboost.joblib
+    ├── random_forest.joblib
+    └── nbeats.joblib
+
+として保存する。起動時は推論対象（重みが正）の個別モデルを読み込んで検証し
+（load_active_members）、壊れた・互換性のないファイルがあれば MLModelLoader は pickle に
+フォールバックする。重み 0 のモデルはファイルサイズのみ検証し、使用時まで読み込まない（LazyMember）。メモリマップは使わない（sklearn の Tree は unpickle 時に
+ノード配列を自身のバッファへコピーし、LightGBM・XGBoost・torch の pickle は大きな numpy 配列を
+持たないため RSS が減らない）。
+
+マニフェストにはコンパイル元 pickle の SHA-256 とサイズ・mtime を記録し、再学習後の古い
+アーティファクトは使用しない（MLModelLoader が pickle 読み込みにフォールバック）。サイズ・mtime が
+一致する間は MLModelLoader は pickle を読まずに記録済みの SHA-256 を使う。
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..core.logger import get_logger
+from .ensemble import ProductionEnsemble
+
+MANIFEST_NAME = "manifest.json"
+FORMAT_VERSION = 1
+
+
+def current_rss_mb() -> Optional[float]:
+    """現在のプロセス RSS（MB）。取得できない環境では None."""
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except ImportError:
+        pass
+    try:
+        import os
+
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class LazyMember:
+    """
+    初回使用時に読み込む個別モデル
+
+    n_features_in_・required_lookback はマニフェストの値を持つため、ProductionEnsemble の
+    初期化やライブ推論行数の決定ではモデルを読み込まない。それ以外の属性アクセス
+    （predict_proba 等）で読み込み、以降は読み込んだモデルに委譲する。
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        name: str,
+        n_features: int,
+        required_lookback: int = 0,
+    ):
+        self._path = Path(path)
+        self._name = name
+        self._model: Any = None
+        self._lock = threading.Lock()
+        self.n_features_in_ = n_features
+        self.required_lookback = required_lookback
+        self.load_ms: Optional[float] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._model is not None
+
+    def load(self) -> Any:
+        """個別モデルを読み込み（並列推論から同時に呼ばれても 1 回だけ）."""
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    import joblib
+
+                    rss_before = current_rss_mb()
+                    start = time.perf_counter()
+                    model = joblib.load(self._path)
+                    self.load_ms = (time.perf_counter() - start) * 1000
+                    rss_after = current_rss_mb()
+                    rss_text = (
+                        f"・RSS +{rss_after - rss_before:.1f}MB"
+                        if rss_before is not None and rss_after is not None
+                        else ""
+                    )
+                    get_logger().info(
+                        f"📦 個別モデル読み込み: {self._name} {self.load_ms:.0f}ms{rss_text}"
+                    )
+                    self._model = model
+        return self._model
+
+    def __getattr__(self, name: str) -> Any:
+        # 未初期化時（unpickle 等）の再帰とプライベート属性の委譲を防ぐ
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "lazy"
+        return f"LazyMember({self._name}, {state})"
+
+
+def source_signature(path: Optional[Path]) -> Dict[str, int]:
+    """pickle のサイズ・mtime（マニフェスト記録用・パスなし/取得失敗時は空）"""
+    if path is None:
+        return {}
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return {}
+    return {"source_size": stat.st_size, "source_mtime_ns": stat.st_mtime_ns}
+
+
+def save_ensemble_artifact(
+    ensemble: ProductionEnsemble,
+    directory: Path,
+    source_digest: str = "",
+    source_path: Optional[Path] = None,
+) -> Path:
+    """
+    ProductionEnsemble をマニフェスト形式で保存
+
+    マニフェストは最後に書き込む（途中で失敗したアーティファクトは読み込まれない）。
+
+    Args:
+        ensemble: 保存するアンサンブル
+        directory: 出力ディレクトリ（例: models/production/ensemble_full）
+        source_digest: 同時に保存した pickle の SHA-256（古いアーティファクトの検出用）
+        source_path: 同時に保存した pickle のパス（サイズ・mtime を記録し、起動時の
+            SHA-256 再計算を省略するため）
+
+    Returns:
+        マニフェストのパス
+    """
+    import joblib
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    manifest_path = directory / MANIFEST_NAME
+    manifest_path.unlink(missing_ok=True)
+
+    members = {}
+    for name, model in ensemble.models.items():
+        if isinstance(model, LazyMember):
+            model = model.load()
+        filename = f"{name}.joblib"
+        # 読み込み時間を優先して非圧縮で保存
+        joblib.dump(model, directory / filename)
+        lookback = getattr(model, "required_lookback", 0)
+        members[name] = {
+            "file": filename,
+            "required_lookback": lookback if isinstance(lookback, int) else 0,
+            "bytes": (directory / filename).stat().st_size,
+        }
+
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "created_at": datetime.now().isoformat(),
+        "source_sha256": source_digest,
+        **source_signature(source_path),
+        "n_features": int(ensemble.n_features_),
+        "feature_names": list(ensemble.feature_names),
+        "weights": dict(ensemble.weights),
+        "members": members,
+    }
+    tmp_path = directory / f"{MANIFEST_NAME}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    tmp_path.replace(manifest_path)
+    return manifest_path
+
+
+def read_manifest(directory: Path) -> Dict[str, Any]:
+    """
+    マニフェスト読み込み
+
+    Raises:
+        FileNotFoundError: マニフェストなし
+        ValueError: 未対応の形式バージョン・個別モデルファイル不足・サイズ不一致（書き込み途中等）
+    """
+    directory = Path(directory)
+    with open(directory / MANIFEST_NAME, encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format_version") != FORMAT_VERSION:
+        raise ValueError(f"未対応のアーティファクト形式: {manifest.get('format_version')}")
+    missing = []
+    mismatched = []
+    for info in manifest["members"].values():
+        path = directory / info["file"]
+        if not path.exists():
+            missing.append(info["file"])
+        elif "bytes" in info and path.stat().st_size != info["bytes"]:
+            mismatched.append(info["file"])
+    if missing:
+        raise ValueError(f"個別モデルファイル不足: {missing}")
+    if mismatched:
+        raise ValueError(f"個別モデルファイルのサイズ不一致: {mismatched}")
+    return manifest
+
+
+def load_ensemble_artifact(
+    directory: Path, manifest: Optional[Dict[str, Any]] = None
+) -> ProductionEnsemble:
+    """
+    マニフェスト形式のアーティファクトから ProductionEnsemble を構築（個別モデルは遅延読み込み）
+
+    Args:
+        directory: アーティファクトディレクトリ
+        manifest: 読み込み済みマニフェスト（None なら読み込む）
+    """
+    directory = Path(directory)
+    if manifest is None:
+        manifest = read_manifest(directory)
+    n_features = int(manifest["n_features"])
+    members = {
+        name: LazyMember(
+            directory / info["file"],
+            name,
+            n_features,
+            int(info.get("required_lookback", 0)),
+        )
+        for name, info in manifest["members"].items()
+    }
+    ensemble = ProductionEnsemble(members)
+    ensemble.feature_names = list(manifest["feature_names"])
+    ensemble.weights = dict(manifest["weights"])
+    return ensemble
+
+
+def load_active_members(ensemble: ProductionEnsemble) -> None:
+    """
+    推論対象（重みが正）の個別モデルを読み込んで検証
+
+    起動時に呼び、壊れた・互換性のないファイルを初回推論前に検出する（初回推論で失敗すると
+    DummyModel に縮退するため）。重み 0 のモデルは読み込まない。
+
+    Raises:
+        Exception: 読み込み失敗（joblib・unpickle の例外）
+        ValueError: 推論メソッドを持たないモデル
+    """
+    for name, member in ensemble._active_models().items():
+        if not isinstance(member, LazyMember):
+            continue
+        model = member.load()
+        if not (hasattr(model, "predict_proba") or hasattr(model, "predict")):
+            raise ValueError(f"個別モデル {name} に推論メソッドがない")
@@ -241,6 +241,10 @@ class BaseMLModel(ABC):
         if not self.feature_names:
             return X
 
+        # Phase 90: 列が既に学習時の順序と一致していれば補完・削除・並べ替えを省略
+        if X.columns.tolist() == self.feature_names:
+            return X
+
         try:
             # 不足する特徴量を0で補完
             missing_features = set(self.feature_names) - set(X.columns)
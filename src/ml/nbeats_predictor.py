@@ -44,6 +44,10 @@ class NBeatsPredictor:
     - ProductionEnsemble.predict_proba ループから呼ばれる
     """
 
+    # Phase 90: 1 行の特徴量ベクトルを分類する（過去行の窓は入力しない）ため、
+    # 最終行の推論に必要な追加行数は 0（ProductionEnsemble.required_lookback 参照）
+    required_lookback = 0
+
     def __init__(
         self,
         n_features: Optional[int] = None,
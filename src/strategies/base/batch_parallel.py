@@ -0,0 +1,148 @@
+"""
+戦略シグナル一括生成の行単位フォールバック並列化 - Phase 90
+
+StrategyBase._generate_signals_per_row() は行 i で generate_signal(features_df.iloc[:i+1]) を
+実行する。特徴量が因果的（行 i が過去データのみで決まる）なら各行は独立しているため、
+BacktestRunner._precompute_strategy_signals・create_ml_models.py の学習用シグナル生成で
+使われる一括生成を行範囲（シャード）単位でプロセス並列に評価できる。
+
+設計:
+- 特徴量は一時ディレクトリ（/dev/shm があれば共有メモリ上）に列単位の .npy として 1 回だけ
+  書き出し（feature_store と同形式）、各ワーカーは初期化時に mmap でロードする
+  （タスク毎に DataFrame を pickle 転送しない）
+- 戦略インスタンスはワーカー初期化時に 1 回だけ pickle 転送（logger は除外・ワーカー側で再取得）
+- シャードは連続した行範囲。executor.map の順序で結合するため、結果はワーカー数・
+  シャード数に依存せずシリアル実行と同一の配列になる
+- 無効化・小規模入力・プール起動/実行失敗時は None を返し、呼び出し側がシリアル実行する
+
+設定（thresholds.yaml performance.signal_precompute）:
+- enabled: 並列化の有効/無効
+- max_workers: ワーカープロセス数（0 以下で CPU コア数）
+- min_rows_per_shard: 1 シャードの最小行数（これ未満の入力はシリアル実行）
+- start_method: multiprocessing 開始方式（既定 spawn: 特徴量生成スレッドプールと fork の併用回避）
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ...core.config.threshold_manager import get_threshold
+from ...core.logger import get_logger
+
+if TYPE_CHECKING:
+    from .strategy_base import StrategyBase
+
+# 共有メモリ（tmpfs）があれば一時ディレクトリをそこに作成
+SHARED_MEMORY_DIR = "/dev/shm"
+
+# ワーカープロセス内の状態（_init_worker で設定）
+_worker_state: Dict[str, Any] = {}
+
+
+def _resolve_max_workers() -> int:
+    """設定からワーカー数を取得（0 以下は CPU コア数）."""
+    max_workers = int(get_threshold("performance.signal_precompute.max_workers", 0) or 0)
+    if max_workers <= 0:
+        max_workers = os.cpu_count() or 1
+    return max_workers
+
+
+def plan_shards(
+    start: int, stop: int, max_workers: int, min_rows_per_shard: int
+) -> List[Tuple[int, int]]:
+    """
+    [start, stop) を連続した行範囲に分割
+
+    各ワーカーに複数シャードを割り当てて負荷を平準化する（ワーカー数 × 4 が上限）。
+
+    Returns:
+        (開始行, 終了行) のリスト（2 シャード未満なら空 = シリアル実行）
+    """
+    n_rows = max(stop - start, 0)
+    n_shards = min(max_workers * 4, n_rows // max(min_rows_per_shard, 1))
+    if max_workers < 2 or n_shards < 2:
+        return []
+    bounds = np.linspace(start, stop, n_shards + 1).astype(int)
+    return [(int(lo), int(hi)) for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+
+def _init_worker(frame_dir: str, frame_meta: Dict[str, Any], strategy: "StrategyBase") -> None:
+    """ワーカー初期化: 特徴量を mmap でロードし、戦略インスタンスを保持."""
+    from ...features.feature_store import load_frame_arrays
+
+    _worker_state["features"] = load_frame_arrays(Path(frame_dir), frame_meta)
+    _worker_state["strategy"] = strategy
+
+
+def _evaluate_shard(bounds: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """ワーカー: 行範囲のシグナルを評価."""
+    start, stop = bounds
+    strategy = _worker_state["strategy"]
+    return strategy._evaluate_signal_rows(_worker_state["features"], start, stop)
+
+
+def evaluate_rows_parallel(
+    strategy: "StrategyBase", features_df: pd.DataFrame, start: int
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    行 [start, len(features_df)) の行単位シグナルをプロセス並列で評価
+
+    Args:
+        strategy: 評価する戦略（ワーカーへ pickle 転送される）
+        features_df: 特徴量DataFrame（全履歴・因果的であること）
+        start: 評価開始行（最低データ数 - 1）
+
+    Returns:
+        (action配列, confidence配列)（長さ len(features_df) - start）。
+        並列化しない・できない場合は None（呼び出し側でシリアル実行）
+    """
+    if _worker_state or not get_threshold("performance.signal_precompute.enabled", True):
+        return None
+
+    max_workers = _resolve_max_workers()
+    min_rows_per_shard = int(
+        get_threshold("performance.signal_precompute.min_rows_per_shard", 1000)
+    )
+    shards = plan_shards(start, len(features_df), max_workers, min_rows_per_shard)
+    # 列名重複は列単位の保存で失われるためシリアル実行
+    if not shards or not features_df.columns.is_unique:
+        return None
+
+    from ...features.feature_store import save_frame_arrays
+
+    logger = get_logger()
+    start_method = get_threshold("performance.signal_precompute.start_method", "spawn")
+    tmp_root = SHARED_MEMORY_DIR if os.path.isdir(SHARED_MEMORY_DIR) else None
+    frame_dir = Path(tempfile.mkdtemp(prefix="strategy-signals-", dir=tmp_root))
+    try:
+        frame_meta = save_frame_arrays(frame_dir, features_df)
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(shards)),
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_init_worker,
+            initargs=(str(frame_dir), frame_meta, strategy),
+        ) as executor:
+            results = list(executor.map(_evaluate_shard, shards))
+    except Exception as e:
+        logger.warning(f"[{strategy.name}] 行単位シグナル並列評価失敗・シリアル実行: {e}")
+        return None
+    finally:
+        shutil.rmtree(frame_dir, ignore_errors=True)
+
+    logger.info(
+        f"[{strategy.name}] 行単位シグナル並列評価: {len(features_df) - start}行 × "
+        f"{len(shards)}シャード（{min(max_workers, len(shards))}プロセス）"
+    )
+    return (
+        np.concatenate([action for action, _ in results]),
+        np.concatenate([confidence for _, confidence in results]),
+    )
@@ -10,12 +10,14 @@
 Phase 64.5: デッドコード削除・import整理
 """
 
+import logging
 import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from ...core.exceptions import StrategyError
@@ -114,6 +116,16 @@ class StrategyBase(ABC):
 
         self.logger.info(f"戦略初期化完了: {self.name}")
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """pickle 用状態（logger は転送せず復元時に再取得・行単位シグナルの並列評価用）."""
+        state = self.__dict__.copy()
+        state.pop("logger", None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.logger = get_logger()
+
     @abstractmethod
     def analyze(
         self, df: pd.DataFrame, multi_timeframe_data: Optional[Dict[str, pd.DataFrame]] = None
@@ -145,6 +157,15 @@ class StrategyBase(ABC):
         """
         pass
 
+    def get_optional_features(self) -> List[str]:
+        """
+        戦略が存在すれば利用する特徴量リストを返す（列が無くても動作する）
+
+        Returns:
+            任意特徴量名のリスト.
+        """
+        return []
+
     def generate_signal(
         self, df: pd.DataFrame, multi_timeframe_data: Optional[Dict[str, pd.DataFrame]] = None
     ) -> StrategySignal:
@@ -159,7 +180,8 @@ class StrategyBase(ABC):
             生成されたシグナル.
         """
         try:
-            self.logger.debug(f"[{self.name}] シグナル生成開始")
+            if self.logger.is_enabled_for(logging.DEBUG):
+                self.logger.debug(f"[{self.name}] シグナル生成開始")
 
             # 前処理チェック
             self._validate_input_data(df)
@@ -170,20 +192,140 @@ class StrategyBase(ABC):
             # 後処理
             self._post_process_signal(signal)
 
-            self.logger.debug(
-                f"[{self.name}] シグナル生成完了: {signal.action} (信頼度: {signal.confidence:.3f})"
-            )
+            if self.logger.is_enabled_for(logging.DEBUG):
+                self.logger.debug(
+                    f"[{self.name}] シグナル生成完了: {signal.action} (信頼度: {signal.confidence:.3f})"
+                )
 
             return signal
 
         except Exception as e:
             # Phase 35: バックテストモード時はDEBUGレベル
             if os.environ.get("BACKTEST_MODE") == "true":
-                self.logger.debug(f"[{self.name}] シグナル生成エラー: {e}")
+                if self.logger.is_enabled_for(logging.DEBUG):
+                    self.logger.debug(f"[{self.name}] シグナル生成エラー: {e}")
             else:
                 self.logger.error(f"[{self.name}] シグナル生成エラー: {e}")
             raise StrategyError(f"戦略シグナル生成失敗: {e}", strategy_name=self.name)
 
+    def generate_signals_batch(self, features_df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        全行のシグナルを一括生成（バックテスト・ML学習用）
+
+        行 i の結果は generate_signal(features_df.iloc[:i+1]) と一致する。
+        戦略が _generate_signals_vectorized() を実装していればNumPyで一括判定し、
+        未実装・失敗時は行単位の generate_signal() にフォールバックする。
+
+        Args:
+            features_df: 特徴量DataFrame（全履歴）
+
+        Returns:
+            {"action": ndarray[str], "confidence": ndarray[float], "encoded": ndarray[float]}
+            - 例外となる行（データ数不足・特徴量不足等）は hold / 0.0
+            - encoded: buy=+confidence, sell=-confidence, hold=0.0.
+        """
+        n_rows = len(features_df)
+        action = np.full(n_rows, "hold", dtype=object)
+        confidence = np.zeros(n_rows, dtype=float)
+
+        # 必要特徴量不足 → generate_signal() は全行で例外
+        required_features = self.get_required_features()
+        if n_rows == 0 or any(f not in features_df.columns for f in required_features):
+            return self._build_batch_result(action, confidence)
+
+        try:
+            vectorized = self._generate_signals_vectorized(features_df)
+        except Exception as e:
+            self.logger.debug(f"[{self.name}] ベクトル化評価失敗・行単位にフォールバック: {e}")
+            vectorized = None
+
+        if vectorized is None:
+            return self._generate_signals_per_row(features_df)
+
+        action[:], confidence[:] = vectorized
+
+        # エントリーはSignalBuilderのATR取得が前提（ATR無効ならエラーHOLD・信頼度0.0）
+        atr = features_df["atr_14"].to_numpy(dtype=float)
+        atr_unavailable = np.isin(action, ["buy", "sell"]) & ~(atr > 0)
+        action[atr_unavailable] = "hold"
+        confidence[atr_unavailable] = 0.0
+
+        # 最低データ数未満の行は generate_signal() が例外
+        min_data_points = self.config.get("min_data_points", 20)
+        head = min(max(min_data_points - 1, 0), n_rows)
+        action[:head] = "hold"
+        confidence[:head] = 0.0
+
+        return self._build_batch_result(action, confidence)
+
+    def _generate_signals_vectorized(
+        self, features_df: pd.DataFrame
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        ベクトル化シグナル判定（サブクラスで任意実装）
+
+        各行を最新行とみなした analyze() の判定を配列で返す。
+        ATR取得失敗・最低データ数は generate_signals_batch() 側で処理する。
+
+        Returns:
+            (action配列, confidence配列)、未対応の場合None（行単位にフォールバック）.
+        """
+        return None
+
+    def _generate_signals_per_row(self, features_df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        行単位フォールバック（各行で過去データのみを使い generate_signal() を実行）
+
+        Phase 90: 行数が多い場合は行範囲毎にプロセス並列評価（batch_parallel.py）。
+        結果はシリアル実行と同一。
+        """
+        from .batch_parallel import evaluate_rows_parallel
+
+        n_rows = len(features_df)
+        action = np.full(n_rows, "hold", dtype=object)
+        confidence = np.zeros(n_rows, dtype=float)
+
+        start = min(max(self.config.get("min_data_points", 20) - 1, 0), n_rows)
+        evaluated = evaluate_rows_parallel(self, features_df, start)
+        if evaluated is None:
+            evaluated = self._evaluate_signal_rows(features_df, start, n_rows)
+        action[start:], confidence[start:] = evaluated
+
+        return self._build_batch_result(action, confidence)
+
+    def _evaluate_signal_rows(
+        self, features_df: pd.DataFrame, start: int, stop: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """行 [start, stop) を generate_signal(features_df.iloc[:i+1]) で評価（例外行は hold / 0.0）."""
+        action = np.full(stop - start, "hold", dtype=object)
+        confidence = np.zeros(stop - start, dtype=float)
+        for i in range(start, stop):
+            try:
+                signal = self.generate_signal(features_df.iloc[: i + 1])
+            except Exception:
+                continue
+            action[i - start] = signal.action
+            confidence[i - start] = signal.confidence
+        return action, confidence
+
+    @staticmethod
+    def _build_batch_result(action: np.ndarray, confidence: np.ndarray) -> Dict[str, np.ndarray]:
+        """バッチ結果辞書作成（action × confidence エンコーディング付き）."""
+        encoded = np.where(
+            action == "buy", confidence, np.where(action == "sell", -confidence, 0.0)
+        )
+        return {"action": action, "confidence": confidence, "encoded": encoded}
+
+    @staticmethod
+    def _batch_min(a: Any, b: Any) -> np.ndarray:
+        """要素毎の min(a, b)（Python組み込みminと同じNaN挙動）."""
+        return np.where(np.less(b, a), b, a)
+
+    @staticmethod
+    def _batch_max(a: Any, b: Any) -> np.ndarray:
+        """要素毎の max(a, b)（Python組み込みmaxと同じNaN挙動）."""
+        return np.where(np.greater(b, a), b, a)
+
     def _validate_input_data(self, df: pd.DataFrame) -> None:
         """入力データの検証."""
         if df.empty:
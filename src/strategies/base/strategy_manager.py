@@ -12,6 +12,7 @@
 Phase 64.5: デッドコード削除・import整理・quorum重複統合
 """
 
+import logging
 import os
 from collections import defaultdict
 from datetime import datetime
@@ -24,6 +25,7 @@ from ...core.config import get_features_config, get_threshold
 from ...core.exceptions import StrategyError
 from ...core.logger import get_logger
 from .strategy_base import StrategyBase, StrategySignal
+from .strategy_profiler import StrategyProfiler
 
 
 class StrategyManager:
@@ -55,6 +57,9 @@ class StrategyManager:
         # 基本統計（簡素化）
         self.total_decisions = 0
 
+        # Phase 90: 戦略別プロファイリング（performance.strategy_profiling・既定無効）
+        self.profiler = StrategyProfiler()
+
         self.logger.info("戦略マネージャー初期化完了")
 
     def register_strategy(self, strategy: StrategyBase, weight: float = 1.0) -> None:
@@ -89,6 +94,25 @@ class StrategyManager:
         Returns:
             統合された最終シグナル.
         """
+        combined_signal, _ = self.analyze_market_with_signals(df, multi_timeframe_data)
+        return combined_signal
+
+    def analyze_market_with_signals(
+        self, df: pd.DataFrame, multi_timeframe_data: Optional[Dict[str, pd.DataFrame]] = None
+    ) -> Tuple[StrategySignal, Dict[str, Dict[str, float]]]:
+        """
+        全戦略を 1 回だけ実行し、統合シグナルと個別戦略シグナル（ML特徴量用）を返す
+
+        取引サイクルで analyze_market() と get_individual_strategy_signals() を続けて呼ぶと
+        全戦略が 2 回実行されるため、サイクル内ではこちらを使用する。
+
+        Args:
+            df: 市場データ（メインタイムフレーム）
+            multi_timeframe_data: マルチタイムフレームデータ
+
+        Returns:
+            (統合シグナル, get_individual_strategy_signals() と同形式の個別シグナル辞書)
+        """
         try:
             self.logger.debug("市場分析開始 - 全戦略実行")
 
@@ -101,11 +125,13 @@ class StrategyManager:
             # 統合結果記録
             self._record_decision(strategy_signals, combined_signal)
 
-            self.logger.info(
-                f"統合シグナル生成: {combined_signal.action} (信頼度: {combined_signal.confidence:.3f})"
-            )
+            if self.logger.is_enabled_for(logging.INFO):
+                self.logger.info(
+                    f"統合シグナル生成: {combined_signal.action} "
+                    f"(信頼度: {combined_signal.confidence:.3f})"
+                )
 
-            return combined_signal
+            return combined_signal, self._encode_individual_signals(strategy_signals)
 
         except Exception as e:
             # Phase 35: バックテストモード時はDEBUGレベル
@@ -122,23 +148,45 @@ class StrategyManager:
         signals = {}
         errors = []
 
-        self.logger.debug(f"戦略シグナル収集開始: {len(self.strategies)}戦略登録済み")
+        # ホットパス: レベル無効時はメッセージ組み立て（列名リスト化等）を行わない
+        debug_enabled = self.logger.is_enabled_for(logging.DEBUG)
+        info_enabled = self.logger.is_enabled_for(logging.INFO)
+
+        # 無効時は計測経路を通らない（オーバーヘッドなし）
+        profiler = self.profiler if self.profiler.enabled else None
+        if profiler is not None:
+            profiler.start_cycle()
+
+        if debug_enabled:
+            self.logger.debug(f"戦略シグナル収集開始: {len(self.strategies)}戦略登録済み")
         for name, strategy in self.strategies.items():
-            self.logger.debug(f"戦略チェック: {name}, is_enabled={strategy.is_enabled}")
+            if debug_enabled:
+                self.logger.debug(f"戦略チェック: {name}, is_enabled={strategy.is_enabled}")
             if not strategy.is_enabled:
-                self.logger.debug(f"戦略スキップ（無効）: {name}")
+                if debug_enabled:
+                    self.logger.debug(f"戦略スキップ（無効）: {name}")
                 continue
 
             try:
-                self.logger.debug(f"[{name}] シグナル生成開始 - データシェイプ: {df.shape}")
-                self.logger.debug(f"[{name}] 利用可能な列: {list(df.columns)}")
+                if debug_enabled:
+                    self.logger.debug(f"[{name}] シグナル生成開始 - データシェイプ: {df.shape}")
+                    self.logger.debug(f"[{name}] 利用可能な列: {list(df.columns)}")
 
                 # Phase 31: multi_timeframe_dataを渡す
-                signal = strategy.generate_signal(df, multi_timeframe_data=multi_timeframe_data)
+                if profiler is None:
+                    signal = strategy.generate_signal(df, multi_timeframe_data=multi_timeframe_data)
+                else:
+                    signal = profiler.run(
+                        name,
+                        strategy.generate_signal,
+                        df,
+                        multi_timeframe_data=multi_timeframe_data,
+                    )
                 signals[name] = signal
-                self.logger.info(
-                    f"[{name}] シグナル取得成功: {signal.action} ({signal.confidence:.3f})"
-                )
+                if info_enabled:
+                    self.logger.info(
+                        f"[{name}] シグナル取得成功: {signal.action} ({signal.confidence:.3f})"
+                    )
 
             except Exception as e:
                 error_msg = f"[{name}] シグナル生成エラー: {type(e).__name__}: {e}"
@@ -151,10 +199,14 @@ class StrategyManager:
                     self.logger.error(f"[{name}] 必要特徴量: {strategy.get_required_features()}")
                 errors.append(error_msg)
 
+        if profiler is not None and info_enabled:
+            self.logger.info(profiler.format_last_cycle())
+
         if not signals and errors:
             raise StrategyError(f"全戦略でエラー発生: {'; '.join(errors)}")
 
-        self.logger.debug(f"シグナル収集完了: {len(signals)}戦略")
+        if debug_enabled:
+            self.logger.debug(f"シグナル収集完了: {len(signals)}戦略")
         return signals
 
     def _combine_signals(
@@ -301,12 +353,13 @@ class StrategyManager:
                         reason=signal.reason,
                         metadata=signal.metadata,
                     )
-                    self.logger.info(
-                        f"Phase 71: トレンドフィルタ - [{name}] "
-                        f"{signal.action.upper()}信頼度削減 "
-                        f"{signal.confidence:.3f}→{new_confidence:.3f} "
-                        f"(EMA傾き={ema_slope:.4f})"
-                    )
+                    if self.logger.is_enabled_for(logging.INFO):
+                        self.logger.info(
+                            f"Phase 71: トレンドフィルタ - [{name}] "
+                            f"{signal.action.upper()}信頼度削減 "
+                            f"{signal.confidence:.3f}→{new_confidence:.3f} "
+                            f"(EMA傾き={ema_slope:.4f})"
+                        )
             else:
                 filtered_signals[name] = signal
 
@@ -384,10 +437,11 @@ class StrategyManager:
 
             # 両方2票以上 → 矛盾 → HOLD
             if buy_has_quorum and sell_has_quorum:
-                self.logger.info(
-                    f"Phase 56.7: BUY/SELL両方2票以上で矛盾 → HOLD "
-                    f"(BUY={buy_count}票, SELL={sell_count}票)"
-                )
+                if self.logger.is_enabled_for(logging.INFO):
+                    self.logger.info(
+                        f"Phase 56.7: BUY/SELL両方2票以上で矛盾 → HOLD "
+                        f"(BUY={buy_count}票, SELL={sell_count}票)"
+                    )
                 return self._create_hold_signal(
                     df,
                     reason=f"Phase 56.7: BUY/SELL両方2票以上で矛盾 (BUY={buy_count}, SELL={sell_count})",
@@ -427,11 +481,12 @@ class StrategyManager:
             # すべて0の場合はhold選択
             return self._create_hold_signal(df, reason="全戦略信頼度ゼロ")
 
-        self.logger.debug(
-            f"従来ロジック適用: BUY={buy_ratio:.3f}({buy_count}票) "
-            f"SELL={sell_ratio:.3f}({sell_count}票) "
-            f"HOLD={hold_ratio:.3f}({len(hold_signals)}票)"
-        )
+        if self.logger.is_enabled_for(logging.DEBUG):
+            self.logger.debug(
+                f"従来ロジック適用: BUY={buy_ratio:.3f}({buy_count}票) "
+                f"SELL={sell_ratio:.3f}({sell_count}票) "
+                f"HOLD={hold_ratio:.3f}({len(hold_signals)}票)"
+            )
 
         # 最高比率のアクションを選択
         max_ratio = max(buy_ratio, sell_ratio, hold_ratio)
@@ -449,9 +504,10 @@ class StrategyManager:
             ratio = sell_ratio
         else:  # hold_ratio == max_ratio または BUY/SELL同率
             # Phase 53.13: BUY/SELL同率の場合もHOLDに
-            self.logger.info(
-                f"コンフリクト解決: HOLD選択 (BUY={buy_ratio:.3f}, SELL={sell_ratio:.3f}, HOLD={hold_ratio:.3f})"
-            )
+            if self.logger.is_enabled_for(logging.INFO):
+                self.logger.info(
+                    f"コンフリクト解決: HOLD選択 (BUY={buy_ratio:.3f}, SELL={sell_ratio:.3f}, HOLD={hold_ratio:.3f})"
+                )
             return self._create_hold_signal(
                 df,
                 reason=f"従来ロジック - HOLD/同率 (BUY={buy_ratio:.3f}, SELL={sell_ratio:.3f})",
@@ -463,9 +519,10 @@ class StrategyManager:
             key=lambda x: x[1].confidence * self.strategy_weights.get(x[0], 1.0),
         )
 
-        self.logger.info(
-            f"従来ロジック解決: {action.upper()}選択 (比率: {ratio:.3f}, {len(winning_group)}票, 主戦略: {best_strategy_name})"
-        )
+        if self.logger.is_enabled_for(logging.INFO):
+            self.logger.info(
+                f"従来ロジック解決: {action.upper()}選択 (比率: {ratio:.3f}, {len(winning_group)}票, 主戦略: {best_strategy_name})"
+            )
 
         return StrategySignal(
             strategy_name=best_strategy_name,  # Phase 57.12: 個別戦略名を記録
@@ -510,10 +567,11 @@ class StrategyManager:
             winning_signals,
             key=lambda x: x[1].confidence * self.strategy_weights.get(x[0], 1.0),
         )
-        self.logger.info(
-            f"Phase 56.7: {action.upper()} {len(winning_signals)}票でクオーラム達成 → "
-            f"{action.upper()}選択 (信頼度: {weighted_confidence:.3f}, 主戦略: {best_strategy_name})"
-        )
+        if self.logger.is_enabled_for(logging.INFO):
+            self.logger.info(
+                f"Phase 56.7: {action.upper()} {len(winning_signals)}票でクオーラム達成 → "
+                f"{action.upper()}選択 (信頼度: {weighted_confidence:.3f}, 主戦略: {best_strategy_name})"
+            )
         return StrategySignal(
             strategy_name=best_strategy_name,
             timestamp=datetime.now(),
@@ -559,9 +617,10 @@ class StrategyManager:
 
         # ログ出力（デバッグ用）
         action_counts = {action: len(signals) for action, signals in signal_groups.items()}
-        self.logger.debug(
-            f"統合判定: {dominant_action.upper()} (信頼度: {dominant_confidence:.3f}, 票数: {action_counts[dominant_action]})"
-        )
+        if self.logger.is_enabled_for(logging.DEBUG):
+            self.logger.debug(
+                f"統合判定: {dominant_action.upper()} (信頼度: {dominant_confidence:.3f}, 票数: {action_counts[dominant_action]})"
+            )
 
         if dominant_action == "hold":
             return self._create_hold_signal(df, reason=f"{action_counts['hold']}戦略がホールド推奨")
@@ -638,6 +697,10 @@ class StrategyManager:
         if is_backtest:
             return
 
+        # INFO 無効時は診断（get_signal_proximity）の計算自体を省略
+        if not self.logger.is_enabled_for(logging.INFO):
+            return
+
         try:
             diagnosis_lines = []
 
@@ -720,9 +783,10 @@ class StrategyManager:
         self.last_combined_signal = final_signal
 
         # デバッグログのみ（履歴保存なし）
-        self.logger.debug(
-            f"決定記録: {len(strategy_signals)}戦略 → {final_signal.action} (信頼度: {final_signal.confidence:.3f})"
-        )
+        if self.logger.is_enabled_for(logging.DEBUG):
+            self.logger.debug(
+                f"決定記録: {len(strategy_signals)}戦略 → {final_signal.action} (信頼度: {final_signal.confidence:.3f})"
+            )
 
     def update_strategy_weights(self, new_weights: Dict[str, float]) -> None:
         """戦略重み更新."""
@@ -765,34 +829,66 @@ class StrategyManager:
         try:
             # 既存の_collect_all_signals()を再利用
             strategy_signals = self._collect_all_signals(df, multi_timeframe_data)
+            return self._encode_individual_signals(strategy_signals)
 
-            # ML用に変換
-            result = {}
-            for strategy_name, signal in strategy_signals.items():
-                # action × confidence エンコーディング
-                if signal.action == "buy":
-                    encoded = signal.confidence  # +1 * confidence
-                elif signal.action == "sell":
-                    encoded = -signal.confidence  # -1 * confidence
-                else:  # hold
-                    encoded = 0.0  # 0 * confidence
-
-                result[strategy_name] = {
-                    "action": signal.action,
-                    "confidence": signal.confidence,
-                    "encoded": encoded,
-                }
+        except Exception as e:
+            self.logger.error(f"個別戦略シグナル取得エラー: {e}")
+            # エラー時は空辞書を返す（後方互換性）
+            return {}
+
+    def _encode_individual_signals(
+        self, strategy_signals: Dict[str, StrategySignal]
+    ) -> Dict[str, Dict[str, float]]:
+        """個別戦略シグナルを ML 特徴量用の action / confidence / encoded 辞書に変換."""
+        result = {}
+        for strategy_name, signal in strategy_signals.items():
+            # action × confidence エンコーディング
+            if signal.action == "buy":
+                encoded = signal.confidence  # +1 * confidence
+            elif signal.action == "sell":
+                encoded = -signal.confidence  # -1 * confidence
+            else:  # hold
+                encoded = 0.0  # 0 * confidence
+
+            result[strategy_name] = {
+                "action": signal.action,
+                "confidence": signal.confidence,
+                "encoded": encoded,
+            }
 
+        if self.logger.is_enabled_for(logging.DEBUG):
             self.logger.debug(
                 f"個別戦略シグナル取得完了: {len(result)}戦略 "
                 f"(BUY={sum(1 for s in result.values() if s['action'] == 'buy')}, "
                 f"SELL={sum(1 for s in result.values() if s['action'] == 'sell')}, "
                 f"HOLD={sum(1 for s in result.values() if s['action'] == 'hold')})"
             )
+        return result
 
-            return result
+    def get_individual_strategy_signals_batch(
+        self, features_df: pd.DataFrame
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        各戦略の個別シグナルを全行一括取得（バックテスト・ML学習用）
 
-        except Exception as e:
-            self.logger.error(f"個別戦略シグナル取得エラー: {e}")
-            # エラー時は空辞書を返す（後方互換性）
-            return {}
+        行 i の結果は get_individual_strategy_signals(features_df.iloc[:i+1]) と一致する。
+        各戦略の generate_signals_batch() を使用（未対応戦略は行単位フォールバック）。
+
+        Args:
+            features_df: 特徴量DataFrame（全履歴）
+
+        Returns:
+            各戦略の配列辞書
+            例: {"ATRBased": {"action": ndarray, "confidence": ndarray, "encoded": ndarray}}
+        """
+        result = {}
+        for name, strategy in self.strategies.items():
+            if not strategy.is_enabled:
+                continue
+            try:
+                result[name] = strategy.generate_signals_batch(features_df)
+            except Exception as e:
+                self.logger.error(f"[{name}] 一括シグナル生成エラー: {type(e).__name__}: {e}")
+
+        self.logger.debug(f"個別戦略シグナル一括取得完了: {len(result)}戦略 × {len(features_df)}行")
+        return result
@@ -0,0 +1,182 @@
+"""
+戦略プロファイラー - Phase 90
+
+StrategyManager._collect_all_signals() の戦略毎のコストを計測する。
+
+- 戦略毎: 呼び出し回数・壁時計時間（合計/最大）・エラー数・get_threshold 呼び出し回数（キー別）
+- 任意: tracemalloc による 1 呼び出しあたりのメモリ割り当てピーク（trace_memory: true）
+- ライブ: サイクル毎に直近サイクルの内訳を INFO ログ出力（StrategyManager から）
+- バックテスト: 終了時に累積サマリーをログ出力・最終レポートへ格納（BacktestRunner から）
+
+無効時（既定）は StrategyManager が計測経路を通らないためオーバーヘッドなし。
+有効時のコストは 1 戦略呼び出しあたり perf_counter 2 回とキー毎のカウントのみ
+（tracemalloc 有効時は割り当て追跡のため大きく低下する点に注意）。
+
+設定（thresholds.yaml performance.strategy_profiling）:
+- enabled / trace_memory / top_lookups（サマリーに表示する get_threshold キー数）
+"""
+
+import time
+import tracemalloc
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional
+
+from ...core.config.threshold_manager import get_threshold, set_threshold_lookup_observer
+
+
+class _StrategyStats:
+    """戦略 1 つ分の累積統計."""
+
+    __slots__ = ("calls", "errors", "total_sec", "max_sec", "peak_bytes", "lookups")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_sec = 0.0
+        self.max_sec = 0.0
+        self.peak_bytes = 0
+        self.lookups: Counter = Counter()
+
+
+class StrategyProfiler:
+    """戦略毎の実行時間・呼び出し回数・メモリ割り当てピークの計測."""
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        trace_memory: Optional[bool] = None,
+        top_lookups: Optional[int] = None,
+    ):
+        """
+        Args:
+            enabled: 計測有効化（None で config から取得）
+            trace_memory: tracemalloc によるメモリピーク計測（None で config から取得）
+            top_lookups: サマリーに表示する get_threshold キー数（None で config から取得）
+        """
+        if enabled is None:
+            enabled = get_threshold("performance.strategy_profiling.enabled", False)
+        if trace_memory is None:
+            trace_memory = get_threshold("performance.strategy_profiling.trace_memory", False)
+        if top_lookups is None:
+            top_lookups = get_threshold("performance.strategy_profiling.top_lookups", 3)
+        self.enabled = bool(enabled)
+        self.trace_memory = bool(trace_memory)
+        self.top_lookups = int(top_lookups)
+
+        self.cycles = 0
+        self._stats: Dict[str, _StrategyStats] = {}
+        self._last_cycle: Dict[str, float] = {}
+        self._current: Optional[_StrategyStats] = None
+        self._started_tracing = False
+
+    def start_cycle(self) -> None:
+        """サイクル開始（直近サイクルの内訳をリセット）."""
+        self.cycles += 1
+        self._last_cycle = {}
+
+    def run(self, name: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        func(*args, **kwargs) を計測付きで実行（例外は記録して再送出）
+
+        Args:
+            name: 戦略名
+            func: 計測対象（strategy.generate_signal）
+        """
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = _StrategyStats()
+
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+
+        self._current = stats
+        set_threshold_lookup_observer(self._record_lookup)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            set_threshold_lookup_observer(None)
+            self._current = None
+
+            stats.calls += 1
+            stats.total_sec += elapsed
+            if elapsed > stats.max_sec:
+                stats.max_sec = elapsed
+            self._last_cycle[name] = self._last_cycle.get(name, 0.0) + elapsed
+            if self.trace_memory:
+                peak = tracemalloc.get_traced_memory()[1] - baseline
+                if peak > stats.peak_bytes:
+                    stats.peak_bytes = peak
+
+    def _record_lookup(self, key_path: str) -> None:
+        if self._current is not None:
+            self._current.lookups[key_path] += 1
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        累積サマリー（JSON シリアライズ可能・合計時間の降順）
+
+        Returns:
+            {戦略名: {"calls", "errors", "total_ms", "mean_ms", "max_ms", "share",
+                      "peak_kb"（trace_memory 時）, "threshold_lookups", "top_lookups"}}
+        """
+        grand_total = sum(s.total_sec for s in self._stats.values())
+        result = {}
+        for name, stats in sorted(self._stats.items(), key=lambda item: -item[1].total_sec):
+            entry = {
+                "calls": stats.calls,
+                "errors": stats.errors,
+                "total_ms": round(stats.total_sec * 1000, 3),
+                "mean_ms": round(stats.total_sec * 1000 / stats.calls, 3) if stats.calls else 0.0,
+                "max_ms": round(stats.max_sec * 1000, 3),
+                "share": round(stats.total_sec / grand_total, 4) if grand_total else 0.0,
+                "threshold_lookups": sum(stats.lookups.values()),
+                "top_lookups": dict(stats.lookups.most_common(self.top_lookups)),
+            }
+            if self.trace_memory:
+                entry["peak_kb"] = round(stats.peak_bytes / 1024, 1)
+            result[name] = entry
+        return result
+
+    def format_summary(self) -> List[str]:
+        """累積サマリーのログ行（バックテスト終了時用）."""
+        lines = [f"⏱️ 戦略プロファイル: {self.cycles}サイクル・{len(self._stats)}戦略"]
+        for name, entry in self.summary().items():
+            line = (
+                f"  {name}: {entry['calls']}回 合計{entry['total_ms']:.1f}ms "
+                f"({entry['share']:.1%}) 平均{entry['mean_ms']:.3f}ms 最大{entry['max_ms']:.3f}ms "
+                f"get_threshold {entry['threshold_lookups']}回"
+            )
+            if "peak_kb" in entry:
+                line += f" 割当ピーク{entry['peak_kb']:.1f}KB"
+            if entry["top_lookups"]:
+                top = ", ".join(f"{key}×{count}" for key, count in entry["top_lookups"].items())
+                line += f" [{top}]"
+            lines.append(line)
+        return lines
+
+    def format_last_cycle(self) -> str:
+        """直近サイクルの戦略別時間（ライブのサイクルログ用）."""
+        parts = ", ".join(
+            f"{name}={elapsed * 1000:.2f}ms"
+            for name, elapsed in sorted(self._last_cycle.items(), key=lambda item: -item[1])
+        )
+        total_ms = sum(self._last_cycle.values()) * 1000
+        return f"⏱️ 戦略プロファイル: 合計{total_ms:.2f}ms ({parts})"
+
+    def reset(self) -> None:
+        """累積統計をクリア（自身で開始した tracemalloc は停止）."""
+        self.cycles = 0
+        self._stats = {}
+        self._last_cycle = {}
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
@@ -18,9 +18,11 @@ Phase 55.6: タイトレンジ逆張りモード追加
 - 他戦略（ATR, BB, Stochastic）と異なるDI強度指標を使用
 """
 
+import logging
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from ..base.strategy_base import StrategyBase, StrategySignal
@@ -139,7 +141,8 @@ class ADXTrendStrengthStrategy(StrategyBase):
             戦略シグナル
         """
         try:
-            self.logger.debug(f"[ADXTrend] シグナル生成開始 - データ: {len(df)}行")
+            if self.logger.is_enabled_for(logging.DEBUG):
+                self.logger.debug(f"[ADXTrend] シグナル生成開始 - データ: {len(df)}行")
             # データ検証
             if not self._validate_data(df):
                 return self._create_hold_signal(df, "データ不足")
@@ -149,10 +152,11 @@ class ADXTrendStrengthStrategy(StrategyBase):
                 return self._create_hold_signal(df, "ADX分析失敗")
             # シグナル判定（Phase 32: multi_timeframe_data渡す）
             signal = self._determine_signal(df, adx_analysis, multi_timeframe_data)
-            self.logger.debug(
-                f"[ADXTrend] シグナル生成完了: {signal.action} "
-                f"(信頼度: {signal.confidence:.3f})"
-            )
+            if self.logger.is_enabled_for(logging.DEBUG):
+                self.logger.debug(
+                    f"[ADXTrend] シグナル生成完了: {signal.action} "
+                    f"(信頼度: {signal.confidence:.3f})"
+                )
             return signal
         except Exception as e:
             # Phase 38.4: バックテストログ統合
@@ -261,11 +265,12 @@ class ADXTrendStrengthStrategy(StrategyBase):
                 "volatility_ratio": volatility_ratio,
                 "volume_ratio": volume_ratio,
             }
-            self.logger.debug(
-                f"[ADXTrend] ADX分析: ADX={adx:.1f}, +DI={plus_di:.1f}, -DI={minus_di:.1f}, "
-                f"強度={['弱', '中', '強'][int(is_moderate_trend) + int(is_strong_trend)]}, "
-                f"方向={dominant_direction}"
-            )
+            if self.logger.is_enabled_for(logging.DEBUG):
+                self.logger.debug(
+                    f"[ADXTrend] ADX分析: ADX={adx:.1f}, +DI={plus_di:.1f}, -DI={minus_di:.1f}, "
+                    f"強度={['弱', '中', '強'][int(is_moderate_trend) + int(is_strong_trend)]}, "
+                    f"方向={dominant_direction}"
+                )
             return analysis
         except Exception as e:
             self.logger.error(f"[ADXTrend] ADX分析エラー: {e}")
@@ -401,6 +406,308 @@ class ADXTrendStrengthStrategy(StrategyBase):
             dynamic_confidence,
         )
 
+    def _generate_signals_vectorized(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        全行一括判定（analyze() → _determine_signal() と同一ルール・同一優先順位のNumPy版）
+
+        Args:
+            df: 市場データ（全履歴）
+
+        Returns:
+            (action配列, confidence配列)
+        """
+        from ...core.config.threshold_manager import get_threshold
+
+        n_rows = len(df)
+        close = df["close"].to_numpy(dtype=float)
+        adx = df["adx_14"].to_numpy(dtype=float)
+        plus_di = df["plus_di_14"].to_numpy(dtype=float)
+        minus_di = df["minus_di_14"].to_numpy(dtype=float)
+        volume_ratio = df["volume_ratio"].to_numpy(dtype=float)
+        rsi = df["rsi_14"].to_numpy(dtype=float)
+        bb_position = df["bb_position"].to_numpy(dtype=float)
+
+        # 前期間値（NaN・先頭行は当期値で代替）
+        def _previous(values: np.ndarray) -> np.ndarray:
+            prev = np.r_[values[:1], values[:-1]]
+            return np.where(np.isnan(prev), values, prev)
+
+        prev_adx = _previous(adx)
+        di_difference = plus_di - minus_di
+        prev_di_difference = _previous(plus_di) - _previous(minus_di)
+
+        # トレンド強度・DI分析（_analyze_adx_trend相当）
+        is_strong_trend = adx >= self.strong_trend_threshold
+        is_weak_trend = adx < self.weak_trend_threshold
+        is_moderate_trend = (self.weak_trend_threshold <= adx) & (adx < self.strong_trend_threshold)
+        adx_rising = adx > prev_adx
+        adx_falling = adx < prev_adx
+        di_strength = np.abs(di_difference)
+        bullish_crossover = (
+            (di_difference > 0)
+            & (prev_di_difference <= 0)
+            & (di_strength >= self.di_crossover_threshold)
+        )
+        bearish_crossover = (
+            (di_difference < 0)
+            & (prev_di_difference >= 0)
+            & (di_strength >= self.di_crossover_threshold)
+        )
+        dominant_bullish = plus_di > minus_di
+
+        action = np.full(n_rows, "hold", dtype=object)
+        confidence = np.zeros(n_rows, dtype=float)
+        decided = np.zeros(n_rows, dtype=bool)
+
+        def _assign(mask: np.ndarray, value: Any, conf: Any) -> None:
+            target = mask & ~decided
+            action[target] = value
+            confidence[target] = np.broadcast_to(conf, n_rows)[target]
+            decided[target] = True
+
+        # データ検証失敗（データ長不足・最新行NaN）→ 設定値HOLD
+        invalid = (np.arange(1, n_rows + 1) < self.adx_period + 5) | np.isnan(
+            np.column_stack([close, adx, plus_di, minus_di])
+        ).any(axis=1)
+        _assign(invalid, "hold", get_threshold("strategies.adx_trend.hold_confidence", 0.25))
+
+        # Phase 55.6 / 56.9: レンジ逆張りモード（最優先）
+        if self.range_mode_enabled:
+            in_range = adx < self.range_adx_threshold
+            if self.use_rsi_driven_mode:
+                rsi_buy = in_range & (rsi < self.rsi_oversold_trigger)
+                rsi_buy &= bb_position < self.bb_lower_trigger
+                rsi_sell = in_range & (rsi > self.rsi_overbought_trigger)
+                rsi_sell &= bb_position > self.bb_upper_trigger
+                _assign(
+                    rsi_buy,
+                    "buy",
+                    self._batch_rsi_reversal_confidence(rsi, bb_position, adx_falling, "buy"),
+                )
+                _assign(
+                    rsi_sell,
+                    "sell",
+                    self._batch_rsi_reversal_confidence(rsi, bb_position, adx_falling, "sell"),
+                )
+            else:
+                di_change = np.abs(di_difference - prev_di_difference)
+                reversal = (
+                    in_range
+                    & (di_change >= self.di_reversal_threshold)
+                    & (di_strength >= self.di_diff_threshold)
+                )
+                range_conf = self._batch_range_reversal_confidence(
+                    adx, volume_ratio, di_change, di_strength
+                )
+                _assign(reversal & (di_difference > 0), "sell", range_conf)
+                _assign(reversal, "buy", range_conf)
+
+        # 1. 強いトレンド + DIクロスオーバー
+        strong_rising = is_strong_trend & adx_rising
+        trend_args = (adx, adx_rising, is_moderate_trend, di_strength, volume_ratio)
+        buy_trend_conf = self._batch_trend_confidence(*trend_args, bullish_crossover)
+        sell_trend_conf = self._batch_trend_confidence(*trend_args, bearish_crossover)
+        _assign(strong_rising & bullish_crossover, "buy", buy_trend_conf)
+        _assign(strong_rising & bearish_crossover, "sell", sell_trend_conf)
+
+        # 1b. Phase 84: 強トレンド継続中のDI差順張り
+        continuation = (
+            (adx >= self.strong_trend_continuation_adx) & ~bullish_crossover & ~bearish_crossover
+        )
+        _assign(
+            continuation & (di_difference >= self.strong_trend_continuation_di_diff),
+            "buy",
+            self.strong_trend_continuation_confidence,
+        )
+        _assign(
+            continuation & (di_difference <= -self.strong_trend_continuation_di_diff),
+            "sell",
+            self.strong_trend_continuation_confidence,
+        )
+
+        # 2. 中程度トレンド + 明確なDI優勢（最小信頼度未満は後続判定へ）
+        moderate = is_moderate_trend & (di_strength >= 2.0) & (volume_ratio > 1.1)
+        _assign(
+            moderate & dominant_bullish & (buy_trend_conf >= self.min_confidence),
+            "buy",
+            buy_trend_conf,
+        )
+        _assign(
+            moderate & ~dominant_bullish & (sell_trend_conf >= self.min_confidence),
+            "sell",
+            sell_trend_conf,
+        )
+
+        # 市場不確実性（動的HOLD信頼度用）
+        market_uncertainty = self._batch_market_uncertainty(df)
+        hold_base = get_threshold("strategies.adx_trend.hold_confidence", 0.30)
+
+        # 3. 弱いトレンド - DI差分ベースの動的判定
+        weak_conf = self._batch_weak_trend_confidence(adx_rising, di_strength, volume_ratio)
+        weak_signal = (
+            is_weak_trend
+            & (di_strength >= self.weak_di_threshold)
+            & (weak_conf >= self.min_confidence)
+        )
+        _assign(weak_signal & (di_difference > 0), "buy", weak_conf)
+        _assign(weak_signal, "sell", weak_conf)
+
+        adx_penalty = (self.weak_trend_threshold - adx) / self.weak_trend_threshold * 0.05
+        weak_hold_conf = (
+            hold_base - adx_penalty + self._batch_min(0.03, di_strength / 10.0 * 0.03)
+        ) * (1 + market_uncertainty)
+        weak_hold_conf = self._batch_max(
+            get_threshold("dynamic_confidence.strategies.adx_trend.hold_min", 0.20),
+            self._batch_min(
+                get_threshold("dynamic_confidence.strategies.adx_trend.hold_max", 0.35),
+                weak_hold_conf,
+            ),
+        )
+        _assign(is_weak_trend, "hold", weak_hold_conf)
+
+        # 4. その他 - 動的HOLD信頼度
+        trend_bonus = np.where(is_moderate_trend, 0.02, np.where(is_weak_trend, -0.02, 0.0))
+        default_conf = (hold_base + trend_bonus) * (1 + market_uncertainty)
+        default_conf = self._batch_max(
+            get_threshold("dynamic_confidence.strategies.adx_trend.default_min", 0.25),
+            self._batch_min(
+                get_threshold("dynamic_confidence.strategies.adx_trend.default_max", 0.60),
+                default_conf,
+            ),
+        )
+        _assign(np.ones(n_rows, dtype=bool), "hold", default_conf)
+
+        return action, confidence
+
+    def _batch_trend_confidence(
+        self,
+        adx: np.ndarray,
+        adx_rising: np.ndarray,
+        is_moderate_trend: np.ndarray,
+        di_strength: np.ndarray,
+        volume_ratio: np.ndarray,
+        crossover: np.ndarray,
+    ) -> np.ndarray:
+        """_calculate_trend_confidence() の配列版（crossover: 同方向クロス発生フラグ）"""
+        from ...core.config.threshold_manager import get_threshold
+
+        adx_bonus = np.where(
+            adx >= self.strong_trend_threshold,
+            self._batch_min(0.3, (adx - self.strong_trend_threshold) / 20 * 0.3),
+            np.where(is_moderate_trend, 0.1, 0.0),
+        )
+        volume_bonus = np.where(
+            volume_ratio > 1.2, self._batch_min(0.1, (volume_ratio - 1.0) * 0.2), 0.0
+        )
+        confidence = (
+            self.min_confidence
+            + adx_bonus
+            + np.where(adx_rising, 0.1, 0.0)
+            + self._batch_min(0.2, di_strength / 10 * 0.2)
+            + np.where(crossover, 0.15, 0.0)
+            + volume_bonus
+        )
+        min_confidence = get_threshold("dynamic_confidence.strategies.adx_trend.strong_min", 0.40)
+        max_confidence = get_threshold("dynamic_confidence.strategies.adx_trend.strong_max", 0.85)
+        return self._batch_max(min_confidence, self._batch_min(max_confidence, confidence))
+
+    def _batch_weak_trend_confidence(
+        self, adx_rising: np.ndarray, di_strength: np.ndarray, volume_ratio: np.ndarray
+    ) -> np.ndarray:
+        """_calculate_weak_trend_confidence() の配列版"""
+        from ...core.config.threshold_manager import get_threshold
+
+        volume_bonus = np.where(
+            volume_ratio > 1.1, self._batch_min(0.1, (volume_ratio - 1.0) * 0.2), 0.0
+        )
+        confidence = (
+            self.di_weak_signal_confidence
+            + self._batch_min(0.2, di_strength / 5.0 * 0.2)
+            + np.where(adx_rising, 0.05, 0.0)
+            + volume_bonus
+        )
+        min_confidence = get_threshold("dynamic_confidence.strategies.adx_trend.weak_min", 0.25)
+        max_confidence = get_threshold("dynamic_confidence.strategies.adx_trend.weak_max", 0.50)
+        return self._batch_max(min_confidence, self._batch_min(max_confidence, confidence))
+
+    def _batch_range_reversal_confidence(
+        self,
+        adx: np.ndarray,
+        volume_ratio: np.ndarray,
+        di_change: np.ndarray,
+        di_diff_abs: np.ndarray,
+    ) -> np.ndarray:
+        """_calculate_range_reversal_confidence() の配列版"""
+        change_bonus = self._batch_min(0.10, (di_change - self.di_reversal_threshold) / 10 * 0.10)
+        diff_bonus = self._batch_min(0.05, (di_diff_abs - self.di_diff_threshold) / 10 * 0.05)
+        adx_bonus = np.where(adx < 15, 0.03, np.where(adx < 18, 0.01, 0.0))
+        volume_bonus = np.where(
+            volume_ratio > 1.2, self._batch_min(0.05, (volume_ratio - 1.0) * 0.1), 0.0
+        )
+        confidence = (
+            self.range_signal_confidence + change_bonus + diff_bonus + adx_bonus + volume_bonus
+        )
+        return self._batch_max(0.35, self._batch_min(0.55, confidence))
+
+    def _batch_rsi_reversal_confidence(
+        self,
+        rsi: np.ndarray,
+        bb_position: np.ndarray,
+        adx_falling: np.ndarray,
+        direction: str,
+    ) -> np.ndarray:
+        """_calculate_rsi_reversal_confidence() の配列版"""
+        if direction == "buy":
+            rsi_extreme = rsi < 30
+            bb_extreme = bb_position < 0.15
+            rsi_bonus = self._batch_max(0, (self.rsi_oversold_trigger - rsi) / 100 * 0.10)
+            bb_bonus = self._batch_max(0, (self.bb_lower_trigger - bb_position) * 0.10)
+        else:
+            rsi_extreme = rsi > 70
+            bb_extreme = bb_position > 0.85
+            rsi_bonus = self._batch_max(0, (rsi - self.rsi_overbought_trigger) / 100 * 0.10)
+            bb_bonus = self._batch_max(0, (bb_position - self.bb_upper_trigger) * 0.10)
+
+        confidence = (
+            self.range_signal_confidence
+            + np.where(rsi_extreme, self.rsi_extreme_bonus, 0.0)
+            + np.where(bb_extreme, self.bb_extreme_bonus, 0.0)
+            + np.where(adx_falling, self.adx_falling_bonus, 0.0)
+            + rsi_bonus
+            + bb_bonus
+        )
+        return self._batch_max(0.40, self._batch_min(0.70, confidence))
+
+    def _batch_market_uncertainty(self, df: pd.DataFrame) -> np.ndarray:
+        """MarketUncertaintyCalculator.calculate() の配列版（行 i は df.iloc[:i+1] に対する値）"""
+        from ...core.config.threshold_manager import get_threshold
+
+        prefix = "dynamic_confidence.market_uncertainty"
+        volatility_max = get_threshold(f"{prefix}.volatility_factor_max", 0.05)
+        volume_max = get_threshold(f"{prefix}.volume_factor_max", 0.03)
+        volume_multiplier = get_threshold(f"{prefix}.volume_multiplier", 0.1)
+        price_max = get_threshold(f"{prefix}.price_factor_max", 0.02)
+        uncertainty_max = get_threshold(f"{prefix}.uncertainty_max", 0.10)
+
+        close = df["close"].to_numpy(dtype=float)
+        volume = df["volume"].to_numpy(dtype=float)
+        avg_volume = df["volume"].rolling(20).mean().to_numpy(dtype=float)
+        price_change = np.abs(df["close"].pct_change().to_numpy(dtype=float))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            volatility_factor = self._batch_min(
+                volatility_max, df["atr_14"].to_numpy(dtype=float) / close
+            )
+            volume_ratio = np.where(avg_volume > 0, volume / avg_volume, 1.0)
+        volume_factor = self._batch_min(volume_max, np.abs(volume_ratio - 1.0) * volume_multiplier)
+        price_factor = self._batch_min(price_max, price_change)
+
+        uncertainty = self._batch_min(
+            uncertainty_max, volatility_factor + volume_factor + price_factor
+        )
+        # 価格0はゼロ除算エラー → デフォルト値
+        return np.where(close == 0, 0.02, uncertainty)
+
     def _calculate_trend_confidence(self, analysis: Dict[str, Any], direction: str) -> float:
         """
         トレンド信頼度計算
@@ -544,20 +851,22 @@ class ADXTrendStrengthStrategy(StrategyBase):
                 if pd.isna(bb_position):
                     return None
 
-                self.logger.debug(
-                    f"[ADXTrend RSI主導] RSI={rsi:.1f}, BB={bb_position:.2f}, "
-                    f"ADX={adx_value:.1f}, falling={adx_falling}"
-                )
+                if self.logger.is_enabled_for(logging.DEBUG):
+                    self.logger.debug(
+                        f"[ADXTrend RSI主導] RSI={rsi:.1f}, BB={bb_position:.2f}, "
+                        f"ADX={adx_value:.1f}, falling={adx_falling}"
+                    )
 
                 # === 買いシグナル（RSI AND BB条件）===
                 if rsi < self.rsi_oversold_trigger and bb_position < self.bb_lower_trigger:
                     confidence = self._calculate_rsi_reversal_confidence(
                         rsi, bb_position, adx_falling, "buy"
                     )
-                    self.logger.info(
-                        f"[ADXTrend RSI主導] BUY検出: RSI={rsi:.1f}, "
-                        f"BB={bb_position:.2f}, ADX={adx_value:.1f}, 信頼度={confidence:.2f}"
-                    )
+                    if self.logger.is_enabled_for(logging.INFO):
+                        self.logger.info(
+                            f"[ADXTrend RSI主導] BUY検出: RSI={rsi:.1f}, "
+                            f"BB={bb_position:.2f}, ADX={adx_value:.1f}, 信頼度={confidence:.2f}"
+                        )
                     return self._create_signal(
                         action="buy",
                         confidence=confidence,
@@ -573,10 +882,11 @@ class ADXTrendStrengthStrategy(StrategyBase):
                     confidence = self._calculate_rsi_reversal_confidence(
                         rsi, bb_position, adx_falling, "sell"
                     )
-                    self.logger.info(
-                        f"[ADXTrend RSI主導] SELL検出: RSI={rsi:.1f}, "
-                        f"BB={bb_position:.2f}, ADX={adx_value:.1f}, 信頼度={confidence:.2f}"
-                    )
+                    if self.logger.is_enabled_for(logging.INFO):
+                        self.logger.info(
+                            f"[ADXTrend RSI主導] SELL検出: RSI={rsi:.1f}, "
+                            f"BB={bb_position:.2f}, ADX={adx_value:.1f}, 信頼度={confidence:.2f}"
+                        )
                     return self._create_signal(
                         action="sell",
                         confidence=confidence,
@@ -17,8 +17,10 @@ BBReversalとの違い:
 4. RSIで反転方向決定
 """
 
-from typing import Any, Dict, List, Optional
+import logging
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from ...core.exceptions import StrategyError
@@ -163,10 +165,11 @@ class ATRBasedStrategy(StrategyBase):
 
             signal = self._create_signal(decision, current_price, df, multi_timeframe_data)
 
-            self.logger.info(
-                f"[ATRレンジ] シグナル生成: {signal.action} "
-                f"(信頼度: {signal.confidence:.3f}, 消尽率: {exhaustion_analysis['ratio']:.1%})"
-            )
+            if self.logger.is_enabled_for(logging.INFO):
+                self.logger.info(
+                    f"[ATRレンジ] シグナル生成: {signal.action} "
+                    f"(信頼度: {signal.confidence:.3f}, 消尽率: {exhaustion_analysis['ratio']:.1%})"
+                )
             return signal
 
         except Exception as e:
@@ -238,16 +241,18 @@ class ATRBasedStrategy(StrategyBase):
 
                     if action == EntryAction.BUY and cmf_value < cmf_buy_threshold:
                         confidence -= cmf_penalty
-                        self.logger.info(
-                            f"[ATRレンジ] Phase 72: CMF不一致ペナルティ "
-                            f"(CMF={cmf_value:.3f} < {cmf_buy_threshold}, -{cmf_penalty})"
-                        )
+                        if self.logger.is_enabled_for(logging.INFO):
+                            self.logger.info(
+                                f"[ATRレンジ] Phase 72: CMF不一致ペナルティ "
+                                f"(CMF={cmf_value:.3f} < {cmf_buy_threshold}, -{cmf_penalty})"
+                            )
                     elif action == EntryAction.SELL and cmf_value > cmf_sell_threshold:
                         confidence -= cmf_penalty
-                        self.logger.info(
-                            f"[ATRレンジ] Phase 72: CMF不一致ペナルティ "
-                            f"(CMF={cmf_value:.3f} > {cmf_sell_threshold}, -{cmf_penalty})"
-                        )
+                        if self.logger.is_enabled_for(logging.INFO):
+                            self.logger.info(
+                                f"[ATRレンジ] Phase 72: CMF不一致ペナルティ "
+                                f"(CMF={cmf_value:.3f} > {cmf_sell_threshold}, -{cmf_penalty})"
+                            )
 
                 # 低出来高フィルタ
                 if "volume_ratio" in df.columns:
@@ -255,12 +260,14 @@ class ATRBasedStrategy(StrategyBase):
                     low_vol_threshold = self.config.get("low_volume_threshold", 0.5)
                     if vol_ratio < low_vol_threshold:
                         confidence -= low_vol_penalty
-                        self.logger.info(
-                            f"[ATRレンジ] Phase 72: 低出来高ペナルティ "
-                            f"(volume_ratio={vol_ratio:.2f} < {low_vol_threshold}, -{low_vol_penalty})"
-                        )
+                        if self.logger.is_enabled_for(logging.INFO):
+                            self.logger.info(
+                                f"[ATRレンジ] Phase 72: 低出来高ペナルティ "
+                                f"(volume_ratio={vol_ratio:.2f} < {low_vol_threshold}, -{low_vol_penalty})"
+                            )
             except Exception as e:
-                self.logger.debug(f"[ATRレンジ] Phase 72: 出来高確認エラー（無視）: {e}")
+                if self.logger.is_enabled_for(logging.DEBUG):
+                    self.logger.debug(f"[ATRレンジ] Phase 72: 出来高確認エラー（無視）: {e}")
 
         # 最小・最大制限
         confidence = max(self.config["min_confidence"], min(confidence, 0.75))
@@ -287,11 +294,12 @@ class ATRBasedStrategy(StrategyBase):
 
         signal = self._create_signal(decision, current_price, df, multi_timeframe_data)
 
-        self.logger.info(
-            f"[ATRレンジ] シグナル生成（BB主導）: {signal.action} "
-            f"(信頼度: {signal.confidence:.3f}, 消尽率: {exhaustion_analysis['ratio']:.1%}, "
-            f"BB位置: {bb_check['position']:.1%})"
-        )
+        if self.logger.is_enabled_for(logging.INFO):
+            self.logger.info(
+                f"[ATRレンジ] シグナル生成（BB主導）: {signal.action} "
+                f"(信頼度: {signal.confidence:.3f}, 消尽率: {exhaustion_analysis['ratio']:.1%}, "
+                f"BB位置: {bb_check['position']:.1%})"
+            )
         return signal
 
     def _check_rsi_confirmation(self, df: pd.DataFrame, expected_direction: str) -> Dict[str, Any]:
@@ -589,6 +597,111 @@ class ATRBasedStrategy(StrategyBase):
             multi_timeframe_data=multi_timeframe_data,
         )
 
+    def _generate_signals_vectorized(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        全行一括判定（analyze()と同一ルールのNumPy版）
+
+        BB主導モード・従来（RSI主導）モードの両方に対応。
+        """
+        close = df["close"].to_numpy(dtype=float)
+        atr = df["atr_14"].to_numpy(dtype=float)
+        adx = df["adx_14"].to_numpy(dtype=float)
+        rsi = df["rsi_14"].to_numpy(dtype=float)
+        bb_upper = df["bb_upper"].to_numpy(dtype=float)
+        bb_lower = df["bb_lower"].to_numpy(dtype=float)
+
+        # Step 1: 消尽率（当日値幅 / ATR14）
+        daily_range = df["high"].to_numpy(dtype=float) - df["low"].to_numpy(dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            exhaustion_ratio = np.where(atr > 0, daily_range / atr, 0.0)
+        is_exhausted = exhaustion_ratio >= self.config["exhaustion_threshold"]
+        is_high_exhaustion = exhaustion_ratio >= self.config["high_exhaustion_threshold"]
+
+        # Step 2: レンジ相場（ADX < 閾値）
+        is_range = adx < self.config["adx_range_threshold"]
+
+        # BB位置（0=下端、1=上端）・帯端判定
+        bb_width = bb_upper - bb_lower
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bb_position = (close - bb_lower) / bb_width
+        threshold = self.config.get("bb_position_threshold", 0.20)
+        bb_valid = ~(bb_width <= 0)
+        bb_buy = bb_valid & (bb_position < threshold)
+        bb_sell = bb_valid & ~bb_buy & (bb_position > (1 - threshold))
+        at_band_edge = bb_buy | bb_sell
+
+        base_conf = np.where(
+            is_high_exhaustion, self.config["high_confidence"], self.config["base_confidence"]
+        )
+        rsi_upper = self.config["rsi_upper"]
+        rsi_lower = self.config["rsi_lower"]
+
+        if self.config.get("bb_as_main_condition", True):
+            # BB主導モード: BB帯端で方向決定・RSIはボーナス
+            is_buy = bb_buy
+            is_sell = bb_sell
+            rsi_confirms = (is_buy & (rsi < rsi_lower)) | (is_sell & (rsi > rsi_upper))
+            confidence = base_conf + np.where(
+                rsi_confirms, self.config.get("rsi_confirmation_bonus", 0.05), 0.0
+            )
+
+            # Phase 72-C: CMF出来高確認（オプション）
+            if self.config.get("volume_confirmation_enabled", False):
+                if "cmf_20" in df.columns:
+                    cmf = df["cmf_20"].to_numpy(dtype=float)
+                    cmf_mismatch = (is_buy & (cmf < self.config.get("cmf_buy_threshold", -0.1))) | (
+                        is_sell & (cmf > self.config.get("cmf_sell_threshold", 0.1))
+                    )
+                    confidence = confidence - np.where(
+                        cmf_mismatch, self.config.get("cmf_mismatch_penalty", 0.15), 0.0
+                    )
+                if "volume_ratio" in df.columns:
+                    low_volume = df["volume_ratio"].to_numpy(dtype=float) < self.config.get(
+                        "low_volume_threshold", 0.5
+                    )
+                    confidence = confidence - np.where(
+                        low_volume, self.config.get("low_volume_penalty", 0.10), 0.0
+                    )
+
+            confidence = self._batch_max(
+                self.config["min_confidence"], self._batch_min(confidence, 0.75)
+            )
+        else:
+            # 従来モード: RSIで方向決定・BB帯端は信頼度ボーナス
+            is_sell = rsi > rsi_upper
+            is_buy = ~is_sell & (rsi < rsi_lower)
+            strength = np.where(
+                is_sell,
+                self._batch_min((rsi - rsi_upper) / 20.0, 1.0),
+                self._batch_min((rsi_lower - rsi) / 20.0, 1.0),
+            )
+            confidence = base_conf + strength * 0.15
+            confidence = np.where(
+                confidence < self.config["min_confidence"],
+                self.config["min_confidence"],
+                confidence,
+            )
+            confidence = self._batch_min(confidence, 0.75)
+
+            if self.config.get("bb_position_enabled", True):
+                bb_match = (is_buy & bb_buy) | (is_sell & bb_sell)
+                confidence = np.where(
+                    at_band_edge,
+                    np.where(
+                        bb_match,
+                        self._batch_min(confidence + 0.10, 0.80),
+                        self._batch_min(confidence + 0.05, 0.75),
+                    ),
+                    confidence,
+                )
+
+        entry = is_exhausted & is_range & (is_buy | is_sell)
+        action = np.where(
+            entry, np.where(is_buy, EntryAction.BUY, EntryAction.SELL), EntryAction.HOLD
+        ).astype(object)
+        confidence = np.where(entry, confidence, self.config["hold_confidence"]).astype(float)
+        return action, confidence
+
     def get_required_features(self) -> List[str]:
         """必要特徴量リスト取得"""
         return [
@@ -602,6 +715,10 @@ class ATRBasedStrategy(StrategyBase):
             "bb_lower",  # Phase 55.4 Approach B: BB位置確認用
         ]
 
+    def get_optional_features(self) -> List[str]:
+        """任意特徴量リスト取得（CMF確認は列が存在する場合のみ）"""
+        return ["cmf_20"]
+
     def get_signal_proximity(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
         シグナルまでの距離を計算（HOLD診断機能）
@@ -16,8 +16,10 @@ Phase 62.2変更:
 - トレンド相場ではシグナル発生を抑制
 """
 
-from typing import Any, Dict, List, Optional
+import logging
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from ...core.config.threshold_manager import get_threshold
@@ -126,26 +128,29 @@ class BBReversalStrategy(StrategyBase):
             latest = df.iloc[-1]
             current_price = float(latest["close"])
 
-            self.logger.debug(
-                f"BBReversal分析開始: 価格={current_price:.0f}円, "
-                f"BB位置={latest['bb_position']:.2f}, "
-                f"RSI={latest['rsi_14']:.1f}, "
-                f"ADX={latest['adx_14']:.1f}"
-            )
+            if self.logger.is_enabled_for(logging.DEBUG):
+                self.logger.debug(
+                    f"BBReversal分析開始: 価格={current_price:.0f}円, "
+                    f"BB位置={latest['bb_position']:.2f}, "
+                    f"RSI={latest['rsi_14']:.1f}, "
+                    f"ADX={latest['adx_14']:.1f}"
+                )
 
             # 3. レンジ相場判定
             if not self._is_range_market(df):
                 reason = f"トレンド相場（ADX={latest['adx_14']:.1f} or BB幅広い）"
-                self.logger.debug(f"BBReversal: {reason}")
+                if self.logger.is_enabled_for(logging.DEBUG):
+                    self.logger.debug(f"BBReversal: {reason}")
                 return self._create_hold_signal(reason, df)
 
             # 4. BB反転シグナル分析
             decision = self._analyze_bb_reversal_signal(df)
 
-            self.logger.info(
-                f"BBReversal判定: {decision['action']} "
-                f"(信頼度={decision['confidence']:.2f}, 強度={decision['strength']:.2f})"
-            )
+            if self.logger.is_enabled_for(logging.INFO):
+                self.logger.info(
+                    f"BBReversal判定: {decision['action']} "
+                    f"(信頼度={decision['confidence']:.2f}, 強度={decision['strength']:.2f})"
+                )
 
             # 5. SignalBuilder使用（リスク管理統合）
             return SignalBuilder.create_signal_with_risk_management(
@@ -228,12 +233,13 @@ class BBReversalStrategy(StrategyBase):
 
             is_range = bb_width_ok and adx_ok
 
-            self.logger.debug(
-                f"レンジ相場判定: BB幅={bb_width:.4f} "
-                f"({'OK' if bb_width_ok else 'NG'}), "
-                f"ADX={adx:.1f} ({'OK' if adx_ok else 'NG'}) "
-                f"→ {'レンジ' if is_range else 'トレンド'}"
-            )
+            if self.logger.is_enabled_for(logging.DEBUG):
+                self.logger.debug(
+                    f"レンジ相場判定: BB幅={bb_width:.4f} "
+                    f"({'OK' if bb_width_ok else 'NG'}), "
+                    f"ADX={adx:.1f} ({'OK' if adx_ok else 'NG'}) "
+                    f"→ {'レンジ' if is_range else 'トレンド'}"
+                )
 
             return is_range
 
@@ -384,6 +390,83 @@ class BBReversalStrategy(StrategyBase):
                 "reason": f"分析エラー: {e}",
             }
 
+    def _generate_signals_vectorized(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        全行一括判定（analyze()と同一ルールのNumPy版）
+
+        Args:
+            df: 特徴量DataFrame（全履歴）
+
+        Returns:
+            (action配列, confidence配列)
+        """
+        close = df["close"].to_numpy(dtype=float)
+        bb_position = df["bb_position"].to_numpy(dtype=float)
+        rsi = df["rsi_14"].to_numpy(dtype=float)
+        adx = df["adx_14"].to_numpy(dtype=float)
+
+        # 1. レンジ相場判定（BB幅NaNは0.0扱い）
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bb_width = (
+                df["bb_upper"].to_numpy(dtype=float) - df["bb_lower"].to_numpy(dtype=float)
+            ) / close
+        bb_width = np.where(np.isnan(bb_width), 0.0, bb_width)
+        is_range = (bb_width < self.config["bb_width_threshold"]) & (
+            adx < self.config["adx_range_threshold"]
+        )
+
+        upper_th = self.config["bb_upper_threshold"]
+        lower_th = self.config["bb_lower_threshold"]
+        overbought = self.config["rsi_overbought"]
+        oversold = self.config["rsi_oversold"]
+
+        # 2. BB反転判定
+        if self.config.get("bb_primary_mode", True):
+            is_sell = bb_position > upper_th
+            is_buy = ~is_sell & (bb_position < lower_th)
+
+            match_bonus = self.config.get("rsi_match_bonus", 0.08)
+            extreme_bonus = self.config.get("rsi_extreme_bonus", 0.05)
+            mismatch_penalty = self.config.get("rsi_mismatch_penalty", 0.05)
+
+            sell_conf = (
+                0.30
+                + (bb_position - upper_th) * 1.5
+                + np.where(
+                    rsi > overbought,
+                    match_bonus + np.where(rsi > 70, extreme_bonus, 0.0),
+                    -mismatch_penalty,
+                )
+            )
+            buy_conf = (
+                0.30
+                + (lower_th - bb_position) * 1.5
+                + np.where(
+                    rsi < oversold,
+                    match_bonus + np.where(rsi < 30, extreme_bonus, 0.0),
+                    -mismatch_penalty,
+                )
+            )
+            confidence = np.where(is_sell, sell_conf, buy_conf)
+            confidence = self._batch_min(
+                self._batch_max(confidence, self.config["min_confidence"]), 0.55
+            )
+        else:
+            is_sell = (bb_position > upper_th) & (rsi > overbought)
+            is_buy = ~is_sell & (bb_position < lower_th) & (rsi < oversold)
+            confidence = np.where(
+                is_sell,
+                self._batch_min(0.30 + (bb_position - 0.95) * 2.0, 0.50),
+                self._batch_min(0.30 + (0.05 - bb_position) * 2.0, 0.50),
+            )
+
+        entry = is_range & (is_buy | is_sell)
+        action = np.where(
+            entry, np.where(is_sell, EntryAction.SELL, EntryAction.BUY), EntryAction.HOLD
+        ).astype(object)
+        confidence = np.where(entry, confidence, self.config["hold_confidence"]).astype(float)
+        return action, confidence
+
     def _create_hold_signal(self, reason: str, df: pd.DataFrame) -> StrategySignal:
         """
         ホールドシグナル生成
@@ -13,9 +13,11 @@ DonchianChannel（勝率14%）の置換として導入。
   戦略は広くシグナルを出し、低品質はMLが除外する
 """
 
+import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from ...core.config import get_threshold
@@ -192,10 +194,11 @@ class CMFReversalStrategy(StrategyBase):
                 multi_timeframe_data=multi_timeframe_data,
             )
 
-            self.logger.info(
-                f"[CMFReversal] シグナル生成: {signal.action} "
-                f"(信頼度: {signal.confidence:.3f}, CMF: {cmf:.3f})"
-            )
+            if self.logger.is_enabled_for(logging.INFO):
+                self.logger.info(
+                    f"[CMFReversal] シグナル生成: {signal.action} "
+                    f"(信頼度: {signal.confidence:.3f}, CMF: {cmf:.3f})"
+                )
             return signal
 
         except Exception as e:
@@ -232,6 +235,40 @@ class CMFReversalStrategy(StrategyBase):
 
         return min(self.max_confidence, max(self.min_confidence, confidence))
 
+    def _generate_signals_vectorized(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """全行一括判定（analyze()と同一ルールのNumPy版）"""
+        adx = df["adx_14"].to_numpy(dtype=float)
+        cmf = df["cmf_20"].to_numpy(dtype=float)
+        rsi = df["rsi_14"].to_numpy(dtype=float)
+
+        # CMF方向判定
+        is_buy = cmf < self.cmf_buy_threshold
+        is_sell = ~is_buy & (cmf > self.cmf_sell_threshold)
+
+        # 信頼度計算（_calculate_confidenceと同順序）
+        confidence = self.base_confidence + np.where(
+            np.abs(cmf) > self.cmf_extreme_threshold, self.extreme_bonus, 0.0
+        )
+        confirms = (is_buy & (rsi < self.rsi_oversold)) | (is_sell & (rsi > self.rsi_overbought))
+        mismatches = (is_buy & (rsi > self.rsi_overbought)) | (is_sell & (rsi < self.rsi_oversold))
+        confidence = confidence + np.where(
+            confirms,
+            self.rsi_confirmation_bonus,
+            np.where(mismatches, -self.rsi_mismatch_penalty, 0.0),
+        )
+        confidence = self._batch_min(
+            self.max_confidence, self._batch_max(self.min_confidence, confidence)
+        )
+
+        # ADXフィルタ（トレンド相場除外）・信頼度不足はHOLD
+        entry = (is_buy | is_sell) & ~(adx > self.adx_max_threshold)
+        entry &= ~(confidence < self.min_confidence)
+
+        action = np.where(
+            entry, np.where(is_buy, EntryAction.BUY, EntryAction.SELL), EntryAction.HOLD
+        ).astype(object)
+        return action, np.where(entry, confidence, self.hold_confidence).astype(float)
+
     def get_required_features(self) -> List[str]:
         """必要特徴量リスト"""
         return ["close", "high", "low", "cmf_20", "adx_14", "rsi_14", "atr_14"]
@@ -13,8 +13,9 @@ MACDクロスオーバー + EMAトレンド確認による高精度エントリ
 Phase 51.7 Day 5実装
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from ...core.config.threshold_manager import get_threshold
@@ -322,6 +323,53 @@ class MACDEMACrossoverStrategy(StrategyBase):
                 "reason": "MACD+EMAクロス条件未達成",
             }
 
+    def _generate_signals_vectorized(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        全行一括判定（analyze()と同一ルールのNumPy版）
+
+        Args:
+            df: 市場データ（全履歴）
+
+        Returns:
+            (action配列, confidence配列)
+        """
+        macd = df["macd"].to_numpy(dtype=float)
+        macd_signal = df["macd_signal"].to_numpy(dtype=float)
+        ema_20 = df["ema_20"].to_numpy(dtype=float)
+        ema_50 = df["ema_50"].to_numpy(dtype=float)
+        adx = df["adx_14"].to_numpy(dtype=float)
+        volume_ratio = df["volume_ratio"].to_numpy(dtype=float)
+
+        # 1つ前の足（先頭行は比較対象なし → クロスなし）
+        prev_macd = np.r_[np.nan, macd[:-1]]
+        prev_signal = np.r_[np.nan, macd_signal[:-1]]
+        golden = (prev_macd <= prev_signal) & (macd > macd_signal)
+        dead = (prev_macd >= prev_signal) & (macd < macd_signal)
+
+        # MACD強度・EMA乖離度（0.0-1.0）
+        macd_strength = self._batch_min(
+            np.abs(macd - macd_signal) / self.config["macd_strong_threshold"], 1.0
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            divergence = np.where(ema_50 > 0, np.abs(ema_20 - ema_50) / ema_50, 0.0)
+        ema_divergence = self._batch_min(divergence / self.config["ema_divergence_threshold"], 1.0)
+
+        is_trend = adx >= self.config["adx_trend_threshold"]
+        volume_ok = volume_ratio >= self.config["volume_ratio_threshold"]
+        is_buy = is_trend & golden & (ema_20 > ema_50) & volume_ok
+        is_sell = is_trend & ~is_buy & dead & (ema_20 < ema_50) & volume_ok
+
+        confidence = self._batch_min(
+            self.config["min_confidence"] + (macd_strength * 0.15) + (ema_divergence * 0.15),
+            0.65,
+        )
+        entry = is_buy | is_sell
+        action = np.where(
+            entry, np.where(is_buy, EntryAction.BUY, EntryAction.SELL), EntryAction.HOLD
+        ).astype(object)
+        confidence = np.where(entry, confidence, self.config["hold_confidence"]).astype(float)
+        return action, confidence
+
     def _create_hold_signal(self, reason: str, df: pd.DataFrame) -> StrategySignal:
         """
         HOLDシグナル生成
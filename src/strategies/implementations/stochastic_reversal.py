@@ -18,8 +18,9 @@ Phase 62.2変更:
 - StochasticDivergence: 価格とモメンタムの乖離（複数期間）
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from ...core.config.threshold_manager import get_threshold
@@ -417,6 +418,103 @@ class StochasticReversalStrategy(StrategyBase):
             "reason": reason,
         }
 
+    def _generate_signals_vectorized(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        全行一括判定（analyze()と同一ルールのNumPy版）
+
+        ダイバージェンス検出の期間内最大/最小はスライディングウィンドウで一括計算。
+
+        Args:
+            df: 市場データ（全履歴）
+
+        Returns:
+            (action配列, confidence配列)
+        """
+        n_rows = len(df)
+        close = df["close"].to_numpy(dtype=float)
+        stoch_k = df["stoch_k"].to_numpy(dtype=float)
+        adx = df["adx_14"].to_numpy(dtype=float)
+
+        lookback = self.config["divergence_lookback"]
+        price_threshold = self.config["divergence_price_threshold"]
+        stoch_threshold = self.config["divergence_stoch_threshold"]
+        min_price_change = self.config.get("min_price_change_ratio", 0.005)
+        enable_min_filter = self.config.get("enable_min_price_filter", True)
+        hold_confidence = self.config["hold_confidence"]
+
+        action = np.full(n_rows, EntryAction.HOLD, dtype=object)
+        confidence = np.full(n_rows, hold_confidence, dtype=float)
+        window = lookback + 1
+        if n_rows < window:
+            return action, confidence
+
+        # 行 i のウィンドウ = [i - lookback, i]（先頭 lookback 行はダイバージェンスなし）
+        close_windows = np.lib.stride_tricks.sliding_window_view(close, window)
+        stoch_windows = np.lib.stride_tricks.sliding_window_view(stoch_k, window)
+        valid = slice(lookback, None)
+
+        current_close = close[valid]
+        current_stoch = stoch_k[valid]
+        min_close = close_windows.min(axis=1)
+        max_close = close_windows.max(axis=1)
+        min_stoch = stoch_windows.min(axis=1)
+        max_stoch = stoch_windows.max(axis=1)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            price_range = max_close - min_close
+            price_position = np.where(
+                price_range > 0, (current_close - min_close) / price_range, 0.5
+            )
+            stoch_range = max_stoch - min_stoch
+            stoch_position = np.where(
+                stoch_range > 0, (current_stoch - min_stoch) / stoch_range, 0.5
+            )
+            period_start_close = close_windows[:, 0]
+            price_change_ratio = (current_close - period_start_close) / period_start_close
+            stoch_change = current_stoch - stoch_windows[:, 0]
+            price_range_ratio = np.where(min_close > 0, price_range / min_close, 0)
+
+        has_sufficient_price_move = price_range_ratio >= min_price_change
+
+        bearish = ((price_position > 0.6) & (stoch_position < 0.4)) | (
+            (price_change_ratio > price_threshold) & (stoch_change < -stoch_threshold)
+        )
+        bullish = ~bearish & (
+            ((price_position < 0.4) & (stoch_position > 0.6))
+            | ((price_change_ratio < -price_threshold) & (stoch_change > stoch_threshold))
+        )
+        detected = bearish | bullish
+        # 弱いダイバージェンス（価格変動不足）は信頼度計算のみ行いHOLD
+        weak = detected & bool(enable_min_filter) & ~has_sufficient_price_move
+        strong = detected & ~weak
+
+        strength = (
+            0.3
+            + np.abs(price_position - stoch_position) * 0.4
+            + np.where(price_range_ratio > min_price_change * 2, 0.1, 0.0)
+        )
+        strength = np.where(strong, self._batch_min(strength, 1.0), 0.0)
+
+        # 極端領域ボーナス
+        overbought_zone = current_stoch > self.config["stoch_overbought"]
+        oversold_zone = ~overbought_zone & (current_stoch < self.config["stoch_oversold"])
+        zone_match = strong & ((bearish & overbought_zone) | (bullish & oversold_zone))
+
+        div_confidence = self.config["base_confidence"] + strength * 0.20
+        div_confidence = div_confidence + np.where(zone_match, self.config["zone_bonus"], 0.0)
+        div_confidence = self._batch_min(div_confidence, self.config["max_confidence"])
+
+        # ADXフィルタ（強トレンド除外）
+        tradable = adx[valid] < self.config["adx_max_threshold"]
+
+        action[valid] = np.where(
+            tradable & strong,
+            np.where(bearish, EntryAction.SELL, EntryAction.BUY),
+            EntryAction.HOLD,
+        )
+        confidence[valid] = np.where(tradable & detected, div_confidence, hold_confidence)
+        return action, confidence
+
     def get_signal_proximity(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
         シグナルまでの距離を計算（HOLD診断機能）
@@ -8,13 +8,23 @@ thresholds.yamlから戦略定義+パラメータを読み込み、動的にイ
 - thresholds.yaml読み込み（get_all_thresholds経由）
 - 戦略動的インスタンス化
 - 優先度順ソート
+- ロード結果のプロセス内キャッシュ（get_cached_strategies / get_strategy_metadata）
+  閾値設定のバージョン（読み込み世代 + ファイル署名）をキーにし、reload_thresholds()・
+  invalidate_strategy_cache()・thresholds.yaml の更新（取得毎にファイル署名を比較）で
+  再ロード。特徴量生成等のホットパスは設定を再読込しない（stat のみ）
 
 Phase 65.11: strategies.yaml廃止・thresholds.yaml統合
 """
 
+import threading
 from typing import Any, Dict, List, Optional
 
-from ..core.config.threshold_manager import get_all_thresholds
+from ..core.config.threshold_manager import (
+    get_all_thresholds,
+    get_thresholds_file_signature,
+    get_thresholds_version,
+    reload_thresholds,
+)
 from ..core.exceptions import StrategyError
 from ..core.logger import get_logger
 from .base.strategy_base import StrategyBase
@@ -247,3 +257,59 @@ class StrategyLoader:
             )
 
         return self.config["strategies"][strategy_id].copy()
+
+
+# ========================================
+# ロード結果キャッシュ（戦略メタデータ + インスタンスプール）
+# ========================================
+
+_strategy_cache: Dict[str, Any] = {"key": None, "strategies": None}
+_strategy_cache_lock = threading.Lock()
+
+
+def get_cached_strategies() -> List[Dict[str, Any]]:
+    """
+    キャッシュ済みの戦略データを取得（load_strategies() と同形式）
+
+    閾値設定のバージョンが変わっていなければ設定の再読込・再インスタンス化を行わない。
+    読み込み時のファイル署名を現在の thresholds.yaml の署名と毎回比較し、ファイルが
+    更新されていれば閾値設定ごと再読込する。
+    instance は呼び出し間で共有されるため、状態を持つ独立インスタンスが必要な場合は
+    StrategyLoader().load_strategies() を使用する。
+
+    Returns:
+        戦略データのリスト（リスト・辞書はコピー、instance は共有）
+
+    Raises:
+        StrategyError: 設定読み込みエラー、戦略ロードエラー
+    """
+    key = get_thresholds_version()
+    if key[1] != get_thresholds_file_signature():
+        reload_thresholds()
+        key = get_thresholds_version()
+    with _strategy_cache_lock:
+        if _strategy_cache["key"] != key or _strategy_cache["strategies"] is None:
+            _strategy_cache["strategies"] = StrategyLoader().load_strategies()
+            _strategy_cache["key"] = key
+        strategies = _strategy_cache["strategies"]
+    return [{**data, "metadata": dict(data["metadata"])} for data in strategies]
+
+
+def get_strategy_metadata() -> List[Dict[str, Any]]:
+    """
+    キャッシュ済みの戦略メタデータを取得（instance を除く・優先度順）
+
+    Returns:
+        戦略データのリスト（weight, priority, regime_affinity, metadata）
+    """
+    return [
+        {key: value for key, value in data.items() if key != "instance"}
+        for data in get_cached_strategies()
+    ]
+
+
+def invalidate_strategy_cache() -> None:
+    """戦略キャッシュを破棄（次回取得時に再ロード）."""
+    with _strategy_cache_lock:
+        _strategy_cache["key"] = None
+        _strategy_cache["strategies"] = None
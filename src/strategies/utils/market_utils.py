@@ -6,6 +6,8 @@
 - 設定ベース統一ロジック：thresholds.yaml設定値の一元管理
 """
 
+import logging
+
 import pandas as pd
 
 from ...core.logger import get_logger
@@ -96,10 +98,11 @@ class MarketUncertaintyCalculator:
             # 設定値で調整範囲を制限
             result = min(uncertainty_max, market_uncertainty)
 
-            logger.debug(
-                f"[MarketUncertainty] 計算完了: {result:.4f} "
-                f"(volatility={volatility_factor:.4f}, volume={volume_factor:.4f}, price={price_factor:.4f})"
-            )
+            if logger.is_enabled_for(logging.DEBUG):
+                logger.debug(
+                    f"[MarketUncertainty] 計算完了: {result:.4f} "
+                    f"(volatility={volatility_factor:.4f}, volume={volume_factor:.4f}, price={price_factor:.4f})"
+                )
 
             return result
 
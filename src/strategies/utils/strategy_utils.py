@@ -14,6 +14,7 @@
 Phase 61.10更新: Dynamic Position Sizingをバックテストでも使用（ライブ互換）
 """
 
+import logging
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
@@ -96,7 +97,8 @@ class RiskManager:
                 if "atr_14" in df_15m.columns and len(df_15m) > 0:
                     atr_15m = float(df_15m["atr_14"].iloc[-1])
                     if atr_15m > 0:
-                        logger.info(f"✅ Phase 31: 15m足ATR使用 = {atr_15m:.0f}円")
+                        if logger.is_enabled_for(logging.INFO):
+                            logger.info(f"✅ Phase 31: 15m足ATR使用 = {atr_15m:.0f}円")
                         return atr_15m
             except Exception as e:
                 logger.warning(f"15m足ATR取得失敗: {e}")
@@ -106,7 +108,8 @@ class RiskManager:
             if "atr_14" in df.columns and len(df) > 0:
                 atr_4h = float(df["atr_14"].iloc[-1])
                 if atr_4h > 0:
-                    logger.info(f"⚠️ Phase 31フォールバック: 4h足ATR使用 = {atr_4h:.0f}円")
+                    if logger.is_enabled_for(logging.INFO):
+                        logger.info(f"⚠️ Phase 31フォールバック: 4h足ATR使用 = {atr_4h:.0f}円")
                     return atr_4h
         except Exception as e:
             logger.error(f"4h足ATR取得失敗: {e}")
@@ -249,12 +252,13 @@ class RiskManager:
                 )
                 return None
 
-            logger.info(
-                f"🎯 Phase 86: 固定金額TP計算（TPSLCalculator統一） - "
-                f"目標純利益={target_net_profit:.0f}円, "
-                f"entry_fee_rate={entry_fee_rate}, exit_fee_rate={exit_fee_rate}, "
-                f"TP価格={tp_price:.0f}円 ({action})"
-            )
+            if logger.is_enabled_for(logging.INFO):
+                logger.info(
+                    f"🎯 Phase 86: 固定金額TP計算（TPSLCalculator統一） - "
+                    f"目標純利益={target_net_profit:.0f}円, "
+                    f"entry_fee_rate={entry_fee_rate}, exit_fee_rate={exit_fee_rate}, "
+                    f"TP価格={tp_price:.0f}円 ({action})"
+                )
 
             return tp_price
 
@@ -309,7 +313,8 @@ class RiskManager:
             regime_enabled = get_threshold(
                 "position_management.take_profit.regime_based.enabled", False
             )
-            logger.debug(f"🔍 レジーム別TP/SL確認 - regime={regime}, enabled={regime_enabled}")
+            if logger.is_enabled_for(logging.DEBUG):
+                logger.debug(f"🔍 レジーム別TP/SL確認 - regime={regime}, enabled={regime_enabled}")
 
             if regime and regime_enabled:
                 # レジーム別TP設定取得
@@ -325,10 +330,11 @@ class RiskManager:
                 )
 
                 # レジーム別設定取得をログ出力（DEBUG）
-                logger.debug(
-                    f"🔍 レジーム別設定取得 - {regime}: "
-                    f"TP={regime_tp}, TP_ratio={regime_tp_ratio}, SL={regime_sl}"
-                )
+                if logger.is_enabled_for(logging.DEBUG):
+                    logger.debug(
+                        f"🔍 レジーム別設定取得 - {regime}: "
+                        f"TP={regime_tp}, TP_ratio={regime_tp_ratio}, SL={regime_sl}"
+                    )
 
                 if regime_tp and regime_sl:
                     # レジーム別設定をconfigに反映
@@ -337,11 +343,12 @@ class RiskManager:
                         config["take_profit_ratio"] = regime_tp_ratio
                     config["max_loss_ratio"] = regime_sl
 
-                    logger.info(
-                        f"🎯 Phase 52.0: レジーム別TP/SL適用 - {regime}: "
-                        f"TP={regime_tp * 100:.1f}%, SL={regime_sl * 100:.1f}%, "
-                        f"RR比={regime_tp_ratio:.2f}:1"
-                    )
+                    if logger.is_enabled_for(logging.INFO):
+                        logger.info(
+                            f"🎯 Phase 52.0: レジーム別TP/SL適用 - {regime}: "
+                            f"TP={regime_tp * 100:.1f}%, SL={regime_sl * 100:.1f}%, "
+                            f"RR比={regime_tp_ratio:.2f}:1"
+                        )
                 else:
                     logger.warning(
                         f"⚠️ Phase 52.0: レジーム別TP/SL設定が不完全 - {regime}: "
@@ -385,13 +392,14 @@ class RiskManager:
                     if weekend_sl:
                         config["max_loss_ratio"] = weekend_sl
 
-                    logger.info(
-                        f"📅 Phase 58.6: 土日TP/SL縮小適用 - {regime}: "
-                        f"TP={weekend_tp * 100:.2f}% ({check_time.strftime('%a')}), "
-                        f"SL={weekend_sl * 100:.2f}%"
-                        if weekend_tp and weekend_sl
-                        else f"📅 Phase 58.6: 土日判定 ({check_time.strftime('%a')}) - 設定なし"
-                    )
+                    if logger.is_enabled_for(logging.INFO):
+                        logger.info(
+                            f"📅 Phase 58.6: 土日TP/SL縮小適用 - {regime}: "
+                            f"TP={weekend_tp * 100:.2f}% ({check_time.strftime('%a')}), "
+                            f"SL={weekend_sl * 100:.2f}%"
+                            if weekend_tp and weekend_sl
+                            else f"📅 Phase 58.6: 土日判定 ({check_time.strftime('%a')}) - 設定なし"
+                        )
 
             # ========================================
             # Phase 90ε: 固定金額（confidence_based）経路用 土日判定
@@ -431,12 +439,13 @@ class RiskManager:
             # max_loss_ratio固定採用（安定性優先）
             stop_loss_distance = sl_distance_from_ratio
 
-            logger.info(
-                f"🎯 Phase 49.16 SL距離計算: "
-                f"max_loss={max_loss_ratio * 100:.1f}% → {sl_distance_from_ratio:.0f}円（固定採用）, "
-                f"ATR×{stop_loss_multiplier:.2f} → {sl_distance_from_atr:.0f}円（参考値） "
-                f"→ 採用={stop_loss_distance:.0f}円({stop_loss_distance / current_price * 100:.2f}%)"
-            )
+            if logger.is_enabled_for(logging.INFO):
+                logger.info(
+                    f"🎯 Phase 49.16 SL距離計算: "
+                    f"max_loss={max_loss_ratio * 100:.1f}% → {sl_distance_from_ratio:.0f}円（固定採用）, "
+                    f"ATR×{stop_loss_multiplier:.2f} → {sl_distance_from_atr:.0f}円（参考値） "
+                    f"→ 採用={stop_loss_distance:.0f}円({stop_loss_distance / current_price * 100:.2f}%)"
+                )
 
             # Phase 66.6: 固定金額SLモードチェック
             fixed_sl_config = get_threshold("position_management.stop_loss.fixed_amount", {})
@@ -609,12 +618,13 @@ class RiskManager:
                 # 大きい方を採用（利益確保優先）
                 take_profit_distance = max(tp_distance_from_ratio, tp_distance_from_sl)
 
-                logger.info(
-                    f"🎯 Phase 49.16 TP距離計算: "
-                    f"min_profit={min_profit_ratio * 100:.1f}% → {tp_distance_from_ratio:.0f}円, "
-                    f"SL×{default_tp_ratio:.2f} → {tp_distance_from_sl:.0f}円 "
-                    f"→ 採用={take_profit_distance:.0f}円({take_profit_distance / current_price * 100:.2f}%)"
-                )
+                if logger.is_enabled_for(logging.INFO):
+                    logger.info(
+                        f"🎯 Phase 49.16 TP距離計算: "
+                        f"min_profit={min_profit_ratio * 100:.1f}% → {tp_distance_from_ratio:.0f}円, "
+                        f"SL×{default_tp_ratio:.2f} → {tp_distance_from_sl:.0f}円 "
+                        f"→ 採用={take_profit_distance:.0f}円({take_profit_distance / current_price * 100:.2f}%)"
+                    )
 
                 # TP価格計算（%ベース）
                 if action == EntryAction.BUY:
@@ -639,13 +649,14 @@ class RiskManager:
                 if action == EntryAction.BUY
                 else abs((current_price - take_profit) / (stop_loss - current_price))
             )
-            logger.info(
-                f"✅ Phase 49.16 TP/SL確定: "
-                f"エントリー={current_price:.0f}円, "
-                f"SL={stop_loss:.0f}円({abs(stop_loss - current_price) / current_price * 100:.2f}%), "
-                f"TP={take_profit:.0f}円({abs(take_profit - current_price) / current_price * 100:.2f}%), "
-                f"RR比={rr_ratio:.2f}:1"
-            )
+            if logger.is_enabled_for(logging.INFO):
+                logger.info(
+                    f"✅ Phase 49.16 TP/SL確定: "
+                    f"エントリー={current_price:.0f}円, "
+                    f"SL={stop_loss:.0f}円({abs(stop_loss - current_price) / current_price * 100:.2f}%), "
+                    f"TP={take_profit:.0f}円({abs(take_profit - current_price) / current_price * 100:.2f}%), "
+                    f"RR比={rr_ratio:.2f}:1"
+                )
 
             return stop_loss, take_profit
 
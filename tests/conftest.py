@@ -33,6 +33,11 @@ os.environ.setdefault("BITBANK_API_SECRET", "test_secret_for_unit_tests")
 # - CI でも有効化 → Firestore real call 回避で test 高速化 + 確実性向上
 os.environ.setdefault("BOT_FORCE_LOCAL_PERSISTENCE", "1")
 
+# 特徴量ストア（.cache/features）へのディスク書き込みを抑止
+# - バックテスト/学習経路のテストがリポジトリ配下にエントリを残さないため
+# - FeatureStore 自体のテストは enabled=True + tmp_path で明示的に有効化
+os.environ.setdefault("FEATURE_STORE_DISABLED", "1")
+
 # 注意: ここで torch を import すると torch の C 拡張が OpenMP プールを先取りし、
 # その後 LightGBM の初期化と競合して macOS で SEGFAULT が発生する。
 # torch のスレッド設定は (a) 環境変数 OMP_NUM_THREADS=1 で間接制御
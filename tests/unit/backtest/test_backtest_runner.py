@@ -59,9 +59,11 @@ class TestBacktestRunnerMLPrecompute:
         df = _make_features_df(10, feature_names)
         runner.precomputed_features["15m"] = df
 
-        # ml_service.predict / predict_proba をスタブ
-        runner.orchestrator.ml_service.predict.return_value = np.zeros(10, dtype=int)
-        runner.orchestrator.ml_service.predict_proba.return_value = np.full((10, 3), 1.0 / 3.0)
+        # ml_service.predict_with_proba をスタブ（Phase 90: ラベル・確率を 1 回で取得）
+        runner.orchestrator.ml_service.predict_with_proba.return_value = (
+            np.zeros(10, dtype=int),
+            np.full((10, 3), 1.0 / 3.0),
+        )
 
         with patch(
             "src.core.config.feature_manager.get_feature_names",
@@ -86,7 +88,7 @@ class TestBacktestRunnerMLPrecompute:
             await runner._precompute_ml_predictions()
 
         # ML 予測は呼ばれない・予測結果も保存されない
-        runner.orchestrator.ml_service.predict.assert_not_called()
+        runner.orchestrator.ml_service.predict_with_proba.assert_not_called()
         assert "15m" not in runner.precomputed_ml_predictions
 
         # 特徴量不足 WARNING が出る
@@ -104,14 +106,16 @@ class TestBacktestRunnerMLPrecompute:
             await runner._precompute_ml_predictions()
 
         assert runner.precomputed_ml_predictions == {}
-        runner.orchestrator.ml_service.predict.assert_not_called()
+        runner.orchestrator.ml_service.predict_with_proba.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_handles_predict_exception_gracefully(self, runner):
-        """predict 中に例外が出ても error ログ + dict クリアで継続"""
+        """predict_with_proba 中に例外が出ても error ログ + dict クリアで継続"""
         feature_names = ["feat_a", "feat_b"]
         runner.precomputed_features["15m"] = _make_features_df(5, feature_names)
-        runner.orchestrator.ml_service.predict.side_effect = RuntimeError("model crashed")
+        runner.orchestrator.ml_service.predict_with_proba.side_effect = RuntimeError(
+            "model crashed"
+        )
 
         with patch(
             "src.core.config.feature_manager.get_feature_names",
@@ -127,11 +131,10 @@ class TestBacktestRunnerMLPrecompute:
 
     @pytest.mark.asyncio
     async def test_handles_predict_proba_exception_gracefully(self, runner):
-        """predict_proba 例外も同様に error ログ + dict クリア"""
+        """確率計算の例外（ValueError）も同様に error ログ + dict クリア"""
         feature_names = ["feat_a", "feat_b"]
         runner.precomputed_features["15m"] = _make_features_df(5, feature_names)
-        runner.orchestrator.ml_service.predict.return_value = np.zeros(5, dtype=int)
-        runner.orchestrator.ml_service.predict_proba.side_effect = ValueError("shape mismatch")
+        runner.orchestrator.ml_service.predict_with_proba.side_effect = ValueError("shape mismatch")
 
         with patch(
             "src.core.config.feature_manager.get_feature_names",
@@ -149,8 +152,10 @@ class TestBacktestRunnerMLPrecompute:
         runner.timeframes = []
         feature_names = ["feat_a"]
         runner.precomputed_features["15m"] = _make_features_df(3, feature_names)
-        runner.orchestrator.ml_service.predict.return_value = np.zeros(3, dtype=int)
-        runner.orchestrator.ml_service.predict_proba.return_value = np.full((3, 3), 1.0 / 3.0)
+        runner.orchestrator.ml_service.predict_with_proba.return_value = (
+            np.zeros(3, dtype=int),
+            np.full((3, 3), 1.0 / 3.0),
+        )
 
         with patch(
             "src.core.config.feature_manager.get_feature_names",
@@ -166,8 +171,10 @@ class TestBacktestRunnerMLPrecompute:
         """開始・完了の WARNING ログが出力される（本番 LOG_LEVEL=WARNING で観察可能）"""
         feature_names = ["feat_a"]
         runner.precomputed_features["15m"] = _make_features_df(2, feature_names)
-        runner.orchestrator.ml_service.predict.return_value = np.zeros(2, dtype=int)
-        runner.orchestrator.ml_service.predict_proba.return_value = np.full((2, 3), 1.0 / 3.0)
+        runner.orchestrator.ml_service.predict_with_proba.return_value = (
+            np.zeros(2, dtype=int),
+            np.full((2, 3), 1.0 / 3.0),
+        )
 
         with patch(
             "src.core.config.feature_manager.get_feature_names",
@@ -191,5 +198,50 @@ class TestBacktestRunnerMLPrecompute:
             await runner._precompute_ml_predictions()
 
         # ML 予測は呼ばれず、precomputed_ml_predictions は空のまま
-        runner.orchestrator.ml_service.predict.assert_not_called()
+        runner.orchestrator.ml_service.predict_with_proba.assert_not_called()
         assert runner.precomputed_ml_predictions == {}
+
+
+class TestBacktestRunnerStrategySignalPrecompute:
+    """`_precompute_strategy_signals` の因果的特徴量スライス利用テスト"""
+
+    @pytest.mark.asyncio
+    async def test_features_computed_once_and_batch_evaluated(self, runner):
+        """特徴量は全履歴で 1 回だけ計算され、戦略シグナルは一括評価される"""
+        n_rows = 30
+        main_df = _make_features_df(n_rows, ["open", "high", "low", "close", "volume"])
+        runner.csv_data = {"15m": main_df}
+        runner.precomputed_features["15m"] = main_df.copy()
+
+        feature_gen = MagicMock()
+        feature_gen.generate_features_causal.return_value = main_df
+        loader = MagicMock()
+        loader.load_strategies.return_value = [
+            {"metadata": {"name": "ATRBased"}},
+            {"metadata": {"name": "BBReversal"}},
+        ]
+
+        encoded = np.where(np.arange(n_rows) < 19, 0.0, 0.6)
+        service = runner.orchestrator.strategy_service
+        service.get_individual_strategy_signals_batch.return_value = {
+            "ATRBased": {"encoded": encoded}
+        }
+
+        with (
+            patch("src.features.feature_generator.FeatureGenerator", return_value=feature_gen),
+            patch("src.strategies.strategy_loader.StrategyLoader", return_value=loader),
+            patch("src.data.external_api_client.get_external_api_client", return_value=None),
+        ):
+            await runner._precompute_strategy_signals()
+
+        feature_gen.generate_features_causal.assert_called_once()
+        feature_gen.generate_features_sync.assert_not_called()
+        # 依存グラフ用の要求特徴量（ML 特徴量 + 有効戦略の必要特徴量）が渡される
+        assert "required_features" in feature_gen.generate_features_causal.call_args.kwargs
+        service.get_individual_strategy_signals_batch.assert_called_once_with(main_df)
+        service.get_individual_strategy_signals.assert_not_called()
+
+        features = runner.precomputed_features["15m"]
+        np.testing.assert_array_equal(features["strategy_signal_ATRBased"], encoded)
+        # 一括評価結果に含まれない戦略は0.0
+        assert (features["strategy_signal_BBReversal"] == 0.0).all()
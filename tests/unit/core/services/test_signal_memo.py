@@ -0,0 +1,136 @@
+"""
+SignalMemo テスト
+
+判断足単位のシグナルメモ（src/core/services/signal_memo.py）のキー・入力照合・
+LRU 削除・ローカル永続化を確認する。
+"""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.services.signal_memo import SignalMemo, compute_input_fingerprint
+
+
+@pytest.fixture(autouse=True)
+def live_mode(monkeypatch):
+    monkeypatch.delenv("BACKTEST_MODE", raising=False)
+    monkeypatch.delenv("ML_TRAINING_MODE", raising=False)
+
+
+@pytest.fixture
+def features() -> dict:
+    n = 30
+    df = pd.DataFrame(
+        {"close": np.linspace(10_000_000, 10_300_000, n), "rsi_14": np.linspace(30, 70, n)},
+        index=pd.date_range("2026-01-01", periods=n, freq="15min"),
+    )
+    return {"15m": df, "4h": df.iloc[::16].copy()}
+
+
+def _memo(tmp_path, **kwargs) -> SignalMemo:
+    return SignalMemo(path=str(tmp_path / "signal_memo.pkl"), logger=MagicMock(), **kwargs)
+
+
+def _put(memo, key, fingerprint, action="buy"):
+    memo.put(
+        key,
+        fingerprint,
+        strategy_signal={"action": action},
+        strategy_signals={"ATRBased": {"action": action, "confidence": 0.7, "encoded": 0.7}},
+        ml_prediction={"prediction": 2, "confidence": 0.8, "n_classes": 3},
+    )
+
+
+class TestSignalMemoLookup:
+    """キー・入力照合テスト"""
+
+    def test_hit_requires_same_key_and_fingerprint(self, tmp_path, features):
+        """キーと入力フィンガープリントが一致した場合のみヒット."""
+        memo = _memo(tmp_path)
+        key = memo.make_key(features["15m"].index[-1], "ProductionEnsemble_FULL:1-2")
+        fingerprint = compute_input_fingerprint(features)
+        _put(memo, key, fingerprint)
+
+        hit = memo.get(key, fingerprint)
+        assert hit["strategy_signal"] == {"action": "buy"}
+        assert hit["ml_prediction"]["n_classes"] == 3
+        assert memo.get(key, "other") is None
+        other_model = memo.make_key(features["15m"].index[-1], "ProductionEnsemble_FULL:3-4")
+        assert memo.get(other_model, fingerprint) is None
+        assert memo.stats()["hits"] == 1
+
+    def test_hit_returns_copy(self, tmp_path, features):
+        """呼び出し側で結果を変更してもメモは変わらない."""
+        memo = _memo(tmp_path)
+        key = memo.make_key(features["15m"].index[-1], "v1")
+        fingerprint = compute_input_fingerprint(features)
+        _put(memo, key, fingerprint)
+
+        memo.get(key, fingerprint)["strategy_signals"]["ATRBased"]["action"] = "sell"
+        assert memo.get(key, fingerprint)["strategy_signals"]["ATRBased"]["action"] == "buy"
+
+    def test_config_change_changes_key(self, tmp_path, features):
+        """設定ハッシュが変わればキーも変わる."""
+        memo = _memo(tmp_path)
+        timestamp = features["15m"].index[-1]
+        key = memo.make_key(timestamp, "v1")
+        with patch("src.core.services.signal_memo.get_config_hash", return_value="changed"):
+            assert memo.make_key(timestamp, "v1") != key
+
+    def test_fingerprint_tracks_latest_row(self, features):
+        """最新行の値が変わればフィンガープリントが変わり、過去行のコピーでは変わらない."""
+        base = compute_input_fingerprint(features)
+        assert compute_input_fingerprint({k: v.copy() for k, v in features.items()}) == base
+
+        changed = {k: v.copy() for k, v in features.items()}
+        changed["15m"].iloc[-1, 0] += 1.0
+        assert compute_input_fingerprint(changed) != base
+
+    def test_disabled_memo_never_hits(self, tmp_path, features):
+        """無効時は保存も取得もしない."""
+        memo = _memo(tmp_path, enabled=False)
+        key = memo.make_key(features["15m"].index[-1], "v1")
+        _put(memo, key, "fp")
+        assert memo.get(key, "fp") is None
+        assert not (tmp_path / "signal_memo.pkl").exists()
+
+
+class TestSignalMemoPersistence:
+    """LRU・永続化テスト"""
+
+    def test_evicts_oldest_candle(self, tmp_path, features):
+        """max_entries を超えた古い判断足から削除される."""
+        memo = _memo(tmp_path, max_entries=2)
+        keys = [memo.make_key(ts, "v1") for ts in features["15m"].index[-3:]]
+        for key in keys:
+            _put(memo, key, "fp")
+
+        assert memo.get(keys[0], "fp") is None
+        assert memo.get(keys[2], "fp") is not None
+
+    def test_restored_by_new_instance(self, tmp_path, features):
+        """ライブ/ペーパーはローカルファイルに保存され、新しいインスタンスで復元される."""
+        key = SignalMemo.make_key(features["15m"].index[-1], "v1")
+        _put(_memo(tmp_path), key, "fp", action="sell")
+
+        restored = _memo(tmp_path).get(key, "fp")
+        assert restored["strategy_signal"] == {"action": "sell"}
+
+    def test_backtest_mode_is_memory_only(self, tmp_path, features, monkeypatch):
+        """バックテスト時はローカルファイルを読み書きしない."""
+        monkeypatch.setenv("BACKTEST_MODE", "true")
+        memo = _memo(tmp_path)
+        key = memo.make_key(features["15m"].index[-1], "v1")
+        _put(memo, key, "fp")
+
+        assert memo.get(key, "fp") is not None
+        assert not (tmp_path / "signal_memo.pkl").exists()
+
+    def test_corrupt_file_starts_empty(self, tmp_path, features):
+        """破損ファイルは無視して空で開始する."""
+        (tmp_path / "signal_memo.pkl").write_bytes(b"not a pickle")
+        memo = _memo(tmp_path)
+        assert memo.get(memo.make_key(features["15m"].index[-1], "v1"), "fp") is None
@@ -13,7 +13,13 @@ from unittest.mock import patch
 import pytest
 import yaml
 
-from src.core.config import get_all_thresholds, get_threshold, load_thresholds, reload_thresholds
+from src.core.config import (
+    get_all_thresholds,
+    get_threshold,
+    get_threshold_snapshot,
+    load_thresholds,
+    reload_thresholds,
+)
 
 
 class TestThresholdConfiguration:
@@ -288,3 +294,68 @@ class TestBoundaryConditions:
         with patch("src.core.config.threshold_manager.load_thresholds", return_value=test_data):
             assert get_threshold("booleans.true", False) is True
             assert get_threshold("booleans.false", True) is False
+
+
+def _walk_threshold(thresholds, key_path, default_value=None):
+    """Phase 90 以前の get_threshold（キー分割・辞書走査）"""
+    current_value = thresholds
+    try:
+        for key in key_path.split("."):
+            current_value = current_value[key]
+        return current_value
+    except (KeyError, TypeError):
+        if default_value is not None:
+            return default_value
+        raise KeyError(f"閾値設定が見つかりません: {key_path}")
+
+
+class TestThresholdSnapshot:
+    """Phase 90: コンパイル済みスナップショットのテスト"""
+
+    def test_matches_nested_walk_for_all_keys(self):
+        """実設定の全キー（中間階層含む）で従来の走査と同じ値・同じオブジェクトを返す."""
+        reload_thresholds()
+        thresholds = load_thresholds()
+        snapshot = get_threshold_snapshot()
+
+        assert len(snapshot.values) > 100
+        for key_path in snapshot.values:
+            assert get_threshold(key_path) is _walk_threshold(thresholds, key_path)
+
+    def test_missing_and_none_values_follow_legacy_rules(self):
+        """未設定・None 値・到達不可キーの扱いが従来と同じ."""
+        test_data = {
+            "a": {"none": None, "list": [1, 2], "b.c": 1, 1: "int_key"},
+            "scalar": "text",
+        }
+        with patch("src.core.config.threshold_manager.load_thresholds", return_value=test_data):
+            for key_path in ("a.none", "a.list.0", "a.b.c", "a.1", "scalar.x", "missing"):
+                expected = _walk_threshold(test_data, key_path, "default")
+                assert get_threshold(key_path, "default") == expected
+            assert get_threshold("a.none", "default") is None
+            with pytest.raises(KeyError, match="閾値設定が見つかりません"):
+                get_threshold("a.b.c")
+
+    def test_rebuilt_only_when_thresholds_change(self):
+        """設定辞書が同じ間は再構築せず、差し替え（reload・モック）時のみ再構築する."""
+        reload_thresholds()
+        snapshot = get_threshold_snapshot()
+        get_threshold("ml.default_confidence", 0.5)
+        assert get_threshold_snapshot() is snapshot
+
+        with patch(
+            "src.core.config.threshold_manager.load_thresholds",
+            return_value={"ml": {"default_confidence": 0.77}},
+        ):
+            assert get_threshold("ml.default_confidence", 0.5) == 0.77
+
+        reload_thresholds()
+        rebuilt = get_threshold_snapshot()
+        assert rebuilt is not snapshot
+        assert rebuilt.version > snapshot.version
+        assert get_threshold("ml.default_confidence", 0.5) == snapshot.get("ml.default_confidence")
+
+    def test_snapshot_values_are_read_only(self):
+        """フラットキーのビューは変更できない."""
+        with pytest.raises(TypeError):
+            get_threshold_snapshot().values["ml.default_confidence"] = 0.0
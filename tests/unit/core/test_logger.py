@@ -446,6 +446,40 @@ class TestCryptoBotLogger:
             logger.warning("Warning message (should not be skipped)")
             mock_log.assert_called_once()
 
+    @patch("src.core.config.get_config")
+    def test_is_enabled_for_backtest_mode(self, mock_get_config):
+        """バックテストモード時はINFOのみ無効（メッセージ組み立て省略の判定）"""
+        mock_config = MagicMock()
+        mock_config.logging.level = "DEBUG"
+        mock_config.logging.file_enabled = False
+        mock_config.logging.retention_days = 7
+        mock_get_config.return_value = mock_config
+
+        os.environ["BACKTEST_MODE"] = "true"
+        logger = CryptoBotLogger("test_bot")
+
+        assert logger.is_enabled_for(logging.INFO) is False
+        assert logger.is_enabled_for(logging.DEBUG) is True
+        assert logger.is_enabled_for(logging.WARNING) is True
+
+    @patch("src.core.config.get_config")
+    def test_is_enabled_for_below_logger_level(self, mock_get_config):
+        """ロガーレベル未満は無効で、出力呼び出しも行わない"""
+        mock_config = MagicMock()
+        mock_config.logging.level = "DEBUG"
+        mock_config.logging.file_enabled = False
+        mock_config.logging.retention_days = 7
+        mock_get_config.return_value = mock_config
+
+        os.environ["LOG_LEVEL"] = "WARNING"
+        logger = CryptoBotLogger("test_bot")
+
+        assert logger.is_enabled_for(logging.DEBUG) is False
+        assert logger.is_enabled_for(logging.INFO) is False
+        with patch.object(logger.logger, "log") as mock_log:
+            logger.debug("Debug message (should be skipped)")
+            mock_log.assert_not_called()
+
 
 class TestConditionalLog:
     """conditional_logメソッドのテスト"""
@@ -20,6 +20,7 @@ from src.core.exceptions import FileIOError, ModelLoadError, ModelPredictionErro
 from src.core.logger import CryptoBotLogger
 from src.core.orchestration.ml_adapter import MLServiceAdapter
 from src.core.orchestration.ml_fallback import DummyModel
+from src.ml.ensemble import ProductionEnsemble
 
 
 class TestDummyModel:
@@ -552,6 +553,59 @@ class TestMLServiceAdapterPredictionErrors:
         adapter.model.predict.assert_called_once_with(X)  # use_confidenceは渡されない
         assert isinstance(result, np.ndarray)
 
+    def test_predict_with_proba_uses_fused_model_path(self, adapter_with_mock_model):
+        """predict_with_proba 対応モデルは 1 回の呼び出しでラベル・確率を取得（Phase 90）"""
+        adapter = adapter_with_mock_model
+        probas = np.array([[0.2, 0.8], [0.6, 0.4]])
+        adapter.model = MagicMock(spec=ProductionEnsemble)
+        adapter.model.predict_with_proba.return_value = (np.array([1, 0]), probas)
+
+        labels, result = adapter.predict_with_proba(np.zeros((2, 3)))
+
+        adapter.model.predict_with_proba.assert_called_once()
+        adapter.model.predict.assert_not_called()
+        adapter.model.predict_proba.assert_not_called()
+        np.testing.assert_array_equal(labels, [1, 0])
+        assert result is probas
+
+    def test_predict_with_proba_without_fused_method(self, adapter_with_mock_model):
+        """predict_with_proba 非対応モデルは predict/predict_proba を個別に呼ぶ"""
+        adapter = adapter_with_mock_model
+        adapter.model.predict.return_value = np.array([0, 1])
+        adapter.model.predict.__code__ = Mock()
+        adapter.model.predict.__code__.co_varnames = ["X"]
+        adapter.model.predict_proba.return_value = np.array([[0.9, 0.1], [0.3, 0.7]])
+
+        labels, probas = adapter.predict_with_proba(np.zeros((2, 3)))
+
+        adapter.model.predict.assert_called_once()
+        adapter.model.predict_proba.assert_called_once()
+        np.testing.assert_array_equal(labels, [0, 1])
+        assert probas.shape == (2, 2)
+
+    def test_predict_with_proba_error_fallback(self, adapter_with_mock_model):
+        """fused 推論失敗時はダミーモデルにフォールバックし、失敗を 2 回分記録"""
+        adapter = adapter_with_mock_model
+        adapter.model = MagicMock(spec=ProductionEnsemble)
+        adapter.model.predict_with_proba.side_effect = ValueError("特徴量数不一致")
+
+        with patch.object(adapter, "_record_ml_failure") as record_failure:
+            labels, probas = adapter.predict_with_proba(np.zeros((3, 2)))
+
+        assert record_failure.call_count == 2
+        assert np.all(labels == 0)
+        assert probas.shape == (3, 2)
+
+    def test_predict_with_proba_dummy_model_failure(self, adapter_with_mock_model):
+        """ダミーモデルでも fused 推論失敗時は ModelPredictionError"""
+        adapter = adapter_with_mock_model
+        adapter.model = MagicMock(spec=ProductionEnsemble)
+        adapter.model_type = "DummyModel"
+        adapter.model.predict_with_proba.side_effect = Exception("推論エラー")
+
+        with pytest.raises(ModelPredictionError, match="ダミーモデルでも予測に失敗"):
+            adapter.predict_with_proba(np.zeros((1, 2)))
+
 
 class TestMLServiceAdapterUtilityMethods:
     """MLServiceAdapterユーティリティメソッドのテスト"""
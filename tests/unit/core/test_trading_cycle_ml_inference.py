@@ -0,0 +1,130 @@
+"""
+ライブML推論の入力行削減テスト
+
+_get_ml_prediction は最終行の予測のみを使うため、最終行 + モデルの必要過去行数
+（ProductionEnsemble.required_lookback）だけを推論に渡す。全行を渡した場合と
+同一の予測・信頼度になることを確認する。
+"""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.orchestration.ml_adapter import MLServiceAdapter
+from src.core.services.trading_cycle_manager import TradingCycleManager
+from src.ml.ensemble import ProductionEnsemble
+
+FEATURES = [f"feat_{i}" for i in range(5)]
+
+
+class _RowMember:
+    """行単位の線形 softmax 分類器（テスト用メンバー）"""
+
+    n_features_in_ = len(FEATURES)
+
+    def __init__(self, seed: int):
+        self.weights = np.random.default_rng(seed).normal(size=(len(FEATURES), 3))
+        self.input_rows = []
+
+    def predict_proba(self, X) -> np.ndarray:
+        self.input_rows.append(len(X))
+        # 行毎に同じ順序で和を取る（入力行数で BLAS の集計順序が変わらないように）
+        logits = (np.asarray(X, dtype=float)[:, :, None] * self.weights[None]).sum(axis=1)
+        exp = np.exp(logits - logits.max(axis=1, keepdims=True))
+        return exp / exp.sum(axis=1, keepdims=True)
+
+
+class _WindowMember(_RowMember):
+    """直近 required_lookback + 1 行の平均を入力とする分類器（テスト用メンバー）"""
+
+    required_lookback = 3
+
+    def predict_proba(self, X) -> np.ndarray:
+        values = np.asarray(X, dtype=float)
+        smoothed = np.stack(
+            [
+                values[max(i - self.required_lookback, 0) : i + 1].mean(axis=0)
+                for i in range(len(values))
+            ]
+        )
+        return super().predict_proba(smoothed)
+
+
+@pytest.fixture
+def main_features() -> pd.DataFrame:
+    rng = np.random.default_rng(11)
+    n = 200
+    data = {name: rng.normal(size=n) for name in FEATURES}
+    data["close"] = np.linspace(10_000_000, 10_200_000, n)
+    return pd.DataFrame(data, index=pd.date_range("2026-01-01", periods=n, freq="15min"))
+
+
+def _manager(members) -> TradingCycleManager:
+    with (
+        patch("src.ml.ensemble.get_feature_names", return_value=FEATURES),
+        patch("src.core.orchestration.ml_loader.MLModelLoader.load_model_with_priority"),
+    ):
+        adapter = MLServiceAdapter(MagicMock())
+        adapter.model = ProductionEnsemble(members)
+    adapter.model_type = "ProductionEnsemble"
+    adapter.is_fitted = True
+    adapter.ensure_correct_model = MagicMock(return_value=True)
+
+    orchestrator = MagicMock()
+    orchestrator.ml_service = adapter
+    with patch(
+        "src.core.services.trading_cycle_manager.get_threshold",
+        side_effect=lambda key, default=None: (
+            False if key == "dynamic_strategy_selection.enabled" else default
+        ),
+    ):
+        return TradingCycleManager(orchestrator, MagicMock())
+
+
+async def _predict(manager, main_features, full_frame: bool = False):
+    with patch("src.core.config.feature_manager.get_feature_names", return_value=FEATURES):
+        if not full_frame:
+            return await manager._get_ml_prediction(main_features)
+        with patch.object(manager.orchestrator.ml_service, "get_inference_rows", return_value=None):
+            return await manager._get_ml_prediction(main_features)
+
+
+@pytest.mark.asyncio
+async def test_row_models_infer_last_row_only(main_features, monkeypatch):
+    """行単位モデルのみなら最終行 1 行だけ推論し、全行推論と同一結果."""
+    monkeypatch.delenv("BACKTEST_MODE", raising=False)
+    members = {"lightgbm": _RowMember(1), "xgboost": _RowMember(2)}
+    manager = _manager(members)
+
+    full = await _predict(manager, main_features, full_frame=True)
+    assert members["lightgbm"].input_rows == [len(main_features)]
+
+    last_row = await _predict(manager, main_features)
+    assert members["lightgbm"].input_rows[-1] == 1
+    assert last_row == full
+    assert last_row["n_classes"] == 3
+
+
+@pytest.mark.asyncio
+async def test_lookback_member_receives_required_rows(main_features, monkeypatch):
+    """過去行を使うモデルがあれば最終行 + required_lookback 行を渡し、全行推論と同一結果."""
+    monkeypatch.delenv("BACKTEST_MODE", raising=False)
+    members = {"lightgbm": _RowMember(1), "nbeats": _WindowMember(3)}
+    manager = _manager(members)
+    assert manager.orchestrator.ml_service.get_inference_rows() == 4
+
+    full = await _predict(manager, main_features, full_frame=True)
+    windowed = await _predict(manager, main_features)
+
+    assert members["nbeats"].input_rows == [len(main_features), 4]
+    assert windowed == full
+
+
+def test_inference_rows_unknown_model_uses_all_rows():
+    """required_lookback を提供しないモデルは None（全行を渡す）."""
+    with patch("src.core.orchestration.ml_loader.MLModelLoader.load_model_with_priority"):
+        adapter = MLServiceAdapter(MagicMock())
+    adapter.model = MagicMock()
+    assert adapter.get_inference_rows() is None
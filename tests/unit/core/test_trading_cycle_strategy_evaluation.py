@@ -0,0 +1,218 @@
+"""
+取引サイクルの戦略評価回数テスト
+
+execute_trading_cycle は統合シグナルと ML 特徴量用の個別戦略シグナルを
+1 回の戦略評価から取得し、各戦略の generate_signal をサイクル毎に 1 回だけ呼ぶ。
+同一足・同一入力の再トリガーではシグナルメモの結果を再利用する。
+"""
+
+from contextlib import ExitStack
+from datetime import datetime
+from typing import Dict, Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.services.trading_cycle_manager import TradingCycleManager
+from src.strategies.base.strategy_base import StrategyBase, StrategySignal
+from src.strategies.base.strategy_manager import StrategyManager
+
+
+class _FixedStrategy(StrategyBase):
+    """固定シグナルを返すテスト用戦略"""
+
+    def __init__(self, name: str, action: str, confidence: float):
+        super().__init__(name=name)
+        self._action = action
+        self._confidence = confidence
+
+    def analyze(
+        self, df: pd.DataFrame, multi_timeframe_data: Optional[Dict[str, pd.DataFrame]] = None
+    ) -> StrategySignal:
+        return StrategySignal(
+            strategy_name=self.name,
+            timestamp=datetime.now(),
+            action=self._action,
+            confidence=self._confidence,
+            strength=0.5,
+            current_price=float(df["close"].iloc[-1]),
+        )
+
+    def get_required_features(self):
+        return ["close", "volume"]
+
+
+@pytest.fixture
+def main_features() -> pd.DataFrame:
+    n = 50
+    return pd.DataFrame(
+        {
+            "close": np.linspace(10_000_000, 10_500_000, n),
+            "volume": np.full(n, 150.0),
+        },
+        index=pd.date_range("2026-01-01", periods=n, freq="15min"),
+    )
+
+
+@pytest.fixture
+def strategy_manager() -> StrategyManager:
+    manager = StrategyManager()
+    manager.register_strategy(_FixedStrategy("BuyA", "buy", 0.7))
+    manager.register_strategy(_FixedStrategy("BuyB", "buy", 0.6))
+    manager.register_strategy(_FixedStrategy("Hold", "hold", 0.5))
+    return manager
+
+
+def _cycle_manager(strategy_manager, memo_path=None) -> TradingCycleManager:
+    """動的戦略選択なしの TradingCycleManager（memo_path 未指定時はシグナルメモ無効）"""
+    thresholds = {
+        "dynamic_strategy_selection.enabled": False,
+        "execution.signal_memo.enabled": memo_path is not None,
+        "execution.signal_memo.live_enabled": memo_path is not None,
+    }
+    if memo_path is not None:
+        thresholds["execution.signal_memo.path"] = str(memo_path)
+    orchestrator = MagicMock()
+    orchestrator.strategy_service = strategy_manager
+    orchestrator.ml_service = MagicMock(spec=["model_version"], model_version="test:1")
+    with patch(
+        "src.core.services.trading_cycle_manager.get_threshold",
+        side_effect=lambda key, default=None: thresholds.get(key, default),
+    ):
+        return TradingCycleManager(orchestrator, MagicMock())
+
+
+async def _run_cycles(manager, strategy_manager, main_features, ml_prediction, cycles=1):
+    """外部依存をモックして取引サイクルを実行し、(generate_signal モック, ML予測モック,
+    戦略シグナル特徴量追加モック, リスク評価モック) を返す"""
+    add_signal_features = AsyncMock(side_effect=lambda features, signals: features)
+    get_ml_prediction = AsyncMock(return_value=ml_prediction)
+    evaluate_risk = AsyncMock(return_value=MagicMock())
+
+    with (
+        patch.object(manager, "_fetch_market_data", AsyncMock(return_value={"15m": None})),
+        patch.object(manager, "_collect_orderbook_snapshot"),
+        patch.object(
+            manager,
+            "_generate_features",
+            AsyncMock(return_value=({"15m": main_features}, main_features)),
+        ),
+        patch.object(manager, "_add_strategy_signal_features", add_signal_features),
+        patch.object(manager, "_get_ml_prediction", get_ml_prediction),
+        patch.object(manager, "_fetch_trading_info", AsyncMock(return_value={})),
+        patch.object(manager, "_evaluate_risk", evaluate_risk),
+        patch.object(manager, "_apply_signal_consistency_check", side_effect=lambda e: e),
+        patch.object(manager, "_execute_approved_trades", AsyncMock()),
+        patch.object(manager, "_check_stop_conditions", AsyncMock()),
+        ExitStack() as stack,
+    ):
+        generate_signal = {
+            name: stack.enter_context(
+                patch.object(strategy, "generate_signal", wraps=strategy.generate_signal)
+            )
+            for name, strategy in strategy_manager.strategies.items()
+        }
+        for _ in range(cycles):
+            await manager.execute_trading_cycle()
+
+    return generate_signal, get_ml_prediction, add_signal_features, evaluate_risk
+
+
+@pytest.mark.asyncio
+async def test_each_strategy_runs_once_per_cycle(strategy_manager, main_features):
+    """1 サイクルで各戦略の generate_signal は 1 回だけ呼ばれ、個別シグナルが後段に渡る."""
+    manager = _cycle_manager(strategy_manager)
+    generate_signal, _, add_signal_features, evaluate_risk = await _run_cycles(
+        manager, strategy_manager, main_features, {}
+    )
+
+    assert {name: mock.call_count for name, mock in generate_signal.items()} == {
+        "BuyA": 1,
+        "BuyB": 1,
+        "Hold": 1,
+    }
+    strategy_signals = add_signal_features.await_args.args[1]
+    assert strategy_signals["BuyA"]["encoded"] == pytest.approx(0.7)
+    assert strategy_signals["Hold"]["encoded"] == 0.0
+    assert evaluate_risk.await_args.kwargs["individual_strategy_signals"] is strategy_signals
+
+
+@pytest.mark.asyncio
+async def test_repeat_trigger_reuses_memoized_signals(
+    strategy_manager, main_features, tmp_path, monkeypatch
+):
+    """同一足・同一入力の再トリガーでは戦略評価・ML予測を再計算せず、同じ結果を後段に渡す."""
+    monkeypatch.delenv("BACKTEST_MODE", raising=False)
+    ml_prediction = {"prediction": 2, "confidence": 0.8, "n_classes": 3, "ml_mode": "direction"}
+    manager = _cycle_manager(strategy_manager, memo_path=tmp_path / "signal_memo.pkl")
+    generate_signal, get_ml_prediction, _, evaluate_risk = await _run_cycles(
+        manager, strategy_manager, main_features, ml_prediction, cycles=3
+    )
+
+    assert all(mock.call_count == 1 for mock in generate_signal.values())
+    assert get_ml_prediction.await_count == 1
+    assert evaluate_risk.await_count == 3
+    first, last = evaluate_risk.await_args_list[0], evaluate_risk.await_args_list[-1]
+    assert last.args[0] == first.args[0] == ml_prediction
+    assert last.args[1].action == first.args[1].action
+    assert last.kwargs["individual_strategy_signals"] == first.kwargs["individual_strategy_signals"]
+    assert manager.signal_memo.stats()["hits"] == 2
+
+    # ローカル永続化: 新しいインスタンス（ウォーム再起動）でも再利用される
+    restarted = _cycle_manager(strategy_manager, memo_path=tmp_path / "signal_memo.pkl")
+    generate_signal, get_ml_prediction, _, _ = await _run_cycles(
+        restarted, strategy_manager, main_features, ml_prediction
+    )
+    assert all(mock.call_count == 0 for mock in generate_signal.values())
+    assert get_ml_prediction.await_count == 0
+
+
+@pytest.mark.asyncio
+async def test_changed_latest_row_recomputes(strategy_manager, main_features, tmp_path):
+    """同じ判断足でも最新行（未確定足の価格等）が変われば再計算する."""
+    ml_prediction = {"prediction": 1, "confidence": 0.6, "n_classes": 3, "ml_mode": "direction"}
+    manager = _cycle_manager(strategy_manager, memo_path=tmp_path / "signal_memo.pkl")
+    await _run_cycles(manager, strategy_manager, main_features, ml_prediction)
+
+    updated = main_features.copy()
+    updated.iloc[-1, updated.columns.get_loc("close")] += 1000.0
+    generate_signal, get_ml_prediction, _, _ = await _run_cycles(
+        manager, strategy_manager, updated, ml_prediction
+    )
+
+    assert all(mock.call_count == 1 for mock in generate_signal.values())
+    assert get_ml_prediction.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_live_mode_skips_memo_by_default(strategy_manager, main_features, monkeypatch):
+    """ライブ/ペーパーは既定でメモ無効（未確定足でヒットしないためコピー・保存もしない）."""
+    monkeypatch.delenv("BACKTEST_MODE", raising=False)
+    monkeypatch.delenv("ML_TRAINING_MODE", raising=False)
+    ml_prediction = {"prediction": 2, "confidence": 0.8, "n_classes": 3, "ml_mode": "direction"}
+    thresholds = {"dynamic_strategy_selection.enabled": False}
+    orchestrator = MagicMock()
+    orchestrator.strategy_service = strategy_manager
+    with patch(
+        "src.core.services.trading_cycle_manager.get_threshold",
+        side_effect=lambda key, default=None: thresholds.get(key, default),
+    ):
+        manager = TradingCycleManager(orchestrator, MagicMock())
+    assert not manager.signal_memo.enabled
+
+    with patch.object(manager.signal_memo, "put") as put:
+        generate_signal, get_ml_prediction, _, _ = await _run_cycles(
+            manager, strategy_manager, main_features, ml_prediction, cycles=2
+        )
+    put.assert_not_called()
+    assert all(mock.call_count == 2 for mock in generate_signal.values())
+    assert get_ml_prediction.await_count == 2
+
+    monkeypatch.setenv("BACKTEST_MODE", "true")
+    with patch(
+        "src.core.services.trading_cycle_manager.get_threshold",
+        side_effect=lambda key, default=None: thresholds.get(key, default),
+    ):
+        assert TradingCycleManager(orchestrator, MagicMock()).signal_memo.enabled
@@ -217,3 +217,58 @@ def test_singleton_pattern():
     reset_external_api_client()
     c3 = get_external_api_client()
     assert c3 is not c1
+
+
+@pytest.mark.asyncio
+async def test_stale_value_served_while_revalidating():
+    """TTL 切れ後 stale_seconds 以内は前回値を即返し、バックグラウンドで再取得する."""
+    client = ExternalAPIClient(timeout_seconds=5, cache_ttl_seconds=300, fallback_value=0.0)
+    client.source_stale["fear_greed"] = 600
+    client._put_cache("fear_greed", 0.42)
+    client._cache["fear_greed"] = (0.42, datetime.now() - timedelta(seconds=10))
+
+    async def _request():
+        client._put_cache("fear_greed", 0.9)
+        return 0.9
+
+    with patch.object(client, "_request_fear_greed_index", side_effect=_request) as mock_request:
+        value = await client.fetch_fear_greed_index()
+        assert value == pytest.approx(0.42)
+        await asyncio.gather(*client._refresh_tasks.values())
+
+    mock_request.assert_called_once()
+    assert await client.fetch_fear_greed_index() == pytest.approx(0.9)
+    assert client._refresh_tasks == {}
+
+
+@pytest.mark.asyncio
+async def test_stale_window_exceeded_refetches_synchronously():
+    """stale_seconds を超えた前回値は返さず再取得を待つ."""
+    client = ExternalAPIClient(timeout_seconds=5, cache_ttl_seconds=300, fallback_value=0.0)
+    client.source_stale["fear_greed"] = 5
+    client._put_cache("fear_greed", 0.42)
+    client._cache["fear_greed"] = (0.42, datetime.now() - timedelta(seconds=10))
+
+    with patch.object(client, "_request_fear_greed_index", AsyncMock(return_value=0.7)):
+        assert await client.fetch_fear_greed_index() == pytest.approx(0.7)
+    assert client._refresh_tasks == {}
+
+
+@pytest.mark.asyncio
+async def test_budget_exceeded_returns_fallback_and_keeps_fetching():
+    """取得予算を超えたら fallback を返し、取得はバックグラウンドで完了してキャッシュされる."""
+    client = ExternalAPIClient(timeout_seconds=5, cache_ttl_seconds=300, fallback_value=-1.0)
+    client.source_budget["funding_rate"] = 0.01
+    release = asyncio.Event()
+
+    async def _slow_request(cache_key, symbol, limit):
+        await release.wait()
+        client._put_cache(cache_key, 0.0003)
+        return 0.0003
+
+    with patch.object(client, "_request_funding_rate", side_effect=_slow_request):
+        assert await client.fetch_funding_rate() == -1.0
+        release.set()
+        await asyncio.gather(*client._refresh_tasks.values())
+
+    assert await client.fetch_funding_rate() == pytest.approx(0.0003)
@@ -5,6 +5,8 @@ feature_generator._add_external_features の動作と generate_features 経由
 external_api_client 連携を検証。
 """
 
+import asyncio
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -150,6 +152,40 @@ async def test_generate_features_falls_back_on_external_api_exception(base_df):
     assert (result["fear_greed_index"] == 0.0).all()
 
 
+@pytest.mark.asyncio
+async def test_fetch_external_values_fetches_sources_concurrently():
+    """funding / fear_greed / ETH ticker は並行取得される（逐次 await では全件開始に到達しない）."""
+    from unittest.mock import MagicMock
+
+    started = []
+    all_started = asyncio.Event()
+
+    def _source(value):
+        async def _fetch():
+            started.append(value)
+            if len(started) == 3:
+                all_started.set()
+            await all_started.wait()
+            return value
+
+        return _fetch
+
+    mock_client = MagicMock()
+    mock_client.fetch_funding_rate = _source(0.0001)
+    mock_client.fetch_fear_greed_index = _source(0.3)
+    mock_client.fetch_eth_jpy_ticker = _source({"last": 400000.0, "volume": 12.0})
+
+    gen = FeatureGenerator(external_api_client=mock_client)
+    values = await asyncio.wait_for(gen._fetch_external_values(), timeout=1.0)
+
+    assert values == {
+        "funding_rate_8h_avg": 0.0001,
+        "fear_greed_index": 0.3,
+        "eth_jpy_last": 400000.0,
+        "eth_jpy_volume": 12.0,
+    }
+
+
 # ===== Phase 89-γ: VPIN + HMM 状態確率 (+5) =====
 
 
@@ -1,13 +1,14 @@
 """
 FeatureCache テスト - Phase 89-α Stage 2
 
-特徴量生成キャッシュ（src/features/feature_cache.py）の包括テスト 12 件。
+特徴量生成キャッシュ（src/features/feature_cache.py）の包括テスト（追記検出の部分ヒット含む）。
 """
 
 import threading
 from datetime import datetime, timedelta
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -216,18 +217,24 @@ def test_disabled_via_config():
 
 
 def test_returned_df_is_copy_not_reference():
-    """get で返る DataFrame はコピー（cache 内 DF への参照ではない）."""
+    """get で返る DataFrame はコピー（in-place 改変・列の追加は cache 内 DF に波及しない）."""
     cache = FeatureCache(max_size=10, ttl_seconds=60, enabled=True)
     df = _make_df()
     key = FeatureCache.compute_key("BTC/JPY", "15m", df)
 
     cache.put(key, df)
+    df["added_after_put"] = 1.0  # put 元の改変
+    df.iloc[0, df.columns.get_loc("close")] = -1.0
     retrieved = cache.get(key)
-    retrieved.loc[retrieved.index[0], "close"] = -999999.0  # 改変
+    assert retrieved is not df
+    retrieved.iloc[0, retrieved.columns.get_loc("close")] = -999999.0  # in-place 改変
+    retrieved["strategy_signal_X"] = 0.5  # 列追加
 
     # 再取得しても改変が反映されていないこと
     retrieved2 = cache.get(key)
-    assert retrieved2.iloc[0]["close"] != -999999.0
+    assert retrieved2.iloc[0]["close"] not in (-999999.0, -1.0)
+    assert "strategy_signal_X" not in retrieved2.columns
+    assert "added_after_put" not in retrieved2.columns
 
 
 def test_singleton_returns_same_instance():
@@ -240,3 +247,217 @@ def test_singleton_returns_same_instance():
     reset_feature_cache()
     c3 = get_feature_cache()
     assert c3 is not c1
+
+
+def _make_random_df(n: int, seed: int = 7) -> pd.DataFrame:
+    """部分ヒットテスト用のランダムウォーク OHLCV DataFrame."""
+    rng = np.random.default_rng(seed)
+    close = 5_000_000 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+    idx = pd.date_range("2026-01-01", periods=n, freq="15min")
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close * 1.002,
+            "low": close * 0.998,
+            "close": close,
+            "volume": rng.lognormal(1.0, 0.4, n),
+        },
+        index=idx,
+    )
+
+
+def test_lookup_detects_appended_rows():
+    """先頭が同じで 2 行追記した入力は部分ヒット（一致行の特徴量を返す）."""
+    cache = FeatureCache(max_size=10, ttl_seconds=60, enabled=True)
+    full = _make_random_df(902)
+    prev, new = full.iloc[:900], full
+    features = prev.assign(feature=np.arange(900, dtype=float))
+    stream_id = FeatureCache.compute_stream_id("BTC/JPY", "15m", prev)
+    cache.put(FeatureCache.compute_key("BTC/JPY", "15m", prev), features, stream_id, prev)
+
+    key = FeatureCache.compute_key("BTC/JPY", "15m", new)
+    cached, reused_rows = cache.lookup(key, stream_id, new)
+
+    assert reused_rows == 900
+    np.testing.assert_array_equal(cached["feature"].to_numpy(), np.arange(900, dtype=float))
+    stats = cache.stats()
+    assert stats["partial_hits"] == 1
+    assert stats["misses"] == 0
+    assert stats["partial_hit_rate_percent"] == 100.0
+
+
+def test_lookup_stops_reuse_at_updated_row():
+    """形成中の足が更新された場合、その行以降は新規行扱い."""
+    cache = FeatureCache(max_size=10, ttl_seconds=60, enabled=True)
+    full = _make_random_df(901)
+    prev = full.iloc[:900]
+    new = full.copy()
+    new.iloc[899, new.columns.get_loc("close")] += 1.0
+    stream_id = FeatureCache.compute_stream_id("BTC/JPY", "15m", prev)
+    cache.put(FeatureCache.compute_key("BTC/JPY", "15m", prev), prev, stream_id, prev)
+
+    _, reused_rows = cache.lookup(FeatureCache.compute_key("BTC/JPY", "15m", new), stream_id, new)
+    assert reused_rows == 899
+
+
+def test_lookup_detects_sliding_window():
+    """先頭行を落とした固定長のスライド窓は重なる行の特徴量を部分ヒットで返す."""
+    cache = FeatureCache(max_size=10, ttl_seconds=60, enabled=True)
+    full = _make_random_df(201)
+    prev, new = full.iloc[:200], full.iloc[1:]
+    features = prev.assign(feature=np.arange(200, dtype=float))
+    stream_id = FeatureCache.compute_stream_id("BTC/JPY", "15m", prev)
+    cache.put(FeatureCache.compute_key("BTC/JPY", "15m", prev), features, stream_id, prev)
+
+    cached, reused_rows = cache.lookup(
+        FeatureCache.compute_key("BTC/JPY", "15m", new), stream_id, new
+    )
+
+    assert reused_rows == 199
+    pd.testing.assert_index_equal(cached.index, new.index[:199])
+    np.testing.assert_array_equal(cached["feature"].to_numpy(), np.arange(1, 200, dtype=float))
+
+
+def test_lookup_misses_unrelated_or_short_overlap():
+    """一致しない入力・直前の入力に無い先頭行・再利用行が重複行数以下の入力はミス."""
+    cache = FeatureCache(max_size=10, ttl_seconds=60, enabled=True)
+    full = _make_random_df(1000)
+    prev = full.iloc[:900]
+    stream_id = FeatureCache.compute_stream_id("BTC/JPY", "15m", prev)
+    cache.put(FeatureCache.compute_key("BTC/JPY", "15m", prev), prev, stream_id, prev)
+
+    unrelated = _make_random_df(900, seed=8)
+    disjoint = full.iloc[900:]
+    slid_past = full.iloc[800:]  # 重なりは 100 行のみ
+    updated = full.copy()
+    updated.iloc[100, updated.columns.get_loc("close")] += 1.0  # 一致は先頭 100 行のみ
+    for df in (unrelated, disjoint, slid_past, updated):
+        cached, reused_rows = cache.lookup(
+            FeatureCache.compute_key("BTC/JPY", "15m", df), stream_id, df
+        )
+        assert cached is None and reused_rows == 0
+    assert cache.stats()["misses"] == 4
+
+
+def _fresh_features(generator, df):
+    """キャッシュを使わない同一入力の全行計算."""
+    get_feature_cache().clear()
+    return generator.generate_features_sync(df)
+
+
+def _assert_matches_fresh(generator, actual, expected, from_row=0):
+    """rolling 系・行単位の列は全行計算と一致、EMA 系は初期値の残差（列の値幅の 0.1%）以内."""
+    assert list(actual.columns) == list(expected.columns)
+    pd.testing.assert_index_equal(actual.index, expected.index)
+    recursive = generator.feature_graph.recursive_outputs()
+    for column in expected.columns:
+        values = actual[column].to_numpy(dtype=float)[from_row:]
+        fresh = expected[column].to_numpy(dtype=float)[from_row:]
+        if column in recursive:
+            scale = float(np.nanmax(np.abs(fresh))) or 1.0
+            np.testing.assert_allclose(values, fresh, rtol=0, atol=1e-3 * scale, err_msg=column)
+        else:
+            np.testing.assert_allclose(values, fresh, rtol=1e-9, atol=1e-12, err_msg=column)
+
+
+def test_generator_partial_hit_matches_full_computation(monkeypatch):
+    """追記一致の出力は同一入力の全行計算と全行一致（EMA 系は初期値の残差以内）."""
+    from src.features.feature_generator import FeatureGenerator
+
+    monkeypatch.delenv("BACKTEST_MODE", raising=False)
+    generator = FeatureGenerator()
+    full = _make_random_df(1000)
+
+    generator.generate_features_sync(full.iloc[:996])
+    partial = generator.generate_features_sync(full)
+    assert get_feature_cache().stats()["partial_hits"] == 1
+
+    _assert_matches_fresh(generator, partial, _fresh_features(generator, full))
+
+
+def test_generator_sliding_window_reuses_rows(monkeypatch):
+    """ライブと同じ 200 行のスライド窓も部分ヒットし、ウォームアップ後の行は全行計算と一致."""
+    from src.features.constants import FEATURE_WARMUP_ROWS
+    from src.features.feature_generator import FeatureGenerator
+
+    monkeypatch.delenv("BACKTEST_MODE", raising=False)
+    generator = FeatureGenerator()
+    full = _make_random_df(202)
+
+    generator.generate_features_sync(full.iloc[:200])
+    generator.generate_features_sync(full.iloc[1:201])
+    sliding = generator.generate_features_sync(full.iloc[2:])
+    assert get_feature_cache().stats()["partial_hits"] == 2
+
+    expected = _fresh_features(generator, full.iloc[2:])
+    _assert_matches_fresh(generator, sliding, expected, from_row=FEATURE_WARMUP_ROWS)
+
+
+def test_partial_hit_broadcasts_frame_level_columns():
+    """入力全体から決まる列（外部 API 値・cross_asset 等）は再利用行も最新の値（再計算なし）."""
+    from src.features.feature_generator import FeatureGenerator
+
+    generator = FeatureGenerator()
+    df = _make_random_df(1000)
+    calls = []
+
+    def pipeline(part):
+        calls.append(len(part))
+        return part.assign(eth_btc_price_ratio=float(part["close"].iloc[-1]))
+
+    cached = pipeline(df.iloc[:990])
+    calls.clear()
+    result = generator._run_pipeline_reusing_rows(df, cached, 990, pipeline)
+
+    pd.testing.assert_frame_equal(result, pipeline(df))
+    assert calls[0] < len(df)
+
+
+def test_partial_hit_falls_back_when_reused_row_differs():
+    """重複区間の最終行が再利用行と一致しない（行単位の列が変わった）場合は全行計算."""
+    from src.features.feature_generator import FeatureGenerator
+
+    generator = FeatureGenerator()
+    df = _make_random_df(1000)
+
+    def pipeline(part):
+        # 入力の開始行に依存する列（再利用行と重複区間で値が変わる）
+        return part.assign(rows_from_start=np.arange(len(part), dtype=float))
+
+    cached = pipeline(df.iloc[:990])
+    result = generator._run_pipeline_reusing_rows(df, cached, 990, pipeline)
+
+    pd.testing.assert_frame_equal(result, pipeline(df))
+
+
+@pytest.mark.asyncio
+async def test_fallback_appends_cross_asset_history_once():
+    """全行計算フォールバックでも cross_asset 履歴の追記は 1 回（キャッシュなしの計算と同一）."""
+    from src.features.feature_generator import FeatureGenerator
+
+    full = _make_random_df(202)
+    frames = [full.iloc[:200], full.iloc[1:201], full.iloc[2:]]
+
+    def _generator():
+        generator = FeatureGenerator()
+        generator._btc_history.clear()
+        generator._eth_history.clear()
+        generator._fetch_external_values = AsyncMock(return_value={"eth_jpy_last": 400_000.0})
+        return generator
+
+    cold = _generator()
+    cold_results = []
+    for frame in frames:
+        get_feature_cache().clear()
+        cold_results.append(await cold.generate_features(frame))
+
+    get_feature_cache().clear()
+    reused = _generator()
+    with patch.object(FeatureGenerator, "_reused_row_matches", return_value=False):
+        results = [await reused.generate_features(frame) for frame in frames]
+
+    assert get_feature_cache().stats()["partial_hits"] == 2
+    assert len(reused._btc_history) == len(frames)
+    assert list(reused._btc_history) == list(cold._btc_history)
+    assert list(reused._eth_history) == list(cold._eth_history)
+    pd.testing.assert_frame_equal(results[-1], cold_results[-1])
@@ -0,0 +1,80 @@
+"""
+FeatureFrame テスト
+
+列指向特徴量フレーム（src/features/feature_frame.py）と
+FeatureGenerator パイプラインのコピー削減後の挙動を確認する。
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.feature_frame import FeatureFrame
+from src.features.feature_generator import FeatureGenerator
+
+
+@pytest.fixture
+def ohlcv() -> pd.DataFrame:
+    n = 120
+    rng = np.random.default_rng(3)
+    close = 5_000_000 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+    idx = pd.date_range("2026-01-01", periods=n, freq="15min")
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close * 1.002,
+            "low": close * 0.998,
+            "close": close,
+            "volume": rng.lognormal(1.0, 0.4, n),
+        },
+        index=idx,
+    )
+
+
+def test_scalar_and_series_assignment(ohlcv):
+    """スカラーは全行ブロードキャスト、Series は index 整列して格納."""
+    frame = FeatureFrame(ohlcv)
+    frame["const"] = 1.5
+    frame["shifted"] = ohlcv["close"].iloc[::-1]  # 逆順 index → 整列される
+
+    result = frame.to_frame()
+    assert (result["const"] == 1.5).all()
+    np.testing.assert_array_equal(result["shifted"].to_numpy(), ohlcv["close"].to_numpy())
+    assert list(result.columns) == list(ohlcv.columns) + ["const", "shifted"]
+
+
+def test_length_mismatch_raises(ohlcv):
+    """行数不一致の配列代入は ValueError."""
+    frame = FeatureFrame(ohlcv)
+    with pytest.raises(ValueError):
+        frame["bad"] = np.zeros(len(ohlcv) - 1)
+
+
+def test_slice_rows_builds_partial_frame(ohlcv):
+    """slice_rows は指定行のみの DataFrame を返す."""
+    frame = FeatureFrame(ohlcv)
+    frame["x"] = np.arange(len(ohlcv), dtype=float)
+    tail = frame.slice_rows(-1)
+    assert len(tail) == 1
+    assert tail.index[0] == ohlcv.index[-1]
+    assert tail["x"].iloc[0] == len(ohlcv) - 1
+
+
+def test_pipeline_does_not_mutate_input(ohlcv):
+    """パイプラインは入力 DataFrame を変更しない（入力側コピー不要）."""
+    original = ohlcv.copy()
+    result = FeatureGenerator()._run_feature_pipeline(ohlcv)
+
+    pd.testing.assert_frame_equal(ohlcv, original)
+    assert isinstance(result, pd.DataFrame)
+    assert "rsi_14" in result.columns and "rsi_14" not in ohlcv.columns
+
+
+def test_stage_accepts_dataframe_for_backward_compatibility(ohlcv):
+    """単体ステージ呼び出しは DataFrame を受け取り DataFrame を返す."""
+    generator = FeatureGenerator()
+    result = generator._generate_technical_indicators(ohlcv)
+
+    assert isinstance(result, pd.DataFrame)
+    assert "rsi_14" in result.columns
+    assert "rsi_14" not in ohlcv.columns
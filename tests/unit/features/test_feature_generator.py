@@ -28,7 +28,12 @@ import pandas as pd
 import pytest
 
 from src.core.exceptions import DataProcessingError
-from src.features.feature_generator import OPTIMIZED_FEATURES, FeatureGenerator
+from src.features.constants import FEATURE_WARMUP_ROWS
+from src.features.feature_generator import (
+    OPTIMIZED_FEATURES,
+    FeatureGenerator,
+    rolling_mean_abs_deviation,
+)
 
 # 戦略シグナル特徴量（6戦略）
 STRATEGY_SIGNAL_FEATURES = [
@@ -588,6 +593,20 @@ class TestPhase72NewIndicators:
         assert len(cci) == len(sample_df)
         assert not cci.isna().any()
 
+    @pytest.mark.parametrize("n", [1, 5, 19, 20, 21, 300])
+    def test_rolling_mean_abs_deviation_matches_rolling_apply(self, n):
+        """ベクトル化MADが rolling.apply 版と一致すること（min_periods=1 のウォームアップ含む）"""
+        values = np.random.default_rng(n).uniform(100, 120, n)
+        if n > 50:
+            values[30] = np.nan
+        expected = (
+            pd.Series(values)
+            .rolling(window=20, min_periods=1)
+            .apply(lambda x: np.abs(x - x.mean()).mean(), raw=True)
+            .to_numpy()
+        )
+        np.testing.assert_array_equal(rolling_mean_abs_deviation(values, 20), expected)
+
     def test_williams_r_calculation(self, generator, sample_df):
         """Williams %Rが-100〜0の範囲で計算されること"""
         wr = generator._calculate_williams_r(sample_df)
@@ -1391,3 +1410,154 @@ class TestFeatureCacheIntegration:
         assert stats["hits"] == 0
         assert stats["misses"] == 0
         assert len(cache) == 0
+
+
+class TestGenerateFeaturesCausal:
+    """全履歴の因果的特徴量一括計算（generate_features_causal）テスト"""
+
+    N_ROWS = 160
+
+    class _LastRowRegimeClassifier:
+        """末尾行の close のみから確率を決めるスタブ（行毎計算の検証用）."""
+
+        def get_hmm_state_probabilities(self, df):
+            last = float(df["close"].iloc[-1])
+            bear = (last % 1000) / 2000
+            return {"hmm_state_bear_prob": bear, "hmm_state_bull_prob": 0.5 - bear}
+
+    @pytest.fixture(scope="class")
+    def ohlcv(self):
+        rng = np.random.default_rng(3)
+        n = self.N_ROWS
+        close = 5_000_000 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+        return pd.DataFrame(
+            {
+                "open": close,
+                "high": close * (1 + np.abs(rng.normal(0, 0.002, n))),
+                "low": close * (1 - np.abs(rng.normal(0, 0.002, n))),
+                "close": close,
+                "volume": rng.lognormal(1.0, 0.4, n),
+            },
+            index=pd.date_range("2026-01-01", periods=n, freq="15min"),
+        )
+
+    @pytest.fixture(scope="class")
+    def generator(self):
+        return FeatureGenerator(regime_classifier=self._LastRowRegimeClassifier())
+
+    @pytest.fixture(scope="class")
+    def causal_features(self, generator, ohlcv):
+        return generator.generate_features_causal(ohlcv)
+
+    @pytest.mark.parametrize("row", [0, 1, 19, 49, 99, 127, 128, 140, 159])
+    def test_matches_prefix_method(self, generator, ohlcv, causal_features, row):
+        """行 i がプレフィックス計算 generate_features_sync(df.iloc[:i+1]) の末尾行と一致."""
+        import os
+        from unittest.mock import patch
+
+        with patch.dict(os.environ, {"BACKTEST_MODE": "true"}):
+            prefix = generator.generate_features_sync(ohlcv.iloc[: row + 1]).iloc[-1]
+
+        actual = causal_features.iloc[row]
+        assert list(actual.index) == list(prefix.index)
+        np.testing.assert_allclose(
+            actual.to_numpy(dtype=float), prefix.to_numpy(dtype=float), rtol=1e-12, equal_nan=True
+        )
+
+    def test_future_rows_do_not_affect_past(self, generator, ohlcv, causal_features):
+        """末尾行を改変しても、それ以前の行の特徴量は変化しない."""
+        perturbed = ohlcv.copy()
+        perturbed.iloc[-10:, perturbed.columns.get_loc("close")] *= 1.05
+        perturbed_features = generator.generate_features_causal(perturbed, warmup_rows=0)
+
+        start = FEATURE_WARMUP_ROWS
+        pd.testing.assert_frame_equal(
+            perturbed_features.iloc[start:-10], causal_features.iloc[start:-10]
+        )
+
+    def test_same_shape_as_input(self, ohlcv, causal_features):
+        """入力と同じ行数・同じ index."""
+        assert len(causal_features) == len(ohlcv)
+        assert causal_features.index.equals(ohlcv.index)
+
+
+class TestGenerateFeaturesMulti:
+    """複数タイムフレーム並列生成（generate_features_multi）テスト"""
+
+    @pytest.fixture(autouse=True)
+    def _reset_cache(self):
+        """各テストでキャッシュをリセット."""
+        from src.features.feature_cache import reset_feature_cache
+
+        reset_feature_cache()
+        yield
+        reset_feature_cache()
+
+    @staticmethod
+    def _ohlcv(freq: str, seed: int) -> pd.DataFrame:
+        n = 100
+        rng = np.random.default_rng(seed)
+        close = 5_000_000 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+        idx = pd.date_range("2026-01-01", periods=n, freq=freq)
+        return pd.DataFrame(
+            {
+                "open": close,
+                "high": close * 1.002,
+                "low": close * 0.998,
+                "close": close,
+                "volume": rng.lognormal(1.0, 0.4, n),
+            },
+            index=idx,
+        )
+
+    @pytest.fixture
+    def frames(self):
+        return {"15m": self._ohlcv("15min", 1), "4h": self._ohlcv("4h", 2)}
+
+    @pytest.mark.asyncio
+    async def test_matches_sequential_generation(self, frames):
+        """並列生成の結果は generate_features の逐次呼び出しと一致し、順序も保持される."""
+        from src.features.feature_cache import reset_feature_cache
+
+        sequential_generator = FeatureGenerator()
+        sequential = {
+            timeframe: await sequential_generator.generate_features(df)
+            for timeframe, df in frames.items()
+        }
+        reset_feature_cache()
+
+        parallel_generator = FeatureGenerator()
+        parallel = await parallel_generator.generate_features_multi(frames)
+
+        assert list(parallel) == list(frames)
+        for timeframe in frames:
+            pd.testing.assert_frame_equal(parallel[timeframe], sequential[timeframe])
+        assert list(parallel_generator._btc_history) == list(sequential_generator._btc_history)
+
+    @pytest.mark.asyncio
+    async def test_failed_timeframe_does_not_block_others(self, frames):
+        """1 タイムフレームの失敗は例外として返り、他のタイムフレームは生成される."""
+        frames["1h"] = pd.DataFrame({"close": [1.0, 2.0]})
+
+        results = await FeatureGenerator().generate_features_multi(frames)
+
+        assert isinstance(results["1h"], DataProcessingError)
+        assert isinstance(results["15m"], pd.DataFrame) and not results["15m"].empty
+        assert isinstance(results["4h"], pd.DataFrame) and not results["4h"].empty
+
+    @pytest.mark.asyncio
+    async def test_disabled_falls_back_to_sequential(self, frames):
+        """features.parallel.enabled=false ではスレッドプールを使わない."""
+        from unittest.mock import patch
+
+        generator = FeatureGenerator()
+        with patch(
+            "src.features.feature_generator.get_threshold",
+            side_effect=lambda key, default=None: (
+                False if key == "features.parallel.enabled" else default
+            ),
+        ):
+            results = await generator.generate_features_multi(frames)
+
+        assert generator._executor is None
+        assert set(results) == set(frames)
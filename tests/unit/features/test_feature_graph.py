@@ -0,0 +1,143 @@
+"""
+FeatureGraph テスト
+
+特徴量依存グラフ（src/features/feature_graph.py）の依存解決と、
+FeatureGenerator の遅延計算（required_features 指定時）の挙動を確認する。
+"""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.config.feature_manager import get_feature_names
+from src.features.feature_generator import FeatureGenerator
+from src.features.feature_graph import FEATURE_NODES, FeatureGraph, collect_required_features
+
+
+@pytest.fixture
+def ohlcv() -> pd.DataFrame:
+    n = 120
+    rng = np.random.default_rng(5)
+    close = 5_000_000 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+    idx = pd.date_range("2026-01-01", periods=n, freq="15min")
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close * 1.002,
+            "low": close * 0.998,
+            "close": close,
+            "volume": rng.lognormal(1.0, 0.4, n),
+        },
+        index=idx,
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_feature_cache(monkeypatch):
+    """キャッシュヒットでパイプラインが省略されないよう sync 版のキャッシュを無効化."""
+    monkeypatch.setenv("BACKTEST_MODE", "true")
+
+
+def _strategy(required, optional=(), enabled=True) -> MagicMock:
+    strategy = MagicMock()
+    strategy.is_enabled = enabled
+    strategy.get_required_features.return_value = list(required)
+    strategy.get_optional_features.return_value = list(optional)
+    return strategy
+
+
+class TestFeatureGraph:
+    """依存解決テスト"""
+
+    def test_resolve_includes_transitive_inputs(self):
+        """交互作用特徴量は入力列の生成ノードまで辿る."""
+        active = FeatureGraph().resolve(["rsi_x_atr"])
+        assert active == {"rsi_x_atr", "rsi", "atr"}
+
+    def test_resolve_ignores_raw_and_unknown_columns(self):
+        """OHLCV・strategy_signal_* 等のグラフ外の列はノードを追加しない."""
+        assert FeatureGraph().resolve(["close", "strategy_signal_ATRBased"]) == set()
+
+    def test_all_ml_features_have_producer(self):
+        """feature_order.json の ML 特徴量（OHLCV 以外）は全てグラフで生成される."""
+        graph = FeatureGraph()
+        missing = [
+            name
+            for name in get_feature_names()
+            if name not in ("close", "volume") and graph.producer_of(name) is None
+        ]
+        assert missing == []
+
+    def test_nodes_are_topologically_ordered(self):
+        """全ノードの入力列は、先行ノードの出力か入力 DataFrame の列."""
+        available = {"open", "high", "low", "close", "volume", "timestamp"}
+        for node in FEATURE_NODES:
+            assert set(node.inputs) <= available, node.name
+            available.update(node.outputs)
+
+    def test_extra_inputs_extend_node(self):
+        """実行時の追加入力列（HMM 入力特徴量）も依存に含まれる."""
+        graph = FeatureGraph(extra_inputs={"hmm_state": ("atr_14",)})
+        assert "atr" in graph.resolve(["hmm_state_bull_prob"])
+
+    def test_recursive_outputs_include_derived_columns(self):
+        """EMA 系ノードの出力とその派生列のみが先頭行依存（部分再計算の一致判定対象外）."""
+        recursive = FeatureGraph().recursive_outputs()
+        assert {"ema_50", "macd", "volume_ema", "macd_lag_1", "macd_x_volume"} <= recursive
+        assert not {"rsi_14", "atr_14", "close_ma_20", "vpin"} & recursive
+
+
+class TestCollectRequiredFeatures:
+    """要求特徴量集合の構築テスト"""
+
+    def test_disabled_strategy_is_skipped(self):
+        """無効化された戦略の必要特徴量は要求に含まれない."""
+        required = collect_required_features(
+            strategies=[
+                _strategy(["cmf_20"], optional=["stoch_k"]),
+                _strategy(["williams_r_14"], enabled=False),
+            ]
+        )
+        assert {"cmf_20", "stoch_k"} <= required
+        assert "williams_r_14" not in required
+        assert set(get_feature_names()) <= required
+
+
+class TestLazyFeatureGeneration:
+    """FeatureGenerator の遅延計算テスト"""
+
+    def test_only_required_nodes_computed(self, ohlcv):
+        """要求外の戦略専用指標は計算されず、要求列は全計算時と一致する."""
+        generator = FeatureGenerator()
+        full = generator.generate_features_sync(ohlcv)
+
+        lazy = generator.generate_features_sync(ohlcv, required_features=["rsi_x_atr", "cmf_20"])
+
+        for column in ("cci_20", "stoch_k", "williams_r_14", "vpin", "hmm_state_bull_prob"):
+            assert column not in lazy.columns
+        for column in ("rsi_x_atr", "rsi_14", "atr_14", "cmf_20"):
+            np.testing.assert_allclose(lazy[column].to_numpy(), full[column].to_numpy())
+        assert set(generator.get_node_profile()) == {"rsi", "atr", "cmf", "rsi_x_atr"}
+
+    def test_none_computes_all_nodes(self, ohlcv):
+        """required_features=None は従来通り全ノードを計算し、全ノードの処理時間を記録."""
+        generator = FeatureGenerator()
+        result = generator.generate_features_sync(ohlcv)
+
+        assert {"cci_20", "stoch_d", "williams_r_14", "bb_upper"} <= set(result.columns)
+        profile = generator.get_node_profile()
+        assert set(profile) == {node.name for node in FEATURE_NODES}
+        assert list(profile.values()) == sorted(profile.values(), reverse=True)
+
+    def test_causal_respects_required_features(self, ohlcv):
+        """因果的一括計算でも要求外ノードはスキップされる."""
+        generator = FeatureGenerator()
+        result = generator.generate_features_causal(
+            ohlcv, warmup_rows=4, required_features=["stoch_k", "stoch_d"]
+        )
+
+        assert len(result) == len(ohlcv)
+        assert {"stoch_k", "stoch_d"} <= set(result.columns)
+        assert "cci_20" not in result.columns
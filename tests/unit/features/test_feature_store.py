@@ -0,0 +1,180 @@
+"""
+FeatureStore テスト
+
+特徴量ストア（src/features/feature_store.py）の保存・ロード・キー生成・
+無効化ルール（prune）を確認する。
+"""
+
+import json
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.feature_store import FeatureStore
+
+
+@pytest.fixture
+def ohlcv() -> pd.DataFrame:
+    n = 50
+    rng = np.random.default_rng(11)
+    close = 5_000_000 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+    idx = pd.date_range("2026-01-01", periods=n, freq="15min", tz="Asia/Tokyo")
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close * 1.002,
+            "low": close * 0.998,
+            "close": close,
+            "volume": rng.lognormal(1.0, 0.4, n),
+        },
+        index=idx,
+    )
+
+
+@pytest.fixture
+def store(tmp_path) -> FeatureStore:
+    return FeatureStore(root=str(tmp_path), enabled=True, max_size_mb=100, max_age_days=30)
+
+
+def _features(ohlcv: pd.DataFrame) -> pd.DataFrame:
+    features = ohlcv.copy()
+    features["rsi_14"] = np.linspace(0, 100, len(ohlcv))
+    features["hour"] = ohlcv.index.hour.astype(np.int32)
+    return features
+
+
+class TestFeatureStoreRoundTrip:
+    """保存・ロードテスト"""
+
+    def test_put_and_get_roundtrip(self, store, ohlcv):
+        """列・dtype・tz 付き index が保存前と一致する."""
+        features = _features(ohlcv)
+        key = store.compute_key(ohlcv)
+        assert store.put(key, features)
+
+        loaded = store.get(key)
+        pd.testing.assert_frame_equal(loaded, features, check_freq=False)
+        # ロード結果は書き込み可能（呼び出し側の列追加・置換に対応）
+        loaded["rsi_14"] = 0.0
+        assert store.stats()["hits"] == 1
+
+    def test_load_or_compute_computes_once(self, store, ohlcv):
+        """2 回目以降は計算関数を呼ばずにロードする."""
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return _features(ohlcv)
+
+        first = store.load_or_compute(ohlcv, compute)
+        second = store.load_or_compute(ohlcv, compute)
+
+        assert len(calls) == 1
+        pd.testing.assert_frame_equal(first, second, check_freq=False)
+
+    @pytest.mark.asyncio
+    async def test_load_or_compute_async_shares_entry(self, store, ohlcv):
+        """非同期版も同じキーで保存し、同期版からヒットする（学習スクリプト経路）."""
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return _features(ohlcv)
+
+        first = await store.load_or_compute_async(ohlcv, compute, variant="primary")
+        second = await store.load_or_compute_async(ohlcv, compute, variant="primary")
+        synced = store.load_or_compute(ohlcv, lambda: calls.append(1), variant="primary")
+
+        assert len(calls) == 1
+        pd.testing.assert_frame_equal(first, second, check_freq=False)
+        pd.testing.assert_frame_equal(first, synced, check_freq=False)
+
+    def test_disabled_store_always_computes(self, tmp_path, ohlcv):
+        """無効化時は保存せず毎回計算する."""
+        store = FeatureStore(root=str(tmp_path), enabled=False)
+        store.load_or_compute(ohlcv, lambda: _features(ohlcv))
+        assert store.list_entries() == []
+
+    def test_corrupt_entry_is_miss(self, store, ohlcv):
+        """列ファイル欠損エントリはミス扱いで削除される."""
+        key = store.compute_key(ohlcv)
+        store.put(key, _features(ohlcv))
+        (store.root / key / "0.npy").unlink()
+
+        assert store.get(key) is None
+        assert not (store.root / key).exists()
+
+
+class TestFeatureStoreKey:
+    """キー生成テスト"""
+
+    def test_key_changes_with_source_data(self, store, ohlcv):
+        """入力データが 1 値でも異なれば別キー."""
+        changed = ohlcv.copy()
+        changed.iloc[-1, changed.columns.get_loc("close")] += 1.0
+        assert store.compute_key(ohlcv) != store.compute_key(changed)
+        assert store.compute_key(ohlcv) == store.compute_key(ohlcv.copy())
+
+    def test_key_changes_with_versions(self, store, ohlcv):
+        """feature_order.json バージョン・生成コードバージョン・特徴量設定・variant で別キー."""
+        base = store.compute_key(ohlcv)
+        with patch("src.features.feature_store.get_feature_order_version", return_value="v0.0.0"):
+            assert store.compute_key(ohlcv) != base
+        with patch("src.features.feature_store.get_generator_code_version", return_value="0" * 16):
+            assert store.compute_key(ohlcv) != base
+        assert store.compute_key(ohlcv, variant="primary") != base
+
+    def test_key_changes_with_feature_config(self, store, ohlcv):
+        """特徴量の値を決める設定（volume_ratio 期間等）が変われば別キー・旧エントリは stale."""
+        key = store.compute_key(ohlcv)
+        store.put(key, _features(ohlcv))
+
+        def changed_config(path, default=None):
+            if path == "anomaly_detection":
+                return {"volume_ratio": {"calculation_period": 30}}
+            return default
+
+        with patch("src.features.feature_store.get_threshold", side_effect=changed_config):
+            assert store.compute_key(ohlcv) != key
+            assert store.prune(dry_run=True) == [key]
+
+
+class TestFeatureStorePrune:
+    """無効化ルールテスト"""
+
+    def test_prune_removes_stale_entries(self, store, ohlcv):
+        """旧生成コードで作られたエントリは prune で削除される."""
+        key = store.compute_key(ohlcv)
+        store.put(key, _features(ohlcv))
+
+        with patch("src.features.feature_store.get_generator_code_version", return_value="0" * 16):
+            assert store.prune(dry_run=True) == [key]
+            assert (store.root / key).exists()
+            assert store.prune() == [key]
+        assert store.list_entries() == []
+
+    def test_prune_removes_expired_entries(self, store, ohlcv):
+        """max_age_days を超えたエントリは削除される."""
+        key = store.compute_key(ohlcv)
+        store.put(key, _features(ohlcv))
+        meta_path = store.root / key / "meta.json"
+        meta = json.loads(meta_path.read_text())
+        meta["created_at"] = (datetime.now() - timedelta(days=31)).isoformat()
+        meta_path.write_text(json.dumps(meta))
+
+        assert store.prune() == [key]
+
+    def test_prune_size_limit_evicts_least_recently_accessed(self, store, ohlcv):
+        """合計サイズ超過時は最終アクセスが古いエントリから削除される."""
+        old_key = store.compute_key(ohlcv, variant="old")
+        new_key = store.compute_key(ohlcv, variant="new")
+        store.put(old_key, _features(ohlcv))
+        store.put(new_key, _features(ohlcv))
+        store.get(new_key)
+
+        entry_mb = store.list_entries()[0]["size_bytes"] / 1024 / 1024
+        assert store.prune(max_size_mb=entry_mb * 1.5) == [old_key]
+        assert store.get(new_key) is not None
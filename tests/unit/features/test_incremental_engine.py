@@ -0,0 +1,121 @@
+"""
+IncrementalFeatureEngine テスト
+
+ストリーミング特徴量エンジン（src/features/incremental_engine.py）が
+バッチパイプライン（FeatureGenerator._run_feature_pipeline）と一致することを確認する。
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.exceptions import DataProcessingError
+from src.features.feature_generator import FeatureGenerator
+from src.features.incremental_engine import FEATURE_COLUMNS, IncrementalFeatureEngine
+
+OHLCV = ["open", "high", "low", "close", "volume"]
+
+
+def _make_ohlcv(n: int = 320, seed: int = 7) -> pd.DataFrame:
+    """ランダムウォークの OHLCV DataFrame を作成."""
+    rng = np.random.default_rng(seed)
+    close = 5_000_000 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+    high = close * (1 + np.abs(rng.normal(0, 0.002, n)))
+    low = close * (1 - np.abs(rng.normal(0, 0.002, n)))
+    open_ = np.r_[close[0], close[:-1]]
+    volume = rng.lognormal(1.0, 0.4, n)
+    idx = pd.date_range("2026-01-01", periods=n, freq="15min")
+    return pd.DataFrame(
+        {"open": open_, "high": high, "low": low, "close": close, "volume": volume}, index=idx
+    )
+
+
+@pytest.fixture
+def ohlcv() -> pd.DataFrame:
+    return _make_ohlcv()
+
+
+@pytest.fixture
+def batch_features(ohlcv) -> pd.DataFrame:
+    generator = FeatureGenerator()
+    return generator._run_feature_pipeline(ohlcv.copy())
+
+
+def test_output_columns_match_batch(ohlcv, batch_features):
+    """出力列がバッチと同一集合・同一順序."""
+    engine = IncrementalFeatureEngine(history_size=len(ohlcv))
+    engine.warm_up(ohlcv)
+    assert list(engine.to_frame().columns) == list(batch_features.columns)
+
+
+def test_streaming_matches_batch_after_warmup(ohlcv, batch_features):
+    """warm-up 以降の全行・全列がバッチと許容誤差内で一致."""
+    engine = IncrementalFeatureEngine(history_size=len(ohlcv))
+    engine.warm_up(ohlcv)
+    streamed = engine.to_frame()
+
+    start = IncrementalFeatureEngine.WARMUP_ROWS
+    for col in OHLCV + FEATURE_COLUMNS:
+        np.testing.assert_allclose(
+            streamed[col].to_numpy(dtype=float)[start:],
+            batch_features[col].to_numpy(dtype=float)[start:],
+            rtol=1e-7,
+            atol=1e-7,
+            err_msg=col,
+        )
+
+
+def test_update_after_warm_up_matches_batch_last_row(ohlcv):
+    """warm_up 済みの状態に 1 本追加した結果がバッチの最終行と一致."""
+    history, new_candle = ohlcv.iloc[:-1], ohlcv.iloc[-1]
+    engine = IncrementalFeatureEngine()
+    engine.warm_up(history)
+    row = engine.update(new_candle)
+
+    expected = FeatureGenerator()._run_feature_pipeline(ohlcv.copy()).iloc[-1]
+    for col in FEATURE_COLUMNS:
+        assert row[col] == pytest.approx(float(expected[col]), rel=1e-7, abs=1e-7), col
+
+
+def test_external_values_are_applied(ohlcv):
+    """external_values / hmm_probs が最新行に反映される."""
+    engine = IncrementalFeatureEngine()
+    engine.warm_up(ohlcv.iloc[:-1])
+    row = engine.update(
+        ohlcv.iloc[-1],
+        external_values={"funding_rate_8h_avg": 0.0001, "fear_greed_index": 55.0},
+        hmm_probs={"hmm_state_bear_prob": 0.2, "hmm_state_bull_prob": 0.7},
+    )
+    assert row["funding_rate_8h_avg"] == 0.0001
+    assert row["fear_greed_index"] == 55.0
+    assert row["btc_funding_premium"] == pytest.approx(0.0001 * 365 * 3)
+    assert row["hmm_state_bear_prob"] == 0.2
+    assert row["hmm_state_bull_prob"] == 0.7
+
+
+def test_history_size_bounds_output(ohlcv):
+    """to_frame() は直近 history_size 行のみ保持し、最新行の日時が index 末尾."""
+    engine = IncrementalFeatureEngine(history_size=50)
+    engine.warm_up(ohlcv)
+    frame = engine.to_frame()
+    assert len(frame) == 50
+    assert frame.index[-1] == ohlcv.index[-1]
+    assert engine.rows_processed == len(ohlcv)
+
+
+def test_no_nan_in_filled_features(ohlcv):
+    """NaN 処理対象の特徴量は warm-up 中も NaN を含まない."""
+    engine = IncrementalFeatureEngine(history_size=len(ohlcv))
+    engine.warm_up(ohlcv.iloc[:30])
+    frame = engine.to_frame()
+    for col in ("bb_position", "volume_lag_3", "close_std_5", "rsi_lag_1"):
+        assert not frame[col].isna().any(), col
+
+
+def test_missing_columns_raise():
+    """必要列不足は DataProcessingError."""
+    engine = IncrementalFeatureEngine()
+    with pytest.raises(DataProcessingError):
+        engine.warm_up(pd.DataFrame({"close": [1.0, 2.0]}))
+    with pytest.raises(DataProcessingError):
+        engine.update({"close": 1.0})
@@ -0,0 +1,118 @@
+"""Phase 90: CV fold 並列評価・fold 境界ベクトル化のテスト.
+
+fold_bounds/split が旧ループ実装と同一の index を返すこと、並列評価が直列評価と
+同一の結果（fold 順）を返すこと、大きな入力がワーカーで読み取り専用メモリマップとして
+共有されることを検証する。
+"""
+
+import time
+
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import f1_score
+
+from src.ml.cv import PurgedKFold, clone_estimator, evaluate_folds
+
+
+def _loop_split(n, n_splits, embargo_pct):
+    """Phase 90 以前の PurgedKFold.split ループ実装"""
+    embargo = int(n * embargo_pct)
+    all_idx = np.arange(n)
+    fold_size = n // n_splits
+    for i in range(n_splits):
+        test_start = i * fold_size
+        test_end = (i + 1) * fold_size if i < n_splits - 1 else n
+        embargo_start = max(0, test_start - embargo)
+        embargo_end = min(n, test_end + embargo)
+        train_idx = np.concatenate([all_idx[:embargo_start], all_idx[embargo_end:]])
+        yield train_idx, all_idx[test_start:test_end]
+
+
+@pytest.mark.parametrize(
+    "n,n_splits,embargo_pct",
+    [(100, 5, 0.01), (103, 4, 0.05), (10, 3, 0.5), (7, 7, 0.0), (1000, 2, 0.3)],
+)
+def test_split_matches_loop_implementation(n, n_splits, embargo_pct):
+    cv = PurgedKFold(n_splits=n_splits, embargo_pct=embargo_pct)
+    actual = list(cv.split(np.zeros((n, 1))))
+    expected = list(_loop_split(n, n_splits, embargo_pct))
+
+    assert len(actual) == len(expected)
+    for (train, test), (exp_train, exp_test) in zip(actual, expected):
+        assert train.dtype == exp_train.dtype
+        np.testing.assert_array_equal(train, exp_train)
+        np.testing.assert_array_equal(test, exp_test)
+
+
+def test_fold_bounds_large_n_is_fast():
+    """数十万サンプルでも境界計算・split が即時."""
+    n = 500_000
+    cv = PurgedKFold(n_splits=5, embargo_pct=0.01)
+    start = time.perf_counter()
+    bounds = cv.fold_bounds(n)
+    sizes = [len(train) + len(test) for train, test in cv.split(np.empty(n))]
+    assert time.perf_counter() - start < 2.0
+
+    assert bounds.shape == (5, 4)
+    assert bounds[0, 0] == 0 and bounds[-1, 1] == n
+    # train + test + embargo（両端で切り詰め）= n
+    embargo = int(n * 0.01)
+    assert sizes[0] == n - embargo and sizes[2] == n - 2 * embargo
+
+
+def _fit_score(X, y, train_idx, test_idx, fold, estimator):
+    model = clone_estimator(estimator, n_threads=1)
+    model.fit(X[train_idx], y[train_idx])
+    return fold, f1_score(y[test_idx], model.predict(X[test_idx]), average="macro")
+
+
+def _read_only(X, y, train_idx, test_idx, fold):
+    return isinstance(X, np.memmap), X.flags.writeable
+
+
+def _dataset(n=600):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(n, 5))
+    y = (X[:, 0] + rng.normal(0, 0.5, n) > 0).astype(int)
+    return X, y
+
+
+def test_parallel_matches_serial():
+    X, y = _dataset()
+    cv = PurgedKFold(n_splits=4, embargo_pct=0.01)
+    kwargs = {"estimator": RandomForestClassifier(n_estimators=20, random_state=0)}
+
+    serial = evaluate_folds(cv, X, y, _fit_score, n_jobs=1, fold_kwargs=kwargs)
+    parallel = evaluate_folds(cv, X, y, _fit_score, n_jobs=2, fold_kwargs=kwargs)
+
+    assert [fold for fold, _ in parallel] == [0, 1, 2, 3]
+    assert parallel == serial
+
+
+def test_workers_share_read_only_memmap():
+    X, y = _dataset()
+    cv = PurgedKFold(n_splits=3, embargo_pct=0.0)
+
+    results = evaluate_folds(cv, X, y, _read_only, n_jobs=2, max_nbytes="1K")
+
+    assert results == [(True, False)] * 3
+    # 直列時は元の配列をそのまま渡す
+    assert evaluate_folds(cv, X, y, _read_only, n_jobs=1) == [(False, True)] * 3
+
+
+def test_clone_estimator_sets_threads_without_touching_original():
+    estimator = RandomForestClassifier(n_estimators=5, n_jobs=-1)
+    fresh = clone_estimator(estimator, n_threads=2)
+
+    assert fresh is not estimator
+    assert fresh.n_jobs == 2
+    assert estimator.n_jobs == -1
+    assert clone_estimator(estimator).n_jobs == -1
+
+
+def test_clone_estimator_never_raises_configured_threads():
+    """設定済みの n_jobs（RandomForest の 1 等）は n_threads まで増やさない."""
+    assert clone_estimator(RandomForestClassifier(n_jobs=1), n_threads=4).n_jobs == 1
+    assert clone_estimator(RandomForestClassifier(n_jobs=8), n_threads=4).n_jobs == 4
+    assert clone_estimator(RandomForestClassifier(n_jobs=None), n_threads=4).n_jobs == 4
@@ -359,6 +359,8 @@ class TestAlignFeatures:
         aligned = model._align_features(X)
 
         assert list(aligned.columns) == model.feature_names
+        # Phase 90: 列順序が一致していれば再構築せずそのまま返す
+        assert aligned is X
 
     def test_align_with_missing_features(self, model):
         """不足特徴量の補完テスト"""
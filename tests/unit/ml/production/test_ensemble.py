@@ -7,13 +7,16 @@ ProductionEnsemble テストファイル - Phase 64.6更新
 Phase 64.6: StackingEnsembleテスト削除
 """
 
+import os
+import threading
+from typing import Optional
 from unittest.mock import MagicMock
 
 import numpy as np
 import pytest
 
 from src.features.constants import EXPECTED_FEATURE_COUNT
-from src.ml.ensemble import ProductionEnsemble
+from src.ml.ensemble import ProductionEnsemble, _limit_model_threads, reset_inference_pool
 
 
 class TestProductionEnsemble:
@@ -105,6 +108,27 @@ class TestProductionEnsemble:
         with pytest.raises(ValueError, match="特徴量数不一致"):
             ensemble.predict_proba(wrong_data)
 
+    def test_predict_with_proba_matches_separate_calls(self, ensemble, mock_models, sample_data):
+        """predict_with_proba は predict/predict_proba と同一結果・各モデル推論 1 回（Phase 90）"""
+        expected_labels = ensemble.predict(sample_data)
+        expected_probas = ensemble.predict_proba(sample_data)
+        for model in mock_models.values():
+            model.predict_proba.reset_mock()
+
+        labels, probas = ensemble.predict_with_proba(sample_data)
+
+        np.testing.assert_array_equal(labels, expected_labels)
+        assert probas.tobytes() == expected_probas.tobytes()
+        for model in mock_models.values():
+            model.predict_proba.assert_called_once()
+
+    def test_required_lookback(self, ensemble, mock_models):
+        """required_lookback はメンバーの最大値・未定義メンバーは 0（Phase 90）"""
+        assert ensemble.required_lookback == 0
+
+        mock_models["random_forest"].required_lookback = 5
+        assert ensemble.required_lookback == 5
+
     def test_get_model_info(self, ensemble):
         """モデル情報取得テスト"""
         info = ensemble.get_model_info()
@@ -349,6 +373,16 @@ class TestProductionEnsembleEdgeCases:
         assert isinstance(predictions, np.ndarray)
         assert probabilities.shape == (len(sample_data), 2)
 
+    def test_weights_not_shared_between_instances(self, mock_models):
+        """Phase 90: 重み変更（0 = 推論対象外）が他のインスタンスに波及しない"""
+        first = ProductionEnsemble(mock_models)
+        first.weights["lightgbm"] = 0
+        first.update_weights({"xgboost": 0.9})
+
+        second = ProductionEnsemble(mock_models)
+        assert second.weights["lightgbm"] > 0
+        assert "lightgbm" in second._active_models()
+
     def test_large_dataset_performance(self, mock_models):
         """大規模データセット性能テスト"""
         ensemble = ProductionEnsemble(mock_models)
@@ -375,3 +409,95 @@ class TestProductionEnsembleEdgeCases:
 
         ensemble = ProductionEnsemble({"fallback": mock_model})
         assert ensemble.n_features_ == EXPECTED_FEATURE_COUNT
+
+
+class _ThreadRecordingModel:
+    """推論時の n_jobs と実行スレッドを記録する sklearn API 互換モデル"""
+
+    def __init__(self, seed: int, n_jobs: Optional[int] = None, fail: bool = False):
+        self.n_jobs = n_jobs
+        self.n_features_in_ = EXPECTED_FEATURE_COUNT
+        self._weights = np.random.default_rng(seed).random((EXPECTED_FEATURE_COUNT, 3))
+        self._fail = fail
+        self.seen_n_jobs = []
+        self.seen_threads = []
+
+    def get_params(self, deep=True):
+        return {"n_jobs": self.n_jobs}
+
+    def set_params(self, **params):
+        self.n_jobs = params["n_jobs"]
+        return self
+
+    def predict_proba(self, X):
+        self.seen_n_jobs.append(self.n_jobs)
+        self.seen_threads.append(threading.current_thread().name)
+        if self._fail:
+            raise RuntimeError("member crashed")
+        scores = np.asarray(X) @ self._weights
+        return scores / scores.sum(axis=1, keepdims=True)
+
+
+class TestProductionEnsembleParallelInference:
+    """Phase 90: 個別モデル並列推論テスト"""
+
+    @pytest.fixture(autouse=True)
+    def _reset_pool(self):
+        yield
+        reset_inference_pool()
+
+    @pytest.fixture
+    def members(self):
+        # 本番の既定値: LightGBM 4.x・XGBoost は n_jobs=None、RandomForest は n_jobs=1（Phase 53.2）
+        return {
+            "lightgbm": _ThreadRecordingModel(1),
+            "xgboost": _ThreadRecordingModel(2),
+            "random_forest": _ThreadRecordingModel(3, n_jobs=1),
+        }
+
+    def test_parallel_matches_sequential(self, members):
+        """並列推論は逐次と完全一致し、共有プール上で n_jobs を制限・復元する."""
+        ensemble = ProductionEnsemble(members)
+        X = np.random.default_rng(0).random((50, EXPECTED_FEATURE_COUNT))
+
+        sequential = ensemble.predict_proba(X, parallel=False)
+        parallel = ensemble.predict_proba(X, parallel=True)
+
+        assert parallel.tobytes() == sequential.tobytes()
+        assert set(ensemble.last_member_timings) == set(members)
+        member_threads = max(1, (os.cpu_count() or 1) // len(members))
+        for model in members.values():
+            assert model.seen_threads[0] == threading.current_thread().name
+            assert model.seen_threads[1].startswith("ensemble-infer")
+        # 未指定（None）は共有プールの 1 モデル当たりスレッド数に制限・RandomForest は 1 のまま
+        assert members["lightgbm"].seen_n_jobs[1] == member_threads
+        assert members["xgboost"].seen_n_jobs[1] == member_threads
+        assert members["random_forest"].seen_n_jobs == [1, 1]
+        # 推論後は元の n_jobs に戻る
+        assert members["lightgbm"].n_jobs is None
+        assert members["random_forest"].n_jobs == 1
+
+    def test_limit_never_raises_configured_threads(self):
+        """n_jobs は設定値より増やさず、未指定・0 以下のみ上限値を設定."""
+        for original, expected in [(None, 4), (-1, 4), (0, 4), (2, 2), (1, 1), (8, 4)]:
+            model = _ThreadRecordingModel(0, n_jobs=original)
+            with _limit_model_threads(model, 4):
+                assert model.n_jobs == expected
+            assert model.n_jobs == original
+
+    def test_small_input_runs_sequentially(self, members):
+        """min_rows 未満の行数は呼び出しスレッドで逐次実行."""
+        ensemble = ProductionEnsemble(members)
+        ensemble.predict_proba(np.random.random((3, EXPECTED_FEATURE_COUNT)))
+
+        for model in members.values():
+            assert model.seen_threads == [threading.current_thread().name]
+            assert model.seen_n_jobs == [model.n_jobs]
+
+    def test_parallel_member_error_propagates(self, members):
+        """並列時もモデルの例外は呼び出し側へ伝播する."""
+        members["xgboost"] = _ThreadRecordingModel(2, fail=True)
+        ensemble = ProductionEnsemble(members)
+
+        with pytest.raises(RuntimeError, match="member crashed"):
+            ensemble.predict_proba(np.random.random((5, EXPECTED_FEATURE_COUNT)), parallel=True)
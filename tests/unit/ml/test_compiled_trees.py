@@ -0,0 +1,164 @@
+"""
+木モデルの NumPy コンパイル推論テスト（Phase 90）
+
+compiled_trees.py のコンパイル結果が LightGBM・XGBoost・RandomForest の predict_proba を
+1e-6 以内で再現すること、ProductionEnsemble の推論バックエンドとして結果が変わらないこと、
+.npz 保存・読み込みの往復を確認する。
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.ml.compiled_trees import (
+    CompiledTreeModel,
+    compile_ensemble,
+    compile_tree_model,
+    file_sha256,
+    load_compiled_members,
+    save_compiled_members,
+)
+from src.ml.ensemble import ProductionEnsemble
+
+lightgbm = pytest.importorskip("lightgbm")
+xgboost = pytest.importorskip("xgboost")
+sklearn_ensemble = pytest.importorskip("sklearn.ensemble")
+
+FEATURES = [f"feat_{i}" for i in range(6)]
+TOLERANCE = 1e-6
+
+
+@pytest.fixture(scope="module")
+def training_data():
+    rng = np.random.default_rng(42)
+    X = pd.DataFrame(rng.normal(size=(1500, len(FEATURES))), columns=FEATURES)
+    # 一部特徴量を離散化して閾値ちょうどの値を含める
+    X["feat_5"] = np.round(X["feat_5"], 1)
+    y = np.digitize(X["feat_0"] + 0.5 * X["feat_1"] + rng.normal(0, 0.5, len(X)), [-0.5, 0.5])
+    return X, y
+
+
+@pytest.fixture(scope="module")
+def trained_models(training_data):
+    X, y = training_data
+    models = {
+        "lightgbm": lightgbm.LGBMClassifier(n_estimators=40, verbose=-1, random_state=42),
+        "xgboost": xgboost.XGBClassifier(n_estimators=40, max_depth=4, random_state=42),
+        "random_forest": sklearn_ensemble.RandomForestClassifier(
+            n_estimators=20, max_depth=6, random_state=42
+        ),
+    }
+    for model in models.values():
+        model.fit(X, y)
+    return models
+
+
+def _ensemble(models) -> ProductionEnsemble:
+    with patch("src.ml.ensemble.get_feature_names", return_value=FEATURES):
+        return ProductionEnsemble(dict(models))
+
+
+def _test_inputs(training_data) -> pd.DataFrame:
+    X, _ = training_data
+    rng = np.random.default_rng(7)
+    fresh = pd.DataFrame(rng.normal(size=(300, len(FEATURES))), columns=FEATURES)
+    return pd.concat([X.iloc[:300], fresh], ignore_index=True)
+
+
+@pytest.mark.parametrize("name", ["lightgbm", "xgboost", "random_forest"])
+def test_compiled_model_matches_native(trained_models, training_data, name):
+    """コンパイル版の確率が元モデルと 1e-6 以内で一致（学習データ・未知データ・1 行）."""
+    model = trained_models[name]
+    compiled = compile_tree_model(model)
+    X = _test_inputs(training_data)
+
+    np.testing.assert_allclose(compiled.predict_proba(X), model.predict_proba(X), atol=TOLERANCE)
+    np.testing.assert_allclose(
+        compiled.predict_proba(X.iloc[[-1]]), model.predict_proba(X.iloc[[-1]]), atol=TOLERANCE
+    )
+    assert compiled.n_classes == 3
+
+
+def test_lightgbm_near_zero_values_match_native(trained_models, training_data):
+    """LightGBM は |x| <= kZeroThreshold を 0 として分岐（0 が多い特徴量の ±1e-35 分岐）."""
+    model = trained_models["lightgbm"]
+    compiled = compile_tree_model(model)
+    X = _test_inputs(training_data).iloc[:12].copy()
+    X["feat_5"] = [0.0, -0.0, 1e-36, -1e-36, 1e-35, -1e-35, 2e-35, -2e-35, 1e-30, -1e-30, 0.1, -0.1]
+
+    np.testing.assert_allclose(compiled.predict_proba(X), model.predict_proba(X), atol=TOLERANCE)
+
+
+def test_compile_ensemble_keeps_validated_members(trained_models):
+    """検証済みの全木モデルがコンパイル対象・非木モデルは除外."""
+
+    class _OpaqueMember:
+        def predict_proba(self, X):
+            return np.full((len(X), 3), 1.0 / 3)
+
+    ensemble = _ensemble({**trained_models, "nbeats": _OpaqueMember()})
+    compiled = compile_ensemble(ensemble, tolerance=TOLERANCE, n_probe_rows=500)
+
+    assert set(compiled) == {"lightgbm", "xgboost", "random_forest"}
+    assert all(isinstance(model, CompiledTreeModel) for model in compiled.values())
+
+
+def test_ensemble_with_compiled_members_matches_native(trained_models, training_data):
+    """コンパイル版をバックエンドにしてもアンサンブル確率は元モデルと 1e-6 以内."""
+    ensemble = _ensemble(trained_models)
+    X = _test_inputs(training_data)
+    expected = ensemble.predict_proba(X, parallel=False)
+
+    ensemble.attach_compiled_members(compile_ensemble(ensemble, n_probe_rows=500))
+    np.testing.assert_allclose(ensemble.predict_proba(X, parallel=False), expected, atol=TOLERANCE)
+    np.testing.assert_allclose(ensemble.predict_proba(X, parallel=True), expected, atol=TOLERANCE)
+
+    ensemble.detach_compiled_members()
+    assert ensemble.predict_proba(X, parallel=False).tobytes() == expected.tobytes()
+
+
+def test_missing_values_use_native_models(trained_models, training_data):
+    """欠損値を含む入力は元モデルで推論."""
+    ensemble = _ensemble(trained_models)
+    X = _test_inputs(training_data).iloc[:10].copy()
+    X.iloc[0, 0] = np.nan
+    expected = ensemble.predict_proba(X, parallel=False)
+
+    ensemble.attach_compiled_members(compile_ensemble(ensemble, n_probe_rows=500))
+    with patch.object(CompiledTreeModel, "predict_proba") as compiled_predict:
+        actual = ensemble.predict_proba(X, parallel=False)
+
+    compiled_predict.assert_not_called()
+    assert actual.tobytes() == expected.tobytes()
+
+
+def test_attach_rejects_unknown_member(trained_models):
+    """アンサンブルに存在しないモデル名は拒否."""
+    ensemble = _ensemble(trained_models)
+    compiled = compile_tree_model(trained_models["lightgbm"])
+    with pytest.raises(ValueError):
+        ensemble.attach_compiled_members({"catboost": compiled})
+
+
+def test_save_load_roundtrip(trained_models, training_data, tmp_path):
+    """npz 保存・読み込み後も同一の確率・コンパイル元ダイジェストを保持."""
+    source = tmp_path / "ensemble_full.pkl"
+    source.write_bytes(b"ensemble")
+    compiled = {name: compile_tree_model(model) for name, model in trained_models.items()}
+    path = tmp_path / "ensemble_full_compiled.npz"
+
+    save_compiled_members(path, compiled, file_sha256(source))
+    loaded, digest = load_compiled_members(path)
+
+    assert digest == file_sha256(source)
+    X = _test_inputs(training_data)
+    for name, model in compiled.items():
+        assert loaded[name].predict_proba(X).tobytes() == model.predict_proba(X).tobytes()
+
+
+def test_unsupported_model_raises():
+    """木モデル以外はコンパイル不可."""
+    with pytest.raises(ValueError):
+        compile_tree_model(object())
@@ -0,0 +1,196 @@
+"""
+マニフェスト形式アーティファクトのテスト（Phase 90）
+
+個別モデルが初回推論時まで読み込まれないこと・重み 0 のモデルは読み込まれないこと・
+pickle と同一の予測になること・MLModelLoader がアーティファクトを優先し、pickle と
+不一致・個別モデルが壊れている場合は pickle にフォールバックすることを確認する。
+"""
+
+import json
+import os
+import pickle
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from src.core.logger import CryptoBotLogger
+from src.core.orchestration.ml_loader import MLModelLoader
+from src.ml.compiled_trees import file_sha256
+from src.ml.ensemble import ProductionEnsemble
+from src.ml.model_artifacts import (
+    MANIFEST_NAME,
+    LazyMember,
+    load_ensemble_artifact,
+    read_manifest,
+    save_ensemble_artifact,
+)
+
+FEATURES = [f"feat_{i}" for i in range(4)]
+
+
+class _LinearMember:
+    """行単位の線形 softmax 分類器（pickle 可能なテスト用メンバー）"""
+
+    n_features_in_ = len(FEATURES)
+
+    def __init__(self, seed: int, required_lookback: int = 0):
+        self.weights = np.random.default_rng(seed).normal(size=(len(FEATURES), 3))
+        self.required_lookback = required_lookback
+
+    def predict_proba(self, X) -> np.ndarray:
+        logits = np.asarray(X, dtype=float) @ self.weights
+        exp = np.exp(logits - logits.max(axis=1, keepdims=True))
+        return exp / exp.sum(axis=1, keepdims=True)
+
+
+@pytest.fixture
+def ensemble() -> ProductionEnsemble:
+    with patch("src.ml.ensemble.get_feature_names", return_value=FEATURES):
+        model = ProductionEnsemble(
+            {
+                "lightgbm": _LinearMember(1),
+                "xgboost": _LinearMember(2),
+                "nbeats": _LinearMember(3, required_lookback=5),
+            }
+        )
+    model.weights = {"lightgbm": 0.5, "xgboost": 0.5, "nbeats": 0.0}
+    return model
+
+
+@pytest.fixture
+def saved_artifact(ensemble, tmp_path):
+    model_path = tmp_path / "ensemble_full.pkl"
+    with open(model_path, "wb") as f:
+        pickle.dump(ensemble, f)
+    save_ensemble_artifact(
+        ensemble, model_path.with_suffix(""), file_sha256(model_path), source_path=model_path
+    )
+    return model_path
+
+
+def test_members_load_lazily_and_match_pickle(ensemble, saved_artifact):
+    """起動時は個別モデル未読み込み・推論結果は元アンサンブルと同一."""
+    loaded = load_ensemble_artifact(saved_artifact.with_suffix(""))
+
+    assert all(isinstance(member, LazyMember) for member in loaded.models.values())
+    assert not any(member.is_loaded for member in loaded.models.values())
+    assert loaded.n_features_ == len(FEATURES)
+    assert loaded.feature_names == FEATURES
+    assert loaded.weights == ensemble.weights
+
+    X = np.random.default_rng(0).normal(size=(20, len(FEATURES)))
+    assert loaded.predict_proba(X).tobytes() == ensemble.predict_proba(X).tobytes()
+    assert loaded.models["lightgbm"].is_loaded
+
+
+def test_zero_weight_member_is_never_loaded(saved_artifact):
+    """重み 0 のモデルは推論・required_lookback 算出で読み込まれない."""
+    loaded = load_ensemble_artifact(saved_artifact.with_suffix(""))
+
+    loaded.predict_proba(np.zeros((3, len(FEATURES))))
+
+    assert not loaded.models["nbeats"].is_loaded
+    assert loaded.required_lookback == 0
+
+
+def test_manifest_records_lookback_without_loading(saved_artifact):
+    """required_lookback はマニフェストの値（モデルを読み込まない）."""
+    loaded = load_ensemble_artifact(saved_artifact.with_suffix(""))
+    loaded.weights["nbeats"] = 0.2
+
+    assert loaded.required_lookback == 5
+    assert not loaded.models["nbeats"].is_loaded
+
+
+def test_read_manifest_rejects_unknown_version(saved_artifact):
+    directory = saved_artifact.with_suffix("")
+    manifest = json.loads((directory / MANIFEST_NAME).read_text())
+    manifest["format_version"] = 999
+    (directory / MANIFEST_NAME).write_text(json.dumps(manifest))
+
+    with pytest.raises(ValueError):
+        read_manifest(directory)
+
+
+def _loader() -> MLModelLoader:
+    logger = Mock(spec=CryptoBotLogger)
+    return MLModelLoader(logger)
+
+
+def test_loader_prefers_artifact(saved_artifact):
+    """pickle と一致するアーティファクトは遅延読み込みで使用."""
+    loader = _loader()
+    level_info = {"full": {"count": len(FEATURES), "model_file": saved_artifact.name}}
+
+    assert loader._load_ensemble_artifact(saved_artifact, "full", level_info) is True
+    assert isinstance(loader.model.models["lightgbm"], LazyMember)
+    assert loader.model_type == "ProductionEnsemble_FULL"
+    # 推論対象は起動時に読み込み済み・重み 0 のモデルは未読み込み
+    assert loader.model.models["lightgbm"].is_loaded
+    assert loader.model.models["xgboost"].is_loaded
+    assert not loader.model.models["nbeats"].is_loaded
+
+
+@pytest.mark.parametrize("member", ["xgboost", "nbeats"])
+def test_loader_falls_back_when_member_truncated(saved_artifact, member):
+    """途中で切れた個別モデル（重み 0 を含む）はアーティファクトを使用しない."""
+    path = saved_artifact.with_suffix("") / f"{member}.joblib"
+    path.write_bytes(path.read_bytes()[: path.stat().st_size // 2])
+    loader = _loader()
+    level_info = {"full": {"count": len(FEATURES), "model_file": saved_artifact.name}}
+
+    assert loader._load_ensemble_artifact(saved_artifact, "full", level_info) is False
+    assert loader.model is None
+
+
+def test_loader_falls_back_when_member_unreadable(saved_artifact):
+    """サイズが同じでも読み込めない推論対象モデルは起動時に検出して pickle へ."""
+    path = saved_artifact.with_suffix("") / "xgboost.joblib"
+    path.write_bytes(b"\0" * path.stat().st_size)
+    loader = _loader()
+    level_info = {"full": {"count": len(FEATURES), "model_file": saved_artifact.name}}
+
+    assert loader._load_ensemble_artifact(saved_artifact, "full", level_info) is False
+    assert loader.model is None
+    loader.logger.warning.assert_called()
+
+
+def test_loader_falls_back_when_pickle_changed(ensemble, saved_artifact):
+    """再学習で pickle が変わった場合はアーティファクトを使用しない."""
+    ensemble.weights = {"lightgbm": 1.0, "xgboost": 0.0, "nbeats": 0.0}
+    stat = saved_artifact.stat()
+    with open(saved_artifact, "wb") as f:
+        pickle.dump(ensemble, f)
+    # サイズ同一・mtime 粒度の粗いファイルシステムでも変更を検出させる
+    os.utime(saved_artifact, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    loader = _loader()
+    level_info = {"full": {"count": len(FEATURES), "model_file": saved_artifact.name}}
+
+    assert loader._load_ensemble_artifact(saved_artifact, "full", level_info) is False
+    loader.logger.warning.assert_called()
+
+
+def test_loader_skips_hash_when_pickle_unchanged(saved_artifact):
+    """サイズ・mtime がマニフェストと一致すれば pickle を読まない（起動時の全読み込み回避）."""
+    loader = _loader()
+    level_info = {"full": {"count": len(FEATURES), "model_file": saved_artifact.name}}
+
+    with patch("src.ml.compiled_trees.file_sha256") as sha256:
+        assert loader._load_ensemble_artifact(saved_artifact, "full", level_info) is True
+    sha256.assert_not_called()
+
+
+def test_loader_hashes_pickle_once_per_load(saved_artifact):
+    """mtime が変わった（コピー等）場合も SHA-256 の計算は 1 回で、コンパイル済み照合と共有."""
+    stat = saved_artifact.stat()
+    os.utime(saved_artifact, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    loader = _loader()
+    level_info = {"full": {"count": len(FEATURES), "model_file": saved_artifact.name}}
+
+    with patch("src.ml.compiled_trees.file_sha256", side_effect=file_sha256) as sha256:
+        assert loader._load_ensemble_artifact(saved_artifact, "full", level_info) is True
+        digest = loader._source_digest(saved_artifact)
+
+    assert sha256.call_count == 1
+    assert digest == file_sha256(saved_artifact)
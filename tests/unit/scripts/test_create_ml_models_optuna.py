@@ -0,0 +1,115 @@
+"""Phase 90: create_ml_models の Optuna 並列・永続化テスト。
+
+sqlite ストレージ上の study が再実行で終了済み trial から再開すること、
+並列設定（プロセス数 × trial スレッド数）の自動決定、経過時間 vs trial 数の推移を検証する。
+"""
+
+import importlib.util
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import optuna
+import pandas as pd
+
+_module_path = Path(__file__).parent.parent.parent.parent / "scripts" / "ml" / "create_ml_models.py"
+_spec = importlib.util.spec_from_file_location("create_ml_models_optuna", _module_path)
+_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_mod)
+
+
+def _dataset(n: int = 240):
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(n, 4)), columns=[f"f{i}" for i in range(4)])
+    y = pd.Series((X["f0"] + rng.normal(0, 0.3, n) > 0).astype(int))
+    return X, y
+
+
+def test_settings_split_cores(monkeypatch, tmp_path):
+    monkeypatch.setattr(_mod.os, "cpu_count", lambda: 8)
+    monkeypatch.delenv("ML_OPTUNA_WORKERS", raising=False)
+    monkeypatch.delenv("ML_OPTUNA_TRIAL_THREADS", raising=False)
+    monkeypatch.delenv("ML_OPTUNA_STORAGE", raising=False)
+
+    settings = _mod._optuna_settings(20, tmp_path)
+    assert settings["workers"] == 4
+    assert settings["trial_threads"] == 2
+    assert settings["storage"].startswith("sqlite:///")
+
+    # 試行数より多いプロセスは起動しない
+    monkeypatch.setenv("ML_OPTUNA_WORKERS", "16")
+    assert _mod._optuna_settings(3, tmp_path)["workers"] == 3
+
+
+def test_rf_trial_threads_capped_by_training_n_jobs(monkeypatch):
+    """RF の trial スレッド数は ML_TRAINING_N_JOBS（default 1）を超えない."""
+    monkeypatch.delenv("ML_TRAINING_N_JOBS", raising=False)
+    assert _mod._rf_n_jobs(4) == 1
+
+    monkeypatch.setenv("ML_TRAINING_N_JOBS", "2")
+    assert _mod._rf_n_jobs(4) == 2
+    assert _mod._rf_n_jobs(1) == 1
+
+    # -1（全コア）は上限なし: 並列 trial 間の配分をそのまま使う
+    monkeypatch.setenv("ML_TRAINING_N_JOBS", "-1")
+    assert _mod._rf_n_jobs(4) == 4
+
+
+def test_cv_fold_threads_independent_of_workers(monkeypatch):
+    """fold スレッド数は直列・並列で同じ値（CV スコアが ML_CV_WORKERS に依らない）."""
+    monkeypatch.setattr(_mod.os, "cpu_count", lambda: 8)
+    monkeypatch.delenv("ML_CV_FOLD_THREADS", raising=False)
+
+    monkeypatch.setenv("ML_CV_WORKERS", "1")
+    serial = _mod._cv_settings(5)
+    monkeypatch.setenv("ML_CV_WORKERS", "0")
+    parallel = _mod._cv_settings(5)
+
+    assert (serial["workers"], parallel["workers"]) == (1, 5)
+    assert serial["fold_threads"] == parallel["fold_threads"] == 1
+
+    monkeypatch.setenv("ML_CV_FOLD_THREADS", "3")
+    assert _mod._cv_settings(5)["fold_threads"] == 3
+
+
+def test_study_resumes_from_sqlite(tmp_path):
+    """同じ study 名での再実行は終了済み trial を引き継ぎ、合計 max_trials で停止."""
+    X, y = _dataset()
+    settings = {
+        "workers": 1,
+        "trial_threads": 1,
+        "storage": f"sqlite:///{tmp_path / 'optuna.db'}",
+        "pruner": "median",
+    }
+    optuna.create_study(
+        study_name="full_random_forest_test",
+        storage=settings["storage"],
+        direction="maximize",
+    )
+    run_start = datetime.now()
+
+    _mod._optuna_worker(
+        settings, "full_random_forest_test", "random_forest", X, y, 2, 2, 3, 600, 42
+    )
+    study = optuna.load_study(study_name="full_random_forest_test", storage=settings["storage"])
+    assert len(study.get_trials(states=_mod._FINISHED_TRIAL_STATES)) == 2
+
+    # 「クラッシュ後の再実行」: 残り 1 trial のみ実行
+    _mod._optuna_worker(
+        settings, "full_random_forest_test", "random_forest", X, y, 2, 3, 3, 600, 42
+    )
+    study = optuna.load_study(study_name="full_random_forest_test", storage=settings["storage"])
+    assert len(study.get_trials(states=_mod._FINISHED_TRIAL_STATES)) == 3
+
+    progress = _mod._trial_progress(study, run_start)
+    assert [p["trials"] for p in progress] == [1, 2, 3]
+    assert all(p["elapsed_seconds"] >= 0 for p in progress)
+    assert progress[-1]["best_score"] == study.best_value
+
+
+def test_fingerprint_changes_with_data():
+    X, y = _dataset()
+    base = _mod._data_fingerprint(X, y, 2)
+    assert base == _mod._data_fingerprint(X.copy(), y.copy(), 2)
+    assert base != _mod._data_fingerprint(X.iloc[:-1], y.iloc[:-1], 2)
+    assert base != _mod._data_fingerprint(X, y, 3)
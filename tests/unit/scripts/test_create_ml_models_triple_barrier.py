@@ -0,0 +1,92 @@
+"""Phase 90: create_ml_models の Triple Barrier ラベル（ベクトル化）テスト。
+
+triple_barrier_labels が旧実装（行 × 将来足の二重ループ）と全行で同一のラベルを
+返すことを、同値到達・同一足での TP/SL 同時到達・欠損値・短い系列を含めて検証する。
+"""
+
+import importlib.util
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+_module_path = Path(__file__).parent.parent.parent.parent / "scripts" / "ml" / "create_ml_models.py"
+_spec = importlib.util.spec_from_file_location("create_ml_models_tb", _module_path)
+_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_mod)
+
+triple_barrier_labels = _mod.triple_barrier_labels
+
+
+def _loop_labels(close, high, low, tp_ratio, sl_ratio, max_bars):
+    """Phase 90 以前の _generate_meta_label_target のループ実装"""
+    n = len(close)
+    target = np.full(n, 0, dtype=int)
+    for i in range(n - 1):
+        entry_price = close[i]
+        tp_price = entry_price * (1 + tp_ratio)
+        sl_price = entry_price * (1 - sl_ratio)
+        end_idx = min(i + max_bars + 1, n)
+        for j in range(i + 1, end_idx):
+            if high[j] >= tp_price:
+                target[i] = 1
+                break
+            if low[j] <= sl_price:
+                target[i] = 0
+                break
+    return target
+
+
+def _ohlc(n: int, seed: int):
+    rng = np.random.default_rng(seed)
+    close = np.round(10_000_000 * np.exp(np.cumsum(rng.normal(0, 0.002, n))), -3)
+    high = close + np.round(np.abs(rng.normal(0, 15_000, n)), -3)
+    low = close - np.round(np.abs(rng.normal(0, 15_000, n)), -3)
+    return close, high, low
+
+
+@pytest.mark.parametrize(
+    "tp_ratio,sl_ratio,max_bars",
+    [(0.0075, 0.005, 20), (0.002, 0.002, 20), (0.01, 0.0005, 5), (0.003, 0.003, 1)],
+)
+def test_matches_loop_implementation(tp_ratio, sl_ratio, max_bars):
+    close, high, low = _ohlc(3000, seed=1)
+    expected = _loop_labels(close, high, low, tp_ratio, sl_ratio, max_bars)
+
+    actual = triple_barrier_labels(close, high, low, tp_ratio, sl_ratio, max_bars)
+
+    assert actual.dtype == expected.dtype
+    np.testing.assert_array_equal(actual, expected)
+
+
+def test_exact_touch_and_same_bar_tie():
+    """TP/SL ちょうどの到達は到達扱い・同じ足で両方到達なら TP 優先."""
+    close = np.array([100.0, 100.0, 100.0, 100.0])
+    tp_ratio, sl_ratio = 0.01, 0.01
+    high = np.array([100.0, 100.0 * (1 + tp_ratio), 100.0, 100.0])
+    low = np.array([100.0, 100.0 * (1 - sl_ratio), 100.0, 99.0])
+
+    actual = triple_barrier_labels(close, high, low, tp_ratio, sl_ratio, 20)
+
+    np.testing.assert_array_equal(actual, _loop_labels(close, high, low, tp_ratio, sl_ratio, 20))
+    assert actual[0] == 1
+
+
+def test_missing_values_and_short_series():
+    close, high, low = _ohlc(50, seed=2)
+    high[[3, 10, 11]] = np.nan
+    low[[4, 10, 30]] = np.nan
+    for n in (0, 1, 2, 50):
+        expected = _loop_labels(close[:n], high[:n], low[:n], 0.003, 0.002, 20)
+        actual = triple_barrier_labels(close[:n], high[:n], low[:n], 0.003, 0.002, 20)
+        np.testing.assert_array_equal(actual, expected)
+
+
+def test_large_series_is_fast():
+    """15 分足 100k 行超のラベル生成が数秒以内."""
+    close, high, low = _ohlc(150_000, seed=3)
+    start = time.perf_counter()
+    labels = triple_barrier_labels(close, high, low, 0.0075, 0.005, 20)
+    assert time.perf_counter() - start < 5.0
+    assert len(labels) == len(close)
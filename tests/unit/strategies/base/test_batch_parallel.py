@@ -0,0 +1,151 @@
+"""
+行単位シグナル並列評価テスト（src/strategies/base/batch_parallel.py）
+
+generate_signals_batch() の行単位フォールバックをプロセス並列で評価した結果が
+シリアル実行とバイト単位で一致することを確認する。
+"""
+
+import pickle
+from datetime import datetime
+from typing import Dict, Optional
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.strategies.base.batch_parallel import plan_shards
+from src.strategies.base.strategy_base import StrategyBase, StrategySignal
+
+
+class _MeanReversionStrategy(StrategyBase):
+    """ベクトル化未実装（行単位フォールバック）のテスト用戦略"""
+
+    def __init__(self, config=None):
+        super().__init__(name="MeanReversion", config=config or {"min_data_points": 10})
+        self.band = 0.001
+
+    def analyze(
+        self, df: pd.DataFrame, multi_timeframe_data: Optional[Dict[str, pd.DataFrame]] = None
+    ) -> StrategySignal:
+        close = float(df["close"].iloc[-1])
+        deviation = close / float(df["close"].iloc[-10:].mean()) - 1.0
+        if float(df["rsi_14"].iloc[-1]) > 90:
+            raise ValueError("skip")
+        action = "sell" if deviation > self.band else "buy" if deviation < -self.band else "hold"
+        return StrategySignal(
+            strategy_name=self.name,
+            timestamp=datetime.now(),
+            action=action,
+            confidence=min(abs(deviation) * 100, 1.0),
+            strength=0.5,
+            current_price=close,
+        )
+
+    def get_required_features(self):
+        return ["close", "rsi_14"]
+
+
+@pytest.fixture
+def features_df() -> pd.DataFrame:
+    n_rows = 240
+    rng = np.random.default_rng(7)
+    return pd.DataFrame(
+        {
+            "close": 5_000_000 * np.exp(np.cumsum(rng.normal(0, 0.003, n_rows))),
+            "rsi_14": rng.uniform(10, 95, n_rows),
+            "regime": np.where(np.arange(n_rows) % 3 == 0, "range", "trend"),
+        },
+        index=pd.date_range("2026-01-01", periods=n_rows, freq="15min", tz="Asia/Tokyo"),
+    )
+
+
+def _thresholds(**overrides):
+    values = {
+        "performance.signal_precompute.enabled": True,
+        "performance.signal_precompute.max_workers": 3,
+        "performance.signal_precompute.min_rows_per_shard": 20,
+        "performance.signal_precompute.start_method": "fork",
+    }
+    values.update({f"performance.signal_precompute.{k}": v for k, v in overrides.items()})
+    return patch(
+        "src.strategies.base.batch_parallel.get_threshold",
+        side_effect=lambda key, default=None: values.get(key, default),
+    )
+
+
+def test_parallel_matches_serial_bytes(features_df):
+    """並列評価はシリアル実行と dtype・値とも完全一致（インスタンス属性の変更も反映）."""
+    strategy = _MeanReversionStrategy()
+    strategy.band = 0.002
+
+    with _thresholds(enabled=False):
+        serial = strategy.generate_signals_batch(features_df)
+    with (
+        _thresholds(),
+        patch.object(
+            strategy, "_evaluate_signal_rows", wraps=strategy._evaluate_signal_rows
+        ) as rows,
+    ):
+        parallel = strategy.generate_signals_batch(features_df)
+
+    rows.assert_not_called()  # 親プロセスではシリアル評価しない
+    assert parallel["action"].dtype == serial["action"].dtype
+    np.testing.assert_array_equal(parallel["action"], serial["action"])
+    for name in ("confidence", "encoded"):
+        assert parallel[name].dtype == serial[name].dtype
+        assert parallel[name].tobytes() == serial[name].tobytes()
+    assert np.isin(serial["action"], ["buy", "sell"]).any()
+    assert (serial["action"][:9] == "hold").all()
+
+
+def test_small_input_runs_serially(features_df):
+    """2 シャード未満の入力はプールを起動せずシリアル実行."""
+    strategy = _MeanReversionStrategy()
+    with (
+        _thresholds(min_rows_per_shard=1000),
+        patch("src.strategies.base.batch_parallel.ProcessPoolExecutor") as pool,
+    ):
+        result = strategy.generate_signals_batch(features_df)
+
+    pool.assert_not_called()
+    assert len(result["action"]) == len(features_df)
+
+
+def test_pool_failure_falls_back_to_serial(features_df):
+    """プール起動失敗時はシリアル実行に切り替わり、結果は変わらない."""
+    strategy = _MeanReversionStrategy()
+    with _thresholds(enabled=False):
+        serial = strategy.generate_signals_batch(features_df)
+    with (
+        _thresholds(),
+        patch(
+            "src.strategies.base.batch_parallel.ProcessPoolExecutor",
+            side_effect=OSError("no processes"),
+        ),
+    ):
+        result = strategy.generate_signals_batch(features_df)
+
+    np.testing.assert_array_equal(result["action"], serial["action"])
+    np.testing.assert_array_equal(result["confidence"], serial["confidence"])
+
+
+def test_strategy_pickles_without_logger():
+    """ワーカー転送用の pickle は logger を含まず、復元時に再取得する."""
+    strategy = _MeanReversionStrategy()
+    strategy.band = 0.005
+
+    restored = pickle.loads(pickle.dumps(strategy))
+    assert restored.band == 0.005
+    assert restored.config == strategy.config
+    assert restored.logger is not None
+
+
+def test_plan_shards_covers_range_contiguously():
+    """シャードは [start, stop) を隙間・重複なく連続分割する."""
+    shards = plan_shards(19, 1019, max_workers=2, min_rows_per_shard=100)
+    assert len(shards) == 8
+    assert shards[0][0] == 19 and shards[-1][1] == 1019
+    assert all(prev[1] == nxt[0] for prev, nxt in zip(shards, shards[1:]))
+    assert plan_shards(19, 150, max_workers=4, min_rows_per_shard=100) == []
+    assert plan_shards(0, 10_000, max_workers=1, min_rows_per_shard=100) == []
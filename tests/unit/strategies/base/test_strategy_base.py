@@ -326,3 +326,87 @@ class TestStrategyBase:
         assert strategy.logger is not None
         assert hasattr(strategy, "last_update")
         assert isinstance(strategy.last_update, datetime)
+
+
+class VectorizedStrategy(ConcreteStrategy):
+    """ベクトル化判定を実装したテスト用戦略（全行BUY）"""
+
+    def get_required_features(self) -> list:
+        return ["close", "atr_14"]
+
+    def _generate_signals_vectorized(self, features_df):
+        n_rows = len(features_df)
+        return np.full(n_rows, "buy", dtype=object), np.full(n_rows, 0.6)
+
+
+class TestGenerateSignalsBatch:
+    """generate_signals_batch（全行一括シグナル生成）テスト"""
+
+    @pytest.fixture
+    def features(self):
+        n_points = 40
+        close = np.where(np.arange(n_points) % 3 == 0, 2500000.0, 4000000.0)
+        return pd.DataFrame(
+            {
+                "close": close,
+                "volume": np.full(n_points, 200.0),
+                "rsi_14": np.full(n_points, 50.0),
+                "bb_position": np.full(n_points, 0.5),
+                "atr_14": np.full(n_points, 10000.0),
+            }
+        )
+
+    def test_per_row_fallback_matches_generate_signal(self, features):
+        """未実装戦略は行単位フォールバックで generate_signal(df.iloc[:i+1]) と一致"""
+        strategy = ConcreteStrategy()
+        batch = strategy.generate_signals_batch(features)
+
+        for i in range(len(features)):
+            if i + 1 < 20:
+                assert batch["action"][i] == "hold"
+                assert batch["confidence"][i] == 0.0
+                continue
+            signal = strategy.generate_signal(features.iloc[: i + 1])
+            assert batch["action"][i] == signal.action
+            assert batch["confidence"][i] == signal.confidence
+
+    def test_encoded_values(self):
+        """encoded: buy=+confidence, sell=-confidence, hold=0.0"""
+        result = StrategyBase._build_batch_result(
+            np.array(["buy", "sell", "hold"], dtype=object), np.array([0.6, 0.4, 0.5])
+        )
+        np.testing.assert_allclose(result["encoded"], [0.6, -0.4, 0.0])
+
+    def test_missing_features_returns_hold(self, features):
+        """必要特徴量不足は全行 hold / 0.0"""
+        strategy = ConcreteStrategy()
+        batch = strategy.generate_signals_batch(features.drop(columns=["rsi_14"]))
+        assert (batch["action"] == "hold").all()
+        assert (batch["confidence"] == 0.0).all()
+
+    def test_vectorized_applies_min_data_points_and_atr(self, features):
+        """ベクトル化結果にも最低データ数・ATR無効時のエラーHOLDが適用される"""
+        features.loc[25, "atr_14"] = 0.0
+        features.loc[30, "atr_14"] = np.nan
+        strategy = VectorizedStrategy(config={"min_data_points": 10})
+
+        with patch.object(strategy, "_generate_signals_per_row") as per_row:
+            batch = strategy.generate_signals_batch(features)
+        per_row.assert_not_called()
+
+        hold_rows = set(range(9)) | {25, 30}
+        for i in range(len(features)):
+            if i in hold_rows:
+                assert (batch["action"][i], batch["confidence"][i]) == ("hold", 0.0)
+            else:
+                assert (batch["action"][i], batch["confidence"][i]) == ("buy", 0.6)
+
+    def test_vectorized_failure_falls_back_to_per_row(self, features):
+        """ベクトル化判定が例外の場合は行単位にフォールバック"""
+        strategy = VectorizedStrategy()
+        with (
+            patch.object(strategy, "_generate_signals_vectorized", side_effect=ValueError("x")),
+            patch.object(strategy, "_generate_signals_per_row", return_value="fallback") as per_row,
+        ):
+            assert strategy.generate_signals_batch(features) == "fallback"
+        per_row.assert_called_once()
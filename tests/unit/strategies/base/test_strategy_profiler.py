@@ -0,0 +1,112 @@
+"""
+戦略プロファイラーテスト（src/strategies/base/strategy_profiler.py）
+
+戦略別の呼び出し回数・時間・get_threshold 呼び出し回数の記録と、
+StrategyManager からの計測経路（無効時は通らない）を確認する。
+"""
+
+from datetime import datetime
+from typing import Dict, Optional
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.config import get_threshold
+from src.strategies.base.strategy_base import StrategyBase, StrategySignal
+from src.strategies.base.strategy_manager import StrategyManager
+from src.strategies.base.strategy_profiler import StrategyProfiler
+
+
+class _LookupStrategy(StrategyBase):
+    """閾値を参照して固定シグナルを返すテスト用戦略"""
+
+    def __init__(self, name: str, lookups: int, fail: bool = False):
+        super().__init__(name=name)
+        self._lookups = lookups
+        self._fail = fail
+
+    def analyze(
+        self, df: pd.DataFrame, multi_timeframe_data: Optional[Dict[str, pd.DataFrame]] = None
+    ) -> StrategySignal:
+        for _ in range(self._lookups):
+            get_threshold("ml.default_confidence", 0.5)
+        if self._fail:
+            raise ValueError("broken")
+        return StrategySignal(
+            strategy_name=self.name,
+            timestamp=datetime.now(),
+            action="buy",
+            confidence=0.6,
+            strength=0.5,
+            current_price=float(df["close"].iloc[-1]),
+        )
+
+    def get_required_features(self):
+        return ["close"]
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    n = 30
+    return pd.DataFrame(
+        {"close": np.linspace(10_000_000, 10_100_000, n)},
+        index=pd.date_range("2026-01-01", periods=n, freq="15min"),
+    )
+
+
+def _manager(enabled: bool, **profiler_kwargs) -> StrategyManager:
+    manager = StrategyManager()
+    manager.profiler = StrategyProfiler(enabled=enabled, **profiler_kwargs)
+    manager.register_strategy(_LookupStrategy("Heavy", lookups=3))
+    manager.register_strategy(_LookupStrategy("Light", lookups=1))
+    manager.register_strategy(_LookupStrategy("Broken", lookups=0, fail=True))
+    return manager
+
+
+def test_records_calls_time_and_lookups(df):
+    """戦略毎に呼び出し回数・エラー・get_threshold キー別回数を記録する."""
+    manager = _manager(enabled=True)
+    for _ in range(4):
+        manager._collect_all_signals(df)
+
+    summary = manager.profiler.summary()
+    assert manager.profiler.cycles == 4
+    assert summary["Heavy"]["calls"] == 4
+    assert summary["Heavy"]["threshold_lookups"] == 12
+    assert summary["Heavy"]["top_lookups"] == {"ml.default_confidence": 12}
+    assert summary["Light"]["threshold_lookups"] == 4
+    assert summary["Broken"]["errors"] == 4
+    assert sum(entry["share"] for entry in summary.values()) == pytest.approx(1.0, abs=1e-3)
+    assert all(entry["total_ms"] >= entry["max_ms"] > 0 for entry in summary.values())
+
+    # 戦略外の get_threshold は記録しない
+    get_threshold("ml.default_confidence", 0.5)
+    assert manager.profiler.summary()["Heavy"]["threshold_lookups"] == 12
+
+    lines = manager.profiler.format_summary()
+    assert "4サイクル" in lines[0] and len(lines) == 4
+    assert "Heavy=" in manager.profiler.format_last_cycle()
+
+
+def test_disabled_profiler_is_bypassed(df):
+    """無効時は計測経路を通らず、統計も残らない."""
+    manager = _manager(enabled=False)
+    with patch.object(manager.profiler, "run") as run:
+        signals = manager._collect_all_signals(df)
+
+    run.assert_not_called()
+    assert set(signals) == {"Heavy", "Light"}
+    assert manager.profiler.summary() == {}
+
+
+def test_trace_memory_reports_peak(df):
+    """trace_memory 有効時は割り当てピークを記録する."""
+    profiler = StrategyProfiler(enabled=True, trace_memory=True)
+    profiler.start_cycle()
+    try:
+        profiler.run("Alloc", lambda: np.ones(200_000))
+        assert profiler.summary()["Alloc"]["peak_kb"] >= 1500
+    finally:
+        profiler.reset()
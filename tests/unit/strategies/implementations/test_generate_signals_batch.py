@@ -0,0 +1,110 @@
+"""
+generate_signals_batch パリティテスト
+
+各戦略のベクトル化一括判定（_generate_signals_vectorized）が
+行単位の generate_signal(df.iloc[:i+1]) と全行で一致することを確認する。
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.feature_generator import FeatureGenerator
+from src.strategies.implementations.adx_trend import ADXTrendStrengthStrategy
+from src.strategies.implementations.atr_based import ATRBasedStrategy
+from src.strategies.implementations.bb_reversal import BBReversalStrategy
+from src.strategies.implementations.cmf_reversal import CMFReversalStrategy
+from src.strategies.implementations.macd_ema_crossover import MACDEMACrossoverStrategy
+from src.strategies.implementations.stochastic_reversal import StochasticReversalStrategy
+
+
+def _adx_di_reversal_mode() -> ADXTrendStrengthStrategy:
+    strategy = ADXTrendStrengthStrategy()
+    strategy.use_rsi_driven_mode = False
+    return strategy
+
+
+STRATEGY_FACTORIES = {
+    "atr_based_rsi_mode": lambda: ATRBasedStrategy({"bb_as_main_condition": False}),
+    "atr_based_bb_mode": lambda: ATRBasedStrategy(
+        {"bb_as_main_condition": True, "volume_confirmation_enabled": True}
+    ),
+    "adx_trend": ADXTrendStrengthStrategy,
+    "adx_trend_di_reversal": _adx_di_reversal_mode,
+    "bb_reversal": lambda: BBReversalStrategy(
+        {
+            "bb_width_threshold": 0.06,
+            "adx_range_threshold": 30,
+            "bb_upper_threshold": 0.75,
+            "bb_lower_threshold": 0.25,
+        }
+    ),
+    "bb_reversal_and_mode": lambda: BBReversalStrategy(
+        {
+            "bb_primary_mode": False,
+            "bb_width_threshold": 0.1,
+            "adx_range_threshold": 40,
+            "bb_upper_threshold": 0.8,
+            "bb_lower_threshold": 0.2,
+            "rsi_overbought": 55,
+            "rsi_oversold": 45,
+        }
+    ),
+    "cmf_reversal": CMFReversalStrategy,
+    "macd_ema_crossover": lambda: MACDEMACrossoverStrategy(
+        {"adx_trend_threshold": 15, "volume_ratio_threshold": 0.8}
+    ),
+    "stochastic_reversal": StochasticReversalStrategy,
+}
+
+
+@pytest.fixture(scope="module")
+def features_df() -> pd.DataFrame:
+    """低ボラ・高ボラ区間を交互に含む特徴量DataFrame"""
+    n_rows = 400
+    rng = np.random.default_rng(3)
+    volatility = np.where((np.arange(n_rows) // 80) % 2 == 0, 0.002, 0.008)
+    close = 5_000_000 * np.exp(np.cumsum(rng.normal(0, volatility)))
+    ohlcv = pd.DataFrame(
+        {
+            "open": np.r_[close[0], close[:-1]],
+            "high": close * (1 + np.abs(rng.normal(0, 0.003, n_rows))),
+            "low": close * (1 - np.abs(rng.normal(0, 0.003, n_rows))),
+            "close": close,
+            "volume": rng.lognormal(1.0, 0.5, n_rows),
+        },
+        index=pd.date_range("2026-01-01", periods=n_rows, freq="15min"),
+    )
+    return FeatureGenerator()._run_feature_pipeline(ohlcv)
+
+
+@pytest.mark.parametrize("case", list(STRATEGY_FACTORIES))
+def test_vectorized_matches_per_row(case, features_df, monkeypatch):
+    """ベクトル化結果が行単位実行と action・confidence とも一致"""
+    monkeypatch.setenv("BACKTEST_MODE", "true")
+    strategy = STRATEGY_FACTORIES[case]()
+
+    batch = strategy.generate_signals_batch(features_df)
+    per_row = strategy._generate_signals_per_row(features_df)
+
+    np.testing.assert_array_equal(batch["action"], per_row["action"])
+    np.testing.assert_allclose(batch["confidence"], per_row["confidence"], rtol=0, atol=1e-12)
+    np.testing.assert_allclose(batch["encoded"], per_row["encoded"], rtol=0, atol=1e-12)
+    # パリティが自明にならないよう、エントリーシグナルを含むことを確認
+    assert np.isin(per_row["action"], ["buy", "sell"]).any()
+
+
+def test_atr_unavailable_entry_becomes_error_hold(features_df):
+    """ATR無効行のエントリーは行単位と同じくエラーHOLD（信頼度0.0）"""
+    strategy = CMFReversalStrategy()
+    baseline = strategy.generate_signals_batch(features_df)
+    entry_rows = np.flatnonzero(np.isin(baseline["action"], ["buy", "sell"]))
+    target = entry_rows[-1]
+
+    broken = features_df.copy()
+    broken.iloc[target, broken.columns.get_loc("atr_14")] = 0.0
+    batch = strategy.generate_signals_batch(broken)
+    signal = strategy.generate_signal(broken.iloc[: target + 1])
+
+    assert batch["action"][target] == signal.action == "hold"
+    assert batch["confidence"][target] == signal.confidence == 0.0
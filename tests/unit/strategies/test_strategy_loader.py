@@ -11,7 +11,12 @@ import pytest
 
 from src.core.exceptions import StrategyError
 from src.strategies.base.strategy_base import StrategyBase
-from src.strategies.strategy_loader import StrategyLoader
+from src.strategies.strategy_loader import (
+    StrategyLoader,
+    get_cached_strategies,
+    get_strategy_metadata,
+    invalidate_strategy_cache,
+)
 from src.strategies.strategy_registry import StrategyRegistry
 
 
@@ -424,3 +429,131 @@ class TestStrategyLoaderDefaultValues:
             strategies = loader.load_strategies()
 
             assert strategies[0]["priority"] == 99
+
+
+class TestStrategyCache:
+    """ロード結果キャッシュ（get_cached_strategies / get_strategy_metadata）テスト"""
+
+    def setup_method(self):
+        """各テストの前にレジストリ・キャッシュをクリア"""
+        StrategyRegistry.clear_registry()
+        invalidate_strategy_cache()
+
+        @StrategyRegistry.register(name="CacheTest", strategy_type="cache")
+        class CacheTest(StrategyBase):
+            def __init__(self, config=None):
+                self.config = config or {}
+
+            def analyze(self, df):
+                return None
+
+            def get_required_features(self):
+                return []
+
+        self.thresholds = _make_thresholds(
+            {
+                "cache_test": {
+                    "enabled": True,
+                    "class_name": "CacheTest",
+                    "strategy_type": "cache",
+                    "weight": 0.5,
+                    "priority": 1,
+                }
+            }
+        )
+
+    def teardown_method(self):
+        invalidate_strategy_cache()
+
+    def test_cached_until_thresholds_version_changes(self):
+        """閾値設定のバージョンが同じ間は再ロードせず、変わると再ロードする."""
+        version = [(1, (100, 10))]
+        with (
+            patch(
+                "src.strategies.strategy_loader.get_all_thresholds",
+                return_value=self.thresholds,
+            ) as mock_thresholds,
+            patch(
+                "src.strategies.strategy_loader.get_thresholds_version",
+                side_effect=lambda: version[0],
+            ),
+            patch(
+                "src.strategies.strategy_loader.get_thresholds_file_signature",
+                side_effect=lambda: version[0][1],
+            ),
+        ):
+            first = get_cached_strategies()
+            second = get_cached_strategies()
+            assert mock_thresholds.call_count == 1
+            assert first[0]["instance"] is second[0]["instance"]
+
+            # reload_thresholds() 相当（読み込み世代が進む）
+            version[0] = (2, (200, 10))
+            third = get_cached_strategies()
+            assert mock_thresholds.call_count == 2
+            assert third[0]["instance"] is not first[0]["instance"]
+
+    def test_reloads_when_thresholds_file_changes(self):
+        """読み込み後に thresholds.yaml が更新されると、閾値設定ごと再ロードする."""
+        version = [(1, (100, 10))]
+        signature = [(100, 10)]
+
+        def reload():
+            version[0] = (version[0][0] + 1, signature[0])
+
+        with (
+            patch(
+                "src.strategies.strategy_loader.get_all_thresholds",
+                return_value=self.thresholds,
+            ) as mock_thresholds,
+            patch(
+                "src.strategies.strategy_loader.get_thresholds_version",
+                side_effect=lambda: version[0],
+            ),
+            patch(
+                "src.strategies.strategy_loader.get_thresholds_file_signature",
+                side_effect=lambda: signature[0],
+            ),
+            patch(
+                "src.strategies.strategy_loader.reload_thresholds", side_effect=reload
+            ) as mock_reload,
+        ):
+            first = get_cached_strategies()
+            assert get_cached_strategies()[0]["instance"] is first[0]["instance"]
+            assert mock_reload.call_count == 0
+
+            # ファイル更新（reload_thresholds() は呼ばれていない）
+            signature[0] = (200, 12)
+            second = get_cached_strategies()
+            assert mock_reload.call_count == 1
+            assert mock_thresholds.call_count == 2
+            assert second[0]["instance"] is not first[0]["instance"]
+
+            # 再読込後は署名が一致するため再ロードしない
+            assert get_cached_strategies()[0]["instance"] is second[0]["instance"]
+            assert mock_reload.call_count == 1
+
+    def test_invalidate_forces_reload(self):
+        """invalidate_strategy_cache() 後は再ロードする."""
+        with patch(
+            "src.strategies.strategy_loader.get_all_thresholds",
+            return_value=self.thresholds,
+        ) as mock_thresholds:
+            get_cached_strategies()
+            invalidate_strategy_cache()
+            get_cached_strategies()
+
+        assert mock_thresholds.call_count == 2
+
+    def test_metadata_excludes_instance_and_is_copy(self):
+        """メタデータは instance を含まず、書き換えてもキャッシュに影響しない."""
+        with patch(
+            "src.strategies.strategy_loader.get_all_thresholds",
+            return_value=self.thresholds,
+        ):
+            metadata = get_strategy_metadata()
+            metadata[0]["metadata"]["name"] = "changed"
+
+            assert "instance" not in metadata[0]
+            assert metadata[0]["weight"] == 0.5
+            assert get_strategy_metadata()[0]["metadata"]["name"] == "CacheTest"
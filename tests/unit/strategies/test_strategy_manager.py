@@ -482,6 +482,48 @@ class TestStrategyManager(unittest.TestCase):
             or "Phase 56.7" in result.reason
         )
 
+    def test_get_individual_strategy_signals_batch(self):
+        """一括取得は行単位の get_individual_strategy_signals と一致（無効戦略は除外）."""
+        buy_strategy = MockStrategy("TestBuy", self.buy_signal)
+        sell_strategy = MockStrategy("TestSell", self.sell_signal)
+        sell_strategy.disable()
+        self.manager.register_strategy(buy_strategy)
+        self.manager.register_strategy(sell_strategy)
+
+        batch = self.manager.get_individual_strategy_signals_batch(self.test_df)
+
+        self.assertEqual(set(batch.keys()), {"TestBuy"})
+        encoded = batch["TestBuy"]["encoded"]
+        self.assertEqual(len(encoded), len(self.test_df))
+        for i in (19, 35, 49):
+            expected = self.manager.get_individual_strategy_signals(self.test_df.iloc[: i + 1])
+            self.assertAlmostEqual(encoded[i], expected["TestBuy"]["encoded"])
+        # 最低データ数未満の行はhold
+        self.assertTrue((encoded[:19] == 0.0).all())
+
+    def test_analyze_market_with_signals_runs_each_strategy_once(self):
+        """統合シグナルと個別シグナルを 1 回の戦略実行で返す（個別は単独取得と一致）."""
+        buy_strategy = MockStrategy("TestBuy", self.buy_signal)
+        sell_strategy = MockStrategy("TestSell", self.sell_signal)
+        self.manager.register_strategy(buy_strategy)
+        self.manager.register_strategy(sell_strategy)
+
+        with (
+            patch.object(
+                buy_strategy, "generate_signal", wraps=buy_strategy.generate_signal
+            ) as buy_generate,
+            patch.object(
+                sell_strategy, "generate_signal", wraps=sell_strategy.generate_signal
+            ) as sell_generate,
+        ):
+            combined, individual = self.manager.analyze_market_with_signals(self.test_df)
+
+        self.assertEqual(buy_generate.call_count, 1)
+        self.assertEqual(sell_generate.call_count, 1)
+        self.assertIsInstance(combined, StrategySignal)
+        self.assertEqual(individual, self.manager.get_individual_strategy_signals(self.test_df))
+        self.assertAlmostEqual(individual["TestSell"]["encoded"], -0.6)
+
 
 class TestPhase69TrendFilter(unittest.TestCase):
     """Phase 69: EMAトレンド方向フィルタテスト"""